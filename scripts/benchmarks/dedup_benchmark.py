@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Benchmark bulk deduplication scoring across worker counts.
+
+Builds a synthetic contact set with planted duplicates, generates
+candidate pairs once, then times run_bulk_deduplication with 1/2/4/8
+worker processes and checks every run returns the same matches.
+
+Usage:
+    python scripts/benchmarks/dedup_benchmark.py                       # 200k contacts
+    python scripts/benchmarks/dedup_benchmark.py --contacts 50000 --workers 1 4
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import structlog
+
+from src.deduplication import DeduplicationEngine
+from tests.fixtures.dedup_corpus import make_dedup_corpus
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--max-block-size", type=int, default=100)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    contacts = make_dedup_corpus(size=args.contacts)
+    engine = DeduplicationEngine()
+
+    start = time.perf_counter()
+    _, stats = engine.candidate_pairs(contacts, max_block_size=args.max_block_size)
+    blocking_s = time.perf_counter() - start
+    print(
+        f"{args.contacts:,} contacts: {stats.candidate_pairs:,} candidate pairs "
+        f"(reduction {stats.reduction_ratio:.6f}) in {blocking_s:.1f}s"
+    )
+
+    baseline = None
+    baseline_s = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        matches = engine.run_bulk_deduplication(
+            contacts,
+            workers=workers,
+            chunk_size=args.chunk_size,
+            max_block_size=args.max_block_size,
+        )
+        elapsed = time.perf_counter() - start
+        signature = [(m.contact_id_1, m.contact_id_2, m.score) for m in matches]
+        if baseline is None:
+            baseline, baseline_s = signature, elapsed
+        print(
+            f"  workers={workers}: {elapsed:7.1f}s  "
+            f"speedup {baseline_s / elapsed:4.2f}x  matches {len(matches):,}  "
+            f"identical={signature == baseline}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark memory search: pure-Python cosine loop vs EmbeddingStore.
+
+Builds one session of synthetic clustered 1536-dim embeddings and reports
+per-query latency for the previous exact path (cosine over JSON-decoded
+lists), the NumPy exact path, and the IVF index, plus the IVF index's
+recall@k against the exact top-k.
+
+Usage:
+    python scripts/benchmarks/memory_search_benchmark.py                 # 1k, 10k, 50k vectors
+    python scripts/benchmarks/memory_search_benchmark.py --sizes 5000 --queries 100 --nprobe 16
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.services.embedding_store import EmbeddingStore
+
+DIM = 1536
+
+
+def cosine_similarity(a: list[float], b: list[float]) -> float:
+    """The per-row scoring loop MemoryService used before the vector store."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if norm_a == 0 or norm_b == 0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def make_session(size: int, n_queries: int, seed: int = 3) -> tuple[np.ndarray, np.ndarray]:
+    """Clustered embeddings (topics) plus queries drawn near the same topics."""
+    rng = np.random.default_rng(seed)
+    topics = rng.normal(size=(max(8, size // 100), DIM))
+    vectors = topics[rng.integers(0, len(topics), size)] + 0.5 * rng.normal(size=(size, DIM))
+    queries = topics[rng.integers(0, len(topics), n_queries)] + 0.5 * rng.normal(size=(n_queries, DIM))
+    return vectors.astype(np.float32), queries.astype(np.float32)
+
+
+def python_search(rows: list[tuple[str, str]], query: list[float], k: int) -> list[str]:
+    scored = []
+    for memory_id, raw in rows:
+        scored.append((memory_id, cosine_similarity(query, json.loads(raw))))
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return [memory_id for memory_id, _ in scored[:k]]
+
+
+def timed(fn, queries) -> tuple[list, float]:
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        results.append(fn(query))
+    return results, 1000 * (time.perf_counter() - start) / len(queries)
+
+
+def run(size: int, n_queries: int, k: int, nprobe: int, python_limit: int) -> None:
+    vectors, queries = make_session(size, n_queries)
+    ids = [str(i) for i in range(size)]
+
+    store = EmbeddingStore(ann_min_vectors=1, nprobe=nprobe)
+    start = time.perf_counter()
+    store.add("session", list(zip(ids, vectors)))
+    load_ms = 1000 * (time.perf_counter() - start)
+    start = time.perf_counter()
+    store.search("session", queries[0], limit=k)  # builds the IVF index
+    build_ms = 1000 * (time.perf_counter() - start)
+
+    exact, exact_ms = timed(lambda q: store.search("session", q, limit=k, exact=True), queries)
+    ann, ann_ms = timed(lambda q: store.search("session", q, limit=k), queries)
+    recall = np.mean([
+        len({m for m, _ in e} & {m for m, _ in a}) / k for e, a in zip(exact, ann)
+    ])
+
+    line = (
+        f"{size:>7,} vectors  load {load_ms:7.1f}ms  ivf build {build_ms:7.1f}ms  "
+        f"numpy exact {exact_ms:7.2f}ms/q  ivf {ann_ms:6.2f}ms/q  ivf recall@{k} {recall:.3f}"
+    )
+    if size <= python_limit:
+        # The old path also decoded every row's JSON on each search
+        rows = [(memory_id, json.dumps(v.tolist())) for memory_id, v in zip(ids, vectors)]
+        sample = [q.tolist() for q in queries[:5]]
+        baseline, python_ms = timed(lambda q: python_search(rows, q, k), sample)
+        agree = np.mean([
+            len(set(b) & {m for m, _ in e}) / k for b, e in zip(baseline, exact)
+        ])
+        line += f"  python loop {python_ms:9.1f}ms/q (agrees with numpy {agree:.3f})"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--nprobe", type=int, default=8)
+    parser.add_argument(
+        "--python-limit", type=int, default=10_000,
+        help="Skip the pure-Python baseline above this many vectors",
+    )
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size, args.queries, args.k, args.nprobe, args.python_limit)
+
+
+if __name__ == "__main__":
+    main()
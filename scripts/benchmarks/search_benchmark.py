@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark SearchService query latency against the inverted index.
+
+Indexes synthetic contacts, companies and deals and reports p50/p99
+latency for a mix of single- and multi-term queries.
+
+Usage:
+    python scripts/benchmarks/search_benchmark.py                  # 10k, 100k, 1M docs
+    python scripts/benchmarks/search_benchmark.py --sizes 10000 50000 --queries 500
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.search.search_service import SearchableEntity, SearchService
+
+FIRST_NAMES = ["jane", "john", "maria", "wei", "omar", "lena", "raj", "sofia", "tom", "ana"]
+LAST_NAMES = ["smith", "doe", "garcia", "chen", "khan", "muller", "patel", "rossi", "lee", "silva"]
+WORDS = [
+    "freight", "logistics", "carrier", "broker", "warehouse", "fleet", "supply", "chain",
+    "pricing", "renewal", "pilot", "expansion", "shipper", "visibility", "tracking", "yard",
+]
+
+
+def make_company(rng: random.Random, i: int) -> str:
+    return f"{rng.choice(WORDS).title()}{i % 5000} {rng.choice(['Inc', 'LLC', 'Corp'])}"
+
+
+def make_documents(count: int, seed: int = 7) -> list[dict]:
+    """Generate synthetic documents across a few entity types."""
+    rng = random.Random(seed)
+    docs = []
+    for i in range(count):
+        kind = i % 3
+        company = make_company(rng, i)
+        if kind == 0:
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            docs.append({
+                "id": f"contact-{i}", "type": "contact", "title": f"{first} {last}",
+                "data": {
+                    "first_name": first, "last_name": last, "company": company,
+                    "email": f"{first}.{last}{i}@example.com",
+                },
+            })
+        elif kind == 1:
+            docs.append({
+                "id": f"company-{i}", "type": "company", "title": company,
+                "data": {
+                    "name": company, "domain": f"{company.split()[0].lower()}.com",
+                    "description": " ".join(rng.choices(WORDS, k=12)),
+                },
+            })
+        else:
+            docs.append({
+                "id": f"deal-{i}", "type": "deal", "title": f"{company} {rng.choice(WORDS)}",
+                "data": {
+                    "name": f"{company} {rng.choice(WORDS)}", "company_name": company,
+                    "description": " ".join(rng.choices(WORDS, k=20)),
+                },
+            })
+    return docs
+
+
+def make_queries(count: int, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        shape = rng.random()
+        if shape < 0.4:
+            queries.append(rng.choice(WORDS))
+        elif shape < 0.7:
+            queries.append(f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}")
+        else:
+            queries.append(" ".join(rng.sample(WORDS, 3)))
+    return queries
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def run(size: int, n_queries: int) -> None:
+    service = SearchService()
+    docs = make_documents(size)
+
+    start = time.perf_counter()
+    await service.bulk_index(docs)
+    index_s = time.perf_counter() - start
+    del docs
+
+    latencies = []
+    for query in make_queries(n_queries):
+        start = time.perf_counter()
+        await service.search(query, include_suggestions=False)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    entity_latencies = []
+    for query in make_queries(n_queries // 2, seed=13):
+        start = time.perf_counter()
+        await service.search(query, entity_types=[SearchableEntity.CONTACT])
+        entity_latencies.append((time.perf_counter() - start) * 1000)
+
+    print(
+        f"{size:>9,} docs  index {index_s:7.1f}s  "
+        f"all-types p50 {percentile(latencies, 50):8.2f}ms p99 {percentile(latencies, 99):8.2f}ms  "
+        f"contacts+suggest p50 {percentile(entity_latencies, 50):8.2f}ms "
+        f"p99 {percentile(entity_latencies, 99):8.2f}ms  "
+        f"(mean {statistics.mean(latencies):.2f}ms)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        asyncio.run(run(size, args.queries))
+
+
+if __name__ == "__main__":
+    main()
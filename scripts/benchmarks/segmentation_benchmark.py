@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark segment evaluation: reference vs compiled vs columnar.
+
+Evaluates 20 segments over a synthetic contact set three ways and checks
+that all three agree:
+  - reference: SegmentRule.evaluate per contact x rule
+  - compiled:  Segment.compile() predicate per contact
+  - columnar:  Segment.evaluate_batch() over the whole batch
+
+Usage:
+    python scripts/benchmarks/segmentation_benchmark.py                  # 100k x 20
+    python scripts/benchmarks/segmentation_benchmark.py --contacts 20000
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import structlog
+
+from src.segmentation import RuleOperator, Segment
+
+TITLES = ["CEO", "CTO", "VP Sales", "Head of Ops", "Director", "Manager", "Analyst", ""]
+INDUSTRIES = ["Technology", "Logistics", "Retail", "Manufacturing", None]
+
+
+def make_contacts(count: int, seed: int = 5) -> list[dict]:
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    return [
+        {
+            "id": f"c{i}",
+            "title": rng.choice(TITLES),
+            "score": rng.randrange(0, 100),
+            "emails_opened": rng.randrange(0, 20),
+            "last_activity_at": (now - timedelta(days=rng.randrange(0, 90))).isoformat(),
+            "created_at": now - timedelta(days=rng.randrange(0, 365)),
+            "company": {
+                "industry": rng.choice(INDUSTRIES),
+                "employee_count": rng.choice([10, 50, 200, 1000, 5000]),
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def make_segments(count: int, seed: int = 9) -> list[Segment]:
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    templates = [
+        ("score", RuleOperator.GREATER_OR_EQUAL, lambda: rng.randrange(10, 90)),
+        ("emails_opened", RuleOperator.GREATER_THAN, lambda: rng.randrange(0, 10)),
+        ("last_activity_at", RuleOperator.WITHIN_DAYS, lambda: rng.choice([7, 30, 60])),
+        ("created_at", RuleOperator.AFTER, lambda: (now - timedelta(days=rng.randrange(30, 300))).isoformat()),
+        ("title", RuleOperator.IN_LIST, lambda: rng.sample(TITLES, 3)),
+        ("company.industry", RuleOperator.CONTAINS, lambda: rng.choice(["tech", "log"])),
+        ("company.employee_count", RuleOperator.GREATER_OR_EQUAL, lambda: rng.choice([200, 1000])),
+    ]
+    segments = []
+    for i in range(count):
+        segment = Segment(id=f"s{i}", name=f"Segment {i}", match_type=rng.choice(["all", "any"]))
+        for field, operator, value in rng.sample(templates, 3):
+            segment.add_rule(field, operator, value())
+        segments.append(segment)
+    return segments
+
+
+def reference(segment: Segment, contacts: list[dict]) -> list[bool]:
+    combine = all if segment.match_type == "all" else any
+    rules = [r for r in segment.rules if r.is_active]
+    return [combine([r.evaluate(c) for r in rules]) for c in contacts]
+
+
+def compiled(segment: Segment, contacts: list[dict]) -> list[bool]:
+    predicate = segment.compile()
+    return [predicate(c) for c in contacts]
+
+
+def columnar(segment: Segment, contacts: list[dict]) -> list[bool]:
+    return segment.evaluate_batch(contacts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=100_000)
+    parser.add_argument("--segments", type=int, default=20)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    contacts = make_contacts(args.contacts)
+    segments = make_segments(args.segments)
+
+    results = {}
+    timings = {}
+    for name, evaluate in [("reference", reference), ("compiled", compiled), ("columnar", columnar)]:
+        start = time.perf_counter()
+        results[name] = [evaluate(segment, contacts) for segment in segments]
+        timings[name] = time.perf_counter() - start
+
+    print(f"{args.contacts:,} contacts x {args.segments} segments")
+    for name, elapsed in timings.items():
+        print(
+            f"  {name:<10} {elapsed:7.2f}s  speedup {timings['reference'] / elapsed:5.2f}x  "
+            f"identical={results[name] == results['reference']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
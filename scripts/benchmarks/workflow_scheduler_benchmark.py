@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark WorkflowEngine wait resumption with many parked executions.
+
+Parks N waiting executions on a two-step delay workflow, then times
+resume_waiting_executions ticks that each find a small number of due
+executions, against the old full scan of every execution.
+
+Usage:
+    python scripts/benchmarks/workflow_scheduler_benchmark.py              # 1M parked
+    python scripts/benchmarks/workflow_scheduler_benchmark.py --parked 100000 --due 50
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import structlog
+
+from src.workflows import ExecutionStatus, StepType, WorkflowEngine, WorkflowExecution
+
+
+def _park(engine: WorkflowEngine, workflow_id: str, wait_step_id: str, parked: int, now: datetime) -> None:
+    rng = random.Random(42)
+    for i in range(parked):
+        execution = WorkflowExecution(
+            id=f"exec-{i}",
+            workflow_id=workflow_id,
+            current_step_id=wait_step_id,
+            status=ExecutionStatus.WAITING,
+            started_at=now,
+            next_execution_at=now + timedelta(seconds=rng.randint(1, 30 * 86400)),
+        )
+        engine.executions[execution.id] = execution
+        engine.scheduler.schedule(execution.id, execution.next_execution_at)
+
+
+def _full_scan(engine: WorkflowEngine, now: datetime) -> int:
+    """The pre-scheduler tick: inspect every execution."""
+    due = 0
+    for execution in engine.executions.values():
+        if execution.status == ExecutionStatus.WAITING:
+            if execution.next_execution_at and execution.next_execution_at <= now:
+                due += 1
+    return due
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--parked", type=int, default=1_000_000)
+    parser.add_argument("--due", type=int, default=100, help="executions due per tick")
+    parser.add_argument("--ticks", type=int, default=10)
+    args = parser.parse_args()
+
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    engine = WorkflowEngine()
+    workflow = engine.create_workflow(name="Benchmark")
+    wait = engine.add_step_to_workflow(workflow.id, "Wait", StepType.WAIT_DELAY, {"delay_seconds": 86400})
+    engine.add_step_to_workflow(workflow.id, "Done", StepType.END, after_step_id=wait.id)
+
+    now = datetime.utcnow()
+    start = time.perf_counter()
+    _park(engine, workflow.id, wait.id, args.parked, now)
+    print(f"parked {args.parked:,} executions in {time.perf_counter() - start:.1f}s")
+
+    # Step the clock so each tick releases roughly --due executions
+    step = timedelta(seconds=30 * 86400 * args.due / args.parked)
+    tick_times, scan_times, resumed_total = [], [], 0
+    for _ in range(args.ticks):
+        now += step
+
+        start = time.perf_counter()
+        _full_scan(engine, now)
+        scan_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        resumed = await engine.resume_waiting_executions(now=now)
+        await engine.runner.join()
+        tick_times.append(time.perf_counter() - start)
+        resumed_total += len(resumed)
+
+    print(f"resumed {resumed_total:,} executions over {args.ticks} ticks")
+    print(f"  full scan tick: {1000 * sum(scan_times) / args.ticks:9.2f} ms")
+    print(f"  scheduler tick: {1000 * sum(tick_times) / args.ticks:9.2f} ms")
+    print(f"  live executions {len(engine.executions):,}, archived {len(engine.archived_executions):,}")
+    await engine.runner.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -11,6 +11,8 @@ Henry-style Evolution (Sprint 15):
 - Semantic search for relevant context
 - Automatic summarization of old conversations
 """
+import asyncio
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Type
 from enum import Enum
@@ -54,6 +56,9 @@ class JarvisAgent(BaseAgent):
         )
     """
 
+    # Seconds an agent may run before it is cancelled and reported as timed out
+    AGENT_TIMEOUT_SECONDS = 30.0
+
     def __init__(self):
         """Initialize Jarvis."""
         super().__init__(
@@ -177,7 +182,10 @@ class JarvisAgent(BaseAgent):
         
         self._register_agent(
             "asset_hunter",
-            AssetHunterAgent(drive_connector=self._connectors.get("drive")),
+            AssetHunterAgent(
+                drive_connector=self._connectors.get("drive"),
+                retriever=self._document_retriever(),
+            ),
             domain=AgentDomain.SALES,
             capabilities=["find_assets", "proposal_search", "case_study_search"]
         )
@@ -430,6 +438,15 @@ class JarvisAgent(BaseAgent):
             capabilities=["monitor_sync", "detect_failures", "track_rate_limits"]
         )
 
+    def _document_retriever(self):
+        """Drive document retrieval service, or None if it cannot be set up."""
+        try:
+            from src.retrieval import get_document_retrieval_service
+            return get_document_retrieval_service()
+        except Exception as e:
+            logger.warning(f"Document retrieval unavailable: {e}")
+            return None
+
     def _register_agent(
         self,
         name: str,
@@ -472,13 +489,14 @@ class JarvisAgent(BaseAgent):
         context: Optional[Dict[str, Any]] = None,
         user_id: Optional[str] = None,
         session_name: str = "default",
+        agent_timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Ask Jarvis a question or request an action.
         
         Jarvis will:
-        1. Load relevant memory from persistent storage
+        1. Load relevant memory from persistent storage while routing the query
         2. Interpret the intent
-        3. Route to appropriate agent(s)
+        3. Run the matching agent(s) concurrently, each with its own timeout
         4. Save the interaction to memory
         5. Aggregate and return results
         
@@ -487,57 +505,34 @@ class JarvisAgent(BaseAgent):
             context: Additional context (deal_id, contact_email, etc.)
             user_id: User identifier for persistent memory (default: "casey")
             session_name: Named session for conversation grouping
+            agent_timeout: Seconds each agent may run (default: AGENT_TIMEOUT_SECONDS)
             
         Returns:
-            Aggregated response from relevant agents
+            Aggregated response from relevant agents. Agents that time out are
+            cancelled and reported with status "timeout"; the others' results
+            are still returned. ``metadata.agent_latency_ms`` has per-agent latency.
         """
         if not self._initialized:
             await self.initialize()
         
         context = context or {}
         user_id = user_id or self._default_user_id
+        timeout = self.AGENT_TIMEOUT_SECONDS if agent_timeout is None else agent_timeout
         logger.info(f"Jarvis received query: {query[:100]}...")
         
-        # ========================================
-        # Henry-style: Load persistent memory
-        # ========================================
-        memory_context = {}
+        # Henry-style persistent memory loads while the query is routed
+        memory_task = None
         if self._memory_enabled:
-            try:
-                async with get_session() as db:
-                    memory = MemoryService(db)
-                    
-                    # Get or create session
-                    session = await memory.get_or_create_session(user_id, session_name)
-                    
-                    # Recall recent conversation
-                    recent_messages = await memory.recall(str(session.id), limit=10)
-                    
-                    # Search for relevant context from past conversations
-                    relevant_context = await memory.search_similar(
-                        str(session.id), 
-                        query, 
-                        limit=3
-                    )
-                    
-                    # Remember the user's query
-                    await memory.remember(
-                        session_id=str(session.id),
-                        role="user",
-                        content=query,
-                        metadata={"context": context}
-                    )
-                    
-                    memory_context = {
-                        "session_id": str(session.id),
-                        "recent_messages": recent_messages,
-                        "relevant_context": relevant_context,
-                        "session_topic": session.last_topic,
-                    }
-                    logger.debug(f"Loaded {len(recent_messages)} recent messages, {len(relevant_context)} relevant")
-            except Exception as e:
-                logger.warning(f"Memory service unavailable: {e}")
-                memory_context = {"error": str(e)}
+            memory_task = asyncio.create_task(
+                self._load_memory(query, context, user_id, session_name)
+            )
+        try:
+            agents_to_invoke = await self._route_query(query, context)
+        except BaseException:
+            if memory_task:
+                memory_task.cancel()
+            raise
+        memory_context = await memory_task if memory_task else {}
         
         # Update conversation context
         self._conversation_context.update(context)
@@ -545,9 +540,6 @@ class JarvisAgent(BaseAgent):
         self._conversation_context["last_query"] = query
         self._conversation_context["timestamp"] = datetime.utcnow().isoformat()
         
-        # Determine which agents to invoke
-        agents_to_invoke = await self._route_query(query, context)
-        
         if not agents_to_invoke:
             return {
                 "status": "no_match",
@@ -555,30 +547,8 @@ class JarvisAgent(BaseAgent):
                 "suggestion": "Try being more specific about what you need.",
             }
         
-        # Execute agents and aggregate results
-        results = {}
-        for agent_name in agents_to_invoke:
-            agent_info = self._agent_registry.get(agent_name)
-            if agent_info:
-                try:
-                    agent = agent_info["agent"]
-                    agent_context = {
-                        **context,
-                        "query": query,
-                        "conversation_context": self._conversation_context,
-                    }
-                    result = await agent.execute(agent_context)
-                    results[agent_name] = {
-                        "status": "success",
-                        "domain": agent_info["domain"].value,
-                        "result": result,
-                    }
-                except Exception as e:
-                    logger.error(f"Agent {agent_name} failed: {e}")
-                    results[agent_name] = {
-                        "status": "error",
-                        "error": str(e),
-                    }
+        # Execute agents concurrently and aggregate results
+        results = await self._invoke_agents(agents_to_invoke, query, context, timeout)
         
         response = {
             "status": "success",
@@ -587,6 +557,11 @@ class JarvisAgent(BaseAgent):
             "results": results,
             "timestamp": datetime.utcnow().isoformat(),
             "memory": {"session_id": memory_context.get("session_id")} if memory_context else None,
+            "metadata": {
+                "agent_latency_ms": {name: r["latency_ms"] for name, r in results.items()},
+                "timed_out": [name for name, r in results.items() if r["status"] == "timeout"],
+                "agent_timeout_seconds": timeout,
+            },
         }
         
         # ========================================
@@ -619,6 +594,104 @@ class JarvisAgent(BaseAgent):
         
         return response
 
+    async def _load_memory(
+        self,
+        query: str,
+        context: Dict[str, Any],
+        user_id: str,
+        session_name: str,
+    ) -> Dict[str, Any]:
+        """Load recent and relevant memory for a query and remember the query.
+
+        Recent messages and the semantic search (which waits on an embedding
+        call) run concurrently, each on its own DB session.
+        """
+        try:
+            async with get_session() as db:
+                memory = MemoryService(db)
+                
+                # Get or create session
+                session = await memory.get_or_create_session(user_id, session_name)
+                session_id = str(session.id)
+                
+                async def search_similar():
+                    async with get_session() as search_db:
+                        return await MemoryService(search_db).search_similar(session_id, query, limit=3)
+                
+                # Recall recent conversation and search past conversations together
+                recent_messages, relevant_context = await asyncio.gather(
+                    memory.recall(session_id, limit=10),
+                    search_similar(),
+                )
+                
+                # Remember the user's query
+                await memory.remember(
+                    session_id=session_id,
+                    role="user",
+                    content=query,
+                    metadata={"context": context}
+                )
+                
+                logger.debug(f"Loaded {len(recent_messages)} recent messages, {len(relevant_context)} relevant")
+                return {
+                    "session_id": session_id,
+                    "recent_messages": recent_messages,
+                    "relevant_context": relevant_context,
+                    "session_topic": session.last_topic,
+                }
+        except Exception as e:
+            logger.warning(f"Memory service unavailable: {e}")
+            return {"error": str(e)}
+
+    async def _invoke_agents(
+        self,
+        agent_names: List[str],
+        query: str,
+        context: Dict[str, Any],
+        timeout: float,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run agents concurrently, cancelling any that exceed ``timeout``.
+
+        One agent failing or timing out does not affect the others. Results
+        keep the order of ``agent_names``; unregistered agents are skipped.
+        """
+        async def invoke(agent_name: str, agent_info: Dict[str, Any]) -> Dict[str, Any]:
+            agent_context = {
+                **context,
+                "query": query,
+                "conversation_context": self._conversation_context,
+            }
+            started = time.perf_counter()
+            try:
+                result = await asyncio.wait_for(agent_info["agent"].execute(agent_context), timeout)
+                outcome = {
+                    "status": "success",
+                    "domain": agent_info["domain"].value,
+                    "result": result,
+                }
+            except asyncio.TimeoutError:
+                logger.warning(f"Agent {agent_name} timed out after {timeout}s")
+                outcome = {
+                    "status": "timeout",
+                    "error": f"Agent did not respond within {timeout}s",
+                }
+            except Exception as e:
+                logger.error(f"Agent {agent_name} failed: {e}")
+                outcome = {
+                    "status": "error",
+                    "error": str(e),
+                }
+            outcome["latency_ms"] = round(1000 * (time.perf_counter() - started), 1)
+            return outcome
+        
+        invocations = [
+            (name, self._agent_registry[name])
+            for name in agent_names
+            if name in self._agent_registry
+        ]
+        outcomes = await asyncio.gather(*(invoke(name, info) for name, info in invocations))
+        return {name: outcome for (name, _), outcome in zip(invocations, outcomes)}
+
     async def _route_query(
         self,
         query: str,
@@ -139,8 +139,12 @@ class ResearchAgent:
             
             # Analyze threads
             thread_summaries = []
-            for thread in threads[:5]:  # Analyze top 5
-                thread_data = await self.gmail_connector.get_thread(thread["id"])
+            # Analyze top 5; only message counts and dates are needed
+            thread_details = await self.gmail_connector.get_threads_batch(
+                [thread["id"] for thread in threads[:5]], format="minimal"
+            )
+            for thread in threads[:5]:
+                thread_data = thread_details.get(thread["id"])
                 if thread_data:
                     messages = thread_data.get("messages", [])
                     if messages:
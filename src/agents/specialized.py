@@ -133,9 +133,23 @@ class AssetHunterAgent:
         },
     }
     
-    def __init__(self, drive_connector=None):
-        """Initialize with optional Drive connector."""
+    # Cosine similarity a retrieved chunk needs to count as a match; weaker
+    # hits are noise (hash collisions, generic wording) and Drive search
+    # fills their place
+    MIN_RELEVANCE = 0.25
+
+    def __init__(self, drive_connector=None, retriever=None, min_relevance: float = MIN_RELEVANCE):
+        """Initialize with optional Drive connector and document retriever.
+
+        Args:
+            drive_connector: DriveConnector for filename/full-text search
+            retriever: DocumentRetrievalService; when it has indexed chunks,
+                assets are ranked by semantic match on their content
+            min_relevance: Minimum similarity for a retrieved asset
+        """
         self.drive_connector = drive_connector
+        self.retriever = retriever
+        self.min_relevance = min_relevance
 
     async def hunt_assets(
         self,
@@ -150,15 +164,42 @@ class AssetHunterAgent:
 
             assets = []
 
-            # Use real Drive connector if available
-            if self.drive_connector:
+            # Prefer content retrieval over indexed Drive chunks
+            if self.retriever:
+                try:
+                    hits = await self.retriever.search_files(
+                        prospect_company,
+                        k=max_results,
+                        filters={"folder": list(self.ALLOWLIST)},
+                        min_score=self.min_relevance,
+                    )
+                    for hit in hits:
+                        asset = {
+                            "id": hit.drive_file_id,
+                            "name": hit.metadata.get("name", ""),
+                            "folder": hit.metadata.get("folder", ""),
+                            "type": hit.metadata.get("type", ""),
+                            "relevance": round(hit.score, 3),
+                            "webViewLink": hit.metadata.get("link", ""),
+                            "snippet": hit.text[:280],
+                        }
+                        if self._validate_asset_in_allowlist(asset):
+                            assets.append(asset)
+                except Exception as e:
+                    logger.warning(f"Document retrieval failed: {e}, falling back to Drive search")
+
+            # Fill remaining slots from the Drive connector if available
+            if self.drive_connector and len(assets) < max_results:
                 try:
                     search_results = await self.drive_connector.search_assets(
                         query=prospect_company,
                         company_name=prospect_company,
                         max_results=max_results,
                     )
+                    found_ids = {asset["id"] for asset in assets}
                     for result in search_results:
+                        if result.get("id") in found_ids:
+                            continue
                         if self._validate_asset_in_allowlist(result):
                             assets.append(result)
                 except Exception as e:
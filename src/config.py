@@ -38,6 +38,17 @@ class Settings(BaseSettings):
     redis_url: str = Field(
         default="redis://localhost:6379/0", alias="REDIS_URL", description="Redis connection URL"
     )
+    contact_cache_redis_enabled: bool = Field(
+        default=False, alias="CONTACT_CACHE_REDIS_ENABLED", description="Share the contact enrichment cache via Redis"
+    )
+    embedding_cache_redis_enabled: bool = Field(
+        default=False, alias="EMBEDDING_CACHE_REDIS_ENABLED", description="Share the memory embedding cache via Redis"
+    )
+
+    # Document retrieval
+    document_index_path: str = Field(
+        default="data/document_index", alias="DOCUMENT_INDEX_PATH", description="Directory for Drive document vector files"
+    )
 
     # Celery
     celery_broker_url: str = Field(
@@ -14,6 +14,7 @@ from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from src.connectors.google_executor import execute_google_request
 from src.logger import get_logger
 
 logger = get_logger(__name__)
@@ -144,7 +145,7 @@ class CalendarConnector:
                 self._build_service()
             
             # Lightweight call: list calendars with minimal results
-            result = self.service.calendarList().list(maxResults=1).execute()
+            result = await execute_google_request(self.service.calendarList().list(maxResults=1))
             
             latency_ms = int((time.time() - start_time) * 1000)
             
@@ -190,7 +191,7 @@ class CalendarConnector:
                 "items": [{"id": cal_id} for cal_id in calendar_ids],
             }
 
-            result = self.service.freebusy().query(body=body).execute()
+            result = await execute_google_request(self.service.freebusy().query(body=body))
             logger.info(f"Retrieved freebusy for {len(calendar_ids)} calendars")
             return result
         except Exception as e:
@@ -321,7 +322,7 @@ class CalendarConnector:
             if attendees:
                 event["attendees"] = [{"email": email} for email in attendees]
 
-            result = self.service.events().insert(calendarId="primary", body=event).execute()
+            result = await execute_google_request(self.service.events().insert(calendarId="primary", body=event))
             logger.info(f"Created calendar event {result['id']}")
             return result["id"]
         except Exception as e:
@@ -16,6 +16,11 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 from googleapiclient.errors import HttpError
 
+from src.connectors.google_executor import (
+    bind_thread_http,
+    execute_google_request,
+    run_google_blocking,
+)
 from src.logger import get_logger
 
 logger = get_logger(__name__)
@@ -123,7 +128,7 @@ class DriveConnector:
                 self._build_service()
             
             # Lightweight call: get user info
-            about = self.service.about().get(fields="user,storageQuota").execute()
+            about = await execute_google_request(self.service.about().get(fields="user,storageQuota"))
             
             latency_ms = int((time.time() - start_time) * 1000)
             
@@ -206,25 +211,25 @@ class DriveConnector:
             drive_query += f" and fullText contains '{query}'"
         
         try:
-            response = self.service.files().list(
+            response = await execute_google_request(self.service.files().list(
                 q=drive_query,
                 spaces="drive",
                 fields="files(id, name, mimeType, webViewLink, modifiedTime, parents)",
                 pageSize=max_results * 2,  # Get extra for filtering
-            ).execute()
+            ))
             
             files = response.get("files", [])
             results = []
             
             for file in files:
                 # Apply allowlist filters
-                if not self._is_allowed(file, config):
+                if not self.is_allowed(file, config):
                     continue
                 
                 results.append({
                     "id": file["id"],
                     "name": file["name"],
-                    "type": self._get_asset_type(file["mimeType"]),
+                    "type": self.get_asset_type(file["mimeType"]),
                     "link": file.get("webViewLink", ""),
                     "modified": file.get("modifiedTime", ""),
                     "relevance": self._calculate_relevance(file, query),
@@ -236,7 +241,35 @@ class DriveConnector:
             logger.error(f"Drive API error: {e}")
             return []
     
-    def _is_allowed(self, file: Dict[str, Any], config: Dict[str, Any]) -> bool:
+    @with_drive_retry(max_retries=3, backoff_base=1.0)
+    async def list_folder_files(self, folder_id: str, page_size: int = 100) -> List[Dict[str, Any]]:
+        """List every file directly in a folder (all pages).
+        
+        Returns:
+            Drive file resources with id, name, mimeType, webViewLink and modifiedTime
+        """
+        if not self.service:
+            self._build_service()
+        
+        if not self.service:
+            return []
+        
+        files: List[Dict[str, Any]] = []
+        page_token = None
+        while True:
+            response = await execute_google_request(self.service.files().list(
+                q=f"'{folder_id}' in parents and trashed = false",
+                spaces="drive",
+                fields="nextPageToken, files(id, name, mimeType, webViewLink, modifiedTime)",
+                pageSize=page_size,
+                pageToken=page_token,
+            ))
+            files.extend(response.get("files", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return files
+    
+    def is_allowed(self, file: Dict[str, Any], config: Dict[str, Any]) -> bool:
         """Check if file passes allowlist filters."""
         if config.get("include_all"):
             return True
@@ -255,7 +288,7 @@ class DriveConnector:
         
         return True
     
-    def _get_asset_type(self, mime_type: str) -> str:
+    def get_asset_type(self, mime_type: str) -> str:
         """Determine asset type from MIME type."""
         if "pdf" in mime_type:
             return "pdf"
@@ -309,7 +342,7 @@ class DriveConnector:
         try:
             # If mime_type not provided, fetch it
             if not mime_type:
-                file = self.service.files().get(fileId=file_id, fields="mimeType").execute()
+                file = await execute_google_request(self.service.files().get(fileId=file_id, fields="mimeType"))
                 mime_type = file.get("mimeType")
 
             content = ""
@@ -319,26 +352,18 @@ class DriveConnector:
                 request = self.service.files().export_media(
                     fileId=file_id, mimeType="text/plain"
                 )
-                fh = io.BytesIO()
-                downloader = MediaIoBaseDownload(fh, request)
-                done = False
-                while done is False:
-                    status, done = downloader.next_chunk()
-                content = fh.getvalue().decode("utf-8")
+                data = await run_google_blocking(self._download, request)
+                content = data.decode("utf-8")
                 
             # Case 2: Plain Text / Unknown -> Try direct download
             else:
                 # Basic text download attempt
                 request = self.service.files().get_media(fileId=file_id)
-                fh = io.BytesIO()
-                downloader = MediaIoBaseDownload(fh, request)
-                done = False
-                while done is False:
-                    status, done = downloader.next_chunk()
+                data = await run_google_blocking(self._download, request)
                 
                 # Try decoding as text, skip if binary
                 try:
-                    content = fh.getvalue().decode("utf-8")
+                    content = data.decode("utf-8")
                 except UnicodeDecodeError:
                     return "[Binary Content - Skipped]"
 
@@ -350,15 +375,25 @@ class DriveConnector:
 
         
         try:
-            file = self.service.files().get(
+            file = await execute_google_request(self.service.files().get(
                 fileId=file_id,
                 fields="webViewLink"
-            ).execute()
+            ))
             return file.get("webViewLink")
         except Exception as e:
             logger.error(f"Error getting file link: {e}")
             return None
 
+    @staticmethod
+    def _download(request) -> bytes:
+        """Download a media request in chunks (runs on the Google API pool)."""
+        fh = io.BytesIO()
+        downloader = MediaIoBaseDownload(fh, bind_thread_http(request))
+        done = False
+        while done is False:
+            status, done = downloader.next_chunk()
+        return fh.getvalue()
+
 
 def create_drive_connector() -> DriveConnector:
     """Create a DriveConnector with credentials from environment."""
@@ -1,8 +1,11 @@
 """Gmail connector for reading/syncing messages."""
+import asyncio
 import base64
+import calendar
 import json
 import os
 from datetime import datetime, timedelta
+from email.utils import parseaddr
 from typing import Any, Dict, List, Optional
 
 from google.auth.transport.requests import Request
@@ -13,6 +16,11 @@ from google.auth import default
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from src.connectors.google_executor import (
+    execute_google_batch,
+    execute_google_request,
+    run_google_blocking,
+)
 from src.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +32,11 @@ SCOPES = [
     "https://www.googleapis.com/auth/gmail.send",  # Added for email sending
 ]
 
+# Batch fetch configuration
+GMAIL_BATCH_LIMIT = 100  # sub-requests per batch HTTP call
+BATCH_INITIAL_BACKOFF = 1.0  # seconds
+BATCH_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
 
 def create_gmail_connector() -> "GmailConnector":
     """Create a GmailConnector with credentials from environment.
@@ -118,7 +131,7 @@ class GmailConnector:
             logger.info("OAuth token expired or expiring soon, refreshing...")
             
             try:
-                self.credentials.refresh(Request())
+                await run_google_blocking(self.credentials.refresh, Request())
                 logger.info("OAuth token refreshed successfully")
                 
                 # Persist refreshed token
@@ -303,7 +316,7 @@ class GmailConnector:
                 self._build_service()
             
             # Lightweight profile check
-            profile = self.service.users().getProfile(userId="me").execute()
+            profile = await execute_google_request(self.service.users().getProfile(userId="me"))
             
             latency_ms = int((time.time() - start_time) * 1000)
             
@@ -330,9 +343,9 @@ class GmailConnector:
             self._build_service()
 
         try:
-            results = self.service.users().threads().list(
+            results = await execute_google_request(self.service.users().threads().list(
                 userId="me", q=query, maxResults=max_results
-            ).execute()
+            ))
 
             threads = results.get("threads", [])
             logger.info(f"Found {len(threads)} threads matching query", query=query)
@@ -347,9 +360,9 @@ class GmailConnector:
             self._build_service()
 
         try:
-            thread = self.service.users().threads().get(
+            thread = await execute_google_request(self.service.users().threads().get(
                 userId="me", id=thread_id, format="full"
-            ).execute()
+            ))
             logger.info(f"Retrieved thread {thread_id}")
             return thread
         except Exception as e:
@@ -362,9 +375,9 @@ class GmailConnector:
             self._build_service()
 
         try:
-            results = self.service.users().messages().list(
+            results = await execute_google_request(self.service.users().messages().list(
                 userId="me", q=query, maxResults=max_results
-            ).execute()
+            ))
 
             messages = results.get("messages", [])
             logger.info(f"Retrieved {len(messages)} messages", query=query)
@@ -379,14 +392,196 @@ class GmailConnector:
             self._build_service()
 
         try:
-            message = self.service.users().messages().get(
+            message = await execute_google_request(self.service.users().messages().get(
                 userId="me", id=message_id, format="full"
-            ).execute()
+            ))
             return message
         except Exception as e:
             logger.error(f"Error retrieving message {message_id}: {e}")
             return None
 
+    async def get_threads_batch(
+        self,
+        thread_ids: List[str],
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None,
+        max_retries: int = 3,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get many threads through the Gmail batch endpoint.
+        
+        Args:
+            thread_ids: Gmail thread IDs
+            format: "full", "metadata" or "minimal"
+            metadata_headers: Headers to return when format="metadata"
+                (e.g. ["From", "Subject", "Date"]); bodies are not downloaded
+            max_retries: Retries for items that failed with a retryable status
+            
+        Returns:
+            Dict of thread ID -> thread, in request order; threads that could
+            not be fetched are left out
+        """
+        return await self._batch_get("threads", thread_ids, format, metadata_headers, max_retries)
+
+    async def get_messages_batch(
+        self,
+        message_ids: List[str],
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None,
+        max_retries: int = 3,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get many messages through the Gmail batch endpoint.
+        
+        Args:
+            message_ids: Gmail message IDs
+            format: "full", "metadata", "minimal" or "raw"
+            metadata_headers: Headers to return when format="metadata"
+            max_retries: Retries for items that failed with a retryable status
+            
+        Returns:
+            Dict of message ID -> message, in request order; messages that
+            could not be fetched are left out
+        """
+        return await self._batch_get("messages", message_ids, format, metadata_headers, max_retries)
+
+    async def _batch_get(
+        self,
+        resource: str,
+        ids: List[str],
+        format: str,
+        metadata_headers: Optional[List[str]],
+        max_retries: int,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch threads or messages by ID, up to 100 per batch HTTP call.
+        
+        Sub-requests that fail with a retryable status (429/5xx), or whose
+        whole batch call failed, are retried with exponential backoff; other
+        failures (e.g. 404) are logged and skipped.
+        """
+        if not self.service:
+            self._build_service()
+        if not self.service or not ids:
+            return {}
+        
+        collection = getattr(self.service.users(), resource)()
+        params: Dict[str, Any] = {"userId": "me", "format": format}
+        if metadata_headers:
+            params["metadataHeaders"] = metadata_headers
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = list(dict.fromkeys(ids))
+        backoff = BATCH_INITIAL_BACKOFF
+        
+        for attempt in range(max_retries + 1):
+            retry: List[str] = []
+            
+            def callback(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+                if exception is None:
+                    results[request_id] = response
+                elif isinstance(exception, HttpError) and exception.resp.status in BATCH_RETRYABLE_STATUSES:
+                    retry.append(request_id)
+                else:
+                    logger.warning(f"Error fetching {resource[:-1]} {request_id}: {exception}")
+            
+            async def run_chunk(chunk: List[str]) -> None:
+                batch = self.service.new_batch_http_request(callback=callback)
+                for item_id in chunk:
+                    batch.add(collection.get(id=item_id, **params), request_id=item_id)
+                try:
+                    await execute_google_batch(batch, self.credentials)
+                except Exception as e:
+                    logger.warning(f"Gmail batch call for {len(chunk)} {resource} failed: {e}")
+                    failed = [i for i in chunk if i not in results and i not in retry]
+                    retry.extend(failed)
+            
+            await asyncio.gather(*(
+                run_chunk(pending[i:i + GMAIL_BATCH_LIMIT])
+                for i in range(0, len(pending), GMAIL_BATCH_LIMIT)
+            ))
+            
+            if not retry:
+                break
+            if attempt == max_retries:
+                logger.error(f"Giving up on {len(retry)} {resource} after {max_retries} retries")
+                break
+            logger.warning(
+                f"Retrying {len(retry)} {resource} in {backoff}s "
+                f"(attempt {attempt + 1}/{max_retries})"
+            )
+            await asyncio.sleep(backoff)
+            backoff *= 2
+            pending = retry
+        
+        logger.info(f"Batch fetched {len(results)}/{len(ids)} {resource}")
+        return {i: results[i] for i in ids if i in results}
+
+    async def is_authenticated(self) -> bool:
+        """Whether the connector has credentials that are valid or refreshable."""
+        if not self.credentials:
+            return False
+        return await self.refresh_token_if_needed()
+
+    async def get_threads_with_replies(
+        self,
+        since: datetime,
+        max_results: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Get inbox threads with activity since a time, with their latest message.
+        
+        Threads are fetched in one batch with format="metadata", so only the
+        From/Subject/Date headers are downloaded.
+        
+        Args:
+            since: Only threads with messages after this time (naive = UTC)
+            max_results: Max threads to check
+            
+        Returns:
+            List of {"id", "subject", "latest_reply"} for threads with more
+            than one message; latest_reply has id, from_email, sender_name,
+            snippet, date and is_from_us
+        """
+        after = calendar.timegm(since.utctimetuple())
+        threads = await self.search_threads(f"in:inbox after:{after}", max_results=max_results)
+        details = await self.get_threads_batch(
+            [t["id"] for t in threads],
+            format="metadata",
+            metadata_headers=["From", "Subject", "Date"],
+        )
+        
+        own_addresses = {
+            a.lower() for a in (self.user_email, os.environ.get("GMAIL_DELEGATED_USER")) if a
+        }
+        replies = []
+        for thread_id, thread in details.items():
+            messages = thread.get("messages", [])
+            if len(messages) < 2:
+                continue
+            latest = messages[-1]
+            headers = {
+                h.get("name", "").lower(): h.get("value", "")
+                for h in latest.get("payload", {}).get("headers", [])
+            }
+            sender_name, from_email = parseaddr(headers.get("from", ""))
+            first_headers = {
+                h.get("name", "").lower(): h.get("value", "")
+                for h in messages[0].get("payload", {}).get("headers", [])
+            }
+            replies.append({
+                "id": thread_id,
+                "subject": first_headers.get("subject", ""),
+                "latest_reply": {
+                    "id": latest.get("id"),
+                    "from_email": from_email,
+                    "sender_name": sender_name,
+                    "snippet": latest.get("snippet", ""),
+                    "date": headers.get("date"),
+                    "is_from_us": (
+                        from_email.lower() in own_addresses
+                        or "SENT" in latest.get("labelIds", [])
+                    ),
+                },
+            })
+        return replies
+
     async def create_draft(self, to: str, subject: str, body: str, from_email: Optional[str] = None) -> Optional[str]:
         """Create a draft email (DRAFT_ONLY mode - NOT SENT).
         
@@ -403,9 +598,9 @@ class GmailConnector:
             message = {
                 "raw": self._create_message(to, subject, body, from_email=from_email)
             }
-            result = self.service.users().drafts().create(
+            result = await execute_google_request(self.service.users().drafts().create(
                 userId="me", body={"message": message}
-            ).execute()
+            ))
             draft_id = result["id"]
             sender = from_email or os.environ.get("GMAIL_DELEGATED_USER", "me")
             logger.info(f"Created draft {draft_id} from {sender} to {to} (DRAFT_ONLY - not sent)", subject=subject)
@@ -485,10 +680,10 @@ class GmailConnector:
         # Retry logic with exponential backoff (circuit breaker tracks failures)
         for attempt in range(max_retries):
             try:
-                result = self.service.users().messages().send(
+                result = await execute_google_request(self.service.users().messages().send(
                     userId="me",
                     body={"raw": encoded_message}
-                ).execute()
+                ))
                 
                 message_id = result.get("id")
                 thread_id = result.get("threadId")
@@ -586,10 +781,10 @@ class GmailConnector:
             self._build_service()
         
         try:
-            self.service.users().drafts().delete(
+            await execute_google_request(self.service.users().drafts().delete(
                 userId="me",
                 id=draft_id
-            ).execute()
+            ))
             logger.info(f"Deleted draft {draft_id}")
             return True
         except Exception as e:
@@ -0,0 +1,126 @@
+"""Bounded thread pool for blocking Google API client calls.
+
+``googleapiclient`` is synchronous: ``request.execute()`` blocks on an
+httplib2 round-trip. Calling it from an ``async def`` stalls the whole
+event loop, so the Gmail, Calendar and Drive connectors hand their calls
+to ``execute_google_request()``, which runs them on a dedicated, bounded
+``ThreadPoolExecutor``.
+
+httplib2 connections are not thread-safe, so a request built from a shared
+service object is re-bound to a per-thread ``AuthorizedHttp`` (same
+credentials, own connection) before it executes.
+
+The pool size comes from ``GOOGLE_API_MAX_WORKERS`` (default 8); the pool
+is shut down at application shutdown by ``shutdown_google_executor()``.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 8
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+def _max_workers() -> int:
+    value = os.environ.get("GOOGLE_API_MAX_WORKERS")
+    if not value:
+        return DEFAULT_MAX_WORKERS
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Invalid GOOGLE_API_MAX_WORKERS={value!r}, using {DEFAULT_MAX_WORKERS}")
+        return DEFAULT_MAX_WORKERS
+
+
+def get_google_executor() -> ThreadPoolExecutor:
+    """Get the process-wide Google API thread pool, creating it if needed."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_workers(), thread_name_prefix="google-api"
+            )
+        return _executor
+
+
+def shutdown_google_executor(wait: bool = True) -> None:
+    """Shut down the Google API thread pool. Called at application shutdown."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def bind_thread_http(request: Any) -> Any:
+    """Point a googleapiclient request at this thread's own HTTP connection.
+
+    Must be called on the worker thread. Requests that are not real
+    ``HttpRequest`` objects (e.g. test doubles) are returned unchanged.
+    """
+    from googleapiclient.http import HttpRequest
+
+    if not isinstance(request, HttpRequest):
+        return request
+    credentials = getattr(request.http, "credentials", None)
+    if credentials is None:
+        return request
+
+    request.http = _thread_http(credentials)
+    return request
+
+
+def _thread_http(credentials: Any) -> Any:
+    """This thread's ``AuthorizedHttp`` for ``credentials``."""
+    cache: Dict[int, Any] = getattr(_thread_state, "http", None)
+    if cache is None:
+        cache = _thread_state.http = {}
+    entry = cache.get(id(credentials))
+    if entry is None or entry[0] is not credentials:
+        import google_auth_httplib2
+        import httplib2
+
+        entry = (credentials, google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http()))
+        cache[id(credentials)] = entry
+    return entry[1]
+
+
+def _execute(request: Any) -> Any:
+    return bind_thread_http(request).execute()
+
+
+async def run_google_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking Google client function on the Google API thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_google_executor(), partial(func, *args, **kwargs))
+
+
+async def execute_google_request(request: Any) -> Any:
+    """Await ``request.execute()`` without blocking the event loop."""
+    return await run_google_blocking(_execute, request)
+
+
+def _execute_batch(batch: Any, credentials: Any) -> None:
+    http = _thread_http(credentials) if credentials is not None else None
+    batch.execute(http=http)
+
+
+async def execute_google_batch(batch: Any, credentials: Any = None) -> None:
+    """Await ``BatchHttpRequest.execute()`` without blocking the event loop.
+
+    Results are delivered through the batch's callbacks. Pass the service's
+    credentials so the batch runs on this worker thread's own connection.
+    """
+    await run_google_blocking(_execute_batch, batch, credentials)
@@ -0,0 +1,313 @@
+"""Shared, connection-pooled HTTP transport for API connectors.
+
+Connectors used to open a new ``httpx.AsyncClient`` per call, paying a TCP
+and TLS handshake every time. A ``PooledHTTPTransport`` owns one long-lived
+client with bounded pool limits and keep-alive so connections are reused
+across calls, negotiates HTTP/2 when the optional ``h2`` package is
+installed, and records per-request timing and connection reuse through
+httpx event hooks and the httpcore ``trace`` extension.
+
+Transports are shared by name (``get_shared_transport("hubspot")``) and are
+closed at application shutdown by ``close_shared_transports()``.
+"""
+import asyncio
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set
+
+import httpx
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Pool limits, keep-alive and timeouts for a pooled transport."""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    timeout: float = 30.0
+    connect_timeout: float = 10.0
+    pool_timeout: float = 10.0
+    http2: bool = True
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "HTTPPoolConfig":
+        """Build a config from ``<PREFIX>_MAX_CONNECTIONS``-style variables."""
+        defaults = cls()
+
+        def _get(name: str, default, cast):
+            value = os.environ.get(f"{prefix}_{name}")
+            if value is None or value == "":
+                return default
+            try:
+                return cast(value)
+            except ValueError:
+                logger.warning(f"Invalid {prefix}_{name}={value!r}, using {default}")
+                return default
+
+        return cls(
+            max_connections=_get("MAX_CONNECTIONS", defaults.max_connections, int),
+            max_keepalive_connections=_get(
+                "MAX_KEEPALIVE_CONNECTIONS", defaults.max_keepalive_connections, int
+            ),
+            keepalive_expiry=_get("KEEPALIVE_EXPIRY", defaults.keepalive_expiry, float),
+            timeout=_get("TIMEOUT", defaults.timeout, float),
+            connect_timeout=_get("CONNECT_TIMEOUT", defaults.connect_timeout, float),
+            pool_timeout=_get("POOL_TIMEOUT", defaults.pool_timeout, float),
+            http2=_get("HTTP2", defaults.http2, lambda v: v.lower() in ("1", "true", "yes")),
+        )
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def build_timeout(self, timeout: Optional[float] = None) -> httpx.Timeout:
+        """Timeout for one request; ``timeout`` overrides the read/write budget."""
+        total = self.timeout if timeout is None else timeout
+        return httpx.Timeout(
+            total,
+            connect=min(self.connect_timeout, total),
+            pool=self.pool_timeout,
+        )
+
+
+@dataclass
+class TransportStats:
+    """Request timing and connection reuse counters for a transport."""
+    requests: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def reuse_rate(self) -> float:
+        """Fraction of completed requests served on an already open connection."""
+        if self.requests == 0:
+            return 0.0
+        return self.reused_connections / self.requests
+
+    @property
+    def avg_seconds(self) -> float:
+        if self.requests == 0:
+            return 0.0
+        return self.total_seconds / self.requests
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "errors": self.errors,
+            "reuse_rate": round(self.reuse_rate, 4),
+            "avg_ms": round(self.avg_seconds * 1000, 2),
+            "max_ms": round(self.max_seconds * 1000, 2),
+        }
+
+
+class TransportSession:
+    """Request helper bound to a pooled client and a per-call timeout.
+
+    Used as ``async with transport.session(timeout=60) as client:`` in place
+    of ``async with httpx.AsyncClient(timeout=60) as client:``. Leaving the
+    block does not close anything; the pooled connections stay open.
+    """
+
+    def __init__(self, transport: "PooledHTTPTransport", timeout: Optional[float] = None):
+        self._transport = transport
+        self._timeout = transport.config.build_timeout(timeout)
+
+    async def __aenter__(self) -> "TransportSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        kwargs.setdefault("timeout", self._timeout)
+        return await self._transport.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+
+class PooledHTTPTransport:
+    """One long-lived, connection-pooled ``httpx.AsyncClient``.
+
+    The client is created lazily on first use inside a running event loop.
+    Pooled connections belong to the loop that opened them, so if the
+    transport is used from a different loop (e.g. a new test loop) the old
+    client is closed and a fresh one is created for the new loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: Optional[HTTPPoolConfig] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.name = name
+        self.config = config or HTTPPoolConfig()
+        self.stats = TransportStats()
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Set[asyncio.Task] = set()
+
+    @property
+    def http2(self) -> bool:
+        return self.config.http2 and HTTP2_AVAILABLE and self._transport is None
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None and not self._client.is_closed
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is not loop:
+            self._retire(self._client)
+            self._client = None
+        if self._client is None or self._client.is_closed:
+            self._client = self._build_client()
+            self._loop = loop
+        return self._client
+
+    def _retire(self, client: httpx.AsyncClient) -> None:
+        """Close a client left over from another event loop."""
+        if client.is_closed:
+            return
+        task = asyncio.get_running_loop().create_task(self._close_retired(client))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close_retired(self, client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception as e:
+            # Sockets opened on a loop that has since closed cannot shut down cleanly
+            logger.debug(f"Error closing HTTP client '{self.name}' from a previous loop: {e}")
+        else:
+            logger.info(f"Closed pooled HTTP client '{self.name}' from a previous event loop")
+
+    def session(self, timeout: Optional[float] = None) -> TransportSession:
+        """Return a request helper that applies ``timeout`` to each call."""
+        return TransportSession(self, timeout)
+
+    def _build_client(self) -> httpx.AsyncClient:
+        logger.info(
+            f"Opening pooled HTTP client '{self.name}' "
+            f"(max_connections={self.config.max_connections}, "
+            f"keepalive={self.config.max_keepalive_connections}, http2={self.http2})"
+        )
+        kwargs: Dict[str, Any] = {}
+        if self._transport is not None:
+            kwargs["transport"] = self._transport
+        return httpx.AsyncClient(
+            limits=self.config.limits(),
+            timeout=self.config.build_timeout(),
+            http2=self.http2,
+            event_hooks={
+                "request": [self._on_request],
+                "response": [self._on_response],
+            },
+            **kwargs,
+        )
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        timing = {"start": time.perf_counter(), "new_connection": False}
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.started":
+                timing["new_connection"] = True
+
+        request.extensions["timing"] = timing
+        request.extensions["trace"] = trace
+
+    async def _on_response(self, response: httpx.Response) -> None:
+        timing = response.request.extensions.get("timing")
+        if timing is None:
+            return
+        elapsed = time.perf_counter() - timing["start"]
+        stats = self.stats
+        stats.requests += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        if timing["new_connection"]:
+            stats.new_connections += 1
+        else:
+            stats.reused_connections += 1
+        if response.status_code >= 500:
+            stats.errors += 1
+        logger.debug(
+            f"{self.name} {response.request.method} {response.request.url.path} "
+            f"{response.status_code} {elapsed * 1000:.1f}ms "
+            f"{'new' if timing['new_connection'] else 'reused'} connection"
+        )
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        client, self._client = self._client, None
+        self._loop = None
+        if client is not None and not client.is_closed:
+            await client.aclose()
+            logger.info(f"Closed pooled HTTP client '{self.name}': {self.stats.to_dict()}")
+
+
+_shared_transports: Dict[str, PooledHTTPTransport] = {}
+
+
+def get_shared_transport(name: str, config: Optional[HTTPPoolConfig] = None) -> PooledHTTPTransport:
+    """Get the process-wide transport for a service, creating it if needed.
+
+    The config defaults to ``<NAME>_HTTP_*`` environment variables
+    (e.g. ``HUBSPOT_HTTP_MAX_CONNECTIONS``).
+    """
+    transport = _shared_transports.get(name)
+    if transport is None:
+        transport = PooledHTTPTransport(
+            name, config or HTTPPoolConfig.from_env(f"{name.upper()}_HTTP")
+        )
+        _shared_transports[name] = transport
+    return transport
+
+
+def get_transport_stats() -> Dict[str, Dict[str, Any]]:
+    """Timing and reuse stats for every shared transport."""
+    return {name: t.stats.to_dict() for name, t in _shared_transports.items()}
+
+
+async def close_shared_transports() -> None:
+    """Close every shared transport. Called at application shutdown."""
+    for transport in list(_shared_transports.values()):
+        try:
+            await transport.aclose()
+        except Exception as e:
+            logger.warning(f"Error closing HTTP transport '{transport.name}': {e}")
@@ -1,11 +1,19 @@
 """HubSpot connector for CRM integration."""
 import asyncio
+import heapq
 import os
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
 
 import httpx
 
+from src.connectors.http_transport import (
+    PooledHTTPTransport,
+    TransportSession,
+    get_shared_transport,
+)
 from src.logger import get_logger
+from src.rate_limiter_enhanced import RequestPriority, rate_limit_priority
 
 logger = get_logger(__name__)
 
@@ -71,6 +79,91 @@ async def _retry_with_backoff(
     return None
 
 
+async def _gather_or_cancel(coros: List[Any]) -> List[Any]:
+    """Run coroutines concurrently; on the first error cancel the rest and raise it."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _timestamp_key(activity: Dict[str, Any]) -> str:
+    return activity.get("timestamp") or ""
+
+
+# Batch read configuration
+BATCH_READ_LIMIT = 100  # ids per HubSpot batch call
+BATCH_LOAD_WINDOW = 0.01  # seconds to collect single-id loads
+
+
+class _BatchLoader:
+    """Coalesce single-key loads into batch calls (DataLoader-style).
+
+    Loads issued within ``window`` seconds of each other on the same event
+    loop are dispatched together as one ``batch_fn(keys)`` call, or as soon
+    as ``max_batch_size`` distinct keys are pending. Each caller gets the
+    result for its own key (None if the batch did not return it).
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        max_batch_size: int = BATCH_READ_LIMIT,
+        window: float = BATCH_LOAD_WINDOW,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.window = window
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, key: str) -> Any:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Celery tasks run each job on a fresh loop; never join a batch
+            # that belongs to another one
+            self._loop, self._pending, self._timer = loop, {}, None
+
+        future = self._pending.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._dispatch)
+        # Shield so one cancelled caller does not cancel the shared result
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = self._loop.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[str, asyncio.Future]) -> None:
+        try:
+            results = await self.batch_fn(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+
 def create_hubspot_connector() -> "HubSpotConnector":
     """Create a HubSpotConnector with API key from environment.
     
@@ -91,13 +184,35 @@ class HubSpotConnector:
     # Shared circuit breaker for all HubSpot connectors
     _circuit_breaker = None
 
-    def __init__(self, api_key: str):
-        """Initialize HubSpot connector."""
+    def __init__(
+        self,
+        api_key: str,
+        transport: Optional[PooledHTTPTransport] = None,
+        rate_limiter=None,
+        max_concurrency: int = 8,
+    ):
+        """Initialize HubSpot connector.
+
+        Args:
+            api_key: HubSpot private app token
+            transport: Pooled HTTP transport (default: the shared "hubspot"
+                transport, also used by src.integrations.hubspot.HubSpotClient)
+            rate_limiter: Token bucket for fan-out requests (default: the
+                shared HubSpot account bucket)
+            max_concurrency: Max in-flight requests per fan-out call
+        """
         self.api_key = api_key
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
         }
+        self.transport = transport or get_shared_transport("hubspot")
+        if rate_limiter is None:
+            from src.integrations.hubspot.client import get_hubspot_rate_limiter
+            rate_limiter = get_hubspot_rate_limiter()
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max_concurrency
+        self._batch: Optional["HubSpotBatchOperations"] = None
         
         # Initialize shared circuit breaker
         if HubSpotConnector._circuit_breaker is None:
@@ -108,6 +223,97 @@ class HubSpotConnector:
                 name="hubspot",
             )
 
+    def _session(self, timeout: Optional[float] = None) -> TransportSession:
+        """Request helper on the pooled client with a per-call timeout."""
+        return self.transport.session(self.DEFAULT_TIMEOUT if timeout is None else timeout)
+
+    @property
+    def batch(self) -> "HubSpotBatchOperations":
+        """Batch operations bound to this connector.
+        
+        Shared per connector so concurrent single-id loads coalesce.
+        """
+        if self._batch is None:
+            self._batch = HubSpotBatchOperations(self)
+        return self._batch
+
+    def _fanout_semaphore(self, concurrency: Optional[int] = None) -> asyncio.Semaphore:
+        return asyncio.Semaphore(concurrency or self.max_concurrency)
+
+    async def _breaker_call(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Run a request through the shared HubSpot circuit breaker."""
+        if self._circuit_breaker is None:
+            return await func(*args, **kwargs)
+        return await self._circuit_breaker.call(func, *args, **kwargs)
+
+    async def _limited_get(
+        self,
+        client: TransportSession,
+        url: str,
+        semaphore: asyncio.Semaphore,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """GET bounded by a fan-out semaphore and the HubSpot token bucket."""
+        async with semaphore:
+            await self.rate_limiter.acquire()
+            return await client.get(url, headers=self.headers, params=params)
+
+    async def _get_associated_objects(
+        self,
+        client: TransportSession,
+        contact_id: str,
+        object_type: str,
+        properties: List[str],
+        params: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[tuple]:
+        """Fetch objects associated with a contact, reading details concurrently.
+
+        Args:
+            client: HTTP client
+            contact_id: HubSpot contact ID
+            object_type: Associated object type (emails, deals, notes, ...)
+            properties: Properties to fetch for each object
+            params: Query params for the associations request
+            limit: Max associated objects to read
+            semaphore: Shared fan-out bound (default: max_concurrency)
+
+        Returns:
+            List of (object_id, object JSON) in association order; objects
+            that could not be read are left out
+        """
+        if semaphore is None:
+            semaphore = self._fanout_semaphore()
+
+        assoc_response = await self._limited_get(
+            client,
+            f"{self.BASE_URL}/crm/v4/objects/contacts/{contact_id}/associations/{object_type}",
+            semaphore,
+            params=params,
+        )
+        assoc_response.raise_for_status()
+        results = assoc_response.json().get("results", [])
+        if limit is not None:
+            results = results[:limit]
+        object_ids = [r.get("toObjectId") for r in results if r.get("toObjectId")]
+
+        detail_params = {"properties": ",".join(properties)}
+        responses = await _gather_or_cancel([
+            self._limited_get(
+                client,
+                f"{self.BASE_URL}/crm/v3/objects/{object_type}/{object_id}",
+                semaphore,
+                params=detail_params,
+            )
+            for object_id in object_ids
+        ])
+        return [
+            (object_id, response.json())
+            for object_id, response in zip(object_ids, responses)
+            if response.status_code == 200
+        ]
+
     @classmethod
     def get_circuit_breaker_state(cls) -> dict:
         """Get current circuit breaker state for monitoring."""
@@ -124,7 +330,7 @@ class HubSpotConnector:
         import time
         start = time.time()
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with self._session(timeout=10.0) as client:
             try:
                 response = await client.get(
                     f"{self.BASE_URL}/crm/v3/objects/contacts?limit=1",
@@ -144,59 +350,28 @@ class HubSpotConnector:
                 return {"status": "unhealthy", "error": str(e), "latency_ms": -1}
 
     async def search_contacts(self, email: str) -> Optional[Dict[str, Any]]:
-        """Search for a contact by email address with circuit breaker protection."""
+        """Search for a contact by email address with circuit breaker protection.
+        
+        Concurrent lookups are coalesced into one batch read (see
+        HubSpotBatchOperations.load_contact_by_email).
+        """
         from src.resilience import CircuitBreakerOpenError
         
-        # Check circuit breaker
+        # Fail fast while the circuit is open
         if self._circuit_breaker and self._circuit_breaker.state == "open":
             if not self._circuit_breaker._should_attempt_reset():
                 raise CircuitBreakerOpenError("HubSpot circuit breaker is open")
-            self._circuit_breaker.state = "half_open"
         
-        async with httpx.AsyncClient() as client:
-            try:
-                payload = {
-                    "filterGroups": [
-                        {
-                            "filters": [
-                                {
-                                    "propertyName": "email",
-                                    "operator": "EQ",
-                                    "value": email
-                                }
-                            ]
-                        }
-                    ],
-                    "limit": 1
-                }
-                response = await client.post(
-                    f"{self.BASE_URL}/crm/v3/objects/contacts/search",
-                    headers=self.headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-                results = response.json()
-                
-                # Record success
-                if self._circuit_breaker:
-                    self._circuit_breaker._on_success()
-                
-                if results.get("results"):
-                    contact = results["results"][0]
-                    logger.info(f"Found contact {contact['id']} with email {email}")
-                    return contact
-                logger.info(f"No contact found with email {email}")
-                return None
-            except Exception as e:
-                # Record failure
-                if self._circuit_breaker:
-                    self._circuit_breaker._on_failure()
-                logger.error(f"Error searching contacts by email: {e}")
-                return None
+        contact = await self.batch.load_contact_by_email(email)
+        if contact:
+            logger.info(f"Found contact {contact['id']} with email {email}")
+        else:
+            logger.info(f"No contact found with email {email}")
+        return contact
 
     async def search_companies(self, domain: str) -> Optional[Dict[str, Any]]:
         """Search for a company by domain."""
-        async with httpx.AsyncClient() as client:
+        async with self._session() as client:
             try:
                 payload = {
                     "filterGroups": [
@@ -230,40 +405,28 @@ class HubSpotConnector:
                 return None
 
     async def get_contact_associations(self, contact_id: str) -> Optional[List[Dict[str, Any]]]:
-        """Get associated companies for a contact."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.BASE_URL}/crm/v3/objects/contacts/{contact_id}/associations/companies",
-                    headers=self.headers,
-                )
-                response.raise_for_status()
-                results = response.json()
-                associations = results.get("results", [])
-                logger.info(f"Retrieved {len(associations)} company associations for contact {contact_id}")
-                return associations
-            except Exception as e:
-                logger.error(f"Error retrieving contact associations: {e}")
-                return None
+        """Get associated companies for a contact.
+        
+        Concurrent calls are coalesced into one batch associations read.
+        """
+        associations = await self.batch.load_associations(contact_id, "companies")
+        if associations is not None:
+            logger.info(f"Retrieved {len(associations)} company associations for contact {contact_id}")
+        return associations
 
     async def get_company(self, company_id: str) -> Optional[Dict[str, Any]]:
-        """Get company details from HubSpot."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.BASE_URL}/crm/v3/objects/companies/{company_id}",
-                    headers=self.headers,
-                )
-                response.raise_for_status()
-                logger.info(f"Retrieved company {company_id}")
-                return response.json()
-            except Exception as e:
-                logger.error(f"Error retrieving company {company_id}: {e}")
-                return None
+        """Get company details from HubSpot.
+        
+        Concurrent calls are coalesced into one batch read.
+        """
+        company = await self.batch.load_company(company_id)
+        if company:
+            logger.info(f"Retrieved company {company_id}")
+        return company
 
     async def get_contact(self, contact_id: str) -> Optional[Dict[str, Any]]:
         """Get contact details from HubSpot."""
-        async with httpx.AsyncClient() as client:
+        async with self._session() as client:
             try:
                 response = await client.get(
                     f"{self.BASE_URL}/crm/v3/objects/contacts/{contact_id}",
@@ -288,7 +451,7 @@ class HubSpotConnector:
         Returns:
             Contact data with requested properties
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
                 response = await client.get(
                     f"{self.BASE_URL}/crm/v3/objects/contacts/{contact_id}",
@@ -314,7 +477,7 @@ class HubSpotConnector:
         Returns:
             Company data with requested properties
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
                 response = await client.get(
                     f"{self.BASE_URL}/crm/v3/objects/companies/{company_id}",
@@ -329,32 +492,54 @@ class HubSpotConnector:
                 return None
 
     async def get_contact_timeline(
-        self, contact_id: str, limit: int = 50
+        self, contact_id: str, limit: int = 50, concurrency: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Get timeline activities for a contact.
         
-        Fetches engagements, emails, calls, meetings, notes associated with contact.
+        Fetches emails, calls, meetings and notes associated with the contact
+        concurrently, with at most ``concurrency`` requests in flight, each
+        drawing from the HubSpot token bucket, then k-way merges the streams
+        by timestamp.
         
         Args:
             contact_id: HubSpot contact ID
             limit: Max activities to return
+            concurrency: Max in-flight requests (default: max_concurrency)
             
         Returns:
             List of timeline activity objects sorted by timestamp
         """
-        activities: List[Dict[str, Any]] = []
+        semaphore = self._fanout_semaphore(concurrency)
         
-        async with httpx.AsyncClient(timeout=60) as client:
+        async with self._session(timeout=60) as client:
             try:
-                # Get emails
-                emails = await self._get_contact_object_timeline(
-                    client, contact_id, "emails", 
-                    ["hs_email_subject", "hs_email_direction", "hs_timestamp", "hs_email_status"],
-                    limit // 3
-                )
+                emails, calls, meetings, notes = await _gather_or_cancel([
+                    self._get_contact_object_timeline(
+                        client, contact_id, "emails",
+                        ["hs_email_subject", "hs_email_direction", "hs_timestamp", "hs_email_status"],
+                        limit // 3, semaphore=semaphore,
+                    ),
+                    self._get_contact_object_timeline(
+                        client, contact_id, "calls",
+                        ["hs_call_title", "hs_call_duration", "hs_timestamp", "hs_call_disposition"],
+                        limit // 3, semaphore=semaphore,
+                    ),
+                    self._get_contact_object_timeline(
+                        client, contact_id, "meetings",
+                        ["hs_meeting_title", "hs_meeting_start_time", "hs_meeting_end_time", "hs_meeting_outcome"],
+                        limit // 3, semaphore=semaphore,
+                    ),
+                    self._get_contact_object_timeline(
+                        client, contact_id, "notes",
+                        ["hs_note_body", "hs_timestamp"],
+                        limit // 4, semaphore=semaphore,
+                    ),
+                ])
+                
+                streams: List[List[Dict[str, Any]]] = [[], [], [], []]
                 for email in emails:
                     props = email.get("properties", {})
-                    activities.append({
+                    streams[0].append({
                         "type": "email",
                         "id": email.get("id"),
                         "timestamp": props.get("hs_timestamp"),
@@ -362,16 +547,9 @@ class HubSpotConnector:
                         "direction": props.get("hs_email_direction"),
                         "status": props.get("hs_email_status"),
                     })
-                
-                # Get calls
-                calls = await self._get_contact_object_timeline(
-                    client, contact_id, "calls",
-                    ["hs_call_title", "hs_call_duration", "hs_timestamp", "hs_call_disposition"],
-                    limit // 3
-                )
                 for call in calls:
                     props = call.get("properties", {})
-                    activities.append({
+                    streams[1].append({
                         "type": "call",
                         "id": call.get("id"),
                         "timestamp": props.get("hs_timestamp"),
@@ -379,16 +557,9 @@ class HubSpotConnector:
                         "duration": props.get("hs_call_duration"),
                         "disposition": props.get("hs_call_disposition"),
                     })
-                
-                # Get meetings
-                meetings = await self._get_contact_object_timeline(
-                    client, contact_id, "meetings",
-                    ["hs_meeting_title", "hs_meeting_start_time", "hs_meeting_end_time", "hs_meeting_outcome"],
-                    limit // 3
-                )
                 for meeting in meetings:
                     props = meeting.get("properties", {})
-                    activities.append({
+                    streams[2].append({
                         "type": "meeting",
                         "id": meeting.get("id"),
                         "timestamp": props.get("hs_meeting_start_time"),
@@ -396,30 +567,25 @@ class HubSpotConnector:
                         "end_time": props.get("hs_meeting_end_time"),
                         "outcome": props.get("hs_meeting_outcome"),
                     })
-                
-                # Get notes
-                notes = await self._get_contact_object_timeline(
-                    client, contact_id, "notes",
-                    ["hs_note_body", "hs_timestamp"],
-                    limit // 4
-                )
                 for note in notes:
                     props = note.get("properties", {})
-                    activities.append({
+                    streams[3].append({
                         "type": "note",
                         "id": note.get("id"),
                         "timestamp": props.get("hs_timestamp"),
                         "body": props.get("hs_note_body", "")[:200],  # Truncate for preview
                     })
                 
-                # Sort by timestamp descending
-                activities.sort(
-                    key=lambda x: x.get("timestamp") or "", 
-                    reverse=True
-                )
+                # Merge the per-type streams newest first
+                for stream in streams:
+                    stream.sort(key=_timestamp_key, reverse=True)
+                activities = list(islice(
+                    heapq.merge(*streams, key=_timestamp_key, reverse=True),
+                    limit,
+                ))
                 
                 logger.info(f"Retrieved {len(activities)} timeline activities for contact {contact_id}")
-                return activities[:limit]
+                return activities
                 
             except Exception as e:
                 logger.error(f"Error getting contact timeline: {e}")
@@ -427,11 +593,12 @@ class HubSpotConnector:
 
     async def _get_contact_object_timeline(
         self,
-        client: httpx.AsyncClient,
+        client: TransportSession,
         contact_id: str,
         object_type: str,
         properties: List[str],
         limit: int,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> List[Dict[str, Any]]:
         """Helper to get associated objects for timeline.
         
@@ -441,33 +608,17 @@ class HubSpotConnector:
             object_type: Type of object (emails, calls, meetings, notes)
             properties: Properties to fetch
             limit: Max objects to return
+            semaphore: Fan-out bound shared with the other timeline fetches
             
         Returns:
             List of object data
         """
         try:
-            # Get associations
-            assoc_response = await client.get(
-                f"{self.BASE_URL}/crm/v4/objects/contacts/{contact_id}/associations/{object_type}",
-                headers=self.headers,
-                params={"limit": limit},
+            objects = await self._get_associated_objects(
+                client, contact_id, object_type, properties,
+                params={"limit": limit}, limit=limit, semaphore=semaphore,
             )
-            assoc_response.raise_for_status()
-            assoc_data = assoc_response.json()
-            
-            objects = []
-            for result in assoc_data.get("results", [])[:limit]:
-                obj_id = result.get("toObjectId")
-                if obj_id:
-                    obj_response = await client.get(
-                        f"{self.BASE_URL}/crm/v3/objects/{object_type}/{obj_id}",
-                        headers=self.headers,
-                        params={"properties": ",".join(properties)},
-                    )
-                    if obj_response.status_code == 200:
-                        objects.append(obj_response.json())
-            
-            return objects
+            return [obj for _, obj in objects]
             
         except Exception as e:
             logger.warning(f"Error getting {object_type} for contact {contact_id}: {e}")
@@ -477,7 +628,7 @@ class HubSpotConnector:
         self, contact_id: str, title: str, body: str, due_date: Optional[str] = None
     ) -> Optional[str]:
         """Create a task in HubSpot."""
-        async with httpx.AsyncClient() as client:
+        async with self._session() as client:
             try:
                 payload = {
                     "properties": {
@@ -504,7 +655,7 @@ class HubSpotConnector:
 
     async def create_note(self, contact_id: str, body: str) -> Optional[str]:
         """Create a note in HubSpot."""
-        async with httpx.AsyncClient() as client:
+        async with self._session() as client:
             try:
                 payload = {
                     "properties": {
@@ -540,7 +691,7 @@ class HubSpotConnector:
         Returns:
             List of email objects with subject, body, recipient, timestamp
         """
-        async with httpx.AsyncClient(timeout=60) as client:
+        async with self._session(timeout=60) as client:
             try:
                 # Fetch emails without API filter - filter in code for reliability
                 emails = []
@@ -633,7 +784,7 @@ class HubSpotConnector:
         Returns:
             List of form submission objects with contact data
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
                 submissions = []
                 after = None
@@ -690,46 +841,36 @@ class HubSpotConnector:
         self,
         contact_id: str,
         limit: int = 50,
+        concurrency: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get engagements associated with a contact.
         
         Args:
             contact_id: HubSpot contact ID
             limit: Max engagements to return
+            concurrency: Max in-flight detail reads (default: max_concurrency)
             
         Returns:
             List of engagement objects
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
-                # Get engagement associations
-                response = await client.get(
-                    f"{self.BASE_URL}/crm/v4/objects/contacts/{contact_id}/associations/engagements",
-                    headers=self.headers,
+                objects = await self._get_associated_objects(
+                    client, contact_id, "engagements",
+                    ["hs_engagement_type", "hs_timestamp", "hs_body_preview"],
                     params={"limit": limit},
+                    semaphore=self._fanout_semaphore(concurrency),
                 )
-                response.raise_for_status()
-                data = response.json()
                 
                 engagements = []
-                for result in data.get("results", []):
-                    eng_id = result.get("toObjectId")
-                    if eng_id:
-                        # Get engagement details
-                        eng_response = await client.get(
-                            f"{self.BASE_URL}/crm/v3/objects/engagements/{eng_id}",
-                            headers=self.headers,
-                            params={"properties": "hs_engagement_type,hs_timestamp,hs_body_preview"},
-                        )
-                        if eng_response.status_code == 200:
-                            eng_data = eng_response.json()
-                            props = eng_data.get("properties", {})
-                            engagements.append({
-                                "id": eng_id,
-                                "type": props.get("hs_engagement_type"),
-                                "timestamp": props.get("hs_timestamp"),
-                                "preview": props.get("hs_body_preview"),
-                            })
+                for eng_id, eng_data in objects:
+                    props = eng_data.get("properties", {})
+                    engagements.append({
+                        "id": eng_id,
+                        "type": props.get("hs_engagement_type"),
+                        "timestamp": props.get("hs_timestamp"),
+                        "preview": props.get("hs_body_preview"),
+                    })
                 
                 return engagements
                 
@@ -740,42 +881,29 @@ class HubSpotConnector:
     async def get_contact_deals(
         self,
         contact_id: str,
+        concurrency: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get deals associated with a contact.
         
         Args:
             contact_id: HubSpot contact ID
+            concurrency: Max in-flight detail reads (default: max_concurrency)
             
         Returns:
             List of deal objects
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
-                # Get deal associations
-                response = await client.get(
-                    f"{self.BASE_URL}/crm/v4/objects/contacts/{contact_id}/associations/deals",
-                    headers=self.headers,
+                objects = await self._get_associated_objects(
+                    client, contact_id, "deals",
+                    ["dealname", "dealstage", "amount", "closedate"],
+                    semaphore=self._fanout_semaphore(concurrency),
                 )
-                response.raise_for_status()
-                data = response.json()
-                
-                deals = []
-                for result in data.get("results", []):
-                    deal_id = result.get("toObjectId")
-                    if deal_id:
-                        deal_response = await client.get(
-                            f"{self.BASE_URL}/crm/v3/objects/deals/{deal_id}",
-                            headers=self.headers,
-                            params={"properties": "dealname,dealstage,amount,closedate"},
-                        )
-                        if deal_response.status_code == 200:
-                            deal_data = deal_response.json()
-                            deals.append({
-                                "id": deal_id,
-                                **deal_data.get("properties", {}),
-                            })
                 
-                return deals
+                return [
+                    {"id": deal_id, **deal_data.get("properties", {})}
+                    for deal_id, deal_data in objects
+                ]
                 
             except Exception as e:
                 logger.warning(f"Error getting contact deals: {e}")
@@ -785,42 +913,31 @@ class HubSpotConnector:
         self,
         contact_id: str,
         limit: int = 10,
+        concurrency: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get notes associated with a contact.
         
         Args:
             contact_id: HubSpot contact ID
             limit: Max notes to return
+            concurrency: Max in-flight detail reads (default: max_concurrency)
             
         Returns:
             List of note objects
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
-                response = await client.get(
-                    f"{self.BASE_URL}/crm/v4/objects/contacts/{contact_id}/associations/notes",
-                    headers=self.headers,
+                objects = await self._get_associated_objects(
+                    client, contact_id, "notes",
+                    ["hs_note_body", "hs_timestamp"],
                     params={"limit": limit},
+                    semaphore=self._fanout_semaphore(concurrency),
                 )
-                response.raise_for_status()
-                data = response.json()
-                
-                notes = []
-                for result in data.get("results", []):
-                    note_id = result.get("toObjectId")
-                    if note_id:
-                        note_response = await client.get(
-                            f"{self.BASE_URL}/crm/v3/objects/notes/{note_id}",
-                            headers=self.headers,
-                            params={"properties": "hs_note_body,hs_timestamp"},
-                        )
-                        if note_response.status_code == 200:
-                            note_data = note_response.json()
-                            notes.append({
-                                "id": note_id,
-                                **note_data.get("properties", {}),
-                            })
                 
+                notes = [
+                    {"id": note_id, **note_data.get("properties", {})}
+                    for note_id, note_data in objects
+                ]
                 return notes[:limit]
                 
             except Exception as e:
@@ -830,41 +947,29 @@ class HubSpotConnector:
     async def get_contact_tasks(
         self,
         contact_id: str,
+        concurrency: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get tasks associated with a contact.
         
         Args:
             contact_id: HubSpot contact ID
+            concurrency: Max in-flight detail reads (default: max_concurrency)
             
         Returns:
             List of task objects
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
-                response = await client.get(
-                    f"{self.BASE_URL}/crm/v4/objects/contacts/{contact_id}/associations/tasks",
-                    headers=self.headers,
+                objects = await self._get_associated_objects(
+                    client, contact_id, "tasks",
+                    ["hs_task_subject", "hs_task_status", "hs_task_due_date", "hs_task_type"],
+                    semaphore=self._fanout_semaphore(concurrency),
                 )
-                response.raise_for_status()
-                data = response.json()
-                
-                tasks = []
-                for result in data.get("results", []):
-                    task_id = result.get("toObjectId")
-                    if task_id:
-                        task_response = await client.get(
-                            f"{self.BASE_URL}/crm/v3/objects/tasks/{task_id}",
-                            headers=self.headers,
-                            params={"properties": "hs_task_subject,hs_task_status,hs_task_due_date,hs_task_type"},
-                        )
-                        if task_response.status_code == 200:
-                            task_data = task_response.json()
-                            tasks.append({
-                                "id": task_id,
-                                **task_data.get("properties", {}),
-                            })
                 
-                return tasks
+                return [
+                    {"id": task_id, **task_data.get("properties", {})}
+                    for task_id, task_data in objects
+                ]
                 
             except Exception as e:
                 logger.warning(f"Error getting contact tasks: {e}")
@@ -874,42 +979,31 @@ class HubSpotConnector:
         self,
         contact_id: str,
         limit: int = 10,
+        concurrency: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Get meetings associated with a contact.
         
         Args:
             contact_id: HubSpot contact ID
             limit: Max meetings to return
+            concurrency: Max in-flight detail reads (default: max_concurrency)
             
         Returns:
             List of meeting objects
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
-                response = await client.get(
-                    f"{self.BASE_URL}/crm/v4/objects/contacts/{contact_id}/associations/meetings",
-                    headers=self.headers,
+                objects = await self._get_associated_objects(
+                    client, contact_id, "meetings",
+                    ["hs_meeting_title", "hs_meeting_body", "hs_meeting_outcome", "hs_timestamp"],
                     params={"limit": limit},
+                    semaphore=self._fanout_semaphore(concurrency),
                 )
-                response.raise_for_status()
-                data = response.json()
-                
-                meetings = []
-                for result in data.get("results", []):
-                    meeting_id = result.get("toObjectId")
-                    if meeting_id:
-                        meeting_response = await client.get(
-                            f"{self.BASE_URL}/crm/v3/objects/meetings/{meeting_id}",
-                            headers=self.headers,
-                            params={"properties": "hs_meeting_title,hs_meeting_body,hs_meeting_outcome,hs_timestamp"},
-                        )
-                        if meeting_response.status_code == 200:
-                            meeting_data = meeting_response.json()
-                            meetings.append({
-                                "id": meeting_id,
-                                **meeting_data.get("properties", {}),
-                            })
                 
+                meetings = [
+                    {"id": meeting_id, **meeting_data.get("properties", {})}
+                    for meeting_id, meeting_data in objects
+                ]
                 return meetings[:limit]
                 
             except Exception as e:
@@ -930,7 +1024,7 @@ class HubSpotConnector:
         Returns:
             List of contact objects
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
                 payload = {
                     "filterGroups": [{
@@ -982,7 +1076,7 @@ class HubSpotConnector:
         Returns:
             List of marketing email objects
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
                 # HubSpot Marketing Email API v3
                 url = f"{self.BASE_URL}/marketing/v3/emails"
@@ -1025,7 +1119,7 @@ class HubSpotConnector:
         Returns:
             True if deleted, False on error
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
                 response = await client.delete(
                     f"{self.BASE_URL}/crm/v3/objects/tasks/{task_id}",
@@ -1048,7 +1142,7 @@ class HubSpotConnector:
         Returns:
             Updated task dict or None on error
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
                 response = await client.patch(
                     f"{self.BASE_URL}/crm/v3/objects/tasks/{task_id}",
@@ -1072,7 +1166,7 @@ class HubSpotConnector:
         Returns:
             Updated deal dict or None on error
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
                 response = await client.patch(
                     f"{self.BASE_URL}/crm/v3/objects/deals/{deal_id}",
@@ -1095,7 +1189,7 @@ class HubSpotConnector:
         Returns:
             List of stage dicts with label, displayOrder, etc.
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
                 response = await client.get(
                     f"{self.BASE_URL}/crm/v3/pipelines/deals/{pipeline_id}/stages",
@@ -1117,7 +1211,7 @@ class HubSpotConnector:
         Returns:
             Dict mapping stage_id -> list of deals
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self._session(timeout=30) as client:
             try:
                 response = await client.get(
                     f"{self.BASE_URL}/crm/v3/objects/deals",
@@ -1257,6 +1351,12 @@ class HubSpotBatchOperations:
         self.connector = connector
         self.headers = connector.headers
         self.BASE_URL = connector.BASE_URL
+        self._loaders: Dict[tuple, _BatchLoader] = {}
+    
+    async def _acquire(self) -> None:
+        """Wait for a HubSpot token in the background lane."""
+        with rate_limit_priority(RequestPriority.BACKGROUND):
+            await self.connector.rate_limiter.acquire()
     
     async def create_contact(
         self, 
@@ -1272,7 +1372,7 @@ class HubSpotBatchOperations:
         Returns:
             Contact ID if created, None on error
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self.connector._session(timeout=30) as client:
             try:
                 payload = {
                     "properties": {
@@ -1315,7 +1415,7 @@ class HubSpotBatchOperations:
         Returns:
             True if updated, False on error
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self.connector._session(timeout=30) as client:
             try:
                 payload = {"properties": properties}
                 response = await client.patch(
@@ -1339,7 +1439,7 @@ class HubSpotBatchOperations:
         Returns:
             True if deleted, False on error
         """
-        async with httpx.AsyncClient(timeout=30) as client:
+        async with self.connector._session(timeout=30) as client:
             try:
                 response = await client.delete(
                     f"{self.BASE_URL}/crm/v3/objects/contacts/{contact_id}",
@@ -1368,7 +1468,7 @@ class HubSpotBatchOperations:
         """
         results = {"created": 0, "failed": 0, "errors": [], "contact_ids": []}
         
-        async with httpx.AsyncClient(timeout=60) as client:
+        async with self.connector._session(timeout=60) as client:
             for i in range(0, len(contacts), chunk_size):
                 chunk = contacts[i:i + chunk_size]
                 
@@ -1383,6 +1483,7 @@ class HubSpotBatchOperations:
                     })
                 
                 try:
+                    await self._acquire()
                     response = await client.post(
                         f"{self.BASE_URL}/crm/v3/objects/contacts/batch/create",
                         headers=self.headers,
@@ -1405,9 +1506,6 @@ class HubSpotBatchOperations:
                     results["failed"] += len(chunk)
                     results["errors"].append(str(e))
                     logger.error(f"Batch create error: {e}")
-                
-                # Rate limit protection
-                await asyncio.sleep(0.2)
         
         return results
     
@@ -1427,7 +1525,7 @@ class HubSpotBatchOperations:
         """
         results = {"updated": 0, "failed": 0, "errors": []}
         
-        async with httpx.AsyncClient(timeout=60) as client:
+        async with self.connector._session(timeout=60) as client:
             for i in range(0, len(updates), chunk_size):
                 chunk = updates[i:i + chunk_size]
                 
@@ -1437,6 +1535,7 @@ class HubSpotBatchOperations:
                 ]
                 
                 try:
+                    await self._acquire()
                     response = await client.post(
                         f"{self.BASE_URL}/crm/v3/objects/contacts/batch/update",
                         headers=self.headers,
@@ -1452,8 +1551,6 @@ class HubSpotBatchOperations:
                 except Exception as e:
                     results["failed"] += len(chunk)
                     results["errors"].append(str(e))
-                
-                await asyncio.sleep(0.2)
         
         return results
     
@@ -1478,11 +1575,12 @@ class HubSpotBatchOperations:
         
         all_contacts = []
         
-        async with httpx.AsyncClient(timeout=60) as client:
+        async with self.connector._session(timeout=60) as client:
             for i in range(0, len(contact_ids), chunk_size):
                 chunk = contact_ids[i:i + chunk_size]
                 
                 try:
+                    await self._acquire()
                     response = await client.post(
                         f"{self.BASE_URL}/crm/v3/objects/contacts/batch/read",
                         headers=self.headers,
@@ -1502,11 +1600,237 @@ class HubSpotBatchOperations:
                     
                 except Exception as e:
                     logger.error(f"Batch read error: {e}")
-                
-                await asyncio.sleep(0.1)
         
         return all_contacts
     
+    async def read_objects(
+        self,
+        object_type: str,
+        ids: List[str],
+        properties: Optional[List[str]] = None,
+        id_property: Optional[str] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Read CRM objects by ID through the batch read endpoint.
+        
+        Chunks of up to 100 ids are requested concurrently, bounded by the
+        connector's max_concurrency and the HubSpot token bucket, through
+        the shared circuit breaker.
+        
+        Args:
+            object_type: CRM object type (contacts, companies, deals, ...)
+            ids: Object IDs, or values of ``id_property``
+            properties: Properties to fetch (default: HubSpot's defaults)
+            id_property: Unique property to look objects up by (e.g. "email")
+            
+        Returns:
+            Dict of requested id -> object JSON; ids HubSpot could not
+            find are left out. Email lookups are keyed lowercase.
+        """
+        ids = list(dict.fromkeys(ids))
+        payloads = []
+        for start in range(0, len(ids), BATCH_READ_LIMIT):
+            payload: Dict[str, Any] = {"inputs": [{"id": i} for i in ids[start:start + BATCH_READ_LIMIT]]}
+            if properties is not None:
+                payload["properties"] = properties
+            if id_property:
+                payload["idProperty"] = id_property
+            payloads.append(payload)
+        results = await self._post_chunks(f"/crm/v3/objects/{object_type}/batch/read", payloads)
+        
+        objects: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            if id_property:
+                key = result.get("properties", {}).get(id_property)
+                if key and id_property == "email":
+                    key = key.lower()
+            else:
+                key = result.get("id")
+            if key:
+                objects[key] = result
+        return objects
+    
+    async def read_associations(
+        self,
+        from_type: str,
+        to_type: str,
+        ids: List[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Read associations for many objects through the batch endpoint.
+        
+        Args:
+            from_type: Source object type (e.g. "contacts")
+            to_type: Associated object type (e.g. "companies")
+            ids: Source object IDs
+            
+        Returns:
+            Dict of source id -> associations in the same shape as
+            HubSpotConnector.get_contact_associations ({"id", "type"});
+            ids without associations map to an empty list
+        """
+        ids = list(dict.fromkeys(ids))
+        results = await self._post_chunks(
+            f"/crm/v3/associations/{from_type}/{to_type}/batch/read",
+            [
+                {"inputs": [{"id": i} for i in ids[start:start + BATCH_READ_LIMIT]]}
+                for start in range(0, len(ids), BATCH_READ_LIMIT)
+            ],
+        )
+        
+        associations: Dict[str, List[Dict[str, Any]]] = {i: [] for i in ids}
+        for result in results:
+            from_id = str(result.get("from", {}).get("id"))
+            associations.setdefault(from_id, []).extend(result.get("to", []))
+        return associations
+    
+    async def _post_chunks(self, path: str, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """POST batch payloads concurrently and return their combined results.
+        
+        Each request is bounded by the connector's fan-out semaphore and
+        token bucket and goes through the shared circuit breaker, like the
+        connector's single-object reads.
+        """
+        semaphore = self.connector._fanout_semaphore()
+        
+        async def post(client: TransportSession, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                await self.connector.rate_limiter.acquire()
+                response = await client.post(f"{self.BASE_URL}{path}", headers=self.headers, json=payload)
+            response.raise_for_status()
+            return response.json().get("results", [])
+        
+        async with self.connector._session(timeout=60) as client:
+            chunks = await _gather_or_cancel([
+                self.connector._breaker_call(post, client, payload) for payload in payloads
+            ])
+        return [result for chunk in chunks for result in chunk]
+    
+    def _loader(self, key: tuple, batch_fn) -> _BatchLoader:
+        loader = self._loaders.get(key)
+        if loader is None:
+            loader = self._loaders[key] = _BatchLoader(batch_fn)
+        return loader
+    
+    async def _load_object(
+        self,
+        object_type: str,
+        key: str,
+        properties: Optional[List[str]] = None,
+        id_property: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        props = tuple(properties) if properties is not None else None
+        loader = self._loader(
+            ("objects", object_type, props, id_property),
+            lambda ids: self.read_objects(object_type, ids, properties, id_property),
+        )
+        try:
+            return await loader.load(key)
+        except Exception as e:
+            logger.error(f"Error batch loading {object_type} {key}: {e}")
+            return None
+    
+    async def load_contact(
+        self,
+        contact_id: str,
+        properties: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a contact, coalesced with concurrent loads into one batch read.
+        
+        Args:
+            contact_id: HubSpot contact ID
+            properties: Properties to fetch (default: HubSpot's defaults)
+            
+        Returns:
+            Contact object JSON, or None if not found or on error
+        """
+        return await self._load_object("contacts", contact_id, properties)
+    
+    async def load_contact_by_email(
+        self,
+        email: str,
+        properties: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Find a contact by email, coalesced with concurrent lookups.
+        
+        Backs HubSpotConnector.search_contacts.
+        
+        Args:
+            email: Contact email address
+            properties: Properties to fetch (default: HubSpot's defaults)
+            
+        Returns:
+            Contact object JSON, or None if not found or on error
+        """
+        if not email:
+            return None
+        return await self._load_object("contacts", email.lower(), properties, id_property="email")
+    
+    async def load_company(
+        self,
+        company_id: str,
+        properties: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get a company, coalesced with concurrent loads into one batch read.
+        
+        Args:
+            company_id: HubSpot company ID
+            properties: Properties to fetch (default: HubSpot's defaults)
+            
+        Returns:
+            Company object JSON, or None if not found or on error
+        """
+        return await self._load_object("companies", company_id, properties)
+    
+    async def load_associations(
+        self,
+        contact_id: str,
+        to_type: str = "companies",
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get a contact's associations, coalesced with concurrent loads.
+        
+        Backs HubSpotConnector.get_contact_associations.
+        
+        Args:
+            contact_id: HubSpot contact ID
+            to_type: Associated object type
+            
+        Returns:
+            List of {"id", "type"} associations, or None on error
+        """
+        loader = self._loader(
+            ("associations", "contacts", to_type),
+            lambda ids: self.read_associations("contacts", to_type, ids),
+        )
+        try:
+            return await loader.load(contact_id)
+        except Exception as e:
+            logger.error(f"Error batch loading {to_type} associations for contact {contact_id}: {e}")
+            return None
+    
+    async def load_contact_companies(
+        self,
+        contact_id: str,
+        properties: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the companies associated with a contact.
+        
+        Batched replacement for the get_contact_associations -> get_company
+        chain: both hops go through coalescing loaders, so concurrent callers
+        share one associations call and one company batch read.
+        
+        Args:
+            contact_id: HubSpot contact ID
+            properties: Company properties to fetch
+            
+        Returns:
+            Company object JSON in association order
+        """
+        associations = await self.load_associations(contact_id, "companies") or []
+        companies = await asyncio.gather(*(
+            self.load_company(str(a["id"]), properties)
+            for a in associations if a.get("id")
+        ))
+        return [c for c in companies if c]
+    
     async def get_all_contacts_paginated(
         self,
         properties: List[str] = None,
@@ -1530,7 +1854,7 @@ class HubSpotBatchOperations:
         contacts = []
         next_cursor = after
         
-        async with httpx.AsyncClient(timeout=60) as client:
+        async with self.connector._session(timeout=60) as client:
             while len(contacts) < limit:
                 params = {
                     "limit": min(100, limit - len(contacts)),
@@ -1540,6 +1864,7 @@ class HubSpotBatchOperations:
                     params["after"] = next_cursor
                 
                 try:
+                    await self._acquire()
                     response = await client.get(
                         f"{self.BASE_URL}/crm/v3/objects/contacts",
                         headers=self.headers,
@@ -1563,8 +1888,6 @@ class HubSpotBatchOperations:
                 except Exception as e:
                     logger.error(f"Pagination error: {e}")
                     break
-                
-                await asyncio.sleep(0.1)
         
         logger.info(f"Retrieved {len(contacts)} contacts via pagination")
         return {
@@ -1593,7 +1916,7 @@ class HubSpotBatchOperations:
         
         modified_contacts = []
         
-        async with httpx.AsyncClient(timeout=60) as client:
+        async with self.connector._session(timeout=60) as client:
             after = None
             
             while True:
@@ -1613,6 +1936,7 @@ class HubSpotBatchOperations:
                     payload["after"] = after
                 
                 try:
+                    await self._acquire()
                     response = await client.post(
                         f"{self.BASE_URL}/crm/v3/objects/contacts/search",
                         headers=self.headers,
@@ -1636,8 +1960,6 @@ class HubSpotBatchOperations:
                 except Exception as e:
                     logger.error(f"Delta sync error: {e}")
                     break
-                
-                await asyncio.sleep(0.1)
         
         logger.info(f"Delta sync found {len(modified_contacts)} modified contacts since {since_timestamp}")
         return modified_contacts
@@ -1651,7 +1973,7 @@ def get_batch_operations() -> Optional[HubSpotBatchOperations]:
     """Get batch operations helper."""
     connector = get_hubspot_connector()
     if connector:
-        return HubSpotBatchOperations(connector)
+        return connector.batch
     return None
 
 
@@ -8,6 +8,7 @@ from src.deduplication.dedup_engine import (
     MatchConfidence,
     get_dedup_engine,
 )
+from src.deduplication.blocking import BlockingStats
 
 __all__ = [
     "DeduplicationEngine",
@@ -16,4 +17,5 @@ __all__ = [
     "DeduplicationRule",
     "MatchConfidence",
     "get_dedup_engine",
+    "BlockingStats",
 ]
@@ -13,6 +13,9 @@ from enum import Enum
 from typing import Optional
 import structlog
 
+from src.deduplication.blocking import BlockingStats, generate_candidate_pairs, qgrams
+from src.deduplication.parallel import score_pairs_parallel
+
 logger = structlog.get_logger(__name__)
 
 
@@ -106,6 +109,7 @@ class DeduplicationEngine:
         self.rules: list[DeduplicationRule] = []
         self.pending_matches: list[DuplicateMatch] = []
         self.merge_history: list[MergeResult] = []
+        self.last_blocking_stats: Optional[BlockingStats] = None
         self._setup_default_rules()
     
     def _setup_default_rules(self) -> None:
@@ -198,8 +202,14 @@ class DeduplicationEngine:
         self,
         contact_1: dict,
         contact_2: dict,
+        filled_counts: Optional[tuple[int, int]] = None,
     ) -> Optional[DuplicateMatch]:
-        """Compare two contacts for duplicate detection."""
+        """
+        Compare two contacts for duplicate detection.
+        
+        filled_counts optionally carries precomputed non-empty field counts
+        for master selection, for callers that pass trimmed contact dicts.
+        """
         total_weight = 0
         total_score = 0
         matched_fields = []
@@ -241,10 +251,10 @@ class DeduplicationEngine:
         # Determine recommended action
         if confidence == MatchConfidence.EXACT:
             action = "merge"
-            master = self._determine_master(contact_1, contact_2)
+            master = self._determine_master(contact_1, contact_2, filled_counts)
         elif confidence == MatchConfidence.HIGH:
             action = "review"
-            master = self._determine_master(contact_1, contact_2)
+            master = self._determine_master(contact_1, contact_2, filled_counts)
         else:
             action = "review"
             master = None
@@ -345,11 +355,15 @@ class DeduplicationEngine:
         self,
         contact_1: dict,
         contact_2: dict,
+        filled_counts: Optional[tuple[int, int]] = None,
     ) -> str:
         """Determine which record should be the master."""
         # Prefer the record with more data
-        score_1 = sum(1 for v in contact_1.values() if v)
-        score_2 = sum(1 for v in contact_2.values() if v)
+        if filled_counts:
+            score_1, score_2 = filled_counts
+        else:
+            score_1 = sum(1 for v in contact_1.values() if v)
+            score_2 = sum(1 for v in contact_2.values() if v)
         
         if score_1 > score_2:
             return contact_1.get("id")
@@ -458,33 +472,60 @@ class DeduplicationEngine:
         self,
         contacts: list[dict],
         threshold: float = 70.0,
+        use_blocking: bool = True,
+        window: int = 5,
+        max_block_size: int = 100,
+        workers: int = 1,
+        chunk_size: int = 5000,
     ) -> list[DuplicateMatch]:
         """
         Run deduplication across all contacts.
         
+        With blocking enabled, only candidate pairs that share a blocking
+        key (see _blocking_keys) or sit close together in name order are
+        compared, instead of every pair. With workers > 1, pairs are scored
+        in a process pool; results are identical to a serial run.
+        
         Args:
             contacts: List of all contacts
             threshold: Minimum score to consider a match
+            use_blocking: Compare candidate pairs only (False compares all pairs)
+            window: Sorted-neighbourhood window for fuzzy rule fields
+            max_block_size: Blocks larger than this are skipped, except
+                those of exact and normalized rule values
+            workers: Worker processes used to score pairs
+            chunk_size: Pairs per worker task
         
         Returns:
             List of all detected duplicates
         """
         all_matches = []
-        checked_pairs = set()
         
-        for i, contact in enumerate(contacts):
-            for j, other in enumerate(contacts[i + 1:], i + 1):
-                pair_key = tuple(sorted([
-                    contact.get("id", str(i)),
-                    other.get("id", str(j))
-                ]))
-                
-                if pair_key in checked_pairs:
-                    continue
-                
-                checked_pairs.add(pair_key)
-                
-                match = self._compare_contacts(contact, other)
+        if use_blocking:
+            pairs, stats = self.candidate_pairs(
+                contacts, window=window, max_block_size=max_block_size,
+            )
+        else:
+            pairs = self._all_pairs(contacts)
+            stats = BlockingStats(
+                records=len(contacts),
+                total_pairs=len(pairs),
+                candidate_pairs=len(pairs),
+            )
+        self.last_blocking_stats = stats
+        
+        if workers > 1 and len(pairs) > chunk_size:
+            all_matches = score_pairs_parallel(
+                self.rules,
+                contacts,
+                pairs,
+                threshold=threshold,
+                workers=workers,
+                chunk_size=chunk_size,
+            )
+        else:
+            for i, j in pairs:
+                match = self._compare_contacts(contacts[i], contacts[j])
                 if match and match.score >= threshold:
                     all_matches.append(match)
         
@@ -496,11 +537,141 @@ class DeduplicationEngine:
         logger.info(
             "bulk_deduplication_complete",
             contacts_checked=len(contacts),
+            pairs_compared=stats.candidate_pairs,
+            pair_reduction_ratio=round(stats.reduction_ratio, 4),
             duplicates_found=len(all_matches),
+            workers=workers,
         )
         
         return all_matches
     
+    def _all_pairs(self, contacts: list[dict]) -> list[tuple[int, int]]:
+        """All index pairs, skipping repeated contact id pairs."""
+        pairs = []
+        checked_pairs = set()
+        
+        for i, contact in enumerate(contacts):
+            for j in range(i + 1, len(contacts)):
+                pair_key = tuple(sorted([
+                    contact.get("id", str(i)),
+                    contacts[j].get("id", str(j))
+                ]))
+                
+                if pair_key in checked_pairs:
+                    continue
+                
+                checked_pairs.add(pair_key)
+                pairs.append((i, j))
+        
+        return pairs
+    
+    def candidate_pairs(
+        self,
+        contacts: list[dict],
+        window: int = 5,
+        max_block_size: int = 100,
+    ) -> tuple[list[tuple[int, int]], BlockingStats]:
+        """
+        Generate candidate contact index pairs for comparison.
+        
+        Blocks of exact and normalized rule values are never capped by
+        ``max_block_size``: every pair in them is a match by definition.
+        
+        Returns:
+            Tuple of (sorted (i, j) index pairs, blocking statistics)
+        """
+        fuzzy_fields = sorted({
+            r.field for r in self.rules if r.is_active and r.match_type == "fuzzy"
+        })
+        
+        block_keys = [self._blocking_keys(contact) for contact in contacts]
+        
+        # Sorted neighbourhood on each fuzzy field, in natural and
+        # reversed-token order so typos near the start are also caught
+        sort_keys = []
+        for field_name in fuzzy_fields:
+            forward = []
+            backward = []
+            for contact in contacts:
+                value = contact.get(field_name)
+                norm = self._normalize_value(value, field_name) if isinstance(value, str) else ""
+                forward.append(norm)
+                backward.append(" ".join(reversed(norm.split())))
+            sort_keys.extend([forward, backward])
+        
+        pairs, stats = generate_candidate_pairs(
+            block_keys,
+            sort_keys=sort_keys,
+            window=window,
+            max_block_size=max_block_size,
+            uncapped_prefixes=tuple(
+                f"{r.id}:" for r in self.rules
+                if r.is_active and r.match_type in ("exact", "normalized")
+            ),
+        )
+        
+        logger.debug("dedup_blocking_complete", **stats.to_dict())
+        
+        return pairs, stats
+    
+    def _fuzzy_keys(self, value: str) -> set[str]:
+        """
+        Blocking keys for a fuzzy-matched value such as a name.
+        
+        Uses the last token, each token paired with a prefix of the other,
+        and q-grams of the last token anchored on the first initial, so
+        single-character typos in either token still share a key.
+        """
+        tokens = value.split()
+        if not tokens:
+            return set()
+        first, last = tokens[0], tokens[-1]
+        keys = {
+            f"l:{last}",
+            f"ft:{first}|{last[:2]}",
+            f"lt:{first[:1]}|{last}",
+        }
+        keys.update(f"q:{first[:1]}|{gram}" for gram in qgrams(last))
+        return keys
+    
+    def _blocking_keys(self, contact: dict) -> set[str]:
+        """
+        Blocking keys for a contact.
+        
+        Every active exact/normalized/domain rule contributes its normalized
+        value, so pairs those rules would match always share a block (domain
+        blocks are still subject to the block size cap). Email domain and
+        name q-grams add candidates for fuzzy matches.
+        """
+        keys = set()
+        
+        for rule in self.rules:
+            if not rule.is_active:
+                continue
+            value = contact.get(rule.field)
+            if not value or not isinstance(value, str):
+                continue
+            
+            if rule.match_type == "exact":
+                keys.add(f"{rule.id}:{value.lower()}")
+            elif rule.match_type == "normalized":
+                norm = self._normalize_value(value, rule.field)
+                if norm:
+                    keys.add(f"{rule.id}:{norm}")
+            elif rule.match_type == "domain":
+                keys.add(f"{rule.id}:{self._extract_domain(value)}")
+            elif rule.match_type == "fuzzy":
+                keys.update(
+                    f"{rule.id}:{key}"
+                    for key in self._fuzzy_keys(self._normalize_value(value, rule.field))
+                )
+        
+        email = contact.get("email")
+        if email and isinstance(email, str) and "@" in email:
+            keys.add(f"email_domain:{self._extract_domain(email)}")
+        
+        return keys
+    
     def get_pending_matches(
         self,
         confidence: MatchConfidence = None,
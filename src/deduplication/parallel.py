@@ -0,0 +1,130 @@
+"""
+Parallel Pair Scoring
+=====================
+Scores candidate contact pairs across worker processes.
+
+Pair scoring is pure-Python string work (normalization, SequenceMatcher),
+so it is CPU bound and does not benefit from threads. Candidate pairs are
+split into chunks; each chunk ships only the records it references, packed
+as compact tuples of the fields the active rules read, to a
+ProcessPoolExecutor. Chunks are consumed in submission order, so results
+come back in the same order as a serial run.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Packed record: (id, non-empty field count, *rule field values)
+PackedContact = tuple
+
+_worker_engine = None
+
+
+def pack_contact(contact: dict, fields: list[str]) -> PackedContact:
+    """Pack the fields needed for scoring into a compact tuple."""
+    filled = sum(1 for v in contact.values() if v)
+    return (contact.get("id"), filled, *(contact.get(f) for f in fields))
+
+
+def _unpack_contact(record: PackedContact, fields: list[str]) -> dict:
+    contact = {f: v for f, v in zip(fields, record[2:]) if v is not None}
+    if record[0] is not None:
+        contact["id"] = record[0]
+    return contact
+
+
+def _init_worker(rules: list) -> None:
+    """Create the per-process engine used to score chunks."""
+    global _worker_engine
+    from src.deduplication.dedup_engine import DeduplicationEngine
+
+    _worker_engine = DeduplicationEngine()
+    _worker_engine.rules = rules
+
+
+def _score_chunk(
+    fields: list[str],
+    records: dict[int, PackedContact],
+    pairs: list[tuple[int, int]],
+    threshold: float,
+) -> list:
+    """Score one chunk of pairs in a worker process."""
+    contacts = {index: _unpack_contact(record, fields) for index, record in records.items()}
+    matches = []
+    for i, j in pairs:
+        match = _worker_engine._compare_contacts(
+            contacts[i],
+            contacts[j],
+            filled_counts=(records[i][1], records[j][1]),
+        )
+        if match and match.score >= threshold:
+            matches.append(match)
+    return matches
+
+
+def _chunks(
+    packed: list[PackedContact],
+    pairs: list[tuple[int, int]],
+    chunk_size: int,
+) -> Iterator[tuple[dict[int, PackedContact], list[tuple[int, int]]]]:
+    for start in range(0, len(pairs), chunk_size):
+        chunk = pairs[start:start + chunk_size]
+        records = {}
+        for i, j in chunk:
+            records[i] = packed[i]
+            records[j] = packed[j]
+        yield records, chunk
+
+
+def score_pairs_parallel(
+    rules: list,
+    contacts: list[dict],
+    pairs: list[tuple[int, int]],
+    threshold: float,
+    workers: int,
+    chunk_size: int = 5000,
+) -> list:
+    """
+    Score candidate pairs across worker processes.
+
+    Args:
+        rules: Deduplication rules to apply (active ones are used)
+        contacts: All contacts, indexed by the pair indexes
+        pairs: Candidate (i, j) index pairs
+        threshold: Minimum score to keep a match
+        workers: Number of worker processes
+        chunk_size: Pairs per task sent to a worker
+
+    Returns:
+        Matches at or above threshold, in pair order
+    """
+    active_rules = [r for r in rules if r.is_active]
+    fields = sorted({r.field for r in active_rules})
+    packed = [pack_contact(contact, fields) for contact in contacts]
+
+    tasks = list(_chunks(packed, pairs, chunk_size))
+    logger.info(
+        "dedup_parallel_scoring_started",
+        pairs=len(pairs),
+        chunks=len(tasks),
+        workers=workers,
+    )
+
+    matches = []
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(active_rules,),
+    ) as executor:
+        futures = [
+            executor.submit(_score_chunk, fields, records, chunk, threshold)
+            for records, chunk in tasks
+        ]
+        for future in futures:
+            matches.extend(future.result())
+
+    return matches
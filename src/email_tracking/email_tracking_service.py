@@ -2,15 +2,28 @@
 Email Tracking Service - Email Engagement Tracking
 ==================================================
 Handles email opens, clicks, replies, and engagement analytics.
+
+Statistics are read from aggregates kept up to date as events are
+recorded, instead of rescanning every EmailTrack per dashboard request:
+
+- counters per (user, campaign, sequence, day the email was created)
+- link clicks and unique clickers per (campaign, sequence, URL)
+- open device counts per campaign
+
+Date-range queries add up whole-day buckets and scan only the emails of
+the (possibly partial) first and last day, so results match a full scan.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from enum import Enum
 from typing import Any, Optional
 import uuid
 import hashlib
 
+from .unique_counter import UniqueCounter
+
 
 class EmailStatus(str, Enum):
     """Email delivery status."""
@@ -159,6 +172,45 @@ class EmailTrack:
     created_at: datetime = field(default_factory=datetime.utcnow)
 
 
+@dataclass
+class StatsBucket:
+    """Email counters for one (user, campaign, sequence, day) bucket."""
+    sent: int = 0
+    delivered: int = 0
+    opened: int = 0
+    clicked: int = 0
+    replied: int = 0
+    bounced: int = 0
+    total_opens: int = 0
+    total_clicks: int = 0
+    
+    def add(self, email: EmailTrack, sign: int = 1) -> None:
+        """Add (or with ``sign=-1`` remove) one email's contribution."""
+        self.sent += sign
+        self.delivered += sign * (email.status not in (EmailStatus.QUEUED, EmailStatus.BOUNCED))
+        self.opened += sign * (email.open_count > 0)
+        self.clicked += sign * (email.click_count > 0)
+        self.replied += sign * (email.replied_at is not None)
+        self.bounced += sign * (email.status == EmailStatus.BOUNCED)
+        self.total_opens += sign * email.open_count
+        self.total_clicks += sign * email.click_count
+    
+    def merge(self, other: "StatsBucket") -> None:
+        """Add another bucket's counters to this one."""
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+
+@dataclass
+class LinkStats:
+    """Clicks on one URL within a (campaign, sequence)."""
+    clicks: int = 0
+    clickers: UniqueCounter = field(default_factory=UniqueCounter)
+
+
+BucketKey = tuple[Optional[str], Optional[str], Optional[str], date]
+
+
 class EmailTrackingService:
     """Service for email tracking."""
     
@@ -166,6 +218,12 @@ class EmailTrackingService:
         self.emails: dict[str, EmailTrack] = {}
         self.open_tracking_map: dict[str, str] = {}  # tracking_id -> email_id
         self.click_tracking_map: dict[str, str] = {}  # tracking_id -> email_id
+        
+        # Aggregates (see module docstring)
+        self._buckets: dict[BucketKey, StatsBucket] = {}
+        self._emails_by_day: dict[date, list[str]] = defaultdict(list)
+        self._links: dict[tuple[Optional[str], Optional[str]], dict[str, LinkStats]] = defaultdict(dict)
+        self._devices: dict[Optional[str], dict[str, int]] = defaultdict(dict)
     
     # Email tracking CRUD
     async def create_tracking(
@@ -198,6 +256,8 @@ class EmailTrackingService:
         self.emails[email.id] = email
         self.open_tracking_map[email.open_tracking_id] = email.id
         self.click_tracking_map[email.click_tracking_id] = email.id
+        self._emails_by_day[email.created_at.date()].append(email.id)
+        self._count(email)
         
         return email
     
@@ -257,8 +317,10 @@ class EmailTrackingService:
         if not email:
             return None
         
+        self._count(email, -1)
         email.status = EmailStatus.SENT
         email.sent_at = datetime.utcnow()
+        self._count(email)
         
         return email
     
@@ -268,8 +330,10 @@ class EmailTrackingService:
         if not email:
             return None
         
+        self._count(email, -1)
         email.status = EmailStatus.DELIVERED
         email.delivered_at = datetime.utcnow()
+        self._count(email)
         
         return email
     
@@ -300,6 +364,7 @@ class EmailTrackingService:
             device_type=device_type,
         )
         
+        self._count(email, -1)
         email.opens.append(open_event)
         email.open_count += 1
         
@@ -308,6 +373,8 @@ class EmailTrackingService:
             email.status = EmailStatus.OPENED
         
         email.last_opened_at = open_event.opened_at
+        self._count(email)
+        self._count_open(email, open_event)
         
         return open_event
     
@@ -358,6 +425,7 @@ class EmailTrackingService:
             device_type=device_type,
         )
         
+        self._count(email, -1)
         email.clicks.append(click_event)
         email.click_count += 1
         
@@ -368,6 +436,8 @@ class EmailTrackingService:
         if not email.first_clicked_at:
             email.first_clicked_at = click_event.clicked_at
             email.status = EmailStatus.CLICKED
+        self._count(email)
+        self._count_click(email, click_event)
         
         return click_event
     
@@ -396,11 +466,13 @@ class EmailTrackingService:
             message_id=message_id,
         )
         
+        self._count(email, -1)
         email.replies.append(reply_event)
         
         if not email.replied_at and not is_auto_reply:
             email.replied_at = reply_event.replied_at
             email.status = EmailStatus.REPLIED
+        self._count(email)
         
         return reply_event
     
@@ -425,9 +497,11 @@ class EmailTrackingService:
             diagnostic_code=diagnostic_code,
         )
         
+        self._count(email, -1)
         email.bounce = bounce
         email.bounced_at = bounce.bounced_at
         email.status = EmailStatus.BOUNCED
+        self._count(email)
         
         return bounce
     
@@ -438,7 +512,9 @@ class EmailTrackingService:
         if not email:
             return False
         
+        self._count(email, -1)
         email.status = EmailStatus.UNSUBSCRIBED
+        self._count(email)
         return True
     
     # Complaint
@@ -448,7 +524,9 @@ class EmailTrackingService:
         if not email:
             return False
         
+        self._count(email, -1)
         email.status = EmailStatus.COMPLAINED
+        self._count(email)
         return True
     
     # Analytics
@@ -461,16 +539,32 @@ class EmailTrackingService:
         to_date: Optional[datetime] = None
     ) -> dict[str, Any]:
         """Get email statistics."""
-        emails, _ = await self.list_tracking(
-            user_id=user_id,
-            campaign_id=campaign_id,
-            sequence_id=sequence_id,
-            from_date=from_date,
-            to_date=to_date,
-            limit=100000
-        )
-        
-        total = len(emails)
+        first_day = from_date.date() if from_date else None
+        last_day = to_date.date() if to_date else None
+        edge_days = {day for day in (first_day, last_day) if day is not None}
+        
+        totals = StatsBucket()
+        for key, bucket in self._buckets.items():
+            day = key[3]
+            if (
+                self._key_matches(key, user_id, campaign_id, sequence_id)
+                and day not in edge_days
+                and (first_day is None or day > first_day)
+                and (last_day is None or day < last_day)
+            ):
+                totals.merge(bucket)
+        
+        # First and last days may be partial: check each email's timestamp
+        for day in edge_days:
+            for email in self._emails_on(day):
+                if (
+                    self._key_matches(self._bucket_key(email), user_id, campaign_id, sequence_id)
+                    and (from_date is None or email.created_at >= from_date)
+                    and (to_date is None or email.created_at <= to_date)
+                ):
+                    totals.add(email)
+        
+        total = totals.sent
         if total == 0:
             return {
                 "total_sent": 0,
@@ -485,11 +579,11 @@ class EmailTrackingService:
                 "bounce_rate": 0,
             }
         
-        delivered = len([e for e in emails if e.status not in [EmailStatus.QUEUED, EmailStatus.BOUNCED]])
-        opened = len([e for e in emails if e.open_count > 0])
-        clicked = len([e for e in emails if e.click_count > 0])
-        replied = len([e for e in emails if e.replied_at])
-        bounced = len([e for e in emails if e.status == EmailStatus.BOUNCED])
+        delivered = totals.delivered
+        opened = totals.opened
+        clicked = totals.clicked
+        replied = totals.replied
+        bounced = totals.bounced
         
         return {
             "total_sent": total,
@@ -502,8 +596,8 @@ class EmailTrackingService:
             "click_rate": (clicked / opened * 100) if opened > 0 else 0,
             "reply_rate": (replied / delivered * 100) if delivered > 0 else 0,
             "bounce_rate": (bounced / total * 100) if total > 0 else 0,
-            "total_opens": sum(e.open_count for e in emails),
-            "total_clicks": sum(e.click_count for e in emails),
+            "total_opens": totals.total_opens,
+            "total_clicks": totals.total_clicks,
         }
     
     async def get_link_performance(
@@ -511,36 +605,30 @@ class EmailTrackingService:
         campaign_id: Optional[str] = None,
         sequence_id: Optional[str] = None
     ) -> list[dict[str, Any]]:
-        """Get link click performance."""
-        emails, _ = await self.list_tracking(
-            campaign_id=campaign_id,
-            sequence_id=sequence_id,
-            limit=100000
-        )
-        
-        link_stats: dict[str, dict[str, Any]] = {}
-        
-        for email in emails:
-            for click in email.clicks:
-                url = click.url
-                if url not in link_stats:
-                    link_stats[url] = {
-                        "url": url,
-                        "clicks": 0,
-                        "unique_clickers": set(),
-                    }
-                
-                link_stats[url]["clicks"] += 1
-                if email.contact_id:
-                    link_stats[url]["unique_clickers"].add(email.contact_id)
+        """Get link click performance.
+        
+        ``unique_clickers`` counts distinct contacts; it is exact up to
+        UniqueCounter's limit and an estimate past it.
+        """
+        link_stats: dict[str, LinkStats] = {}
+        
+        for (link_campaign_id, link_sequence_id), links in self._links.items():
+            if campaign_id and link_campaign_id != campaign_id:
+                continue
+            if sequence_id and link_sequence_id != sequence_id:
+                continue
+            for url, stats in links.items():
+                merged = link_stats.setdefault(url, LinkStats())
+                merged.clicks += stats.clicks
+                merged.clickers.update(stats.clickers)
         
         return [
             {
-                "url": stats["url"],
-                "clicks": stats["clicks"],
-                "unique_clickers": len(stats["unique_clickers"]),
+                "url": url,
+                "clicks": stats.clicks,
+                "unique_clickers": len(stats.clickers),
             }
-            for stats in sorted(link_stats.values(), key=lambda x: x["clicks"], reverse=True)
+            for url, stats in sorted(link_stats.items(), key=lambda x: (-x[1].clicks, x[0]))
         ]
     
     async def get_daily_stats(
@@ -550,12 +638,7 @@ class EmailTrackingService:
     ) -> list[dict[str, Any]]:
         """Get daily email stats."""
         from_date = datetime.utcnow() - timedelta(days=days)
-        
-        emails, _ = await self.list_tracking(
-            user_id=user_id,
-            from_date=from_date,
-            limit=100000
-        )
+        first_day = from_date.date()
         
         daily: dict[str, dict[str, int]] = {}
         
@@ -563,16 +646,23 @@ class EmailTrackingService:
             date = (from_date + timedelta(days=i)).strftime("%Y-%m-%d")
             daily[date] = {"sent": 0, "opened": 0, "clicked": 0, "replied": 0}
         
-        for email in emails:
-            date = email.created_at.strftime("%Y-%m-%d")
-            if date in daily:
-                daily[date]["sent"] += 1
-                if email.open_count > 0:
-                    daily[date]["opened"] += 1
-                if email.click_count > 0:
-                    daily[date]["clicked"] += 1
-                if email.replied_at:
-                    daily[date]["replied"] += 1
+        def add(day: str, counts: StatsBucket) -> None:
+            if day in daily:
+                daily[day]["sent"] += counts.sent
+                daily[day]["opened"] += counts.opened
+                daily[day]["clicked"] += counts.clicked
+                daily[day]["replied"] += counts.replied
+        
+        for key, bucket in self._buckets.items():
+            if key[3] > first_day and (not user_id or key[0] == user_id):
+                add(key[3].strftime("%Y-%m-%d"), bucket)
+        
+        # The first day is partial
+        first = StatsBucket()
+        for email in self._emails_on(first_day):
+            if email.created_at >= from_date and (not user_id or email.user_id == user_id):
+                first.add(email)
+        add(first_day.strftime("%Y-%m-%d"), first)
         
         return [
             {"date": date, **stats}
@@ -584,20 +674,82 @@ class EmailTrackingService:
         campaign_id: Optional[str] = None
     ) -> dict[str, int]:
         """Get device type breakdown for opens."""
-        emails, _ = await self.list_tracking(
-            campaign_id=campaign_id,
-            limit=100000
-        )
+        if campaign_id:
+            return dict(self._devices.get(campaign_id, {}))
         
         devices: dict[str, int] = {}
         
-        for email in emails:
-            for open_event in email.opens:
-                device = open_event.device_type or "unknown"
-                devices[device] = devices.get(device, 0) + 1
+        for campaign_devices in self._devices.values():
+            for device, count in campaign_devices.items():
+                devices[device] = devices.get(device, 0) + count
         
         return devices
     
+    def rebuild_stats(self) -> None:
+        """Recompute every aggregate from the tracked emails.
+        
+        Needed only if EmailTrack records are changed other than through
+        this service (e.g. loaded in bulk).
+        """
+        self._buckets = {}
+        self._emails_by_day = defaultdict(list)
+        self._links = defaultdict(dict)
+        self._devices = defaultdict(dict)
+        
+        for email in self.emails.values():
+            self._emails_by_day[email.created_at.date()].append(email.id)
+            self._count(email)
+            for open_event in email.opens:
+                self._count_open(email, open_event)
+            for click in email.clicks:
+                self._count_click(email, click)
+    
+    # Aggregate maintenance
+    def _bucket_key(self, email: EmailTrack) -> BucketKey:
+        return (email.user_id, email.campaign_id, email.sequence_id, email.created_at.date())
+    
+    def _key_matches(
+        self,
+        key: BucketKey,
+        user_id: Optional[str],
+        campaign_id: Optional[str],
+        sequence_id: Optional[str],
+    ) -> bool:
+        """Same filter semantics as list_tracking (empty filters match all)."""
+        return (
+            (not user_id or key[0] == user_id)
+            and (not campaign_id or key[1] == campaign_id)
+            and (not sequence_id or key[2] == sequence_id)
+        )
+    
+    def _emails_on(self, day: date) -> list[EmailTrack]:
+        return [self.emails[email_id] for email_id in self._emails_by_day.get(day, [])]
+    
+    def _count(self, email: EmailTrack, sign: int = 1) -> None:
+        """Add (or remove) an email's current state to its bucket.
+        
+        Callers remove the email before changing it and add it back after.
+        """
+        key = self._bucket_key(email)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = StatsBucket()
+        bucket.add(email, sign)
+    
+    def _count_open(self, email: EmailTrack, open_event: EmailOpen) -> None:
+        devices = self._devices[email.campaign_id]
+        device = open_event.device_type or "unknown"
+        devices[device] = devices.get(device, 0) + 1
+    
+    def _count_click(self, email: EmailTrack, click: EmailClick) -> None:
+        links = self._links[(email.campaign_id, email.sequence_id)]
+        stats = links.get(click.url)
+        if stats is None:
+            stats = links[click.url] = LinkStats()
+        stats.clicks += 1
+        if email.contact_id:
+            stats.clickers.add(email.contact_id)
+    
     def _detect_device(self, user_agent: Optional[str]) -> Optional[str]:
         """Detect device type from user agent."""
         if not user_agent:
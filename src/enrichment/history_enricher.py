@@ -5,6 +5,7 @@ Aggregates past deals, meetings, calls, and emails
 to build a relationship summary for each contact.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
@@ -93,17 +94,14 @@ class HistoryEnricher:
             
             contact_id = contact.get("id") or contact.get("hs_object_id")
             
-            # Get engagement history
-            await self._enrich_engagements(summary, contact_id)
-            
-            # Get deals
-            await self._enrich_deals(summary, contact_id)
-            
-            # Get notes
-            await self._enrich_notes(summary, contact_id)
-            
-            # Get tasks
-            await self._enrich_tasks(summary, contact_id)
+            # Fetch engagements, deals, notes and tasks concurrently; each
+            # step fills its own part of the summary
+            await asyncio.gather(
+                self._enrich_engagements(summary, contact_id),
+                self._enrich_deals(summary, contact_id),
+                self._enrich_notes(summary, contact_id),
+                self._enrich_tasks(summary, contact_id),
+            )
             
             # Calculate relationship stage
             summary.relationship_stage = self._determine_stage(summary)
@@ -2,26 +2,45 @@
 Export Service - Data Export Functionality
 ==========================================
 Export contacts, companies, deals, and other data.
+
+Exports are streamed: rows come from an async generator and are written
+in batches to a spooled temp file (in memory up to SPOOL_MAX_BYTES, then
+on disk), and downloads stream that file back in chunks.
 """
 
 import asyncio
 import csv
-import io
 import json
 import logging
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Optional
+from typing import IO, Any, AsyncIterator, Iterator, Optional
 from uuid import uuid4
 
+from src.exports.writers import (
+    CSVExportWriter,
+    ExportWriter,
+    JSONExportWriter,
+    NDJSONExportWriter,
+    XLSXExportWriter,
+)
+
 logger = logging.getLogger(__name__)
 
+# Rows written (and progress reported) per batch
+EXPORT_BATCH_ROWS = 500
+# Export files larger than this roll over from memory to a temp file on disk
+SPOOL_MAX_BYTES = 1024 * 1024
+DOWNLOAD_CHUNK_BYTES = 64 * 1024
+
 
 class ExportFormat(str, Enum):
     """Supported export formats."""
     CSV = "csv"
     JSON = "json"
+    NDJSON = "ndjson"
     EXCEL = "excel"
 
 
@@ -40,6 +59,17 @@ class ExportType(str, Enum):
     CUSTOM = "custom"
 
 
+# Rows generated per export type by the sample data source
+SAMPLE_ROW_COUNTS = {
+    ExportType.CONTACTS: 100,
+    ExportType.COMPANIES: 50,
+    ExportType.DEALS: 30,
+    ExportType.ACTIVITIES: 200,
+    ExportType.EMAILS: 100,
+}
+DEFAULT_SAMPLE_ROWS = 10
+
+
 class ExportStatus(str, Enum):
     """Status of an export job."""
     PENDING = "pending"
@@ -82,7 +112,7 @@ class ExportJob:
     file_name: Optional[str] = None
     file_size: Optional[int] = None
     file_url: Optional[str] = None
-    file_content: Optional[str] = None  # For small exports
+    file: Optional[IO[bytes]] = field(default=None, repr=False)  # Spooled temp file
     record_count: Optional[int] = None
     
     # Metadata
@@ -159,7 +189,12 @@ class ExportService:
         return job
     
     async def process_export(self, job_id: str) -> Optional[ExportJob]:
-        """Process an export job."""
+        """Process an export job.
+
+        Rows are streamed from the data source and written in batches of
+        EXPORT_BATCH_ROWS to a spooled temp file, so memory use does not
+        grow with the number of rows.
+        """
         job = self.jobs.get(job_id)
         if not job:
             return None
@@ -169,33 +204,40 @@ class ExportService:
         
         job.status = ExportStatus.PROCESSING
         job.started_at = datetime.utcnow()
+        file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
         
         try:
-            # Get sample data based on export type
-            data = await self._get_export_data(job.export_type, job.filters)
+            total = self._count_export_data(job.export_type, job.filters)
+            rows = self._iter_export_data(job.export_type, job.filters)
+            column_fields = [c.field for c in job.columns] if job.columns else None
             
-            # Apply column selection
-            if job.columns:
-                column_fields = [c.field for c in job.columns]
-                data = [
-                    {k: v for k, v in row.items() if k in column_fields}
-                    for row in data
-                ]
+            writer: Optional[ExportWriter] = None
+            batch: list[dict] = []
+            count = 0
+            async for row in rows:
+                # Apply column selection
+                if column_fields:
+                    row = {k: v for k, v in row.items() if k in column_fields}
+                if writer is None:
+                    writer = self._create_writer(job, file, column_fields or list(row.keys()))
+                batch.append(row)
+                if len(batch) >= EXPORT_BATCH_ROWS:
+                    count += self._write_batch(job, writer, batch, count, total)
+                    batch = []
+                    await asyncio.sleep(0)  # Let other requests run between batches
             
-            # Format based on export format
-            if job.format == ExportFormat.CSV:
-                content, file_name = await self._export_to_csv(data, job)
-            elif job.format == ExportFormat.JSON:
-                content, file_name = await self._export_to_json(data, job)
-            elif job.format == ExportFormat.EXCEL:
-                content, file_name = await self._export_to_excel(data, job)
-            else:
-                raise ValueError(f"Unsupported format: {job.format}")
+            if writer is None and (column_fields or job.format != ExportFormat.CSV):
+                writer = self._create_writer(job, file, column_fields or [])
+            if batch:
+                count += self._write_batch(job, writer, batch, count, total)
+            if writer is not None:
+                writer.close()
             
-            job.file_content = content
-            job.file_name = file_name
-            job.file_size = len(content.encode() if isinstance(content, str) else content)
-            job.record_count = len(data)
+            file.seek(0, 2)
+            job.file = file
+            job.file_name = self._file_name(job)
+            job.file_size = file.tell()
+            job.record_count = count
             job.status = ExportStatus.COMPLETED
             job.completed_at = datetime.utcnow()
             job.progress_percent = 100
@@ -203,6 +245,7 @@ class ExportService:
             logger.info(f"Completed export job: {job_id} ({job.record_count} records)")
             
         except Exception as e:
+            file.close()
             job.status = ExportStatus.FAILED
             job.error_message = str(e)
             job.completed_at = datetime.utcnow()
@@ -211,16 +254,73 @@ class ExportService:
         
         return job
     
-    async def _get_export_data(
+    def _create_writer(self, job: ExportJob, file: IO[bytes], fields: list[str]) -> ExportWriter:
+        """Writer for the job's format."""
+        headers = None
+        if job.include_headers:
+            headers = [c.header for c in job.columns] if job.columns else fields
+        
+        if job.format == ExportFormat.CSV:
+            return CSVExportWriter(file, fields, headers)
+        elif job.format == ExportFormat.JSON:
+            return JSONExportWriter(
+                file,
+                fields,
+                meta={
+                    "export_type": job.export_type.value,
+                    "exported_at": datetime.utcnow().isoformat(),
+                },
+            )
+        elif job.format == ExportFormat.NDJSON:
+            return NDJSONExportWriter(file, fields)
+        elif job.format == ExportFormat.EXCEL:
+            return XLSXExportWriter(file, fields, headers)
+        else:
+            raise ValueError(f"Unsupported format: {job.format}")
+    
+    def _write_batch(
+        self,
+        job: ExportJob,
+        writer: ExportWriter,
+        batch: list[dict],
+        written: int,
+        total: Optional[int],
+    ) -> int:
+        """Write a batch of rows and update progress. Returns rows written."""
+        writer.write_rows(batch)
+        if total:
+            job.progress_percent = min(99, (written + len(batch)) * 100 // total)
+        return len(batch)
+    
+    def _file_name(self, job: ExportJob) -> str:
+        extensions = {
+            ExportFormat.CSV: "csv",
+            ExportFormat.JSON: "json",
+            ExportFormat.NDJSON: "ndjson",
+            ExportFormat.EXCEL: "xlsx",
+        }
+        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        return f"{job.export_type.value}_export_{timestamp}.{extensions[job.format]}"
+    
+    def _count_export_data(
         self,
         export_type: ExportType,
         filters: list[ExportFilter]
-    ) -> list[dict]:
-        """Get data for export based on type."""
+    ) -> Optional[int]:
+        """Number of rows an export will have, for progress (None if unknown)."""
+        return SAMPLE_ROW_COUNTS.get(export_type, DEFAULT_SAMPLE_ROWS)
+    
+    async def _iter_export_data(
+        self,
+        export_type: ExportType,
+        filters: list[ExportFilter]
+    ) -> AsyncIterator[dict]:
+        """Yield export rows one at a time based on type."""
         # Generate sample data
+        rows = range(1, SAMPLE_ROW_COUNTS.get(export_type, DEFAULT_SAMPLE_ROWS) + 1)
         if export_type == ExportType.CONTACTS:
-            return [
-                {
+            for i in rows:
+                yield {
                     "id": f"contact_{i}",
                     "first_name": f"First{i}",
                     "last_name": f"Last{i}",
@@ -235,12 +335,10 @@ class ExportService:
                     "status": "active" if i % 3 != 0 else "inactive",
                     "created_at": (datetime.utcnow() - timedelta(days=i)).isoformat()
                 }
-                for i in range(1, 101)
-            ]
         
         elif export_type == ExportType.COMPANIES:
-            return [
-                {
+            for i in rows:
+                yield {
                     "id": f"company_{i}",
                     "name": f"Company {i}",
                     "domain": f"company{i}.com",
@@ -253,12 +351,10 @@ class ExportService:
                     "contact_count": i % 10,
                     "created_at": (datetime.utcnow() - timedelta(days=i * 2)).isoformat()
                 }
-                for i in range(1, 51)
-            ]
         
         elif export_type == ExportType.DEALS:
-            return [
-                {
+            for i in rows:
+                yield {
                     "id": f"deal_{i}",
                     "name": f"Deal {i}",
                     "company": f"Company {i % 20}",
@@ -269,12 +365,10 @@ class ExportService:
                     "close_date": (datetime.utcnow() + timedelta(days=30 - i)).isoformat(),
                     "created_at": (datetime.utcnow() - timedelta(days=i * 3)).isoformat()
                 }
-                for i in range(1, 31)
-            ]
         
         elif export_type == ExportType.ACTIVITIES:
-            return [
-                {
+            for i in rows:
+                yield {
                     "id": f"activity_{i}",
                     "type": ["email", "call", "meeting", "note"][i % 4],
                     "subject": f"Activity {i}",
@@ -284,12 +378,10 @@ class ExportService:
                     "timestamp": (datetime.utcnow() - timedelta(hours=i)).isoformat(),
                     "notes": f"Notes for activity {i}"
                 }
-                for i in range(1, 201)
-            ]
         
         elif export_type == ExportType.EMAILS:
-            return [
-                {
+            for i in rows:
+                yield {
                     "id": f"email_{i}",
                     "subject": f"Email Subject {i}",
                     "from": "sales@example.com",
@@ -299,75 +391,10 @@ class ExportService:
                     "clicked_at": (datetime.utcnow() - timedelta(hours=i-1)).isoformat() if i % 3 == 0 else None,
                     "sent_at": (datetime.utcnow() - timedelta(hours=i+1)).isoformat()
                 }
-                for i in range(1, 101)
-            ]
         
         else:
-            return [
-                {"id": f"item_{i}", "data": f"Sample data {i}"}
-                for i in range(1, 11)
-            ]
-    
-    async def _export_to_csv(
-        self,
-        data: list[dict],
-        job: ExportJob
-    ) -> tuple[str, str]:
-        """Export data to CSV format."""
-        if not data:
-            return "", f"{job.export_type.value}_export.csv"
-        
-        output = io.StringIO()
-        
-        # Determine headers
-        if job.columns:
-            headers = [c.header for c in job.columns]
-            fields = [c.field for c in job.columns]
-        else:
-            fields = list(data[0].keys())
-            headers = fields
-        
-        writer = csv.DictWriter(output, fieldnames=fields)
-        
-        if job.include_headers:
-            # Write custom headers
-            writer.writerow(dict(zip(fields, headers)))
-        
-        for row in data:
-            writer.writerow(row)
-        
-        file_name = f"{job.export_type.value}_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        return output.getvalue(), file_name
-    
-    async def _export_to_json(
-        self,
-        data: list[dict],
-        job: ExportJob
-    ) -> tuple[str, str]:
-        """Export data to JSON format."""
-        output = {
-            "export_type": job.export_type.value,
-            "exported_at": datetime.utcnow().isoformat(),
-            "record_count": len(data),
-            "data": data
-        }
-        
-        file_name = f"{job.export_type.value}_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-        
-        return json.dumps(output, indent=2), file_name
-    
-    async def _export_to_excel(
-        self,
-        data: list[dict],
-        job: ExportJob
-    ) -> tuple[str, str]:
-        """Export data to Excel format (simplified as CSV for demo)."""
-        # In production, would use openpyxl or xlsxwriter
-        content, _ = await self._export_to_csv(data, job)
-        file_name = f"{job.export_type.value}_export_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        
-        return content, file_name
+            for i in rows:
+                yield {"id": f"item_{i}", "data": f"Sample data {i}"}
     
     async def get_job(self, job_id: str) -> Optional[ExportJob]:
         """Get an export job by ID."""
@@ -398,37 +425,102 @@ class ExportService:
         return results[:limit]
     
     async def download_export(self, job_id: str) -> Optional[dict]:
-        """Get export file content for download."""
+        """Get an export file for download.
+
+        Returns:
+            file_name, content_type, size, and ``stream``: an async
+            iterator of the file's bytes in DOWNLOAD_CHUNK_BYTES chunks
+        """
         job = self.jobs.get(job_id)
         if not job:
             return None
         
-        if job.status != ExportStatus.COMPLETED:
+        if job.status != ExportStatus.COMPLETED or job.file is None:
             return None
         
         # Check expiration
         if job.expires_at and datetime.utcnow() > job.expires_at:
             job.status = ExportStatus.EXPIRED
+            self._release_file(job)
             return None
         
         # Determine content type
         content_types = {
             ExportFormat.CSV: "text/csv",
             ExportFormat.JSON: "application/json",
+            ExportFormat.NDJSON: "application/x-ndjson",
             ExportFormat.EXCEL: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         }
         
         return {
             "file_name": job.file_name,
             "content_type": content_types.get(job.format, "application/octet-stream"),
-            "content": job.file_content,
+            "stream": self._stream_file(job),
             "size": job.file_size
         }
     
+    async def _stream_file(self, job: ExportJob) -> AsyncIterator[bytes]:
+        """Yield the export file in chunks."""
+        for chunk in self._read_chunks(job):
+            yield chunk
+            await asyncio.sleep(0)
+    
+    def _read_chunks(self, job: ExportJob) -> Iterator[bytes]:
+        """Read the export file from the start in chunks.
+
+        Each chunk is a seek + read with no await in between, so concurrent
+        readers of the same file never see each other's position.
+        """
+        position = 0
+        while job.file is not None and not job.file.closed:
+            job.file.seek(position)
+            chunk = job.file.read(DOWNLOAD_CHUNK_BYTES)
+            if not chunk:
+                return
+            position += len(chunk)
+            yield chunk
+    
+    def _iter_lines(self, job: ExportJob) -> Iterator[str]:
+        """Decoded lines of the export file, newline included."""
+        pending = b""
+        for chunk in self._read_chunks(job):
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                yield line.decode("utf-8") + "\n"
+        if pending:
+            yield pending.decode("utf-8")
+    
+    async def preview_export(self, job_id: str, limit: int = 10) -> Optional[list[dict]]:
+        """First ``limit`` rows of a completed export, read from its file."""
+        job = self.jobs.get(job_id)
+        if not job or job.status != ExportStatus.COMPLETED:
+            return None
+        
+        preview: list[dict] = []
+        if job.format == ExportFormat.CSV:
+            for row in csv.DictReader(self._iter_lines(job)):
+                if len(preview) >= limit:
+                    break
+                preview.append(row)
+        
+        elif job.format in (ExportFormat.JSON, ExportFormat.NDJSON):
+            lines = self._iter_lines(job)
+            if job.format == ExportFormat.JSON:
+                next(lines, None)  # Skip the envelope's opening line
+            for line in lines:
+                line = line.strip().rstrip(",")
+                if len(preview) >= limit or line.startswith("]"):
+                    break
+                if line:
+                    preview.append(json.loads(line))
+        
+        return preview
+    
     async def delete_job(self, job_id: str) -> bool:
         """Delete an export job."""
         if job_id in self.jobs:
-            del self.jobs[job_id]
+            self._release_file(self.jobs.pop(job_id))
             logger.info(f"Deleted export job: {job_id}")
             return True
         return False
@@ -445,10 +537,15 @@ class ExportService:
             job = self.jobs.get(job_id)
             if job:
                 job.status = ExportStatus.EXPIRED
-                job.file_content = None  # Clear content to free memory
+                self._release_file(job)  # Free memory / disk
         
         return len(expired_ids)
     
+    def _release_file(self, job: ExportJob) -> None:
+        if job.file is not None:
+            job.file.close()
+            job.file = None
+    
     async def get_export_templates(self) -> list[dict]:
         """Get predefined export templates."""
         return [
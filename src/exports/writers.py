@@ -0,0 +1,180 @@
+"""
+Export Writers - Incremental File Writers
+=========================================
+Write export rows to a binary file batch by batch, so an export never
+holds more than one batch of rows in memory.
+
+XLSX is written with the standard library: a minimal workbook whose
+single sheet is streamed (deflated) into the zip archive, using inline
+strings so no shared-string table has to be built in memory.
+"""
+
+import csv
+import io
+import json
+import re
+import zipfile
+from typing import Any, BinaryIO, Iterable, Optional
+from xml.sax.saxutils import escape
+
+
+class ExportWriter:
+    """Base class: writes rows of ``fields`` to ``file``."""
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        fields: list[str],
+        headers: Optional[list[str]] = None,
+    ):
+        """
+        Args:
+            file: Binary file to write to
+            fields: Row keys to write, in column order
+            headers: Header row; None writes no header
+        """
+        self.file = file
+        self.fields = fields
+        self.headers = headers
+
+    def write_rows(self, rows: Iterable[dict]) -> None:
+        """Append rows to the file."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Write any trailer. Does not close ``file``."""
+
+
+class CSVExportWriter(ExportWriter):
+    """CSV, encoded as UTF-8."""
+
+    def __init__(self, file, fields, headers=None):
+        super().__init__(file, fields, headers)
+        self._buffer = io.StringIO()
+        self._writer = csv.DictWriter(self._buffer, fieldnames=fields, extrasaction="ignore")
+        if headers is not None:
+            self._writer.writerow(dict(zip(fields, headers)))
+            self._flush()
+
+    def write_rows(self, rows):
+        self._writer.writerows(rows)
+        self._flush()
+
+    def _flush(self) -> None:
+        self.file.write(self._buffer.getvalue().encode("utf-8"))
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+
+class NDJSONExportWriter(ExportWriter):
+    """One JSON object per line."""
+
+    def write_rows(self, rows):
+        self.file.write(
+            "".join(json.dumps(row, default=str) + "\n" for row in rows).encode("utf-8")
+        )
+
+
+class JSONExportWriter(ExportWriter):
+    """JSON document ``{..., "data": [rows], "record_count": n}``, one row per line."""
+
+    def __init__(self, file, fields, headers=None, meta: Optional[dict] = None):
+        super().__init__(file, fields, headers)
+        opening = json.dumps({**(meta or {}), "data": []})[:-3]  # drop the closing "]}"
+        self.file.write(f"{opening}[\n".encode("utf-8"))
+        self._count = 0
+
+    def write_rows(self, rows):
+        lines = []
+        for row in rows:
+            lines.append(("" if not self._count else ",\n") + json.dumps(row, default=str))
+            self._count += 1
+        self.file.write("".join(lines).encode("utf-8"))
+
+    def close(self):
+        self.file.write(f'\n], "record_count": {self._count}}}\n'.encode("utf-8"))
+
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        "</Relationships>"
+    ),
+}
+
+# Characters not allowed in XML 1.0
+_INVALID_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _xlsx_cell(value: Any) -> str:
+    if value is None:
+        return "<c/>"
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f"<c><v>{value}</v></c>"
+    text = escape(_INVALID_XML.sub("", str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+class XLSXExportWriter(ExportWriter):
+    """Single-sheet Excel workbook."""
+
+    def __init__(self, file, fields, headers=None):
+        super().__init__(file, fields, headers)
+        self._zip = zipfile.ZipFile(file, "w", zipfile.ZIP_DEFLATED)
+        for name, xml in _XLSX_PARTS.items():
+            self._zip.writestr(name, xml)
+        self._sheet = self._zip.open("xl/worksheets/sheet1.xml", "w", force_zip64=True)
+        self._sheet.write(
+            b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            b"<sheetData>"
+        )
+        if headers is not None:
+            self._write([headers])
+
+    def write_rows(self, rows):
+        self._write([row.get(f) for f in self.fields] for row in rows)
+
+    def close(self):
+        self._sheet.write(b"</sheetData></worksheet>")
+        self._sheet.close()
+        self._zip.close()
+
+    def _write(self, rows: Iterable[list]) -> None:
+        self._sheet.write(
+            "".join(
+                "<row>" + "".join(_xlsx_cell(value) for value in row) + "</row>" for row in rows
+            ).encode("utf-8")
+        )
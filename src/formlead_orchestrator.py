@@ -20,6 +20,7 @@ from src.connectors.hubspot import HubSpotConnector
 from src.connectors.calendar_connector import CalendarConnector
 from src.connectors.drive import DriveConnector
 from src.draft_generator import DraftGenerator
+from src.step_graph import GraphStep, StepGraph
 from src.voice_profile import VoiceProfileManager, VoiceProfile
 
 logger = get_logger(__name__)
@@ -68,7 +69,7 @@ class FormleadOrchestrator:
         form_submission: Dict[str, Any],
         voice_profile: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        """Process form lead through 11-step workflow (DRAFT_ONLY)."""
+        """Process form lead through the 11-step workflow graph (DRAFT_ONLY)."""
         now = datetime.now(timezone.utc)
         workflow_id = f"formlead-{now.strftime('%Y%m%d%H%M%S')}"
         self.context = {
@@ -124,45 +125,108 @@ class FormleadOrchestrator:
         except Exception as e:
             logger.warning(f"Could not persist workflow to DB: {e}")
 
+        timings: Dict[str, Dict[str, float]] = {}
         try:
+            values = await self._build_step_graph(voice_profile, workflow_id).run(
+                {"form_submission": form_submission}, timings=timings
+            )
+            self._record_step_timings(timings)
+            draft_id = values["draft_id"]
+            hubspot_task = values["hubspot_task"]
+
+            self.context["final_status"] = "success"
+            self.context["draft_id"] = draft_id
+            self.context["task_id"] = hubspot_task.get("task_id")
+
+            # Persist success to database
+            try:
+                db = await get_workflow_db()
+                await db.update_workflow_run(
+                    workflow_id=workflow_id,
+                    status="success",
+                    draft_id=draft_id,
+                    steps_completed=self.context.get("steps"),
+                )
+            except Exception as db_err:
+                logger.warning(f"Could not update workflow in DB: {db_err}")
+
+            logger.info(f"Formlead workflow {workflow_id} completed successfully (DRAFT_ONLY)")
+            return self.context
+
+        except Exception as e:
+            logger.error(f"Formlead workflow {workflow_id} failed: {e}", exc_info=True)
+            self._record_step_timings(timings)
+            self.context["final_status"] = "failed"
+            self.context["error"] = str(e)
+
+            # Persist failure to database
+            try:
+                db = await get_workflow_db()
+                await db.update_workflow_run(
+                    workflow_id=workflow_id,
+                    status="failed",
+                    steps_completed=self.context.get("steps"),
+                    error_message=str(e),
+                )
+            except Exception as db_err:
+                logger.warning(f"Could not update failed workflow in DB: {db_err}")
+
+            return self.context
+
+    def _build_step_graph(
+        self,
+        voice_profile: Optional[Dict[str, Any]],
+        workflow_id: str,
+    ) -> StepGraph:
+        """Declare the formlead workflow as a dependency graph.
+
+        Once the HubSpot contact is resolved, research, Gmail search, long
+        memory and asset hunting run concurrently; meeting slots only need
+        a valid payload. Each step records its status in context["steps"].
+        """
+        steps = self.context["steps"]
+
+        async def validate_payload(form_submission):
             # Step 1: Validate webhook payload
-            logger.info("Step 1: Validating webhook payload")
-            form_valid = await self._validate_form_payload(form_submission)
-            if not form_valid:
+            if not await self._validate_form_payload(form_submission):
                 raise ValueError("Invalid form payload")
-            self.context["steps"]["validate_payload"] = {"status": "success"}
+            steps["validate_payload"] = {"status": "success"}
+            return True
 
+        async def resolve_hubspot(form_submission, form_valid):
             # Step 2: Upsert/resolve HubSpot contact + company
-            logger.info("Step 2: Resolving HubSpot contact/company")
             prospect_data = await self._resolve_hubspot(form_submission)
             self.context["prospect"] = prospect_data
-            self.context["steps"]["resolve_hubspot"] = {"status": "success"}
+            steps["resolve_hubspot"] = {"status": "success"}
+            return prospect_data
 
+        async def research_prospect(prospect):
             # Step 2.5: Research prospect and company
-            logger.info("Step 2.5: Researching prospect and company")
             research_data = await self.research_agent.research_prospect(
-                email=prospect_data.get("email", ""),
-                company=prospect_data.get("company"),
-                first_name=prospect_data.get("first_name"),
-                last_name=prospect_data.get("last_name"),
+                email=prospect.get("email", ""),
+                company=prospect.get("company"),
+                first_name=prospect.get("first_name"),
+                last_name=prospect.get("last_name"),
             )
             self.context["research"] = research_data
-            self.context["steps"]["research_prospect"] = {
+            steps["research_prospect"] = {
                 "status": "success",
                 "sources": research_data.get("sources", []),
                 "talking_points": len(research_data.get("talking_points", [])),
                 "hooks": len(research_data.get("personalization_hooks", [])),
             }
+            return research_data
 
+        async def search_gmail(prospect):
             # Step 3: Search Gmail for existing threads
-            logger.info("Step 3: Searching Gmail for threads")
-            threads = await self._search_gmail_threads(prospect_data)
+            threads = await self._search_gmail_threads(prospect)
             if threads:
                 self.context["gmail_threads"] = threads
-            self.context["steps"]["search_gmail"] = {"status": "success", "threads_found": len(threads)}
+            steps["search_gmail"] = {"status": "success", "threads_found": len(threads)}
+            return threads
 
+        async def read_thread(threads):
             # Step 4: Read thread if exists
-            logger.info("Step 4: Reading thread context")
             thread_context = None
             if threads:
                 thread_data = await self._get_thread_context(threads[0]["id"])
@@ -170,85 +234,97 @@ class FormleadOrchestrator:
                     thread_reader_result = await self.thread_reader.read_thread(thread_data)
                     if thread_reader_result.get("status") == "success":
                         thread_context = thread_reader_result.get("context")
-            self.context["steps"]["read_thread"] = {"status": "success", "has_context": thread_context is not None}
+            steps["read_thread"] = {"status": "success", "has_context": thread_context is not None}
+            return thread_context
 
+        async def long_memory(prospect):
             # Step 5: Run LongMemoryAgent for patterns
-            logger.info("Step 5: Finding similar patterns")
             patterns_result = await self.long_memory.find_similar_patterns(
-                prospect_company=prospect_data.get("company", ""),
-                prospect_title=prospect_data.get("title"),
+                prospect_company=prospect.get("company", ""),
+                prospect_title=prospect.get("title"),
             )
             patterns = patterns_result.get("patterns", [])
-            self.context["steps"]["long_memory"] = {"status": patterns_result.get("status"), "patterns_count": len(patterns)}
+            steps["long_memory"] = {"status": patterns_result.get("status"), "patterns_count": len(patterns)}
+            return patterns
 
+        async def asset_hunter(prospect):
             # Step 6: Run AssetHunter with allowlist
-            logger.info("Step 6: Hunting Drive assets (allowlist enforced)")
             assets_result = await self.asset_hunter.hunt_assets(
-                prospect_company=prospect_data.get("company", ""),
+                prospect_company=prospect.get("company", ""),
                 charlie_pesti_folder_id=self.charlie_pesti_folder_id,
             )
             assets = assets_result.get("assets", [])
-            self.context["steps"]["asset_hunter"] = {
+            steps["asset_hunter"] = {
                 "status": assets_result.get("status"),
                 "assets_count": len(assets),
                 "allowlist_enforced": assets_result.get("allowlist_enforced", True),
             }
+            return assets
 
-            # Step 7: Run MeetingSlotAgent
-            logger.info("Step 7: Proposing meeting slots (2-3 in next 1-3 business days)")
+        async def meeting_slots(form_valid):
+            # Step 7: Run MeetingSlotAgent (2-3 slots in next 1-3 business days)
             slots_result = await self.meeting_slot.propose_slots(num_slots=3, max_days_out=3)
             slots = slots_result.get("slots", [])
-            self.context["steps"]["meeting_slots"] = {"status": slots_result.get("status"), "slots_count": len(slots)}
+            steps["meeting_slots"] = {"status": slots_result.get("status"), "slots_count": len(slots)}
+            return slots
 
+        async def next_step_plan(prospect, patterns):
             # Step 8: Run NextStepPlannerAgent
-            logger.info("Step 8: Planning next step (CTA)")
-            cta_result = await self.next_step_planner.plan_next_step(prospect_data, patterns)
+            cta_result = await self.next_step_planner.plan_next_step(prospect, patterns)
             cta = cta_result.get("cta", {})
-            self.context["steps"]["next_step_plan"] = {"status": cta_result.get("status"), "cta": cta.get("primary")}
+            steps["next_step_plan"] = {"status": cta_result.get("status"), "cta": cta.get("primary")}
+            return cta
 
-            # Step 9: Run DraftWriterAgent
-            logger.info("Step 9: Writing draft using voice profile and research context")
-            primary_asset = assets[0] if assets else None
+        async def draft_writer(prospect, slots, assets, thread_context, research):
+            # Step 9: Run DraftWriterAgent with voice profile and research context
             draft_result = await self.draft_writer.write_draft(
-                prospect_data=prospect_data,
+                prospect_data=prospect,
                 meeting_slots=slots,
-                drive_asset=primary_asset,
+                drive_asset=assets[0] if assets else None,
                 voice_profile=voice_profile,
                 thread_context=thread_context,
-                research_context=self.context.get("research"),
+                research_context=research,
             )
-            draft_subject = draft_result.get("subject")
-            draft_body = draft_result.get("body")
-            self.context["steps"]["draft_writer"] = {"status": draft_result.get("status"), "has_body": draft_body is not None}
+            steps["draft_writer"] = {
+                "status": draft_result.get("status"),
+                "has_body": draft_result.get("body") is not None,
+            }
+            return draft_result
 
-            # Step 10: Create Gmail draft + HubSpot note/task
-            logger.info("Step 10: Creating Gmail draft and HubSpot task")
+        async def create_draft(prospect, draft, threads):
+            # Step 10: Create Gmail draft
             draft_id = await self._create_gmail_draft(
-                prospect_data, draft_subject, draft_body, threads, workflow_id=workflow_id
+                prospect, draft.get("subject"), draft.get("body"), threads, workflow_id=workflow_id
             )
-            hubspot_task = await self._create_hubspot_task(prospect_data, draft_id)
-            self.context["steps"]["create_draft"] = {"status": "success", "draft_id": draft_id, "mode": "DRAFT_ONLY"}
-            self.context["steps"]["create_task"] = {"status": "success", "task_id": hubspot_task.get("task_id")}
+            steps["create_draft"] = {"status": "success", "draft_id": draft_id, "mode": "DRAFT_ONLY"}
+            return draft_id
 
+        async def create_task(prospect, draft_id):
+            # Step 10: Create HubSpot note/task
+            hubspot_task = await self._create_hubspot_task(prospect, draft_id)
+            steps["create_task"] = {"status": "success", "task_id": hubspot_task.get("task_id")}
+            return hubspot_task
+
+        async def auto_approval(prospect, draft_id):
             # Step 10.5: Evaluate for auto-approval (Sprint 4)
-            logger.info("Step 10.5: Evaluating draft for auto-approval")
-            auto_approval_result = await self._evaluate_auto_approval(
+            result = await self._evaluate_auto_approval(
                 draft_id=draft_id,
-                recipient_email=prospect_data.get("email", ""),
+                recipient_email=prospect.get("email", ""),
                 draft_metadata={
-                    "icp_score": prospect_data.get("icp_score", 0.0),
-                    "domain": prospect_data.get("company_domain"),
-                    "company": prospect_data.get("company"),
+                    "icp_score": prospect.get("icp_score", 0.0),
+                    "domain": prospect.get("company_domain"),
+                    "company": prospect.get("company"),
                 },
             )
-            self.context["steps"]["auto_approval"] = auto_approval_result
+            steps["auto_approval"] = result
+            return result
 
+        async def label_thread(prospect, threads, assets, draft_id):
             # Step 11: Label thread (or create label) and audit log
-            logger.info("Step 11: Labeling thread and creating audit event")
             if threads:
                 await self._label_thread(threads[0]["id"])
             AuditTrail.log_draft_created(
-                prospect_email=prospect_data.get("email", ""),
+                prospect_email=prospect.get("email", ""),
                 draft_id=draft_id,
                 metadata={
                     "formlead_workflow": workflow_id,
@@ -256,45 +332,42 @@ class FormleadOrchestrator:
                     "assets_included": len(assets),
                 },
             )
-            self.context["steps"]["label_thread"] = {"status": "success"}
-
-            self.context["final_status"] = "success"
-            self.context["draft_id"] = draft_id
-            self.context["task_id"] = hubspot_task.get("task_id")
-
-            # Persist success to database
-            try:
-                db = await get_workflow_db()
-                await db.update_workflow_run(
-                    workflow_id=workflow_id,
-                    status="success",
-                    draft_id=draft_id,
-                    steps_completed=self.context.get("steps"),
-                )
-            except Exception as db_err:
-                logger.warning(f"Could not update workflow in DB: {db_err}")
-
-            logger.info(f"Formlead workflow {workflow_id} completed successfully (DRAFT_ONLY)")
-            return self.context
-
-        except Exception as e:
-            logger.error(f"Formlead workflow {workflow_id} failed: {e}", exc_info=True)
-            self.context["final_status"] = "failed"
-            self.context["error"] = str(e)
+            steps["label_thread"] = {"status": "success"}
+            return True
 
-            # Persist failure to database
-            try:
-                db = await get_workflow_db()
-                await db.update_workflow_run(
-                    workflow_id=workflow_id,
-                    status="failed",
-                    steps_completed=self.context.get("steps"),
-                    error_message=str(e),
-                )
-            except Exception as db_err:
-                logger.warning(f"Could not update failed workflow in DB: {db_err}")
+        return StepGraph(
+            [
+                GraphStep("validate_payload", validate_payload, ("form_submission",), "form_valid"),
+                GraphStep("resolve_hubspot", resolve_hubspot, ("form_submission", "form_valid"), "prospect"),
+                GraphStep("research_prospect", research_prospect, ("prospect",), "research"),
+                GraphStep("search_gmail", search_gmail, ("prospect",), "threads"),
+                GraphStep("read_thread", read_thread, ("threads",), "thread_context"),
+                GraphStep("long_memory", long_memory, ("prospect",), "patterns"),
+                GraphStep("asset_hunter", asset_hunter, ("prospect",), "assets"),
+                GraphStep("meeting_slots", meeting_slots, ("form_valid",), "slots"),
+                GraphStep("next_step_plan", next_step_plan, ("prospect", "patterns"), "cta"),
+                GraphStep(
+                    "draft_writer", draft_writer,
+                    ("prospect", "slots", "assets", "thread_context", "research"), "draft",
+                ),
+                GraphStep("create_draft", create_draft, ("prospect", "draft", "threads"), "draft_id"),
+                GraphStep("create_task", create_task, ("prospect", "draft_id"), "hubspot_task"),
+                GraphStep("auto_approval", auto_approval, ("prospect", "draft_id")),
+                GraphStep("label_thread", label_thread, ("prospect", "threads", "assets", "draft_id")),
+            ],
+            initial=("form_submission",),
+        )
 
-            return self.context
+    def _record_step_timings(self, timings: Dict[str, Dict[str, float]]) -> None:
+        """Merge per-step start offsets and durations into context["steps"]."""
+        steps = self.context["steps"]
+        for name, timing in timings.items():
+            if isinstance(steps.get(name), dict):
+                steps[name].update(timing)
+            else:
+                steps[name] = dict(timing)
+        if timings:
+            self.context["duration_ms"] = max(t["started_ms"] + t["duration_ms"] for t in timings.values())
 
     async def _validate_form_payload(self, form_submission: Dict[str, Any]) -> bool:
         """Validate webhook payload and reject wrong formIds."""
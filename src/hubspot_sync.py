@@ -21,6 +21,8 @@ from pydantic import BaseModel, Field
 from fastapi import HTTPException
 
 from src.integrations.connectors.hubspot import HubSpotConnector
+from src.integrations.hubspot.client import get_hubspot_rate_limiter
+from src.rate_limiter_enhanced import RequestPriority, rate_limit_priority
 from src.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -92,6 +94,8 @@ class HubSpotContactSyncService:
             raise ValueError("HubSpot API key not configured")
         
         self.connector = HubSpotConnector(self.api_key)
+        # Shared HubSpot account bucket; pages wait for a token instead of sleeping
+        self.rate_limiter = get_hubspot_rate_limiter()
         self.stats = SyncStats()
     
     async def sync_all_contacts(
@@ -130,7 +134,9 @@ class HubSpotContactSyncService:
                 logger.info(f"Fetching page {page_num} (after={after_cursor})...")
                 
                 try:
-                    # Fetch page of contacts
+                    # Fetch page of contacts, behind interactive requests
+                    with rate_limit_priority(RequestPriority.BACKGROUND):
+                        await self.rate_limiter.acquire()
                     response = await self.connector.get_contacts(
                         limit=batch_size,
                         after=after_cursor,
@@ -178,9 +184,6 @@ class HubSpotContactSyncService:
                         logger.info(f"Reached max contact limit: {max_contacts}")
                         break
                     
-                    # Small delay to avoid rate limiting
-                    await asyncio.sleep(0.1)
-                    
                 except HTTPException as e:
                     # Handle rate limiting
                     if e.status_code == 429:
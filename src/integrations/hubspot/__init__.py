@@ -6,6 +6,7 @@ from .client import (
     HubSpotClient,
     HubSpotCache,
     TokenBucket,
+    get_hubspot_rate_limiter,
     HubSpotContact,
     HubSpotDeal,
     HubSpotCompany,
@@ -32,6 +33,7 @@ __all__ = [
     "HubSpotClient",
     "HubSpotCache",
     "TokenBucket",
+    "get_hubspot_rate_limiter",
     "get_hubspot_client",
     # Models
     "HubSpotContact",
@@ -20,6 +20,9 @@ from functools import wraps
 import httpx
 from pydantic import BaseModel
 
+from src.connectors.http_transport import HTTPPoolConfig, PooledHTTPTransport, get_shared_transport
+from src.rate_limiter_enhanced import RequestPriority, TokenWaitQueue
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -34,6 +37,10 @@ class TokenBucket:
     
     HubSpot allows 100 requests per 10 seconds for private apps.
     We use 90/10s (9/s) to have headroom.
+    
+    Callers that have to wait are queued FIFO, interactive requests ahead
+    of background work (see src.rate_limiter_enhanced.rate_limit_priority),
+    and woken as soon as the tokens they need have refilled.
     """
     
     def __init__(
@@ -45,34 +52,56 @@ class TokenBucket:
         self.max_tokens = max_tokens
         self.tokens = max_tokens
         self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._queue = TokenWaitQueue(self._take)
+    
+    async def _take(self, tokens: float) -> float:
+        """Consume tokens if available, else return seconds until they are."""
+        now = time.monotonic()
+        
+        # Refill tokens based on time elapsed
+        elapsed = now - self.last_update
+        self.tokens = min(
+            self.max_tokens,
+            self.tokens + (elapsed * self.tokens_per_second)
+        )
+        self.last_update = now
+        
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0.0
+        return (tokens - self.tokens) / self.tokens_per_second
     
-    async def acquire(self, tokens: float = 1.0) -> float:
+    async def acquire(
+        self,
+        tokens: float = 1.0,
+        priority: Optional[RequestPriority] = None,
+    ) -> float:
         """Acquire tokens, waiting if necessary.
         
+        Args:
+            tokens: Tokens to take
+            priority: Queue lane (default: the current rate_limit_priority)
+        
         Returns the time waited in seconds.
         """
-        async with self._lock:
-            now = time.monotonic()
-            
-            # Refill tokens based on time elapsed
-            elapsed = now - self.last_update
-            self.tokens = min(
-                self.max_tokens,
-                self.tokens + (elapsed * self.tokens_per_second)
-            )
-            self.last_update = now
-            
-            wait_time = 0.0
-            if self.tokens < tokens:
-                # Calculate wait time
-                deficit = tokens - self.tokens
-                wait_time = deficit / self.tokens_per_second
-                await asyncio.sleep(wait_time)
-                self.tokens = tokens  # Will be consumed immediately
-            
-            self.tokens -= tokens
-            return wait_time
+        if tokens > self.max_tokens:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.max_tokens}")
+        return await self._queue.acquire(tokens, priority)
+
+
+_shared_rate_limiter: Optional[TokenBucket] = None
+
+
+def get_hubspot_rate_limiter() -> TokenBucket:
+    """Get the process-wide token bucket for the HubSpot account.
+    
+    HubSpot's limit applies per account, so every HubSpot client and
+    connector in the process draws from this one bucket.
+    """
+    global _shared_rate_limiter
+    if _shared_rate_limiter is None:
+        _shared_rate_limiter = TokenBucket()
+    return _shared_rate_limiter
 
 
 # =============================================================================
@@ -285,19 +314,36 @@ class HubSpotClient:
         enable_cache: bool = True,
         cache: Optional[HubSpotCache] = None,
         rate_limiter: Optional[TokenBucket] = None,
+        transport: Optional[PooledHTTPTransport] = None,
+        share_transport: bool = True,
     ):
+        """
+        Args:
+            api_key: HubSpot private app token
+            enable_cache: Cache GET responses
+            cache: Response cache (default: a new HubSpotCache)
+            rate_limiter: Token bucket (default: the process-wide HubSpot bucket)
+            transport: Pooled HTTP transport to use; the caller closes it
+            share_transport: Without ``transport``, use the shared "hubspot"
+                pool (closed at shutdown). False gives this client its own
+                pool, closed by close().
+        """
         self.api_key = api_key
         self.cache = cache or HubSpotCache() if enable_cache else None
-        self.rate_limiter = rate_limiter or TokenBucket()
-        
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
+        self.rate_limiter = rate_limiter or get_hubspot_rate_limiter()
+        
+        # Connection pool shared with src.connectors.hubspot.HubSpotConnector
+        self._owns_transport = transport is None and not share_transport
+        if transport is None:
+            transport = (
+                get_shared_transport("hubspot") if share_transport
+                else PooledHTTPTransport("hubspot", HTTPPoolConfig.from_env("HUBSPOT_HTTP"))
+            )
+        self.transport = transport
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
         
         # Stats for monitoring
         self.stats = {
@@ -308,8 +354,13 @@ class HubSpotClient:
         }
     
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the client's connection pool if it owns one.
+        
+        Shared and caller-provided transports are left open for their
+        other users; the shared pool is closed at application shutdown.
+        """
+        if self._owns_transport:
+            await self.transport.aclose()
     
     async def _request(
         self, 
@@ -334,11 +385,13 @@ class HubSpotClient:
             try:
                 self.stats["requests"] += 1
                 
-                response = await self._client.request(
+                response = await self.transport.client.request(
                     method=method,
-                    url=endpoint,
+                    url=f"{self.BASE_URL}{endpoint}",
                     params=params,
                     json=json,
+                    headers=self._headers,
+                    timeout=self.transport.config.build_timeout(30.0),
                 )
                 
                 # Handle rate limit response (429)
@@ -3,16 +3,22 @@ Enhanced rate limiting and quota management.
 
 Provides:
 - Token bucket algorithm for API rate limiting
-- Redis-backed distributed rate limiting
+- Redis-backed distributed rate limiting (atomic Lua token bucket)
+- Pipelined multi-bucket checks and in-process token leases
+- Wait-until-available acquire with a FIFO queue and an interactive lane
 - Per-service quota tracking (Gmail, HubSpot, etc.)
 - User/tenant-level quotas
 - Graceful degradation under quota pressure
 """
+import asyncio
 import time
 import logging
-from typing import Optional, Dict
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import Enum, IntEnum
 
 logger = logging.getLogger(__name__)
 
@@ -35,11 +41,169 @@ class RateLimitExceeded(Exception):
         super().__init__(f"Rate limit exceeded for {service}. Retry after {self.retry_after}s")
 
 
+class RequestPriority(IntEnum):
+    """Wait-queue lanes for acquire(); lower values are served first."""
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_current_priority: ContextVar[RequestPriority] = ContextVar(
+    "rate_limit_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+def current_priority() -> RequestPriority:
+    """Priority used by acquire() calls that do not pass one."""
+    return _current_priority.get()
+
+
+@contextmanager
+def rate_limit_priority(priority: RequestPriority) -> Iterator[None]:
+    """Run a block (and the tasks it spawns) at the given acquire priority.
+    
+    Background sync and batch jobs wrap their API calls in
+    ``rate_limit_priority(RequestPriority.BACKGROUND)`` so that interactive
+    requests waiting on the same bucket are served first.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class TokenWaitQueue:
+    """Fair wait queue in front of a token bucket.
+    
+    ``take(cost)`` must consume ``cost`` tokens and return 0 when they are
+    available, or return the seconds until they will be without consuming
+    anything. Waiters are served strictly FIFO within a lane, interactive
+    lane first; a single dispatcher sleeps exactly until the head waiter's
+    tokens have refilled, so callers are woken as soon as capacity exists.
+    
+    Waiters and the dispatcher belong to one event loop. When acquire() is
+    called from a different loop (Celery runs each task on a new one),
+    waiters left on the old loop are dropped.
+    """
+    
+    MIN_WAIT = 0.001  # seconds; guards against float rounding busy-loops
+    
+    def __init__(self, take: Callable[[float], Awaitable[float]]):
+        self._take = take
+        self._lanes: Dict[RequestPriority, Deque[Tuple[float, asyncio.Future]]] = {
+            priority: deque() for priority in RequestPriority
+        }
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def __len__(self) -> int:
+        return sum(
+            1 for lane in self._lanes.values() for _, future in lane if not future.done()
+        )
+    
+    def _bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is not loop:
+            self._loop = loop
+            self._lanes = {priority: deque() for priority in RequestPriority}
+            self._dispatcher = None
+    
+    async def acquire(self, cost: float = 1, priority: Optional[RequestPriority] = None) -> float:
+        """Wait until ``cost`` tokens are taken; returns seconds waited."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        if priority is None:
+            priority = current_priority()
+        self._bind_loop(loop)
+        
+        # Nobody is queued, so taking directly cannot jump the line
+        if not len(self) and await self._take(cost) <= 0:
+            return 0.0
+        
+        future = loop.create_future()
+        self._lanes[priority].append((cost, future))
+        if (
+            self._dispatcher is None
+            or self._dispatcher.done()
+            or self._dispatcher.get_loop().is_closed()
+        ):
+            self._dispatcher = loop.create_task(self._dispatch())
+        await future
+        return loop.time() - start
+    
+    def _head(self) -> Optional[Deque[Tuple[float, asyncio.Future]]]:
+        for priority in RequestPriority:
+            lane = self._lanes[priority]
+            while lane and lane[0][1].done():
+                lane.popleft()  # cancelled waiter
+            if lane:
+                return lane
+        return None
+    
+    async def _dispatch(self) -> None:
+        while True:
+            lane = self._head()
+            if lane is None:
+                return
+            cost, future = lane[0]
+            try:
+                wait = await self._take(cost)
+            except Exception as e:
+                lane.popleft()
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            if wait <= 0:
+                lane.popleft()
+                if not future.done():
+                    future.set_result(None)
+            else:
+                await asyncio.sleep(max(wait, self.MIN_WAIT))
+
+
+# Refill-and-consume for one bucket, run atomically inside Redis.
+# KEYS[1] = bucket key
+# ARGV = capacity, refill per second, cost, now (epoch seconds), ttl seconds
+# Returns {allowed (0/1), tokens left as a string}
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+local ttl = tonumber(ARGV[5])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'last_refill')
+local tokens = tonumber(state[1])
+local last_refill = tonumber(state[2])
+if tokens == nil or last_refill == nil then
+    tokens = capacity
+    last_refill = now
+end
+
+-- Clocks differ slightly between workers; never refill backwards
+if now > last_refill then
+    tokens = math.min(capacity, tokens + (now - last_refill) * rate)
+    last_refill = now
+end
+
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'last_refill', tostring(last_refill))
+redis.call('EXPIRE', KEYS[1], ttl)
+return {allowed, tostring(tokens)}
+"""
+
+
 class TokenBucketRateLimiter:
     """
     Token bucket rate limiter with Redis backend.
     
     Allows burst traffic up to bucket capacity, then enforces steady rate.
+    Each Redis check is a single atomic script call, so concurrent workers
+    and pods can never admit more than the bucket holds.
     """
     
     # Rate limits per service (tokens per minute)
@@ -66,15 +230,31 @@ class TokenBucketRateLimiter:
         },
     }
     
-    def __init__(self, redis_client = None):
+    # Tokens reserved from Redis at once for high-rate services; they are
+    # handed out in-process until used up or LEASE_TTL seconds pass
+    SERVICE_LEASES = {
+        RateLimitService.HUBSPOT: 10,
+    }
+    LEASE_TTL = 1.0  # seconds
+    
+    BUCKET_TTL = 3600  # Redis key expiry (seconds)
+    
+    def __init__(self, redis_client = None, lease_sizes: Optional[Dict] = None):
         """
         Initialize rate limiter.
         
         Args:
             redis_client: Redis client for distributed tracking
+            lease_sizes: Tokens to pre-reserve per service (default:
+                SERVICE_LEASES); only used with Redis
         """
         self.redis = redis_client
         self.local_cache = {}  # Fallback for when Redis unavailable
+        self.lease_sizes = self.SERVICE_LEASES if lease_sizes is None else lease_sizes
+        self._leases: Dict[str, Dict] = {}
+        self._lease_locks: Dict[str, asyncio.Lock] = {}
+        self._wait_queues: Dict[str, TokenWaitQueue] = {}
+        self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT) if redis_client else None
     
     def _get_key(self, service: RateLimitService, user_id: Optional[str] = None) -> str:
         """Generate Redis key for rate limit tracking."""
@@ -112,51 +292,126 @@ class TokenBucketRateLimiter:
         
         if self.redis:
             # Redis-backed distributed rate limiting
+            lease_size = self.lease_sizes.get(service, 0)
+            if lease_size > 1:
+                return await self._check_leased(key, config, cost, lease_size)
             return await self._check_redis(key, config, cost, now)
         else:
             # Local fallback
             return self._check_local(key, config, cost, now)
     
+    async def acquire(
+        self,
+        service: RateLimitService,
+        cost: int = 1,
+        user_id: Optional[str] = None,
+        priority: Optional[RequestPriority] = None,
+    ) -> float:
+        """
+        Wait until the request fits the rate limit, then consume it.
+        
+        Unlike check_limit(), this never raises RateLimitExceeded: callers
+        are parked in a FIFO queue per bucket (interactive lane first) and
+        woken when tokens refill.
+        
+        Args:
+            service: Service being called
+            cost: Token cost
+            user_id: Optional user ID for per-user limits
+            priority: Queue lane (default: the current rate_limit_priority)
+        
+        Returns:
+            Seconds waited
+        """
+        config = self.SERVICE_LIMITS.get(service)
+        if not config:
+            return 0.0
+        if cost > config["capacity"]:
+            raise ValueError(
+                f"Cost {cost} exceeds {service.value} bucket capacity {config['capacity']}"
+            )
+        
+        key = self._get_key(service, user_id)
+        queue = self._wait_queues.get(key)
+        if queue is None:
+            async def take(amount: float) -> float:
+                try:
+                    await self.check_limit(service, int(amount), user_id)
+                    return 0.0
+                except RateLimitExceeded as e:
+                    return max(e.reset_at - time.time(), TokenWaitQueue.MIN_WAIT)
+            
+            queue = self._wait_queues[key] = TokenWaitQueue(take)
+        return await queue.acquire(cost, priority)
+    
+    async def check_many(
+        self,
+        checks: List[Tuple[RateLimitService, int, Optional[str]]],
+    ) -> List[bool]:
+        """
+        Check several buckets in one pipelined Redis round-trip.
+        
+        Each bucket is checked and consumed independently (atomically per
+        bucket), so a denied bucket does not refund the others.
+        
+        Args:
+            checks: (service, cost, user_id) tuples
+        
+        Returns:
+            True/False per check, in order
+        """
+        now = time.time()
+        results: List[Optional[bool]] = [None] * len(checks)
+        queued = []
+        
+        for i, (service, cost, user_id) in enumerate(checks):
+            config = self.SERVICE_LIMITS.get(service)
+            if not config:
+                results[i] = True
+            elif not self.redis:
+                results[i] = self._allowed(self._check_local, self._get_key(service, user_id), config, cost, now)
+            else:
+                queued.append((i, self._get_key(service, user_id), config, cost))
+        
+        if queued:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for _, key, config, cost in queued:
+                    await self._script(keys=[key], args=self._script_args(config, cost, now), client=pipe)
+                replies = await pipe.execute()
+                for (i, _, _, _), (allowed, _tokens) in zip(queued, replies):
+                    results[i] = bool(int(allowed))
+            except Exception as e:
+                logger.error(f"Redis rate limit check failed: {e}, falling back to local")
+                for i, key, config, cost in queued:
+                    results[i] = self._allowed(self._check_local, key, config, cost, now)
+        
+        return results
+    
+    @staticmethod
+    def _allowed(check, key: str, config: Dict, cost: int, now: float) -> bool:
+        try:
+            return check(key, config, cost, now)
+        except RateLimitExceeded:
+            return False
+    
+    def _script_args(self, config: Dict, cost: float, now: float) -> List:
+        return [config["capacity"], config["refill_rate"] / 60.0, cost, now, self.BUCKET_TTL]
+    
+    @staticmethod
+    def _reset_at(config: Dict, cost: float, tokens: float, now: float) -> float:
+        needed = cost - tokens
+        return now + (needed / config["refill_rate"]) * 60
+    
     async def _check_redis(self, key: str, config: Dict, cost: int, now: float) -> bool:
-        """Check rate limit using Redis."""
+        """Check rate limit using Redis (one atomic script call)."""
         try:
-            # Get current state
-            state = await self.redis.hgetall(key)
-            
-            if not state:
-                # Initialize bucket
-                tokens = config["capacity"] - cost
-                await self.redis.hset(key, mapping={
-                    "tokens": str(tokens),
-                    "last_refill": str(now)
-                })
-                await self.redis.expire(key, 3600)  # Expire after 1 hour
+            allowed, tokens = await self._script(
+                keys=[key], args=self._script_args(config, cost, now)
+            )
+            if int(allowed):
                 return True
-            
-            # Calculate refill
-            tokens = float(state.get(b"tokens", 0))
-            last_refill = float(state.get(b"last_refill", now))
-            time_passed = now - last_refill
-            
-            # Refill tokens based on time passed
-            refill_amount = (time_passed / 60.0) * config["refill_rate"]
-            tokens = min(config["capacity"], tokens + refill_amount)
-            
-            # Check if enough tokens
-            if tokens >= cost:
-                tokens -= cost
-                await self.redis.hset(key, mapping={
-                    "tokens": str(tokens),
-                    "last_refill": str(now)
-                })
-                return True
-            else:
-                # Calculate when enough tokens will be available
-                needed = cost - tokens
-                seconds_until_available = (needed / config["refill_rate"]) * 60
-                reset_at = now + seconds_until_available
-                
-                raise RateLimitExceeded(key.split(":")[1], reset_at)
+            raise RateLimitExceeded(key.split(":")[1], self._reset_at(config, cost, float(tokens), now))
                 
         except RateLimitExceeded:
             raise
@@ -164,6 +419,43 @@ class TokenBucketRateLimiter:
             logger.error(f"Redis rate limit check failed: {e}, falling back to local")
             return self._check_local(key, config, cost, now)
     
+    async def _check_leased(self, key: str, config: Dict, cost: int, lease_size: int) -> bool:
+        """Serve a check from an in-process lease, refilling it from Redis.
+        
+        Leased tokens are already consumed in Redis, so leases can only
+        under-admit (tokens left when a lease expires are dropped).
+        """
+        lock = self._lease_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            now = time.time()
+            lease = self._leases.get(key)
+            if lease and lease["expires"] > now and lease["tokens"] >= cost:
+                lease["tokens"] -= cost
+                return True
+            
+            # Reserve a fresh lease; if the bucket cannot cover a whole
+            # lease, fall back to taking just this request's cost
+            size = max(lease_size, cost)
+            try:
+                allowed, tokens = await self._script(
+                    keys=[key], args=self._script_args(config, size, now)
+                )
+                if not int(allowed) and size > cost:
+                    size = cost
+                    allowed, tokens = await self._script(
+                        keys=[key], args=self._script_args(config, size, now)
+                    )
+            except Exception as e:
+                logger.error(f"Redis rate limit check failed: {e}, falling back to local")
+                return self._check_local(key, config, cost, now)
+            
+            if not int(allowed):
+                self._leases.pop(key, None)
+                raise RateLimitExceeded(key.split(":")[1], self._reset_at(config, cost, float(tokens), now))
+            
+            self._leases[key] = {"tokens": size - cost, "expires": now + self.LEASE_TTL}
+            return True
+    
     def _check_local(self, key: str, config: Dict, cost: int, now: float) -> bool:
         """Check rate limit using local memory (fallback)."""
         if key not in self.local_cache:
@@ -0,0 +1,26 @@
+"""
+Retrieval Module
+================
+Chunked, embedded Drive documents served from a memory-mapped vector file.
+"""
+
+from .document_retrieval import (
+    ChunkHit,
+    DocumentRetrievalService,
+    chunk_text,
+    get_document_retrieval_service,
+)
+from .embedders import Embedder, HashingEmbedder, OpenAIEmbedder, default_embedder
+from .vector_file import MappedVectorStore
+
+__all__ = [
+    "ChunkHit",
+    "DocumentRetrievalService",
+    "chunk_text",
+    "get_document_retrieval_service",
+    "Embedder",
+    "HashingEmbedder",
+    "OpenAIEmbedder",
+    "default_embedder",
+    "MappedVectorStore",
+]
@@ -0,0 +1,342 @@
+"""
+Document-chunk retrieval over Google Drive assets.
+
+Drive documents are split into overlapping word windows, embedded, and
+stored under ``drive_file_id:chunk_index`` in a MappedVectorStore. A file
+is only re-chunked when its version (Drive ``modifiedTime``, or a content
+hash) changes. Chunks are also written to the ``document_embeddings``
+table when a DB session factory is configured, which lets an empty
+vector file be rebuilt from the database.
+"""
+
+import asyncio
+import hashlib
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, select
+
+from src.logger import get_logger
+from src.retrieval.embedders import Embedder, default_embedder
+from src.retrieval.vector_file import MappedVectorStore
+
+logger = get_logger(__name__)
+
+CHUNK_WORDS = 200
+CHUNK_OVERLAP = 40
+SYNC_CONCURRENCY = 4
+
+
+def chunk_text(text: str, chunk_words: int = CHUNK_WORDS, overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """Split text into windows of ``chunk_words`` words overlapping by ``overlap``."""
+    words = text.split()
+    if not words:
+        return []
+    step = max(1, chunk_words - overlap)
+    return [
+        " ".join(words[start:start + chunk_words])
+        for start in range(0, max(1, len(words) - overlap), step)
+    ]
+
+
+@dataclass
+class ChunkHit:
+    """A chunk matching a retrieval query."""
+    drive_file_id: str
+    chunk_index: int
+    score: float
+    text: str
+    metadata: Dict[str, Any]
+
+
+def _matches(filters: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Metadata predicate: every field equals the value (or is one of a list of values)."""
+    allowed = {
+        field: set(value) if isinstance(value, (list, tuple, set)) else {value}
+        for field, value in filters.items()
+    }
+    return lambda meta: all(meta.get(field) in values for field, values in allowed.items())
+
+
+class DocumentRetrievalService:
+    """Chunk, embed and search Drive documents."""
+
+    def __init__(
+        self,
+        store: MappedVectorStore,
+        embedder: Embedder,
+        drive_connector=None,
+        session_factory=None,
+    ):
+        """
+        Args:
+            store: Vector file holding the chunks
+            embedder: Embedder whose dim matches the store
+            drive_connector: DriveConnector used by sync_drive()
+            session_factory: Async context manager factory for DB sessions
+                (e.g. src.db.get_session); None keeps chunks in the vector file only
+        """
+        if store.dim != embedder.dim:
+            raise ValueError(f"Store dim {store.dim} does not match embedder dim {embedder.dim}")
+        self.store = store
+        self.embedder = embedder
+        self.drive = drive_connector
+        self.session_factory = session_factory
+        self._bootstrapped = False
+
+    def indexed_version(self, drive_file_id: str) -> Optional[str]:
+        """Version of the indexed copy of a file, if any."""
+        meta = self.store.get(f"{drive_file_id}:0")
+        return meta.get("version") if meta else None
+
+    async def index_document(
+        self,
+        drive_file_id: str,
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        version: Optional[str] = None,
+        force: bool = False,
+    ) -> int:
+        """Chunk, embed and store one document, replacing its previous chunks.
+
+        Args:
+            drive_file_id: Drive file ID
+            text: Document text
+            metadata: Filterable fields stored with every chunk (name, folder, ...)
+            version: Document version; defaults to a hash of ``text``
+            force: Re-index even if the version is unchanged
+
+        Returns:
+            Number of chunks written (0 if the document was unchanged)
+        """
+        version = version or hashlib.sha1(text.encode("utf-8")).hexdigest()
+        if not force and self.indexed_version(drive_file_id) == version:
+            return 0
+
+        chunks = chunk_text(text)
+        vectors = await self.embedder.embed(chunks) if chunks else []
+        rows = [
+            (
+                f"{drive_file_id}:{i}",
+                vector,
+                {
+                    **(metadata or {}),
+                    "drive_file_id": drive_file_id,
+                    "chunk_index": i,
+                    "version": version,
+                    "text": chunk,
+                },
+            )
+            for i, (chunk, vector) in enumerate(zip(chunks, vectors))
+        ]
+        self.store.add(rows)
+        self.store.delete(self._chunk_keys(drive_file_id, start=len(rows)))
+        await self._persist(drive_file_id, rows)
+
+        logger.info(f"Indexed {len(rows)} chunks for Drive file {drive_file_id}")
+        return len(rows)
+
+    async def remove_document(self, drive_file_id: str) -> int:
+        """Remove every chunk of a document."""
+        removed = self.store.delete(self._chunk_keys(drive_file_id))
+        await self._persist(drive_file_id, [])
+        return removed
+
+    async def search(
+        self,
+        query: str,
+        k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        min_score: Optional[float] = None,
+    ) -> List[ChunkHit]:
+        """Top ``k`` chunks for ``query``.
+
+        Args:
+            query: Natural language query
+            k: Maximum chunks
+            filters: Metadata filters, e.g. ``{"folder": "pesti_sales", "type": ["pdf", "document"]}``
+            min_score: Drop chunks whose cosine similarity is below this; the
+                store returns the top ``k`` however weak the match
+
+        Returns:
+            Matching chunks, best first
+        """
+        await self._bootstrap()
+        if not query.strip() or not len(self.store):
+            return []
+        vector = (await self.embedder.embed([query]))[0]
+        where = _matches(filters) if filters else None
+        return [
+            ChunkHit(
+                drive_file_id=meta["drive_file_id"],
+                chunk_index=meta["chunk_index"],
+                score=score,
+                text=meta.get("text", ""),
+                metadata=meta,
+            )
+            for _, score, meta in self.store.search(vector, k, where)
+            if min_score is None or score >= min_score
+        ]
+
+    async def search_files(
+        self,
+        query: str,
+        k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        min_score: Optional[float] = None,
+    ) -> List[ChunkHit]:
+        """Best-matching chunk of each of the top ``k`` files."""
+        best: Dict[str, ChunkHit] = {}
+        for hit in await self.search(query, k * 4, filters, min_score):
+            if hit.drive_file_id not in best:
+                best[hit.drive_file_id] = hit
+            if len(best) == k:
+                break
+        return list(best.values())
+
+    async def sync_drive(self, max_files: Optional[int] = None) -> Dict[str, int]:
+        """Index new and modified files in the Drive connector's allowlisted folders.
+
+        Returns:
+            Counts of files indexed, unchanged and failed
+        """
+        stats = {"indexed": 0, "unchanged": 0, "failed": 0}
+        if self.drive is None:
+            return stats
+
+        candidates = []
+        for folder_key, config in self.drive.FOLDER_CONFIG.items():
+            folder_id = config.get("id") or os.environ.get(f"{folder_key.upper()}_FOLDER_ID")
+            if not folder_id:
+                continue
+            try:
+                files = await self.drive.list_folder_files(folder_id)
+            except Exception as e:
+                logger.error(f"Error listing Drive folder {folder_key}: {e}")
+                continue
+            candidates.extend(
+                (folder_key, file) for file in files if self.drive.is_allowed(file, config)
+            )
+        if max_files is not None:
+            candidates = candidates[:max_files]
+
+        semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+
+        async def sync_file(folder_key: str, file: Dict[str, Any]) -> None:
+            version = file.get("modifiedTime")
+            if version and self.indexed_version(file["id"]) == version:
+                stats["unchanged"] += 1
+                return
+            async with semaphore:
+                try:
+                    text = await self.drive.get_file_content(file["id"], file.get("mimeType"))
+                    if text.startswith("[Binary Content") or text.startswith("[Error downloading"):
+                        stats["failed"] += 1
+                        return
+                    await self.index_document(
+                        file["id"],
+                        text,
+                        metadata={
+                            "name": file.get("name", ""),
+                            "folder": folder_key,
+                            "mime_type": file.get("mimeType", ""),
+                            "type": self.drive.get_asset_type(file.get("mimeType", "")),
+                            "link": file.get("webViewLink", ""),
+                            "modified": version or "",
+                        },
+                        version=version,
+                    )
+                    stats["indexed"] += 1
+                except Exception as e:
+                    logger.error(f"Error indexing Drive file {file.get('id')}: {e}")
+                    stats["failed"] += 1
+
+        await asyncio.gather(*(sync_file(folder_key, file) for folder_key, file in candidates))
+        if self.store.deleted > len(self.store):
+            self.store.compact()
+        logger.info(f"Drive document sync: {stats}")
+        return stats
+
+    def _chunk_keys(self, drive_file_id: str, start: int = 0) -> List[str]:
+        keys = []
+        index = start
+        while f"{drive_file_id}:{index}" in self.store:
+            keys.append(f"{drive_file_id}:{index}")
+            index += 1
+        return keys
+
+    async def _persist(self, drive_file_id: str, rows: List[tuple]) -> None:
+        """Replace a document's rows in the document_embeddings table."""
+        if self.session_factory is None:
+            return
+        from src.models.embeddings import DocumentEmbedding
+
+        try:
+            async with self.session_factory() as db:
+                await db.execute(
+                    delete(DocumentEmbedding).where(DocumentEmbedding.drive_file_id == drive_file_id)
+                )
+                for key, vector, meta in rows:
+                    db.add(DocumentEmbedding(
+                        id=uuid.uuid4(),
+                        drive_file_id=drive_file_id,
+                        chunk_index=str(meta["chunk_index"]),
+                        chunk_text=meta["text"],
+                        embedding=[float(x) for x in vector],
+                        metadata_={k: v for k, v in meta.items() if k != "text"},
+                    ))
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist chunks for Drive file {drive_file_id}: {e}")
+
+    async def _bootstrap(self) -> None:
+        """Rebuild an empty vector file from the document_embeddings table once."""
+        if self._bootstrapped or len(self.store) or self.session_factory is None:
+            self._bootstrapped = True
+            return
+        self._bootstrapped = True
+        from src.models.embeddings import DocumentEmbedding
+
+        try:
+            async with self.session_factory() as db:
+                result = await db.execute(select(DocumentEmbedding))
+                records = result.scalars().all()
+        except Exception as e:
+            logger.warning(f"Could not load document embeddings from the database: {e}")
+            return
+        rows = [
+            (
+                f"{r.drive_file_id}:{r.chunk_index}",
+                r.embedding,
+                {**(r.metadata_ or {}), "drive_file_id": r.drive_file_id,
+                 "chunk_index": int(r.chunk_index), "text": r.chunk_text},
+            )
+            for r in records
+            if r.embedding and len(r.embedding) == self.store.dim
+        ]
+        self.store.add(rows)
+        logger.info(f"Rebuilt document vector file with {len(rows)} chunks from the database")
+
+
+_retrieval_service: Optional[DocumentRetrievalService] = None
+
+
+def get_document_retrieval_service() -> DocumentRetrievalService:
+    """Singleton retrieval service backed by DOCUMENT_INDEX_PATH."""
+    global _retrieval_service
+    if _retrieval_service is None:
+        from src.config import get_settings
+        from src.connectors.drive import create_drive_connector
+        from src.db import get_session
+
+        embedder = default_embedder()
+        path = os.path.join(get_settings().document_index_path, embedder.name)
+        _retrieval_service = DocumentRetrievalService(
+            MappedVectorStore(path, embedder.dim),
+            embedder,
+            drive_connector=create_drive_connector(),
+            session_factory=get_session,
+        )
+    return _retrieval_service
@@ -0,0 +1,90 @@
+"""
+Text embedders for document retrieval.
+
+``OpenAIEmbedder`` calls the embeddings API in batches. ``HashingEmbedder``
+is a local stand-in (feature-hashed word and bigram counts) with no
+network or model download, for tests and development environments
+without an OpenAI key.
+"""
+
+import hashlib
+import re
+from typing import List, Optional, Protocol, Sequence
+
+import numpy as np
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class Embedder(Protocol):
+    """Turns texts into fixed-size vectors."""
+
+    name: str
+    dim: int
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Return a ``(len(texts), dim)`` float32 array."""
+        ...
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-words embedder using the hashing trick."""
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _bucket(self, feature: str) -> tuple:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        return value % self.dim, 1.0 if value >> 63 else -1.0
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            tokens = _TOKEN_RE.findall(text.lower())
+            for feature in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+                index, sign = self._bucket(feature)
+                vectors[row, index] += sign
+        return vectors
+
+
+class OpenAIEmbedder:
+    """OpenAI embeddings API, batched."""
+
+    DIMENSIONS = {"text-embedding-3-small": 1536, "text-embedding-3-large": 3072}
+
+    def __init__(self, model: str = "text-embedding-3-small", api_key: Optional[str] = None, batch_size: int = 96):
+        from openai import AsyncOpenAI
+
+        from src.config import get_settings
+
+        self.model = model
+        self.name = model
+        self.dim = self.DIMENSIONS.get(model, 1536)
+        self.batch_size = batch_size
+        self._client = AsyncOpenAI(api_key=api_key or get_settings().openai_api_key)
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[List[float]] = []
+        for i in range(0, len(texts), self.batch_size):
+            response = await self._client.embeddings.create(
+                model=self.model,
+                input=[t[:8000] for t in texts[i:i + self.batch_size]],
+            )
+            rows.extend(item.embedding for item in sorted(response.data, key=lambda d: d.index))
+        return np.asarray(rows, dtype=np.float32).reshape(len(texts), self.dim)
+
+
+def default_embedder() -> Embedder:
+    """OpenAI embeddings when a key is configured, else the hashing stand-in."""
+    from src.config import get_settings
+
+    if get_settings().openai_api_key:
+        return OpenAIEmbedder()
+    logger.warning("OPENAI_API_KEY not configured; document retrieval uses the hashing embedder")
+    return HashingEmbedder()
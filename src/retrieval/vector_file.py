@@ -0,0 +1,220 @@
+"""
+Memory-mapped vector file with a JSON-lines id sidecar.
+
+Layout for a store at ``path``:
+
+- ``path.f32``: L2-normalized float32 rows, appended in row order
+- ``path.ids.jsonl``: a header line ``{"dim": ...}``, then one line per
+  row (``{"row": i, "key": ..., "meta": {...}}``) and one line per
+  deletion (``{"delete": i}``)
+
+Vectors are written before their sidecar lines, so a crash mid-append
+leaves at most some unreferenced trailing rows, which are ignored. Cold
+starts map the vector file instead of parsing embeddings from JSON, and
+readers in other processes pick up appends on their next search. There
+must be a single writer process (the Drive sync job).
+"""
+
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.logger import get_logger
+from src.services.vector_math import normalize, top_k
+
+logger = get_logger(__name__)
+
+
+class MappedVectorStore:
+    """Append-only float32 vector file plus id/metadata sidecar."""
+
+    def __init__(self, path: str, dim: int):
+        """
+        Args:
+            path: File prefix; ``.f32`` and ``.ids.jsonl`` are added
+            dim: Vector dimension. An existing store of another dimension
+                is discarded (e.g. after switching embedding models).
+        """
+        self.path = path
+        self.dim = dim
+        self.vectors_path = f"{path}.f32"
+        self.ids_path = f"{path}.ids.jsonl"
+        self.keys: List[str] = []
+        self.meta: List[Dict[str, Any]] = []
+        self._live: List[bool] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        self._sidecar: Optional[Tuple[int, int]] = None  # (inode, size) last read
+        self._offset = 0
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Metadata of a live row."""
+        row = self._rows.get(key)
+        return self.meta[row] if row is not None else None
+
+    def refresh(self) -> None:
+        """Apply sidecar lines appended since the last read and remap the vectors."""
+        try:
+            stat = os.stat(self.ids_path)
+        except FileNotFoundError:
+            if self._sidecar is not None or self.keys:
+                self._clear()
+            return
+        if self._sidecar == (stat.st_ino, stat.st_size):
+            return
+        if self._sidecar is None or stat.st_ino != self._sidecar[0] or stat.st_size < self._offset:
+            # First read, or the file was compacted: start over
+            self._clear()
+
+        with open(self.ids_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read()
+        complete = data.rfind(b"\n") + 1  # a partial trailing line is read next time
+        for line in data[:complete].splitlines():
+            entry = json.loads(line)
+            if "dim" in entry:
+                if entry["dim"] != self.dim:
+                    logger.warning(
+                        f"Vector store {self.path} has dim {entry['dim']}, expected {self.dim}; resetting"
+                    )
+                    self._reset()
+                    return
+            elif "delete" in entry:
+                row = entry["delete"]
+                if row < len(self.keys):
+                    self._live[row] = False
+                    if self._rows.get(self.keys[row]) == row:
+                        del self._rows[self.keys[row]]
+            else:
+                self._rows[entry["key"]] = len(self.keys)
+                self.keys.append(entry["key"])
+                self.meta.append(entry["meta"])
+                self._live.append(True)
+        self._offset += complete
+        self._sidecar = (stat.st_ino, stat.st_size)
+
+        rows_on_disk = os.path.getsize(self.vectors_path) // (4 * self.dim) if os.path.exists(self.vectors_path) else 0
+        n = min(len(self.keys), rows_on_disk)
+        self._matrix = (
+            np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(n, self.dim)) if n else None
+        )
+
+    def add(self, rows: Sequence[Tuple[str, Sequence[float], Dict[str, Any]]]) -> None:
+        """Append ``(key, vector, metadata)`` rows; an existing key is replaced."""
+        if not rows:
+            return
+        vectors = np.asarray([vector for _, vector, _ in rows], dtype=np.float32)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dim vectors, got {vectors.shape[1]}")
+
+        self.refresh()
+        lines = [] if self._offset else [json.dumps({"dim": self.dim})]
+        lines += [json.dumps({"delete": self._rows[key]}) for key, _, _ in rows if key in self._rows]
+        start = len(self.keys)
+        lines += [
+            json.dumps({"row": start + i, "key": key, "meta": meta})
+            for i, (key, _, meta) in enumerate(rows)
+        ]
+        with open(self.vectors_path, "ab") as f:
+            if f.tell() != 4 * self.dim * start:
+                f.truncate(4 * self.dim * start)  # drop rows left by an interrupted append
+            f.write(normalize(vectors).tobytes())
+        self._append_sidecar(lines)
+        self.refresh()
+
+    def delete(self, keys: Sequence[str]) -> int:
+        """Mark rows deleted. Returns how many existed."""
+        self.refresh()
+        rows = [self._rows[key] for key in keys if key in self._rows]
+        if rows:
+            self._append_sidecar([json.dumps({"delete": row}) for row in rows])
+            self.refresh()
+        return len(rows)
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int = 5,
+        where: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """Top ``k`` live rows by cosine similarity to ``query``.
+
+        Args:
+            query: Query vector
+            k: Maximum results
+            where: Predicate over row metadata; only matching rows are scored
+
+        Returns:
+            List of ``(key, score, metadata)``, best first
+        """
+        self.refresh()
+        if self._matrix is None:
+            return []
+        n = len(self._matrix)
+        mask = np.array(self._live[:n], dtype=bool)
+        if where is not None:
+            mask &= np.fromiter((where(m) for m in self.meta[:n]), dtype=bool, count=n)
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            return []
+
+        q = normalize(np.asarray(query, dtype=np.float32))
+        scores = self._matrix[rows] @ q if len(rows) < n else self._matrix @ q
+        best = top_k(scores, k)
+        return [(self.keys[rows[i]], float(scores[i]), self.meta[rows[i]]) for i in best]
+
+    def compact(self) -> None:
+        """Rewrite both files without deleted rows."""
+        self.refresh()
+        n = len(self._matrix) if self._matrix is not None else 0
+        keep = [row for row in range(n) if self._live[row]]
+        vectors = np.asarray(self._matrix[keep]) if keep else np.empty((0, self.dim), np.float32)
+        lines = [json.dumps({"dim": self.dim})] + [
+            json.dumps({"row": i, "key": self.keys[row], "meta": self.meta[row]})
+            for i, row in enumerate(keep)
+        ]
+        self._matrix = None
+        tmp_vectors, tmp_ids = f"{self.vectors_path}.tmp", f"{self.ids_path}.tmp"
+        with open(tmp_vectors, "wb") as f:
+            f.write(vectors.tobytes())
+        with open(tmp_ids, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_vectors, self.vectors_path)
+        os.replace(tmp_ids, self.ids_path)
+        self.refresh()
+
+    @property
+    def deleted(self) -> int:
+        """Rows still on disk that have been deleted or replaced."""
+        return len(self.keys) - len(self._rows)
+
+    def _append_sidecar(self, lines: List[str]) -> None:
+        with open(self.ids_path, "ab") as f:
+            if f.tell() > self._offset:
+                f.truncate(self._offset)  # drop a line left by an interrupted append
+            f.write(("\n".join(lines) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _clear(self) -> None:
+        self.keys, self.meta, self._live = [], [], []
+        self._rows = {}
+        self._matrix = None
+        self._sidecar = None
+        self._offset = 0
+
+    def _reset(self) -> None:
+        for file_path in (self.vectors_path, self.ids_path):
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        self._clear()
@@ -430,13 +430,10 @@ async def get_todays_moves(
         enrichment_service = get_contact_enrichment_service()
         # Build dict of contact_id -> ContactInfo
         contact_ids = {item.contact_id for item in items if item.contact_id}
-        contact_map = {}
-        for contact_id in contact_ids:
-            try:
-                info = await enrichment_service.get_contact_info(contact_id)
-                contact_map[contact_id] = info
-            except Exception:
-                pass  # Skip failed enrichments
+        try:
+            contact_map = await enrichment_service.get_contact_infos(contact_ids)
+        except Exception:
+            contact_map = {}  # Skip failed enrichments
         
         # Convert with enrichment
         responses = []
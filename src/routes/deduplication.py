@@ -83,6 +83,7 @@ async def run_bulk_deduplication(request: BulkDeduplicationRequest):
         "matches": [m.to_dict() for m in matches[:100]],  # Limit response
         "total": len(matches),
         "by_confidence": by_confidence,
+        "blocking": engine.last_blocking_stats.to_dict() if engine.last_blocking_stats else None,
     }
 
 
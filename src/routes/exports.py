@@ -5,7 +5,7 @@ REST API for exporting data.
 """
 
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional
 
@@ -28,6 +28,18 @@ class CreateExportRequest(BaseModel):
     include_headers: bool = True
 
 
+def _stream_download(download: dict) -> StreamingResponse:
+    """Stream an export file in chunks rather than loading it into memory."""
+    return StreamingResponse(
+        download["stream"],
+        media_type=download["content_type"],
+        headers={
+            "Content-Disposition": f'attachment; filename="{download["file_name"]}"',
+            "Content-Length": str(download["size"]),
+        }
+    )
+
+
 @router.post("")
 async def create_export(request: CreateExportRequest):
     """Create a new export job."""
@@ -171,13 +183,7 @@ async def download_export(job_id: str):
     if not download:
         raise HTTPException(status_code=404, detail="Export not found or expired")
     
-    return Response(
-        content=download["content"],
-        media_type=download["content_type"],
-        headers={
-            "Content-Disposition": f'attachment; filename="{download["file_name"]}"'
-        }
-    )
+    return _stream_download(download)
 
 
 @router.get("/{job_id}/preview")
@@ -195,19 +201,7 @@ async def preview_export(
     if job.status != ExportStatus.COMPLETED:
         raise HTTPException(status_code=400, detail="Export not completed")
     
-    # Parse content based on format
-    preview_data = []
-    
-    if job.format == ExportFormat.JSON:
-        import json
-        content = json.loads(job.file_content)
-        preview_data = content.get("data", [])[:limit]
-    
-    elif job.format == ExportFormat.CSV:
-        import csv
-        import io
-        reader = csv.DictReader(io.StringIO(job.file_content))
-        preview_data = [row for row in list(reader)[:limit]]
+    preview_data = await service.preview_export(job_id, limit=limit)
     
     return {
         "job_id": job_id,
@@ -267,12 +261,6 @@ async def quick_export(
     if job.status == ExportStatus.COMPLETED:
         download = await service.download_export(job.id)
         
-        return Response(
-            content=download["content"],
-            media_type=download["content_type"],
-            headers={
-                "Content-Disposition": f'attachment; filename="{download["file_name"]}"'
-            }
-        )
+        return _stream_download(download)
     else:
         raise HTTPException(status_code=500, detail=job.error_message or "Export failed")
@@ -18,6 +18,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from src.db import get_session
+from src.services.embedding_client import get_embedding_client
 from src.services.memory_service import MemoryService
 from src.logger import get_logger
 from src.security.csrf import verify_csrf_token
@@ -287,7 +288,8 @@ async def get_memory_stats(
     Get memory usage statistics for a user.
     
     Returns:
-        Total sessions, messages, summaries, etc.
+        Total sessions, messages, summaries, etc., plus embedding cache
+        hit rate and batch sizes for this worker.
     """
     async with get_session() as db:
         from sqlalchemy import select, func
@@ -328,5 +330,6 @@ async def get_memory_stats(
                 "total_messages": message_count,
                 "total_summaries": summary_count,
             },
+            "embeddings": get_embedding_client().metrics(),
             "timestamp": datetime.utcnow().isoformat(),
         }
@@ -46,6 +46,11 @@ class GetContactsRequest(BaseModel):
     contacts: list[dict]
 
 
+class ContactChangeRequest(BaseModel):
+    contact_before: Optional[dict] = None
+    contact_after: Optional[dict] = None
+
+
 class PreviewSegmentRequest(BaseModel):
     rules: list[dict]
     match_type: str = "all"
@@ -234,6 +239,35 @@ async def refresh_membership(segment_id: str, contacts: list[dict]):
     return result
 
 
+@router.post("/contacts/changes")
+async def apply_contact_change(request: ContactChangeRequest):
+    """Incrementally update memberships for a changed contact."""
+    engine = get_segmentation_engine()
+    
+    if request.contact_before is None and request.contact_after is None:
+        raise HTTPException(status_code=400, detail="contact_before or contact_after is required")
+    
+    deltas = engine.apply_contact_change(request.contact_before, request.contact_after)
+    
+    return {
+        "deltas": [d.to_dict() for d in deltas],
+        "total": len(deltas),
+    }
+
+
+@router.post("/expirations/process")
+async def process_expirations():
+    """Re-evaluate members whose time-window rules have lapsed."""
+    engine = get_segmentation_engine()
+    
+    deltas = engine.process_expirations()
+    
+    return {
+        "deltas": [d.to_dict() for d in deltas],
+        "total": len(deltas),
+    }
+
+
 @router.post("/preview")
 async def preview_segment(request: PreviewSegmentRequest):
     """Preview segment membership without creating it."""
@@ -251,6 +251,13 @@ async def resume_waiting_executions():
     }
 
 
+@router.get("/runner/metrics")
+async def get_runner_metrics():
+    """Step runner queue depth, worker usage and step latency."""
+    engine = get_workflow_engine()
+    return engine.runner.metrics()
+
+
 @router.get("/step-types")
 async def list_step_types():
     """List available step types."""
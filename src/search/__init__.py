@@ -16,6 +16,7 @@ from .search_service import (
     SearchableEntity,
     SearchOperator,
 )
+from .inverted_index import InvertedIndex
 
 __all__ = [
     "SearchService",
@@ -28,4 +29,5 @@ __all__ = [
     "SearchIndex",
     "SearchableEntity",
     "SearchOperator",
+    "InvertedIndex",
 ]
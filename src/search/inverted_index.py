@@ -0,0 +1,183 @@
+"""
+Inverted Index
+==============
+In-process inverted index with BM25 scoring used by the search service.
+"""
+
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Iterable, Optional
+import heapq
+import math
+import re
+
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class InvertedIndex:
+    """
+    Field-aware inverted index.
+
+    Postings are kept per term and field (term -> field -> {doc_id: tf}) so
+    each field is scored with its own length normalization and boost, in
+    the style of BM25F. Documents are added and removed incrementally.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[list[str]] = None,
+        boost_fields: Optional[dict[str, float]] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            fields: Fields to index (default: every non-underscore string field)
+            boost_fields: Per-field score multipliers
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.fields = list(fields) if fields else None
+        self.boost_fields = dict(boost_fields or {})
+        self.k1 = k1
+        self.b = b
+
+        self.postings: dict[str, dict[str, dict[str, int]]] = {}
+        self._doc_terms: dict[str, dict[str, Counter]] = {}
+        self._field_doc_counts: Counter = Counter()
+        self._field_length_totals: Counter = Counter()
+        self._field_lengths: dict[str, dict[str, int]] = {}
+        self._vocabulary: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_terms
+
+    @property
+    def doc_ids(self) -> Iterable[str]:
+        """Ids of all indexed documents."""
+        return self._doc_terms.keys()
+
+    @property
+    def term_count(self) -> int:
+        """Number of distinct terms in the index."""
+        return len(self.postings)
+
+    def add(self, doc_id: str, doc: dict) -> None:
+        """Index a document, replacing any previous version."""
+        if doc_id in self._doc_terms:
+            self.remove(doc_id)
+
+        field_terms: dict[str, Counter] = {}
+        if self.fields is not None:
+            keys = self.fields
+        else:
+            keys = [key for key in doc if not key.startswith("_")]
+        for key in keys:
+            value = doc.get(key)
+            if not isinstance(value, str):
+                continue
+            counts = Counter(tokenize(value))
+            if not counts:
+                continue
+            length = sum(counts.values())
+            field_terms[key] = counts
+            self._field_doc_counts[key] += 1
+            self._field_length_totals[key] += length
+            self._field_lengths.setdefault(key, {})[doc_id] = length
+            for term, tf in counts.items():
+                by_field = self.postings.get(term)
+                if by_field is None:
+                    by_field = self.postings[term] = {}
+                    insort(self._vocabulary, term)
+                by_field.setdefault(key, {})[doc_id] = tf
+
+        self._doc_terms[doc_id] = field_terms
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document. Returns False if it was not indexed."""
+        field_terms = self._doc_terms.pop(doc_id, None)
+        if field_terms is None:
+            return False
+
+        for key, counts in field_terms.items():
+            self._field_doc_counts[key] -= 1
+            self._field_length_totals[key] -= self._field_lengths[key].pop(doc_id)
+            for term in counts:
+                by_field = self.postings[term]
+                docs = by_field[key]
+                del docs[doc_id]
+                if not docs:
+                    del by_field[key]
+                if not by_field:
+                    del self.postings[term]
+                    pos = bisect_left(self._vocabulary, term)
+                    del self._vocabulary[pos]
+        return True
+
+    def score(self, terms: Iterable[str]) -> dict[str, float]:
+        """
+        Score every document that contains at least one of the terms.
+
+        Returns:
+            Mapping of doc_id to BM25 score
+        """
+        scores: dict[str, float] = {}
+        k1 = self.k1
+        b = self.b
+
+        for term in dict.fromkeys(terms):
+            by_field = self.postings.get(term)
+            if not by_field:
+                continue
+            for key, docs in by_field.items():
+                n_docs = self._field_doc_counts[key]
+                avg_len = self._field_length_totals[key] / n_docs
+                lengths = self._field_lengths[key]
+                df = len(docs)
+                idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                weight = idf * self.boost_fields.get(key, 1.0)
+                for doc_id, tf in docs.items():
+                    norm = k1 * (1.0 - b + b * lengths[doc_id] / avg_len)
+                    contribution = weight * tf * (k1 + 1.0) / (tf + norm)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + contribution
+
+        return scores
+
+    def terms_with_prefix(self, prefix: str, limit: Optional[int] = None) -> list[str]:
+        """Return indexed terms starting with prefix, in sorted order."""
+        vocabulary = self._vocabulary
+        matches = []
+        for pos in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            term = vocabulary[pos]
+            if not term.startswith(prefix):
+                break
+            matches.append(term)
+            if limit is not None and len(matches) >= limit:
+                break
+        return matches
+
+    def documents_with_terms(self, terms: Iterable[str]) -> set[str]:
+        """Return ids of documents containing any of the terms."""
+        doc_ids: set[str] = set()
+        for term in terms:
+            for docs in self.postings.get(term, {}).values():
+                doc_ids.update(docs)
+        return doc_ids
+
+
+def top_k(scores: dict[str, float], k: int) -> list[tuple[str, float]]:
+    """Select the k highest scoring documents using a bounded heap."""
+    if k <= 0:
+        return []
+    return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
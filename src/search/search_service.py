@@ -7,10 +7,17 @@ Advanced search functionality with full-text search, filters, facets, and sugges
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Optional
 import re
 import uuid
 
+from .inverted_index import InvertedIndex, tokenize, top_k
+
+# The last query term also matches indexed terms it prefixes (search-as-you-type)
+MAX_PREFIX_TERMS = 50
+PREFIX_MATCH_WEIGHT = 0.5
+
 
 class SearchableEntity(str, Enum):
     """Searchable entity types."""
@@ -175,6 +182,10 @@ class SearchService:
         self.saved_searches: dict[str, SavedSearch] = {}
         self.recent_searches: list[RecentSearch] = []
         
+        # Inverted indexes, partitioned by entity type
+        self._content_indexes: dict[str, InvertedIndex] = {}
+        self._title_index = InvertedIndex(fields=["_title"])
+        
         # Initialize default indexes
         self._init_indexes()
     
@@ -262,57 +273,34 @@ class SearchService:
         # Normalize query
         normalized_query = self._normalize_query(query)
         
-        # Find matching documents
-        matches = []
-        for doc_id, doc in self.documents.items():
-            # Check entity type
-            doc_type = SearchableEntity(doc.get("_type", "all"))
-            if SearchableEntity.ALL not in entity_types and doc_type not in entity_types:
-                continue
-            
-            # Calculate relevance score
-            score = self._calculate_score(normalized_query, doc)
-            if score > 0:
-                # Apply filters
-                if filters and not self._apply_filters(doc, filters):
-                    continue
-                
-                # Create result item
-                item = SearchResultItem(
-                    id=doc_id,
-                    entity_type=doc_type,
-                    title=doc.get("_title", ""),
-                    subtitle=doc.get("_subtitle"),
-                    description=doc.get("_description"),
-                    score=score,
-                    highlights=self._get_highlights(normalized_query, doc),
-                    metadata=doc.get("_metadata", {}),
-                    created_at=doc.get("_created_at"),
-                    updated_at=doc.get("_updated_at"),
-                    url=doc.get("_url"),
-                )
-                matches.append(item)
+        # Score candidate documents from the inverted indexes
+        scores, type_counts = self._score_candidates(
+            normalized_query, entity_types, filters
+        )
+        
+        total = len(scores)
+        start = (page - 1) * page_size
+        end = start + page_size
         
-        # Sort results
         if sort_by:
-            matches.sort(
-                key=lambda x: x.metadata.get(sort_by, ""),
-                reverse=sort_order == SortOrder.DESC
-            )
+            ranked = sorted(
+                scores.items(),
+                key=lambda x: self.documents[x[0]].get("_metadata", {}).get(sort_by, ""),
+                reverse=sort_order == SortOrder.DESC,
+            )[start:end]
         else:
-            # Sort by score by default
-            matches.sort(key=lambda x: x.score, reverse=True)
+            # Sort by score by default, only keeping the requested page
+            ranked = top_k(scores, end)[start:]
         
-        # Paginate
-        total = len(matches)
-        start = (page - 1) * page_size
-        end = start + page_size
-        items = matches[start:end]
+        items = [
+            self._build_result_item(doc_id, score, normalized_query)
+            for doc_id, score in ranked
+        ]
         
         # Generate facets
         facets = {}
         if include_facets:
-            facets = self._generate_facets(matches, entity_types)
+            facets = self._generate_facets(type_counts, entity_types)
         
         # Generate suggestions
         suggestions = []
@@ -340,49 +328,102 @@ class SearchService:
         """Normalize search query."""
         return query.lower().strip()
     
-    def _calculate_score(self, query: str, doc: dict) -> float:
-        """Calculate relevance score for a document."""
-        if not query:
-            return 1.0
-        
-        score = 0.0
-        query_terms = query.split()
-        
-        # Get index for this document type
-        doc_type = doc.get("_type", "all")
-        index = None
-        for idx in self.indexes.values():
-            if idx.entity_type.value == doc_type:
-                index = idx
-                break
+    def _content_index(self, doc_type: str) -> InvertedIndex:
+        """Get or create the inverted index for an entity type."""
+        content_index = self._content_indexes.get(doc_type)
+        if content_index is None:
+            config = None
+            for idx in self.indexes.values():
+                if idx.entity_type.value == doc_type:
+                    config = idx
+                    break
+            # Every string data field is searchable; configured boosts apply on top
+            content_index = InvertedIndex(
+                boost_fields=config.boost_fields if config else None,
+            )
+            self._content_indexes[doc_type] = content_index
+        return content_index
+    
+    def _add_to_indexes(self, doc_id: str, doc: dict[str, Any]):
+        """Add or refresh a document in the inverted indexes."""
+        self._content_index(doc.get("_type", "all")).add(doc_id, doc)
+        self._title_index.add(doc_id, doc)
+    
+    def _remove_from_indexes(self, doc_id: str, doc: dict[str, Any]):
+        """Remove a document from the inverted indexes."""
+        self._content_index(doc.get("_type", "all")).remove(doc_id)
+        self._title_index.remove(doc_id)
+    
+    def _score_candidates(
+        self,
+        query: str,
+        entity_types: list[SearchableEntity],
+        filters: Optional[list[SearchFilter]] = None,
+    ) -> tuple[dict[str, float], dict[str, int]]:
+        """
+        Score documents matching the query via the inverted indexes.
         
-        # Search through fields
-        for key, value in doc.items():
-            if key.startswith("_"):
-                continue
-            
-            if isinstance(value, str):
-                value_lower = value.lower()
-                
-                # Get boost factor
-                boost = 1.0
-                if index and key in index.boost_fields:
-                    boost = index.boost_fields[key]
-                
-                # Exact match
-                if query == value_lower:
-                    score += 10.0 * boost
-                
-                # Contains full query
-                elif query in value_lower:
-                    score += 5.0 * boost
-                
-                # Term matches
-                for term in query_terms:
-                    if term in value_lower:
-                        score += 1.0 * boost
+        Returns:
+            Tuple of (doc_id -> score, entity type -> match count)
+        """
+        if SearchableEntity.ALL in entity_types:
+            doc_types = list(self._content_indexes)
+        else:
+            doc_types = [t.value for t in entity_types if t.value in self._content_indexes]
         
-        return score
+        scores: dict[str, float] = {}
+        type_counts: dict[str, int] = {}
+        terms = tokenize(query)
+        for doc_type in doc_types:
+            content_index = self._content_indexes[doc_type]
+            if not query:
+                type_scores = dict.fromkeys(content_index.doc_ids, 1.0)
+            else:
+                type_scores = self._score_terms(content_index, terms)
+            if filters:
+                type_scores = {
+                    doc_id: score for doc_id, score in type_scores.items()
+                    if self._apply_filters(self.documents[doc_id], filters)
+                }
+            if type_scores:
+                scores.update(type_scores)
+                type_counts[doc_type] = len(type_scores)
+        return scores, type_counts
+    
+    def _score_terms(self, content_index: InvertedIndex, terms: list[str]) -> dict[str, float]:
+        """BM25 scores for the query terms, with the last term also matched as a prefix."""
+        scores = content_index.score(terms)
+        if not terms:
+            return scores
+        expansions = [
+            term for term in content_index.terms_with_prefix(terms[-1], limit=MAX_PREFIX_TERMS + 1)
+            if term not in terms
+        ][:MAX_PREFIX_TERMS]
+        for doc_id, score in content_index.score(expansions).items():
+            scores[doc_id] = scores.get(doc_id, 0.0) + PREFIX_MATCH_WEIGHT * score
+        return scores
+    
+    def _build_result_item(
+        self,
+        doc_id: str,
+        score: float,
+        query: str,
+    ) -> SearchResultItem:
+        """Create a result item for a scored document."""
+        doc = self.documents[doc_id]
+        return SearchResultItem(
+            id=doc_id,
+            entity_type=SearchableEntity(doc.get("_type", "all")),
+            title=doc.get("_title", ""),
+            subtitle=doc.get("_subtitle"),
+            description=doc.get("_description"),
+            score=score,
+            highlights=self._get_highlights(query, doc),
+            metadata=doc.get("_metadata", {}),
+            created_at=doc.get("_created_at"),
+            updated_at=doc.get("_updated_at"),
+            url=doc.get("_url"),
+        )
     
     def _apply_filters(self, doc: dict, filters: list[SearchFilter]) -> bool:
         """Apply filters to a document."""
@@ -419,39 +460,28 @@ class SearchService:
     def _get_highlights(self, query: str, doc: dict) -> dict[str, list[str]]:
         """Get highlighted snippets."""
         highlights = {}
-        query_terms = query.split()
+        pattern = _highlight_pattern(query)
+        if pattern is None:
+            return highlights
         
         for key, value in doc.items():
             if key.startswith("_"):
                 continue
             
-            if isinstance(value, str):
-                for term in query_terms:
-                    if term in value.lower():
-                        # Create highlighted snippet
-                        pattern = re.compile(f"({re.escape(term)})", re.IGNORECASE)
-                        highlighted = pattern.sub(r"<em>\1</em>", value)
-                        if key not in highlights:
-                            highlights[key] = []
-                        highlights[key].append(highlighted[:200])
-                        break
+            if isinstance(value, str) and pattern.search(value):
+                highlights[key] = [pattern.sub(r"<em>\1</em>", value)[:200]]
         
         return highlights
     
     def _generate_facets(
         self,
-        results: list[SearchResultItem],
+        type_counts: dict[str, int],
         entity_types: list[SearchableEntity],
     ) -> dict[str, list[SearchFacet]]:
-        """Generate facets from results."""
+        """Generate facets from per-entity-type match counts."""
         facets = {}
         
         # Entity type facet
-        type_counts: dict[str, int] = {}
-        for item in results:
-            type_name = item.entity_type.value
-            type_counts[type_name] = type_counts.get(type_name, 0) + 1
-        
         facets["entity_type"] = [
             SearchFacet(
                 field="entity_type",
@@ -493,8 +523,16 @@ class SearchService:
         """Get search suggestions."""
         suggestions = []
         query_lower = query.lower()
+        query_terms = tokenize(query_lower)
+        if not query_terms:
+            return suggestions
         
-        for doc_id, doc in self.documents.items():
+        # Candidate titles have a word starting with the first query term
+        prefix_terms = self._title_index.terms_with_prefix(query_terms[0])
+        candidates = self._title_index.documents_with_terms(prefix_terms)
+        
+        for doc_id in candidates:
+            doc = self.documents[doc_id]
             # Check entity type
             doc_type = SearchableEntity(doc.get("_type", "all"))
             if entity_types and SearchableEntity.ALL not in entity_types:
@@ -517,7 +555,7 @@ class SearchService:
                 suggestions.append(suggestion)
         
         # Sort by score and limit
-        suggestions.sort(key=lambda x: x.score, reverse=True)
+        suggestions.sort(key=lambda x: (-x.score, x.text))
         return suggestions[:limit]
     
     async def index_document(
@@ -542,7 +580,11 @@ class SearchService:
             "_metadata": {},
             **data,
         }
+        previous = self.documents.get(doc_id)
+        if previous is not None:
+            await self.delete_document(doc_id)
         self.documents[doc_id] = doc
+        self._add_to_indexes(doc_id, doc)
         
         # Update index stats
         for idx in self.indexes.values():
@@ -554,13 +596,19 @@ class SearchService:
     async def update_document(self, doc_id: str, data: dict[str, Any]):
         """Update an indexed document."""
         if doc_id in self.documents:
-            self.documents[doc_id].update(data)
-            self.documents[doc_id]["_updated_at"] = datetime.utcnow()
+            doc = self.documents[doc_id]
+            previous_type = doc.get("_type", "all")
+            doc.update(data)
+            doc["_updated_at"] = datetime.utcnow()
+            if doc.get("_type", "all") != previous_type:
+                self._content_index(previous_type).remove(doc_id)
+            self._add_to_indexes(doc_id, doc)
     
     async def delete_document(self, doc_id: str):
         """Delete a document from the index."""
         if doc_id in self.documents:
             doc = self.documents.pop(doc_id)
+            self._remove_from_indexes(doc_id, doc)
             
             # Update index stats
             doc_type = SearchableEntity(doc.get("_type", "all"))
@@ -688,6 +736,7 @@ class SearchService:
         """Get search index statistics."""
         return {
             "total_documents": len(self.documents),
+            "total_terms": sum(i.term_count for i in self._content_indexes.values()),
             "indexes": [
                 {
                     "id": idx.id,
@@ -715,6 +764,18 @@ class SearchService:
         }
 
 
+@lru_cache(maxsize=256)
+def _highlight_pattern(query: str) -> Optional[re.Pattern]:
+    """Compile (once per query) a pattern matching any query term."""
+    terms = sorted(set(tokenize(query)), key=len, reverse=True)
+    if not terms:
+        return None
+    return re.compile(
+        "(" + "|".join(re.escape(term) for term in terms) + ")",
+        re.IGNORECASE,
+    )
+
+
 # Singleton instance
 _search_service: Optional[SearchService] = None
 
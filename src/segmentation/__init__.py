@@ -5,6 +5,7 @@ from src.segmentation.segmentation_engine import (
     Segment,
     SegmentRule,
     SegmentMembership,
+    MembershipDelta,
     RuleOperator,
     get_segmentation_engine,
 )
@@ -14,6 +15,7 @@ __all__ = [
     "Segment",
     "SegmentRule",
     "SegmentMembership",
+    "MembershipDelta",
     "RuleOperator",
     "get_segmentation_engine",
 ]
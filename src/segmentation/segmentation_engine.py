@@ -6,14 +6,24 @@ Supports complex rule combinations with AND/OR logic.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+import heapq
 import structlog
 import uuid
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - columnar evaluation falls back to closures
+    np = None
+
 logger = structlog.get_logger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
 
 class RuleOperator(str, Enum):
     """Operators for segment rules."""
@@ -36,6 +46,42 @@ class RuleOperator(str, Enum):
     WITHIN_DAYS = "within_days"
 
 
+NUMERIC_OPERATORS = {
+    RuleOperator.GREATER_THAN,
+    RuleOperator.LESS_THAN,
+    RuleOperator.GREATER_OR_EQUAL,
+    RuleOperator.LESS_OR_EQUAL,
+}
+DATE_OPERATORS = {
+    RuleOperator.BEFORE,
+    RuleOperator.AFTER,
+    RuleOperator.WITHIN_DAYS,
+}
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    """Parse a date value."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return None
+
+
+def _is_aware(value: datetime) -> bool:
+    return value.utcoffset() is not None
+
+
+def _to_micros(value: datetime) -> int:
+    """Microseconds since the epoch, exact for naive and aware datetimes."""
+    if _is_aware(value):
+        return (value - _EPOCH_UTC) // _MICROSECOND
+    return (value - _EPOCH) // _MICROSECOND
+
+
 @dataclass
 class SegmentRule:
     """A single rule in a segment."""
@@ -44,11 +90,28 @@ class SegmentRule:
     operator: RuleOperator
     value: Any = None
     is_active: bool = True
+    _compiled: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _on_change: Optional[Callable[[], None]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Reassigning the rule definition invalidates the compiled predicate
+        if name in ("field", "operator", "value"):
+            super().__setattr__("_compiled", None)
+        if name in ("field", "is_active") and getattr(self, "_on_change", None):
+            self._on_change()
     
     def evaluate(self, contact: dict) -> bool:
-        """Evaluate this rule against a contact."""
-        actual_value = self._get_nested_value(contact, self.field)
+        """
+        Evaluate this rule against a contact.
         
+        Reference implementation; segments evaluate through compile() and
+        evaluate_batch(), which return the same results.
+        """
+        return self._evaluate_value(self._get_nested_value(contact, self.field))
+    
+    def _evaluate_value(self, actual_value: Any) -> bool:
+        """Evaluate this rule against an already-resolved field value."""
         if self.operator == RuleOperator.EQUALS:
             return str(actual_value).lower() == str(self.value).lower() if actual_value else False
         
@@ -133,14 +196,212 @@ class SegmentRule:
     
     def _parse_date(self, value: Any) -> Optional[datetime]:
         """Parse a date value."""
-        if isinstance(value, datetime):
+        return _parse_date(value)
+    
+    def compile(self) -> Callable[[dict], bool]:
+        """
+        Compile this rule into a predicate over a contact.
+        
+        Operands are normalized once (lowered strings, a frozenset for
+        list operators, parsed numbers and dates) instead of per contact.
+        The result is cached until field, operator or value is reassigned;
+        mutate a list value in place and the cache must be reset by
+        reassigning it.
+        """
+        getter, test = self._compiled_parts()
+        return lambda contact: test(getter(contact))
+    
+    def evaluate_batch(self, contacts: list[dict]) -> list[bool]:
+        """Evaluate this rule against a batch of contacts."""
+        getter = self._compiled_parts()[0]
+        mask = self._evaluate_column([getter(c) for c in contacts])
+        return mask.tolist() if np is not None else mask
+    
+    def _compiled_parts(self) -> tuple[Callable[[dict], Any], Callable[[Any], bool]]:
+        """Cached (value getter, value test) pair for this rule."""
+        if self._compiled is None:
+            super().__setattr__("_compiled", (self._build_getter(), self._build_test()))
+        return self._compiled
+    
+    def _build_getter(self) -> Callable[[dict], Any]:
+        """Build a getter for the rule's (possibly dotted) field."""
+        keys = self.field.split(".")
+        
+        if len(keys) == 1:
+            key = keys[0]
+            return lambda obj: obj.get(key) if isinstance(obj, dict) else None
+        
+        def get_nested(obj: dict) -> Any:
+            value = obj
+            for key in keys:
+                if isinstance(value, dict):
+                    value = value.get(key)
+                else:
+                    return None
             return value
-        if isinstance(value, str):
+        
+        return get_nested
+    
+    def _build_test(self) -> Callable[[Any], bool]:
+        """Build a test over the field value with pre-normalized operands."""
+        op = self.operator
+        
+        # Operands that fail to normalize fall back to the reference
+        # evaluation so error behaviour stays the same
+        fallback = self._evaluate_value
+        
+        if op in (
+            RuleOperator.EQUALS, RuleOperator.NOT_EQUALS, RuleOperator.CONTAINS,
+            RuleOperator.NOT_CONTAINS, RuleOperator.STARTS_WITH, RuleOperator.ENDS_WITH,
+        ):
+            target = str(self.value).lower()
+            if op == RuleOperator.EQUALS:
+                return lambda a: str(a).lower() == target if a else False
+            if op == RuleOperator.NOT_EQUALS:
+                return lambda a: str(a).lower() != target if a else True
+            if op == RuleOperator.CONTAINS:
+                return lambda a: target in str(a).lower() if a else False
+            if op == RuleOperator.NOT_CONTAINS:
+                return lambda a: target not in str(a).lower() if a else True
+            if op == RuleOperator.STARTS_WITH:
+                return lambda a: str(a).lower().startswith(target) if a else False
+            return lambda a: str(a).lower().endswith(target) if a else False
+        
+        if op in NUMERIC_OPERATORS:
             try:
-                return datetime.fromisoformat(value.replace("Z", "+00:00"))
-            except ValueError:
+                number = float(self.value)
+            except (TypeError, ValueError):
+                return fallback
+            if op == RuleOperator.GREATER_THAN:
+                return lambda a: float(a) > number if a else False
+            if op == RuleOperator.LESS_THAN:
+                return lambda a: float(a) < number if a else False
+            if op == RuleOperator.GREATER_OR_EQUAL:
+                return lambda a: float(a) >= number if a else False
+            return lambda a: float(a) <= number if a else False
+        
+        if op == RuleOperator.IS_EMPTY:
+            return lambda a: not a
+        
+        if op == RuleOperator.IS_NOT_EMPTY:
+            return lambda a: bool(a)
+        
+        if op in (RuleOperator.IN_LIST, RuleOperator.NOT_IN_LIST):
+            if not isinstance(self.value, list):
+                result = op == RuleOperator.NOT_IN_LIST
+                return lambda a: result
+            options = frozenset(str(v).lower() for v in self.value)
+            if op == RuleOperator.IN_LIST:
+                return lambda a: str(a).lower() in options
+            return lambda a: str(a).lower() not in options
+        
+        if op in (RuleOperator.BEFORE, RuleOperator.AFTER):
+            target_date = _parse_date(self.value)
+            if target_date is None:
+                return lambda a: False
+            
+            def test_date(a: Any) -> bool:
+                if a:
+                    actual_date = _parse_date(a)
+                    if actual_date:
+                        if op == RuleOperator.BEFORE:
+                            return actual_date < target_date
+                        return actual_date > target_date
+                return False
+            
+            return test_date
+        
+        if op == RuleOperator.WITHIN_DAYS:
+            try:
+                window = timedelta(days=int(self.value))
+            except (TypeError, ValueError, OverflowError):
+                return fallback
+            
+            def test_within(a: Any) -> bool:
+                if a:
+                    actual_date = _parse_date(a)
+                    if actual_date:
+                        return actual_date >= datetime.utcnow() - window
+                return False
+            
+            return test_within
+        
+        return lambda a: False
+    
+    def _evaluate_column(self, values: list[Any]):
+        """
+        Evaluate the rule over a column of field values.
+        
+        Numeric and date comparisons are vectorized with NumPy when it is
+        available; other operators apply the compiled test per value.
+        Returns a NumPy bool array, or a list of bools without NumPy.
+        """
+        test = self._compiled_parts()[1]
+        op = self.operator
+        
+        if np is None:
+            return [test(v) for v in values]
+        
+        if op in NUMERIC_OPERATORS:
+            try:
+                number = float(self.value)
+            except (TypeError, ValueError):
+                return np.fromiter((test(v) for v in values), dtype=bool, count=len(values))
+            column = np.fromiter(
+                (float(v) if v else np.nan for v in values),
+                dtype=np.float64,
+                count=len(values),
+            )
+            # NaN (empty values) compares False, matching the scalar path
+            if op == RuleOperator.GREATER_THAN:
+                return column > number
+            if op == RuleOperator.LESS_THAN:
+                return column < number
+            if op == RuleOperator.GREATER_OR_EQUAL:
+                return column >= number
+            return column <= number
+        
+        if op in DATE_OPERATORS:
+            mask = self._evaluate_date_column(values)
+            if mask is not None:
+                return mask
+        
+        return np.fromiter((test(v) for v in values), dtype=bool, count=len(values))
+    
+    def _evaluate_date_column(self, values: list[Any]):
+        """Vectorized date comparison, or None to use the scalar path."""
+        op = self.operator
+        if op == RuleOperator.WITHIN_DAYS:
+            try:
+                target = datetime.utcnow() - timedelta(days=int(self.value))
+            except (TypeError, ValueError, OverflowError):
                 return None
-        return None
+        else:
+            target = _parse_date(self.value)
+            if target is None:
+                return np.zeros(len(values), dtype=bool)
+        
+        target_aware = _is_aware(target)
+        present = np.zeros(len(values), dtype=bool)
+        micros = np.zeros(len(values), dtype=np.int64)
+        for i, value in enumerate(values):
+            if not value:
+                continue
+            parsed = _parse_date(value)
+            if parsed is None:
+                continue
+            if _is_aware(parsed) != target_aware:
+                # Mixed naive/aware comparisons raise; let the scalar path do so
+                return None
+            present[i] = True
+            micros[i] = _to_micros(parsed)
+        
+        target_micros = _to_micros(target)
+        if op == RuleOperator.BEFORE:
+            return present & (micros < target_micros)
+        if op == RuleOperator.AFTER:
+            return present & (micros > target_micros)
+        return present & (micros >= target_micros)
     
     def to_dict(self) -> dict:
         return {
@@ -171,6 +432,25 @@ class SegmentMembership:
         }
 
 
+@dataclass
+class MembershipDelta:
+    """A change in a contact's segment membership."""
+    segment_id: str
+    contact_id: str
+    change: str  # added, removed
+    reason: str = "contact_change"  # contact_change, expiry
+    at: datetime = field(default_factory=datetime.utcnow)
+    
+    def to_dict(self) -> dict:
+        return {
+            "segment_id": self.segment_id,
+            "contact_id": self.contact_id,
+            "change": self.change,
+            "reason": self.reason,
+            "at": self.at.isoformat(),
+        }
+
+
 @dataclass
 class Segment:
     """A contact segment with rules."""
@@ -186,22 +466,67 @@ class Segment:
     member_count: int = 0
     last_evaluated_at: Optional[datetime] = None
     metadata: dict = field(default_factory=dict)
+    _on_change: Optional[Callable[[], None]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Changes that decide which contact fields the segment depends on
+        if name == "rules":
+            for rule in value:
+                rule._on_change = self._rules_changed
+        if name in ("rules", "is_active", "is_dynamic", "_on_change"):
+            self._rules_changed()
+    
+    def _rules_changed(self) -> None:
+        if getattr(self, "_on_change", None):
+            self._on_change()
     
     def evaluate_contact(self, contact: dict) -> bool:
         """Check if a contact matches this segment."""
+        return self.compile()(contact)
+    
+    def compile(self) -> Callable[[dict], bool]:
+        """
+        Compile the segment into a single predicate over a contact.
+        
+        Compile once and reuse the predicate when checking many contacts.
+        """
         if not self.is_active:
-            return False
+            return lambda contact: False
+        
+        predicates = [rule.compile() for rule in self.rules if rule.is_active]
+        
+        if not predicates:
+            return lambda contact: False
         
+        if self.match_type == "all":
+            return lambda contact: all([p(contact) for p in predicates])
+        return lambda contact: any([p(contact) for p in predicates])
+    
+    def evaluate_batch(self, contacts: list[dict]) -> list[bool]:
+        """
+        Check which contacts in a batch match this segment.
+        
+        Each rule is evaluated column-wise across the whole batch (see
+        SegmentRule._evaluate_column) and the rule masks are combined.
+        """
         active_rules = [r for r in self.rules if r.is_active]
         
-        if not active_rules:
-            return False
+        if not self.is_active or not active_rules:
+            return [False] * len(contacts)
         
-        results = [rule.evaluate(contact) for rule in active_rules]
+        masks = []
+        for rule in active_rules:
+            getter = rule._compiled_parts()[0]
+            masks.append(rule._evaluate_column([getter(c) for c in contacts]))
+        
+        if np is None:
+            combine = all if self.match_type == "all" else any
+            return [combine(row) for row in zip(*masks)]
         
         if self.match_type == "all":
-            return all(results)
-        return any(results)
+            return np.logical_and.reduce(masks).tolist()
+        return np.logical_or.reduce(masks).tolist()
     
     def add_rule(
         self,
@@ -216,8 +541,10 @@ class Segment:
             operator=operator,
             value=value,
         )
+        rule._on_change = self._rules_changed
         self.rules.append(rule)
         self.updated_at = datetime.utcnow()
+        self._rules_changed()
         return rule
     
     def remove_rule(self, rule_id: str) -> bool:
@@ -225,7 +552,9 @@ class Segment:
         for i, rule in enumerate(self.rules):
             if rule.id == rule_id:
                 self.rules.pop(i)
+                rule._on_change = None
                 self.updated_at = datetime.utcnow()
+                self._rules_changed()
                 return True
         return False
     
@@ -250,9 +579,18 @@ class SegmentationEngine:
     Manages contact segmentation with dynamic rules.
     """
     
-    def __init__(self):
+    def __init__(self, expiry_bucket_seconds: int = 3600):
         self.segments: dict[str, Segment] = {}
         self.memberships: dict[str, list[SegmentMembership]] = {}  # segment_id -> memberships
+        
+        # Incremental maintenance state
+        self._active_members: dict[str, dict[str, SegmentMembership]] = {}  # segment_id -> contact_id -> membership
+        self._field_dependencies: Optional[dict[str, set[str]]] = None  # root field -> segment_ids
+        self.expiry_bucket_seconds = expiry_bucket_seconds
+        self._expiry_buckets: dict[int, set[tuple[str, str]]] = {}  # bucket -> (segment_id, contact_id)
+        self._expiry_heap: list[int] = []
+        self._expiry_entries: dict[tuple[str, str], tuple[datetime, dict]] = {}  # -> (due, contact)
+        
         self._setup_default_segments()
     
     def _setup_default_segments(self) -> None:
@@ -324,6 +662,8 @@ class SegmentationEngine:
         
         self.segments[segment.id] = segment
         self.memberships[segment.id] = []
+        self._active_members[segment.id] = {}
+        segment._on_change = self._invalidate_dependencies
         
         logger.info("segment_created", segment_id=segment.id, name=name)
         
@@ -367,9 +707,11 @@ class SegmentationEngine:
     def delete_segment(self, segment_id: str) -> bool:
         """Delete a segment."""
         if segment_id in self.segments:
-            del self.segments[segment_id]
+            self.segments.pop(segment_id)._on_change = None
+            self._invalidate_dependencies()
             if segment_id in self.memberships:
                 del self.memberships[segment_id]
+            self._active_members.pop(segment_id, None)
             return True
         return False
     
@@ -432,10 +774,11 @@ class SegmentationEngine:
         if not segment:
             return []
         
-        matching = []
-        for contact in contacts:
-            if segment.evaluate_contact(contact):
-                matching.append(contact)
+        matching = [
+            contact
+            for contact, matched in zip(contacts, segment.evaluate_batch(contacts))
+            if matched
+        ]
         
         # Update segment member count
         segment.member_count = len(matching)
@@ -454,15 +797,18 @@ class SegmentationEngine:
             return {"error": "Segment not found"}
         
         # Get current members
-        current_members = {m.contact_id for m in self.memberships.get(segment_id, []) if m.is_active}
+        active = self._active_members.setdefault(segment_id, {})
+        current_members = set(active)
         
         # Evaluate all contacts
         new_members = set()
-        for contact in contacts:
-            if segment.evaluate_contact(contact):
+        member_contacts = []
+        for contact, matched in zip(contacts, segment.evaluate_batch(contacts)):
+            if matched:
                 contact_id = contact.get("id")
                 if contact_id:
                     new_members.add(contact_id)
+                    member_contacts.append(contact)
         
         # Find added and removed
         added = new_members - current_members
@@ -472,16 +818,15 @@ class SegmentationEngine:
         now = datetime.utcnow()
         
         for contact_id in added:
-            membership = SegmentMembership(
-                contact_id=contact_id,
-                segment_id=segment_id,
-            )
-            self.memberships[segment_id].append(membership)
+            self._add_member(segment_id, contact_id)
+        
+        for contact_id in removed:
+            self._remove_member(segment_id, contact_id, now)
         
-        for membership in self.memberships.get(segment_id, []):
-            if membership.contact_id in removed and membership.is_active:
-                membership.is_active = False
-                membership.removed_at = now
+        # Members that qualify through WITHIN_DAYS rules expire over time
+        if self._within_days_rules(segment):
+            for contact in member_contacts:
+                self._schedule_expiry(segment, contact)
         
         segment.member_count = len(new_members)
         segment.last_evaluated_at = now
@@ -493,6 +838,231 @@ class SegmentationEngine:
             "removed": len(removed),
         }
     
+    def _add_member(self, segment_id: str, contact_id: str) -> None:
+        """Record a new active membership."""
+        membership = SegmentMembership(
+            contact_id=contact_id,
+            segment_id=segment_id,
+        )
+        self.memberships[segment_id].append(membership)
+        self._active_members[segment_id][contact_id] = membership
+    
+    def _remove_member(self, segment_id: str, contact_id: str, now: datetime) -> None:
+        """Deactivate an active membership."""
+        membership = self._active_members[segment_id].pop(contact_id, None)
+        self._expiry_entries.pop((segment_id, contact_id), None)
+        if membership:
+            membership.is_active = False
+            membership.removed_at = now
+    
+    def _auto_updated_segments(self) -> list[Segment]:
+        """Segments whose membership follows contact changes."""
+        return [s for s in self.segments.values() if s.is_active and s.is_dynamic]
+    
+    def _invalidate_dependencies(self) -> None:
+        self._field_dependencies = None
+    
+    def _dependency_index(self) -> dict[str, set[str]]:
+        """
+        Map each root contact field to the auto-updated segments whose rules read it.
+        
+        Segments and their rules clear the index when they change (see
+        _invalidate_dependencies), so it is rebuilt on next use.
+        """
+        if self._field_dependencies is None:
+            index: dict[str, set[str]] = {}
+            for segment in self._auto_updated_segments():
+                for rule in segment.rules:
+                    if rule.is_active:
+                        root = rule.field.split(".")[0]
+                        index.setdefault(root, set()).add(segment.id)
+            self._field_dependencies = index
+        return self._field_dependencies
+    
+    def apply_contact_change(
+        self,
+        contact_before: Optional[dict],
+        contact_after: Optional[dict],
+    ) -> list[MembershipDelta]:
+        """
+        Incrementally update memberships for one changed contact.
+        
+        Only active, dynamic segments with a rule on a changed field are
+        re-evaluated; static and inactive segments keep their members.
+        Pass contact_before=None for a new contact and contact_after=None
+        for a deleted one.
+        
+        Returns:
+            Membership additions and removals caused by the change
+        """
+        contact = contact_after if contact_after is not None else contact_before
+        contact_id = contact.get("id") if contact else None
+        if not contact_id:
+            return []
+        
+        now = datetime.utcnow()
+        deltas = []
+        
+        if contact_after is None:
+            for segment_id, members in self._active_members.items():
+                if contact_id in members:
+                    self._remove_member(segment_id, contact_id, now)
+                    self.segments[segment_id].member_count = len(members)
+                    deltas.append(MembershipDelta(segment_id, contact_id, "removed", at=now))
+            return deltas
+        
+        if contact_before is None:
+            affected = [s.id for s in self._auto_updated_segments()]
+        else:
+            changed = {
+                key for key in contact_before.keys() | contact_after.keys()
+                if contact_before.get(key) != contact_after.get(key)
+            }
+            dependencies = self._dependency_index()
+            affected = set()
+            for key in changed:
+                affected.update(dependencies.get(key, ()))
+        
+        for segment_id in affected:
+            delta = self._reevaluate_member(self.segments[segment_id], contact_after, now)
+            if delta:
+                deltas.append(delta)
+        
+        if deltas:
+            logger.info(
+                "segment_membership_changed",
+                contact_id=contact_id,
+                added=sum(1 for d in deltas if d.change == "added"),
+                removed=sum(1 for d in deltas if d.change == "removed"),
+            )
+        
+        return deltas
+    
+    def _reevaluate_member(
+        self,
+        segment: Segment,
+        contact: dict,
+        now: datetime,
+        reason: str = "contact_change",
+    ) -> Optional[MembershipDelta]:
+        """Re-evaluate one contact against one segment and apply any change."""
+        contact_id = contact["id"]
+        members = self._active_members.setdefault(segment.id, {})
+        is_member = contact_id in members
+        matches = segment.evaluate_contact(contact)
+        
+        if matches and self._within_days_rules(segment):
+            self._schedule_expiry(segment, contact)
+        else:
+            self._expiry_entries.pop((segment.id, contact_id), None)
+        
+        if matches == is_member:
+            return None
+        
+        if matches:
+            self._add_member(segment.id, contact_id)
+            change = "added"
+        else:
+            self._remove_member(segment.id, contact_id, now)
+            change = "removed"
+        segment.member_count = len(members)
+        return MembershipDelta(segment.id, contact_id, change, reason=reason, at=now)
+    
+    def _within_days_rules(self, segment: Segment) -> list[SegmentRule]:
+        return [
+            r for r in segment.rules
+            if r.is_active and r.operator == RuleOperator.WITHIN_DAYS
+        ]
+    
+    def _schedule_expiry(self, segment: Segment, contact: dict) -> None:
+        """
+        Queue a member for re-evaluation when a WITHIN_DAYS rule lapses.
+        
+        A WITHIN_DAYS rule can only turn from true to false as time passes,
+        so the earliest lapse among the rules the contact currently
+        satisfies is the next moment its membership can change.
+        """
+        due = None
+        for rule in self._within_days_rules(segment):
+            actual = _parse_date(rule._get_nested_value(contact, rule.field))
+            if actual is None:
+                continue
+            try:
+                lapse = actual + timedelta(days=int(rule.value))
+            except (TypeError, ValueError, OverflowError):
+                continue
+            if _is_aware(lapse):
+                lapse = lapse.astimezone(timezone.utc).replace(tzinfo=None)
+            if lapse >= datetime.utcnow() and (due is None or lapse < due):
+                due = lapse
+        
+        key = (segment.id, contact["id"])
+        if due is None:
+            self._expiry_entries.pop(key, None)
+            return
+        
+        self._expiry_entries[key] = (due, contact)
+        self._enqueue_expiry(key, due)
+    
+    def _expiry_bucket(self, due: datetime) -> int:
+        return _to_micros(due) // (self.expiry_bucket_seconds * 1_000_000)
+    
+    def _enqueue_expiry(self, key: tuple[str, str], due: datetime) -> None:
+        bucket = self._expiry_bucket(due)
+        if bucket not in self._expiry_buckets:
+            self._expiry_buckets[bucket] = set()
+            heapq.heappush(self._expiry_heap, bucket)
+        self._expiry_buckets[bucket].add(key)
+    
+    def process_expirations(self, now: Optional[datetime] = None) -> list[MembershipDelta]:
+        """
+        Re-evaluate members whose WITHIN_DAYS window has lapsed.
+        
+        Only buckets up to now are visited; entries later in the current
+        bucket stay queued. Call periodically (e.g. from a scheduled task).
+        Due members are re-evaluated against the current time, as rules are.
+        
+        Returns:
+            Membership removals caused by lapsed time windows
+        """
+        now = now or datetime.utcnow()
+        current_bucket = self._expiry_bucket(now)
+        deltas = []
+        
+        while self._expiry_heap and self._expiry_heap[0] <= current_bucket:
+            bucket = heapq.heappop(self._expiry_heap)
+            keys = self._expiry_buckets.pop(bucket)
+            pending = []
+            
+            for key in keys:
+                entry = self._expiry_entries.get(key)
+                segment = self.segments.get(key[0])
+                if entry is None or segment is None:
+                    continue
+                if not (segment.is_active and segment.is_dynamic):
+                    self._expiry_entries.pop(key)
+                    continue
+                due, contact = entry
+                if self._expiry_bucket(due) != bucket:
+                    continue  # Rescheduled into another bucket
+                if due > now:
+                    pending.append((key, due))
+                    continue
+                del self._expiry_entries[key]
+                delta = self._reevaluate_member(segment, contact, now, reason="expiry")
+                if delta:
+                    deltas.append(delta)
+            
+            for key, due in pending:
+                self._enqueue_expiry(key, due)
+            if pending:
+                break
+        
+        if deltas:
+            logger.info("segment_memberships_expired", count=len(deltas))
+        
+        return deltas
+    
     def get_segment_stats(self, segment_id: str) -> dict:
         """Get statistics for a segment."""
         segment = self.segments.get(segment_id)
@@ -541,10 +1111,11 @@ class SegmentationEngine:
                 continue
         
         # Evaluate contacts
-        matching = []
-        for contact in contacts:
-            if temp_segment.evaluate_contact(contact):
-                matching.append(contact)
+        matching = [
+            contact
+            for contact, matched in zip(contacts, temp_segment.evaluate_batch(contacts))
+            if matched
+        ]
         
         return {
             "total_matching": len(matching),
@@ -6,13 +6,15 @@ Supports: Email, LinkedIn, Call reminders
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set
 from dataclasses import dataclass, asdict, field
 from datetime import datetime, timedelta
 from enum import Enum
 import json
 import uuid
 
+from src.wait_scheduler import WaitScheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -85,6 +87,16 @@ class Sequence:
     created_at: datetime = field(default_factory=datetime.utcnow)
     is_active: bool = True
     target_persona: Optional[str] = None  # events, demand_gen, sales, etc.
+    _steps_by_number: Dict[int, SequenceStep] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self._steps_by_number = {step.step_number: step for step in self.steps}
+    
+    def get_step(self, step_number: int) -> Optional[SequenceStep]:
+        """Get a step by its step number."""
+        return self._steps_by_number.get(step_number)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -319,12 +331,19 @@ Casey""",
 
 
 class SequenceEngine:
-    """Manages sequence execution."""
+    """Manages sequence execution.
+    
+    Active enrollments are kept in a min-heap keyed on ``next_step_at`` so
+    a due-steps poll only touches due enrollments, and enrollments are
+    indexed by lower-cased contact email for reply handling.
+    """
     
     def __init__(self, db=None):
         self.db = db
         self.sequences: Dict[str, Sequence] = {}
         self.enrollments: Dict[str, SequenceEnrollment] = {}
+        self._due = WaitScheduler()
+        self._by_email: Dict[str, Set[str]] = {}
         
         # Load templates
         for key, seq in SEQUENCE_TEMPLATES.items():
@@ -444,6 +463,8 @@ class SequenceEngine:
             enrollment.next_step_at = datetime.utcnow() + delay
         
         self.enrollments[enrollment.id] = enrollment
+        self._by_email.setdefault(contact_email.lower(), set()).add(enrollment.id)
+        self._track(enrollment)
         
         # Persist
         if self.db:
@@ -453,6 +474,13 @@ class SequenceEngine:
         
         return enrollment
     
+    def _track(self, enrollment: SequenceEnrollment):
+        """Keep the due-step heap in sync with an enrollment."""
+        if enrollment.status == EnrollmentStatus.ACTIVE and enrollment.next_step_at:
+            self._due.schedule(enrollment.id, enrollment.next_step_at)
+        else:
+            self._due.cancel(enrollment.id)
+    
     async def _save_enrollment(self, enrollment: SequenceEnrollment):
         """Save enrollment to database."""
         try:
@@ -484,13 +512,14 @@ class SequenceEngine:
         """Get all steps that are due to execute.
         
         Returns:
-            List of enrollments with their due steps
+            List of enrollments with their due steps, earliest first
         """
         due_steps = []
         now = datetime.utcnow()
         
-        for enrollment in self.enrollments.values():
-            if enrollment.status != EnrollmentStatus.ACTIVE:
+        for enrollment_id in self._due.peek_due(now):
+            enrollment = self.enrollments.get(enrollment_id)
+            if not enrollment or enrollment.status != EnrollmentStatus.ACTIVE:
                 continue
             
             if enrollment.next_step_at and enrollment.next_step_at <= now:
@@ -498,13 +527,7 @@ class SequenceEngine:
                 if not sequence:
                     continue
                 
-                # Find current step
-                current_step = None
-                for step in sequence.steps:
-                    if step.step_number == enrollment.current_step:
-                        current_step = step
-                        break
-                
+                current_step = sequence.get_step(enrollment.current_step)
                 if current_step:
                     due_steps.append({
                         "enrollment": enrollment.to_dict(),
@@ -536,17 +559,13 @@ class SequenceEngine:
         if not sequence:
             raise ValueError(f"Sequence not found: {enrollment.sequence_id}")
         
-        # Find current step
-        current_step = None
-        for step in sequence.steps:
-            if step.step_number == enrollment.current_step:
-                current_step = step
-                break
+        current_step = sequence.get_step(enrollment.current_step)
         
         if not current_step:
             # No more steps - complete
             enrollment.status = EnrollmentStatus.COMPLETED
             enrollment.completed_at = datetime.utcnow()
+            self._track(enrollment)
             return {"status": "completed", "message": "Sequence completed"}
         
         # Render templates
@@ -569,11 +588,7 @@ class SequenceEngine:
         })
         
         # Advance to next step
-        next_step = None
-        for step in sequence.steps:
-            if step.step_number == enrollment.current_step + 1:
-                next_step = step
-                break
+        next_step = sequence.get_step(enrollment.current_step + 1)
         
         if next_step:
             enrollment.current_step = next_step.step_number
@@ -583,6 +598,7 @@ class SequenceEngine:
             enrollment.status = EnrollmentStatus.COMPLETED
             enrollment.completed_at = datetime.utcnow()
             enrollment.next_step_at = None
+        self._track(enrollment)
         
         # Persist
         if self.db:
@@ -671,12 +687,13 @@ class SequenceEngine:
         Args:
             contact_email: Contact who replied
         """
-        for enrollment in self.enrollments.values():
-            if enrollment.contact_email.lower() == contact_email.lower():
-                if enrollment.status == EnrollmentStatus.ACTIVE:
-                    enrollment.status = EnrollmentStatus.REPLIED
-                    enrollment.completed_at = datetime.utcnow()
-                    logger.info(f"Marked {contact_email} as replied, stopping sequence")
+        for enrollment_id in self._by_email.get(contact_email.lower(), ()):
+            enrollment = self.enrollments.get(enrollment_id)
+            if enrollment and enrollment.status == EnrollmentStatus.ACTIVE:
+                enrollment.status = EnrollmentStatus.REPLIED
+                enrollment.completed_at = datetime.utcnow()
+                self._track(enrollment)
+                logger.info(f"Marked {contact_email} as replied, stopping sequence")
     
     def get_enrollment_status(
         self,
@@ -692,10 +709,17 @@ class SequenceEngine:
         """
         results = []
         
-        for enrollment in self.enrollments.values():
-            if contact_email and enrollment.contact_email.lower() != contact_email.lower():
-                continue
-            
+        if contact_email:
+            enrollments = [
+                self.enrollments[enrollment_id]
+                for enrollment_id in self._by_email.get(contact_email.lower(), ())
+                if enrollment_id in self.enrollments
+            ]
+            enrollments.sort(key=lambda e: e.enrolled_at)
+        else:
+            enrollments = self.enrollments.values()
+        
+        for enrollment in enrollments:
             sequence = self.sequences.get(enrollment.sequence_id)
             
             results.append({
@@ -2,20 +2,27 @@
 
 Sprint 39B: Provides contact context (name, email) for queue items
 by looking up HubSpot contact IDs and caching results.
+
+Contacts are cached in a size-bounded LRU with a TTL. Entries past their
+TTL are still served for ``stale_ttl`` seconds while a background refresh
+runs; concurrent misses for the same contact share one HubSpot call; and
+``get_contact_infos`` fetches all misses with one batch read. An optional
+Redis tier shares warm entries across API workers.
 """
-import asyncio
-from typing import Dict, Optional, List, Any
-from dataclasses import dataclass
+import json
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
 import structlog
 
 from src.connectors.hubspot import HubSpotConnector, create_hubspot_connector
+from src.services.tiered_cache import TieredCache, create_cache_redis
 
 logger = structlog.get_logger(__name__)
 
-# Simple in-memory cache for contact info
-# Key: contact_id, Value: ContactInfo
-_contact_cache: Dict[str, "ContactInfo"] = {}
-
+# Properties read when enriching contacts in batch
+CONTACT_PROPERTIES = ["firstname", "lastname", "email", "company"]
 
 @dataclass
 class ContactInfo:
@@ -32,7 +39,7 @@ class ContactInfo:
         first = props.get("firstname", "") or ""
         last = props.get("lastname", "") or ""
         name = f"{first} {last}".strip() or "Unknown Contact"
-        
+
         return cls(
             id=contact_data.get("id", ""),
             name=name,
@@ -51,17 +58,199 @@ class ContactInfo:
         )
 
 
+class ContactCache(TieredCache):
+    """LRU + TTL cache of ContactInfo with stale-while-revalidate refresh.
+
+    Lookups go local LRU -> Redis (if configured) -> ``fetch``. Misses are
+    single-flight: a contact already being fetched is awaited, not
+    fetched again. Contacts a successful fetch did not return are cached
+    locally as ``ContactInfo.unknown`` for ``miss_ttl`` seconds only; a
+    failed fetch leaves existing entries untouched.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        ttl: float = 300.0,
+        stale_ttl: float = 3600.0,
+        miss_ttl: float = 60.0,
+        redis_client=None,
+        redis_prefix: str = "contact_info:",
+    ):
+        """
+        Args:
+            max_size: Max contacts kept in process; least recently used are evicted
+            ttl: Seconds an entry is fresh
+            stale_ttl: Seconds past ``ttl`` an entry is served while it refreshes
+            miss_ttl: Seconds an unknown-contact placeholder is cached
+            redis_client: Async Redis client for the shared tier (optional)
+            redis_prefix: Key prefix in Redis
+        """
+        super().__init__(
+            max_size,
+            redis_client=redis_client,
+            redis_prefix=redis_prefix,
+            stats=("hits", "stale_hits", "redis_hits", "misses"),
+            name="Contact cache",
+        )
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.miss_ttl = miss_ttl
+
+    def __contains__(self, contact_id: str) -> bool:
+        return self._lookup(contact_id, time.time()) is not None
+
+    def __setitem__(self, contact_id: str, info: ContactInfo) -> None:
+        self.put(info, contact_id=contact_id)
+
+    def put(
+        self,
+        info: ContactInfo,
+        contact_id: Optional[str] = None,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        fetched_at: Optional[float] = None,
+    ) -> None:
+        """Cache ``info`` locally (keyed by ``info.id`` unless ``contact_id`` is given)."""
+        ttl = self.ttl if ttl is None else ttl
+        stale_ttl = self.stale_ttl if stale_ttl is None else stale_ttl
+        fresh_until = (time.time() if fetched_at is None else fetched_at) + ttl
+        self._store(contact_id or info.id, info, fresh_until, fresh_until + stale_ttl)
+
+    async def get_many(
+        self,
+        contact_ids: Iterable[str],
+        fetch: Callable[[List[str]], Awaitable[Dict[str, ContactInfo]]],
+    ) -> Dict[str, ContactInfo]:
+        """Return ContactInfo for every id, calling ``fetch`` once for the misses.
+
+        Args:
+            contact_ids: HubSpot contact IDs
+            fetch: Coroutine function mapping ids to ContactInfo; ids it
+                leaves out become ``ContactInfo.unknown``. It raises if the
+                lookup failed, in which case cached entries (even stale
+                ones) are kept and returned.
+
+        Returns:
+            Dict of contact id -> ContactInfo
+        """
+        self._bind_loop()
+        now = time.time()
+        found: Dict[str, ContactInfo] = {}
+        stale: List[str] = []
+        missing: List[str] = []
+        for contact_id in dict.fromkeys(contact_ids):
+            entry = self._lookup(contact_id, now)
+            if entry is None:
+                missing.append(contact_id)
+                continue
+            found[contact_id] = entry.value
+            if entry.fresh_until <= now:
+                stale.append(contact_id)
+                self.stats["stale_hits"] += 1
+            else:
+                self.stats["hits"] += 1
+
+        if missing and self.redis is not None:
+            shared = await self._redis_get_infos(missing)
+            for contact_id, (info, fetched_at) in shared.items():
+                self.put(info, contact_id=contact_id, fetched_at=fetched_at)
+                found[contact_id] = info
+                if fetched_at + self.ttl <= now:
+                    stale.append(contact_id)
+            self.stats["redis_hits"] += len(shared)
+            missing = [contact_id for contact_id in missing if contact_id not in shared]
+
+        if stale:
+            self._refresh(stale, fetch)
+        if missing:
+            self.stats["misses"] += len(missing)
+            found.update(await self._load(missing, fetch))
+        return found
+
+    def _refresh(self, contact_ids: List[str], fetch) -> None:
+        """Refresh stale entries in the background."""
+        contact_ids = [c for c in contact_ids if c not in self._inflight]
+        if contact_ids:
+            self._spawn(self._load(contact_ids, fetch))
+
+    async def _load(self, contact_ids: List[str], fetch) -> Dict[str, ContactInfo]:
+        """Fetch ``contact_ids``, joining any fetch already in flight."""
+        waiting = {}
+        mine: List[str] = []
+        for contact_id in contact_ids:
+            waiting[contact_id], is_new = self._join(contact_id)
+            if is_new:
+                mine.append(contact_id)
+        if mine:
+            # A task, so a cancelled caller does not strand other waiters
+            self._spawn(self._fetch(mine, fetch))
+        return await self._gather(waiting)
+
+    async def _fetch(self, contact_ids: List[str], fetch) -> None:
+        fetched: Optional[Dict[str, ContactInfo]] = None
+        try:
+            fetched = await fetch(contact_ids) or {}
+        except Exception as e:
+            logger.error("Failed to enrich contacts", count=len(contact_ids), error=str(e))
+
+        now = time.time()
+        try:
+            if fetched:
+                for contact_id, info in fetched.items():
+                    self.put(info, contact_id=contact_id, fetched_at=now)
+                if self.redis is not None:
+                    await self._redis_set_infos(fetched, now)
+        finally:
+            for contact_id in contact_ids:
+                if fetched is None:
+                    # Keep whatever is cached; answer with it until a fetch succeeds
+                    entry = self._entries.get(contact_id)
+                    info = entry.value if entry is not None else ContactInfo.unknown(contact_id)
+                else:
+                    info = fetched.get(contact_id)
+                    if info is None:
+                        info = ContactInfo.unknown(contact_id)
+                        self.put(info, contact_id, ttl=self.miss_ttl, stale_ttl=0.0, fetched_at=now)
+                self._resolve(contact_id, info)
+
+    async def _redis_get_infos(self, contact_ids: List[str]) -> Dict[str, tuple]:
+        shared = {}
+        for contact_id, value in (await self._redis_get(contact_ids)).items():
+            data = json.loads(value)
+            fetched_at = data.pop("fetched_at")
+            shared[contact_id] = (ContactInfo(**data), fetched_at)
+        return shared
+
+    async def _redis_set_infos(self, infos: Dict[str, ContactInfo], fetched_at: float) -> None:
+        encoded = {
+            contact_id: json.dumps({**asdict(info), "fetched_at": fetched_at})
+            for contact_id, info in infos.items()
+        }
+        await self._redis_set(encoded, int(self.ttl + self.stale_ttl))
+
+
+# Shared by every ContactEnrichmentService in the process
+_contact_cache = ContactCache()
+
+
 class ContactEnrichmentService:
     """Service for enriching queue items with contact information."""
     
-    def __init__(self, hubspot_connector: Optional[HubSpotConnector] = None):
+    def __init__(
+        self,
+        hubspot_connector: Optional[HubSpotConnector] = None,
+        cache: Optional[ContactCache] = None,
+    ):
         """Initialize service.
-        
+
         Args:
             hubspot_connector: Optional HubSpot connector. If not provided,
                 will create one from environment settings.
+            cache: Contact cache (default: the process-wide cache)
         """
         self._connector = hubspot_connector
+        self.cache = cache if cache is not None else _contact_cache
     
     @property
     def connector(self) -> HubSpotConnector:
@@ -72,40 +261,66 @@ class ContactEnrichmentService:
     
     async def get_contact_info(self, contact_id: str) -> ContactInfo:
         """Get contact information by ID.
-        
+
         Args:
             contact_id: HubSpot contact ID
             
         Returns:
             ContactInfo with name, email, etc.
         """
-        # Check cache first
-        if contact_id in _contact_cache:
-            logger.debug("Contact cache hit", contact_id=contact_id)
-            return _contact_cache[contact_id]
-        
-        # Fetch from HubSpot
-        try:
+        infos = await self.cache.get_many([contact_id], self._fetch_contact)
+        return infos[contact_id]
+    
+    async def get_contact_infos(self, contact_ids: Iterable[str]) -> Dict[str, ContactInfo]:
+        """Get contact information for many IDs at once.
+
+        Cache misses are read from HubSpot together through the batch
+        read endpoint (100 contacts per call).
+
+        Args:
+            contact_ids: HubSpot contact IDs
+            
+        Returns:
+            Dict of contact ID -> ContactInfo (unknown placeholder if not found)
+        """
+        return await self.cache.get_many(contact_ids, self._fetch_contacts)
+    
+    async def _fetch_contact(self, contact_ids: List[str]) -> Dict[str, ContactInfo]:
+        """Fetch one contact with a single-object read.
+
+        Raises LookupError when HubSpot returns nothing: get_contact answers
+        None for any HTTP error, so a 404 cannot be told from an outage and
+        the result is not cached as unknown.
+        """
+        infos = {}
+        for contact_id in contact_ids:
             contact_data = await self.connector.get_contact(contact_id)
-            if contact_data:
-                info = ContactInfo.from_hubspot(contact_data)
-                _contact_cache[contact_id] = info
-                logger.info("Contact enriched", contact_id=contact_id, name=info.name)
-                return info
-        except Exception as e:
-            logger.error("Failed to enrich contact", contact_id=contact_id, error=str(e))
-        
-        # Return unknown placeholder
-        info = ContactInfo.unknown(contact_id)
-        _contact_cache[contact_id] = info
-        return info
+            if not contact_data:
+                raise LookupError(f"HubSpot returned no contact {contact_id}")
+            info = ContactInfo.from_hubspot(contact_data)
+            logger.info("Contact enriched", contact_id=contact_id, name=info.name)
+            infos[contact_id] = info
+        return infos
+    
+    async def _fetch_contacts(self, contact_ids: List[str]) -> Dict[str, ContactInfo]:
+        """Fetch contacts through the HubSpot batch read endpoint (raises on failure)."""
+        if len(contact_ids) == 1:
+            return await self._fetch_contact(contact_ids)
+        objects = await self.connector.batch.read_objects(
+            "contacts", contact_ids, properties=CONTACT_PROPERTIES
+        )
+        logger.info("Contacts enriched", requested=len(contact_ids), found=len(objects))
+        return {
+            contact_id: ContactInfo.from_hubspot(contact_data)
+            for contact_id, contact_data in objects.items()
+        }
     
     async def enrich_queue_items(
         self,
         items: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Enrich a list of queue items with contact information.
-        
+
         Args:
             items: List of queue item dicts with contact_id field
             
@@ -118,23 +333,13 @@ class ContactEnrichmentService:
             for item in items
             if item.get("contact_id")
         }
-        
+
         if not contact_ids:
             return items
-        
-        # Fetch all contacts in parallel
-        tasks = [
-            self.get_contact_info(cid)
-            for cid in contact_ids
-        ]
-        contacts = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Build lookup map
-        contact_map: Dict[str, ContactInfo] = {}
-        for result in contacts:
-            if isinstance(result, ContactInfo):
-                contact_map[result.id] = result
-        
+
+        # Fetch all contacts, misses in one batch read
+        contact_map = await self.get_contact_infos(contact_ids)
+
         # Enrich items
         enriched = []
         for item in items:
@@ -146,7 +351,7 @@ class ContactEnrichmentService:
                 item_copy["contact_email"] = info.email
                 item_copy["contact_company"] = info.company
             enriched.append(item_copy)
-        
+
         logger.info(
             "Enriched queue items",
             total_items=len(items),
@@ -156,7 +361,7 @@ class ContactEnrichmentService:
     
     def clear_cache(self):
         """Clear the contact cache."""
-        _contact_cache.clear()
+        self.cache.clear()
         logger.info("Contact cache cleared")
 
 
@@ -168,5 +373,8 @@ def get_contact_enrichment_service() -> ContactEnrichmentService:
     """Get the singleton enrichment service."""
     global _enrichment_service
     if _enrichment_service is None:
+        if _contact_cache.redis is None:
+            _contact_cache.redis = create_cache_redis("contact_cache_redis_enabled")
         _enrichment_service = ContactEnrichmentService()
     return _enrichment_service
+
@@ -0,0 +1,258 @@
+"""
+Batched, cached embedding client for Jarvis memory.
+
+``MemoryService`` used to make one embeddings API call per remembered
+message and per search query, including queries repeated seconds apart
+(Jarvis embeds a query to search memory and then again to remember it).
+``EmbeddingClient`` sits in front of the API:
+
+- Vectors are cached by SHA-256 of the model and the normalized text
+  (whitespace-collapsed, truncated to the API's input size) in a bounded
+  LRU, with an optional Redis tier shared across API workers.
+- Misses are queued and flushed as one API call ``max_wait`` seconds
+  after the first one, or as soon as ``max_batch_size`` texts (or
+  ``max_batch_chars`` characters) are waiting. A text already queued or
+  in flight is awaited, not requested again.
+- Empty texts are answered with None without an API call. When the
+  provider rejects a batch, it is retried in halves so one bad input
+  fails only itself.
+
+``metrics()`` reports the cache hit rate and batch sizes.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from src.logger import get_logger
+from src.services.tiered_cache import TieredCache, create_cache_redis
+
+logger = get_logger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+# OpenAI accepts up to 2048 inputs per embeddings request
+MAX_BATCH_SIZE = 2048
+MAX_INPUT_CHARS = 8000
+
+EmbedBatch = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace and truncate to what is sent to the API."""
+    return " ".join(text.split())[:MAX_INPUT_CHARS]
+
+
+class EmbeddingClient(TieredCache):
+    """Micro-batching embeddings client with an LRU (+ Redis) vector cache."""
+
+    def __init__(
+        self,
+        embed_batch: Optional[EmbedBatch] = None,
+        model: str = EMBEDDING_MODEL,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_batch_chars: int = 400_000,
+        max_wait: float = 0.01,
+        max_size: int = 10_000,
+        redis_client=None,
+        redis_prefix: str = "embedding:",
+        redis_ttl: int = 7 * 24 * 3600,
+    ):
+        """
+        Args:
+            embed_batch: Coroutine function embedding a list of texts, in
+                order; defaults to the OpenAI embeddings API for ``model``
+            model: Embedding model (part of the cache key)
+            max_batch_size: Max texts per API call
+            max_batch_chars: Max characters per API call, to stay under the
+                provider's per-request token limit
+            max_wait: Seconds a miss waits for others to share its API call
+            max_size: Max vectors kept in process; least recently used are evicted
+            redis_client: Async Redis client for the shared tier (optional)
+            redis_prefix: Key prefix in Redis
+            redis_ttl: Seconds a vector is kept in Redis
+        """
+        super().__init__(
+            max_size,
+            redis_client=redis_client,
+            redis_prefix=redis_prefix,
+            stats=(
+                "requests", "hits", "redis_hits", "coalesced", "misses",
+                "errors", "batches", "batched_texts", "max_batch",
+            ),
+            name="Embedding cache",
+        )
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_batch_chars = max_batch_chars
+        self.max_wait = max_wait
+        self.redis_ttl = redis_ttl
+        self._embed_batch = embed_batch or self._openai_embed
+        self._openai_client = None
+        self._pending: Dict[str, str] = {}
+        self._pending_chars = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def key(self, text: str) -> str:
+        """Cache key of ``text``."""
+        return hashlib.sha256(f"{self.model}\n{normalize_text(text)}".encode("utf-8")).hexdigest()
+
+    async def embed(self, text: str) -> Optional[List[float]]:
+        """Embedding of one text, or None if the API call failed."""
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: Iterable[str]) -> List[Optional[List[float]]]:
+        """Embeddings of ``texts`` in order; None for empty texts and texts whose API call failed."""
+        self._bind_loop()
+        texts = [normalize_text(text) for text in texts]
+        keys = [self.key(text) for text in texts]
+        found: Dict[str, Optional[List[float]]] = {}
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            self.stats["requests"] += 1
+            if not text:
+                found[key] = None
+                continue
+            if key in found or key in missing:
+                self.stats["coalesced"] += 1
+                continue
+            entry = self._lookup(key)
+            if entry is not None:
+                self.stats["hits"] += 1
+                found[key] = entry.value
+            else:
+                missing[key] = text
+
+        if missing and self.redis is not None:
+            shared = {key: json.loads(raw) for key, raw in (await self._redis_get(list(missing))).items()}
+            for key, vector in shared.items():
+                self._store(key, vector)
+                found[key] = vector
+                del missing[key]
+            self.stats["redis_hits"] += len(shared)
+
+        if missing:
+            futures = {key: self._enqueue(key, text) for key, text in missing.items()}
+            found.update(await self._gather(futures))
+        return [found[key] for key in keys]
+
+    def metrics(self) -> Dict[str, float]:
+        """Cache hit rate and batch sizes since startup."""
+        stats = self.stats
+        served = stats["hits"] + stats["redis_hits"] + stats["coalesced"]
+        return {
+            **stats,
+            "cached": len(self._entries),
+            "hit_rate": round(served / stats["requests"], 4) if stats["requests"] else 0.0,
+            "avg_batch": round(stats["batched_texts"] / stats["batches"], 2) if stats["batches"] else 0.0,
+        }
+
+    def _bind_loop(self) -> bool:
+        rebound = super()._bind_loop()
+        if rebound:
+            # The queue's timer belongs to the old loop too
+            self._pending, self._pending_chars, self._timer = {}, 0, None
+        return rebound
+
+    def _enqueue(self, key: str, text: str) -> asyncio.Future:
+        """Future for ``key``'s vector, queueing ``text`` unless already requested."""
+        future, is_new = self._join(key)
+        if not is_new:
+            self.stats["coalesced"] += 1
+            return future
+        self.stats["misses"] += 1
+        if self._pending_chars + len(text) > self.max_batch_chars:
+            self._flush()
+        self._pending[key] = text
+        self._pending_chars += len(text)
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = self._loop.call_later(self.max_wait, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Send the queued texts as one API call."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending, self._pending_chars = self._pending, {}, 0
+        self._spawn(self._run_batch(batch))
+
+    async def _run_batch(self, batch: Dict[str, str]) -> None:
+        self.stats["batches"] += 1
+        self.stats["batched_texts"] += len(batch)
+        self.stats["max_batch"] = max(self.stats["max_batch"], len(batch))
+        vectors: Dict[str, List[float]] = {}
+        try:
+            vectors = await self._embed_split(batch)
+            for key, vector in vectors.items():
+                self._store(key, vector)
+            if vectors and self.redis is not None:
+                encoded = {key: json.dumps(vector) for key, vector in vectors.items()}
+                await self._redis_set(encoded, self.redis_ttl)
+        finally:
+            for key in batch:
+                self._resolve(key, vectors.get(key))
+
+    async def _embed_split(self, batch: Dict[str, str]) -> Dict[str, List[float]]:
+        """Vectors for ``batch``; a rejected batch is retried in halves.
+        
+        Transient errors (outage, rate limit) fail the whole batch, since
+        splitting would only multiply the calls that fail.
+        """
+        try:
+            result = await self._embed_batch(list(batch.values()))
+            if len(result) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(result)}")
+            return {key: list(vector) for key, vector in zip(batch, result)}
+        except Exception as e:
+            self.stats["errors"] += 1
+            if len(batch) == 1 or _is_transient(e):
+                logger.warning(f"Embedding batch of {len(batch)} failed: {e}")
+                return {}
+            logger.warning(f"Embedding batch of {len(batch)} rejected, retrying in halves: {e}")
+        items = list(batch.items())
+        middle = len(items) // 2
+        first, second = await asyncio.gather(
+            self._embed_split(dict(items[:middle])),
+            self._embed_split(dict(items[middle:])),
+        )
+        return {**first, **second}
+
+    async def _openai_embed(self, texts: List[str]) -> List[List[float]]:
+        if self._openai_client is None:
+            from openai import AsyncOpenAI
+
+            from src.config import get_settings
+
+            self._openai_client = AsyncOpenAI(api_key=get_settings().openai_api_key)
+        response = await self._openai_client.embeddings.create(model=self.model, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether ``error`` would fail any batch, not just this one's inputs."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is not None:
+        return status in (401, 403, 408, 409, 429) or status >= 500
+    # openai.APIConnectionError / APITimeoutError, builtin connection errors
+    return isinstance(error, (ConnectionError, TimeoutError)) or type(error).__name__.endswith(
+        ("ConnectionError", "TimeoutError")
+    )
+
+
+_embedding_client: Optional[EmbeddingClient] = None
+
+
+def get_embedding_client() -> EmbeddingClient:
+    """Process-wide embedding client shared by MemoryService instances."""
+    global _embedding_client
+    if _embedding_client is None:
+        _embedding_client = EmbeddingClient(redis_client=create_cache_redis("embedding_cache_redis_enabled"))
+    return _embedding_client
+
@@ -0,0 +1,245 @@
+"""
+In-process vector index for Jarvis memory search.
+
+``ConversationMemory.embedding`` is stored as a JSON array, so scoring a
+query used to mean loading every row of the session and running a
+pure-Python cosine loop over 1536-float lists. ``EmbeddingStore`` keeps
+each session's embeddings as L2-normalized float32 rows of one contiguous
+NumPy matrix: a search is a single matrix-vector product plus an
+``argpartition`` top-k. Sessions larger than ``ann_min_vectors`` also get
+an IVF (k-means inverted file) index that scores only the vectors in the
+``nprobe`` clusters nearest the query; vectors added after the index was
+built are always scored exactly.
+
+MemoryService syncs a session incrementally (rows newer than the last one
+seen) before each search, so API workers stay consistent without sharing
+the index.
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.logger import get_logger
+from src.services.vector_math import normalize, top_k
+
+logger = get_logger(__name__)
+
+
+class IVFIndex:
+    """Inverted-file index over the first ``size`` rows of a matrix."""
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        nlist: Optional[int] = None,
+        iterations: int = 8,
+        train_per_list: int = 40,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            vectors: Normalized vectors to index (rows)
+            nlist: Number of clusters (default: sqrt of the row count)
+            iterations: k-means iterations
+            train_per_list: k-means runs on a sample of this many vectors per cluster
+            seed: Seed for the sample and initial centroids
+        """
+        n = len(vectors)
+        nlist = max(1, min(n, nlist or int(np.sqrt(n))))
+        rng = np.random.default_rng(seed)
+        train = vectors[rng.choice(n, min(n, nlist * train_per_list), replace=False)]
+        centroids = train[:nlist].copy()
+        for _ in range(iterations):
+            assign = np.argmax(train @ centroids.T, axis=1)
+            order = np.argsort(assign, kind="stable")
+            counts = np.bincount(assign, minlength=nlist)
+            filled = counts > 0
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            sums = np.add.reduceat(train[order], starts[filled], axis=0)
+            centroids[filled] = normalize(sums)
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+
+        order = np.argsort(assign, kind="stable")
+        self.size = n
+        self.centroids = centroids
+        self.postings = np.split(order, np.cumsum(np.bincount(assign, minlength=nlist))[:-1])
+
+    def candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        """Row indices in the ``nprobe`` clusters closest to ``query``."""
+        nearest = top_k(self.centroids @ query, nprobe)
+        return np.concatenate([self.postings[c] for c in nearest])
+
+
+class SessionVectors:
+    """Normalized embeddings of one session in a growable float32 matrix."""
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.ids: List[str] = []
+        self.positions: Dict[str, int] = {}
+        self.loaded_until: Optional[datetime] = None
+        self.index: Optional[IVFIndex] = None
+        self._matrix = np.empty((16, dim), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return self._matrix[:len(self.ids)]
+
+    def add(self, rows: Sequence[Tuple[str, Sequence[float]]]) -> int:
+        """Append ``(id, embedding)`` rows; ids already present or of the wrong size are skipped."""
+        if not self.dim and rows:
+            self.dim = len(rows[0][1])
+            self._matrix = np.empty((16, self.dim), dtype=np.float32)
+        rows = [(i, e) for i, e in rows if i not in self.positions and len(e) == self.dim]
+        if not rows:
+            return 0
+        n = len(self.ids)
+        needed = n + len(rows)
+        if needed > len(self._matrix):
+            grown = np.empty((max(needed, 2 * len(self._matrix)), self.dim), dtype=np.float32)
+            grown[:n] = self._matrix[:n]
+            self._matrix = grown
+        self._matrix[n:needed] = normalize(np.asarray([e for _, e in rows], dtype=np.float32))
+        for offset, (memory_id, _) in enumerate(rows):
+            self.positions[memory_id] = n + offset
+            self.ids.append(memory_id)
+        return len(rows)
+
+    def remove(self, memory_ids: Iterable[str]) -> int:
+        """Drop rows by id (compacts the matrix and discards the ANN index)."""
+        drop = {self.positions[i] for i in memory_ids if i in self.positions}
+        if not drop:
+            return 0
+        keep = [p for p in range(len(self.ids)) if p not in drop]
+        self._matrix = self._matrix[keep].copy() if keep else np.empty((16, self.dim), dtype=np.float32)
+        self.ids = [self.ids[p] for p in keep]
+        self.positions = {memory_id: p for p, memory_id in enumerate(self.ids)}
+        self.index = None
+        return len(drop)
+
+
+class EmbeddingStore:
+    """Per-session vector matrices, bounded to ``max_sessions`` (LRU)."""
+
+    def __init__(
+        self,
+        max_sessions: int = 256,
+        ann_min_vectors: Optional[int] = 20_000,
+        nprobe: int = 8,
+        rebuild_growth: float = 0.25,
+    ):
+        """
+        Args:
+            max_sessions: Sessions kept in memory; least recently searched are dropped
+            ann_min_vectors: Build an IVF index for sessions at least this large
+                (None: always search exactly)
+            nprobe: IVF clusters scored per query
+            rebuild_growth: Rebuild the IVF index once the unindexed tail
+                exceeds this fraction of the indexed rows
+        """
+        self.max_sessions = max_sessions
+        self.ann_min_vectors = ann_min_vectors
+        self.nprobe = nprobe
+        self.rebuild_growth = rebuild_growth
+        self._sessions: "OrderedDict[str, SessionVectors]" = OrderedDict()
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def get(self, session_id: str) -> Optional[SessionVectors]:
+        vectors = self._sessions.get(session_id)
+        if vectors is not None:
+            self._sessions.move_to_end(session_id)
+        return vectors
+
+    def add(
+        self,
+        session_id: str,
+        rows: Sequence[Tuple[str, Sequence[float]]],
+        loaded_until: Optional[datetime] = None,
+    ) -> SessionVectors:
+        """Add ``(memory_id, embedding)`` rows to a session, creating it if needed."""
+        vectors = self.get(session_id)
+        if vectors is None:
+            vectors = self._sessions[session_id] = SessionVectors(len(rows[0][1]) if rows else 0)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        if rows:
+            added = vectors.add(rows)
+            if added < len(rows):
+                logger.debug(f"Skipped {len(rows) - added} duplicate or mis-sized embeddings for {session_id}")
+        if loaded_until is not None and (vectors.loaded_until is None or loaded_until > vectors.loaded_until):
+            vectors.loaded_until = loaded_until
+        return vectors
+
+    def remove(self, session_id: str, memory_ids: Iterable[str]) -> int:
+        vectors = self._sessions.get(session_id)
+        return vectors.remove(memory_ids) if vectors is not None else 0
+
+    def drop(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    def search(
+        self,
+        session_id: str,
+        query: Sequence[float],
+        limit: int = 5,
+        threshold: float = 0.0,
+        exact: bool = False,
+    ) -> List[Tuple[str, float]]:
+        """Top ``limit`` ``(memory_id, cosine similarity)`` with similarity >= ``threshold``.
+
+        Args:
+            session_id: Session to search
+            query: Query embedding
+            limit: Maximum results
+            threshold: Minimum cosine similarity
+            exact: Score every vector even if the session has an IVF index
+        """
+        vectors = self.get(session_id)
+        if vectors is None or not len(vectors) or len(query) != vectors.dim:
+            return []
+        q = normalize(np.asarray(query, dtype=np.float32))
+        matrix = vectors.matrix
+
+        index = None if exact else self._index(vectors)
+        if index is None:
+            rows = None
+            scores = matrix @ q
+        else:
+            # Probed clusters plus every row added since the index was built
+            rows = np.concatenate([
+                index.candidates(q, self.nprobe),
+                np.arange(index.size, len(vectors)),
+            ])
+            scores = matrix[rows] @ q
+
+        best = top_k(scores, limit)
+        best = best[scores[best] >= threshold]
+        positions = best if rows is None else rows[best]
+        return [(vectors.ids[p], float(s)) for p, s in zip(positions, scores[best])]
+
+    def _index(self, vectors: SessionVectors) -> Optional[IVFIndex]:
+        if self.ann_min_vectors is None or len(vectors) < self.ann_min_vectors:
+            return None
+        index = vectors.index
+        if index is None or len(vectors) - index.size > self.rebuild_growth * index.size:
+            index = vectors.index = IVFIndex(vectors.matrix)
+        return index
+
+
+_embedding_store: Optional[EmbeddingStore] = None
+
+
+def get_embedding_store() -> EmbeddingStore:
+    """Process-wide embedding store shared by MemoryService instances."""
+    global _embedding_store
+    if _embedding_store is None:
+        _embedding_store = EmbeddingStore()
+    return _embedding_store
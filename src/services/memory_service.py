@@ -23,6 +23,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.models.memory import JarvisSession, ConversationMemory, MemorySummary
 from src.connectors.llm import get_llm
 from src.logger import get_logger
+from src.services.embedding_client import get_embedding_client
+from src.services.embedding_store import get_embedding_store
 from src.telemetry import log_event
 
 logger = get_logger(__name__)
@@ -40,12 +42,14 @@ class MemoryService:
     MAX_MESSAGES_PER_SESSION = 1000
     SUMMARIZE_AFTER_DAYS = 7
     MAX_RECALL_MESSAGES = 20
-    EMBEDDING_MODEL = "text-embedding-3-small"
+    SYNC_LOOKBACK = timedelta(seconds=60)  # Re-read window for rows committed out of order
     
-    def __init__(self, db_session: AsyncSession):
+    def __init__(self, db_session: AsyncSession, embedding_store=None, embedding_client=None):
         """Initialize with database session."""
         self.db = db_session
         self.llm = get_llm()
+        self.embeddings = embedding_store or get_embedding_store()
+        self.embedder = embedding_client or get_embedding_client()
     
     # =========================================================================
     # Session Management
@@ -277,7 +281,9 @@ class MemoryService:
         Semantic search for relevant past context.
         
         Uses cosine similarity on embeddings to find messages
-        that are semantically related to the query.
+        that are semantically related to the query. Vectors are scored
+        from the in-process EmbeddingStore, which is synced with the
+        session's newly stored rows first.
         
         Args:
             session_id: Session UUID
@@ -294,31 +300,82 @@ class MemoryService:
             # Fall back to keyword search
             return await self._keyword_search(session_id, query, limit)
         
-        # Get all messages with embeddings for this session
-        result = await self.db.execute(
-            select(ConversationMemory).where(
-                and_(
-                    ConversationMemory.session_id == uuid.UUID(session_id),
-                    ConversationMemory.embedding.isnot(None)
+        hits = await self._search_vectors(session_id, query_embedding, limit, threshold)
+        
+        await log_event(
+            "memory_search",
+            properties={"session_id": session_id, "query_length": len(query), "results": len(hits)},
+        )
+        
+        return hits
+    
+    async def _search_vectors(
+        self,
+        session_id: str,
+        query_embedding: List[float],
+        limit: int,
+        threshold: float,
+    ) -> List[ConversationMemory]:
+        """Top-k search over the session's vectors in the embedding store."""
+        await self._sync_embeddings(session_id)
+        
+        for _ in range(2):
+            ranked = self.embeddings.search(session_id, query_embedding, limit, threshold)
+            if not ranked:
+                return []
+            result = await self.db.execute(
+                select(ConversationMemory).where(
+                    ConversationMemory.id.in_([uuid.UUID(memory_id) for memory_id, _ in ranked])
                 )
             )
+            by_id = {str(msg.id): msg for msg in result.scalars().all()}
+            gone = [memory_id for memory_id, _ in ranked if memory_id not in by_id]
+            if not gone:
+                break
+            # Deleted by another worker since the store was loaded; search again without them
+            self.embeddings.remove(session_id, gone)
+        
+        return [by_id[memory_id] for memory_id, _ in ranked if memory_id in by_id]
+    
+    async def _sync_embeddings(self, session_id: str) -> None:
+        """Bring the store's copy of a session up to date with the database.
+        
+        Rows created since the last sync (minus SYNC_LOOKBACK, since
+        created_at is set before commit and rows can commit out of order)
+        are added. If the store's row count then still differs from the
+        database's, e.g. a row committed later than the lookback or rows
+        deleted by another worker, the session is reloaded in full.
+        """
+        vectors = self.embeddings.get(session_id)
+        session_filter = and_(
+            ConversationMemory.session_id == uuid.UUID(session_id),
+            ConversationMemory.embedding.isnot(None)
         )
-        messages = list(result.scalars().all())
-        
-        # Calculate similarities
-        similarities = []
-        for msg in messages:
-            if msg.embedding:
-                similarity = self._cosine_similarity(query_embedding, msg.embedding)
-                if similarity >= threshold:
-                    similarities.append((msg, similarity))
-        
-        # Sort by similarity and return top results
-        similarities.sort(key=lambda x: x[1], reverse=True)
         
-        log_event("memory_search", session_id=session_id, query_length=len(query), results=len(similarities[:limit]))
+        query = select(
+            ConversationMemory.id,
+            ConversationMemory.embedding,
+            ConversationMemory.created_at,
+        ).where(session_filter)
+        if vectors is not None and vectors.loaded_until is not None:
+            # ids already stored are skipped
+            query = query.where(ConversationMemory.created_at >= vectors.loaded_until - self.SYNC_LOOKBACK)
         
-        return [msg for msg, _ in similarities[:limit]]
+        result = await self.db.execute(query)
+        rows = result.all()
+        synced = self.embeddings.add(
+            session_id,
+            [(str(row.id), row.embedding) for row in rows if row.embedding],
+            loaded_until=max((row.created_at for row in rows if row.created_at), default=None),
+        )
+        if vectors is None:
+            return
+        
+        result = await self.db.execute(select(func.count(ConversationMemory.id)).where(session_filter))
+        if result.scalar() != len(synced):
+            logger.debug(f"Embedding store out of sync for session {session_id}; reloading")
+            self.embeddings.drop(session_id)
+            await self._sync_embeddings(session_id)
     
     async def _keyword_search(
         self,
@@ -434,6 +491,7 @@ Provide:
             await self.db.delete(msg)
         
         await self.db.commit()
+        self.embeddings.remove(session_id, [str(msg.id) for msg in old_messages])
         await self.db.refresh(summary)
         
         log_event("memory_summarized", session_id=session_id, message_count=len(old_messages))
@@ -470,6 +528,7 @@ Provide:
             await self.db.delete(msg)
         
         await self.db.commit()
+        self.embeddings.remove(session_id, [str(msg.id) for msg in messages])
         
         log_event("memory_forget", session_id=session_id, deleted=len(messages))
         logger.info(f"Deleted {len(messages)} messages from session {session_id}")
@@ -513,41 +572,10 @@ Provide:
     # =========================================================================
     
     async def _generate_embedding(self, text: str) -> Optional[List[float]]:
-        """Generate embedding for text using OpenAI."""
+        """Generate embedding for text via the shared batching, caching client."""
         if not self.llm:
             return None
-        
-        try:
-            # Use LLM connector's embedding method if available
-            if hasattr(self.llm, 'create_embedding'):
-                return await self.llm.create_embedding(text)
-            
-            # Fallback: Use OpenAI directly
-            from openai import AsyncOpenAI
-            import os
-            
-            client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
-            response = await client.embeddings.create(
-                model=self.EMBEDDING_MODEL,
-                input=text[:8000]  # Limit input size
-            )
-            return response.data[0].embedding
-        except Exception as e:
-            logger.warning(f"Embedding generation failed: {e}")
-            return None
-    
-    def _cosine_similarity(self, a: List[float], b: List[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        import math
-        
-        dot = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(x * x for x in b))
-        
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        
-        return dot / (norm_a * norm_b)
+        return await self.embedder.embed(text)
 
 
 # Convenience function for getting memory service
@@ -0,0 +1,156 @@
+"""
+Shared plumbing for the in-process caches in front of slow lookups.
+
+``TieredCache`` is a size-bounded LRU with optional per-entry freshness,
+an optional Redis tier shared across API workers, and single-flight
+loading: a key already being loaded is awaited, not loaded again.
+Subclasses (``EmbeddingClient``, ``ContactCache``) decide when to load
+and how values are encoded in Redis.
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+from src.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    fresh_until: float = math.inf
+    expires_at: float = math.inf
+
+
+class TieredCache:
+    """LRU (+ Redis) cache with single-flight loads bound to the running loop."""
+
+    def __init__(
+        self,
+        max_size: int,
+        redis_client=None,
+        redis_prefix: str = "",
+        stats: Iterable[str] = (),
+        name: str = "Cache",
+    ):
+        """
+        Args:
+            max_size: Max entries kept in process; least recently used are evicted
+            redis_client: Async Redis client for the shared tier (optional)
+            redis_prefix: Key prefix in Redis
+            stats: Counter names reported by the subclass, besides evictions
+            name: Label used in log messages
+        """
+        self.max_size = max_size
+        self.redis = redis_client
+        self.redis_prefix = redis_prefix
+        self.name = name
+        self.stats: Dict[str, int] = dict.fromkeys((*stats, "evictions"), 0)
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every local entry (the Redis tier expires on its own)."""
+        self._entries.clear()
+
+    def _lookup(self, key: str, now: Optional[float] = None) -> Optional[CacheEntry]:
+        """Entry for ``key`` unless missing or expired; marks it recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= (time.time() if now is None else now):
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        fresh_until: float = math.inf,
+        expires_at: float = math.inf,
+    ) -> None:
+        self._entries[key] = CacheEntry(value, fresh_until, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _bind_loop(self) -> bool:
+        """Bind to the running loop; True if state from another loop was dropped."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return False
+        # Futures and tasks belong to the loop that created them
+        self._loop, self._inflight, self._tasks = loop, {}, set()
+        return True
+
+    def _spawn(self, coro: Awaitable) -> asyncio.Task:
+        task = self._loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _join(self, key: str) -> Tuple[asyncio.Future, bool]:
+        """Future for ``key``'s value, and whether the caller must load it."""
+        future = self._inflight.get(key)
+        if future is not None:
+            return future, False
+        future = self._loop.create_future()
+        self._inflight[key] = future
+        return future, True
+
+    def _resolve(self, key: str, value: Any) -> None:
+        future = self._inflight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(value)
+
+    @staticmethod
+    async def _gather(futures: Dict[str, asyncio.Future]) -> Dict[str, Any]:
+        # Shielded, so a cancelled caller does not cancel the other waiters
+        values = await asyncio.gather(*(asyncio.shield(f) for f in futures.values()))
+        return dict(zip(futures, values))
+
+    async def _redis_get(self, keys: Sequence[str]) -> Dict[str, str]:
+        """Raw Redis values of ``keys`` that are present; {} if Redis fails."""
+        try:
+            raw = await self.redis.mget([self.redis_prefix + key for key in keys])
+        except Exception as e:
+            logger.warning(f"{self.name} Redis read failed: {e}")
+            return {}
+        return {key: value for key, value in zip(keys, raw) if value is not None}
+
+    async def _redis_set(self, values: Dict[str, str], ttl: int) -> None:
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.set(self.redis_prefix + key, value, ex=ttl)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"{self.name} Redis write failed: {e}")
+
+
+def create_cache_redis(enabled_setting: str):
+    """Redis client for a shared cache tier, if ``enabled_setting`` is on in settings."""
+    from src.config import get_settings
+
+    settings = get_settings()
+    if not getattr(settings, enabled_setting):
+        return None
+    try:
+        import redis.asyncio as aioredis
+        return aioredis.from_url(settings.redis_url)
+    except Exception as e:
+        logger.warning(f"Redis cache tier unavailable ({enabled_setting}): {e}")
+        return None
@@ -30,6 +30,15 @@ def register_shutdown_handlers(app):
         except asyncio.TimeoutError:
             logger.warning("Shutdown timeout reached, forcing exit")
         
+        # Close pooled HTTP connections, the Google API thread pool and the
+        # workflow step runner once in-flight requests are done
+        from src.connectors.http_transport import close_shared_transports
+        await close_shared_transports()
+        from src.connectors.google_executor import shutdown_google_executor
+        shutdown_google_executor(wait=False)
+        from src.workflows.workflow_engine import shutdown_workflow_engine
+        await shutdown_workflow_engine()
+        
         logger.info("Shutdown complete")
     
     def signal_handler(signum, frame):
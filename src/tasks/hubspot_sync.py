@@ -8,6 +8,7 @@ Syncs enhanced contact properties from HubSpot:
 - analytics_source
 """
 import asyncio
+import threading
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -19,6 +20,7 @@ from src.connectors.hubspot import create_hubspot_connector
 from src.db import get_session
 from src.logger import get_logger
 from src.models.hubspot import HubSpotContact, HubSpotCompany, HubSpotDeal
+from src.rate_limiter_enhanced import RequestPriority, rate_limit_priority
 
 logger = get_logger(__name__)
 
@@ -60,14 +62,27 @@ ENHANCED_COMPANY_PROPERTIES = [
 ]
 
 
+_worker = threading.local()
+
+
+def _worker_loop() -> asyncio.AbstractEventLoop:
+    """Event loop reused by every task run on this worker thread.
+
+    Pooled HubSpot connections belong to the loop that opened them, so
+    reusing one loop lets consecutive tasks reuse those connections.
+    """
+    loop = getattr(_worker, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _worker.loop = asyncio.new_event_loop()
+    return loop
+
+
 def _run_async(coro: Any) -> Any:
-    """Run async coroutine in sync context for Celery."""
-    loop = asyncio.new_event_loop()
+    """Run async coroutine in sync context for Celery (background rate-limit lane)."""
+    loop = _worker_loop()
     asyncio.set_event_loop(loop)
-    try:
+    with rate_limit_priority(RequestPriority.BACKGROUND):
         return loop.run_until_complete(coro)
-    finally:
-        loop.close()
 
 
 @celery_app.task(
@@ -99,59 +114,63 @@ async def _sync_contact_deep_async(hubspot_contact_id: str) -> dict:
             hubspot_contact_id, 
             properties=ENHANCED_CONTACT_PROPERTIES
         )
-        
-        if not contact_data:
-            return {"status": "not_found", "hubspot_contact_id": hubspot_contact_id}
-        
-        props = contact_data.get("properties", {})
-        
-        # Build enhanced properties dict
-        enhanced = {
-            "lifecycle_stage": props.get("lifecyclestage"),
-            "lead_status": props.get("hs_lead_status"),
-            "num_contacted_times": _parse_int(props.get("num_contacted_times")),
-            "analytics_source": props.get("hs_analytics_source"),
-            "analytics_source_data_1": props.get("hs_analytics_source_data_1"),
-            "analytics_source_data_2": props.get("hs_analytics_source_data_2"),
-            "recent_deal_amount": _parse_float(props.get("recent_deal_amount")),
-            "num_associated_deals": _parse_int(props.get("num_associated_deals")),
-            "total_revenue": _parse_float(props.get("total_revenue")),
-            "job_title": props.get("jobtitle"),
-            "phone": props.get("phone"),
-            "mobile_phone": props.get("mobilephone"),
-            "email_last_open_date": props.get("hs_email_last_open_date"),
-            "email_last_reply_date": props.get("hs_email_last_reply_date"),
-            "notes_last_updated": props.get("notes_last_updated"),
-            "sequences_enrolled_count": _parse_int(props.get("hs_sequences_actively_enrolled_count")),
-            "synced_at": datetime.utcnow().isoformat(),
-        }
-        
-        # Update in database
-        async with get_session() as session:
-            stmt = select(HubSpotContact).where(
-                HubSpotContact.hubspot_contact_id == hubspot_contact_id
-            )
-            result = await session.execute(stmt)
-            contact = result.scalar_one_or_none()
-            
-            if contact:
-                # Merge with existing custom_properties
-                existing = contact.custom_properties or {}
-                existing.update(enhanced)
-                contact.custom_properties = existing
-                contact.synced_at = datetime.utcnow()
-                await session.commit()
-                logger.info(f"Deep synced contact {hubspot_contact_id}")
-                return {"status": "synced", "hubspot_contact_id": hubspot_contact_id, "properties": enhanced}
-            else:
-                logger.warning(f"Contact {hubspot_contact_id} not found in local DB")
-                return {"status": "not_in_db", "hubspot_contact_id": hubspot_contact_id}
+        return await _store_contact_deep(hubspot_contact_id, contact_data)
                 
     except Exception as e:
         logger.error(f"Error deep syncing contact {hubspot_contact_id}: {e}")
         raise
 
 
+async def _store_contact_deep(hubspot_contact_id: str, contact_data: dict | None) -> dict:
+    """Write fetched enhanced contact properties to the local DB."""
+    if not contact_data:
+        return {"status": "not_found", "hubspot_contact_id": hubspot_contact_id}
+    
+    props = contact_data.get("properties", {})
+    
+    # Build enhanced properties dict
+    enhanced = {
+        "lifecycle_stage": props.get("lifecyclestage"),
+        "lead_status": props.get("hs_lead_status"),
+        "num_contacted_times": _parse_int(props.get("num_contacted_times")),
+        "analytics_source": props.get("hs_analytics_source"),
+        "analytics_source_data_1": props.get("hs_analytics_source_data_1"),
+        "analytics_source_data_2": props.get("hs_analytics_source_data_2"),
+        "recent_deal_amount": _parse_float(props.get("recent_deal_amount")),
+        "num_associated_deals": _parse_int(props.get("num_associated_deals")),
+        "total_revenue": _parse_float(props.get("total_revenue")),
+        "job_title": props.get("jobtitle"),
+        "phone": props.get("phone"),
+        "mobile_phone": props.get("mobilephone"),
+        "email_last_open_date": props.get("hs_email_last_open_date"),
+        "email_last_reply_date": props.get("hs_email_last_reply_date"),
+        "notes_last_updated": props.get("notes_last_updated"),
+        "sequences_enrolled_count": _parse_int(props.get("hs_sequences_actively_enrolled_count")),
+        "synced_at": datetime.utcnow().isoformat(),
+    }
+    
+    # Update in database
+    async with get_session() as session:
+        stmt = select(HubSpotContact).where(
+            HubSpotContact.hubspot_contact_id == hubspot_contact_id
+        )
+        result = await session.execute(stmt)
+        contact = result.scalar_one_or_none()
+        
+        if contact:
+            # Merge with existing custom_properties
+            existing = contact.custom_properties or {}
+            existing.update(enhanced)
+            contact.custom_properties = existing
+            contact.synced_at = datetime.utcnow()
+            await session.commit()
+            logger.info(f"Deep synced contact {hubspot_contact_id}")
+            return {"status": "synced", "hubspot_contact_id": hubspot_contact_id, "properties": enhanced}
+        else:
+            logger.warning(f"Contact {hubspot_contact_id} not found in local DB")
+            return {"status": "not_in_db", "hubspot_contact_id": hubspot_contact_id}
+
+
 @celery_app.task(
     name="src.tasks.hubspot_sync.sync_company_deep",
     bind=True,
@@ -245,9 +264,19 @@ async def _sync_all_contacts_deep_async(limit: int) -> dict:
     synced = 0
     failed = 0
     
+    # One batch read per 100 contacts instead of one GET per contact
+    connector = create_hubspot_connector()
+    try:
+        contacts_data = await connector.batch.read_objects(
+            "contacts", contact_ids, properties=ENHANCED_CONTACT_PROPERTIES
+        )
+    except Exception as e:
+        logger.error(f"Batch read failed for {len(contact_ids)} contacts: {e}")
+        return {"total": len(contact_ids), "synced": 0, "failed": len(contact_ids)}
+    
     for contact_id in contact_ids:
         try:
-            result = await _sync_contact_deep_async(contact_id)
+            result = await _store_contact_deep(contact_id, contacts_data.get(contact_id))
             if result.get("status") == "synced":
                 synced += 1
             else:
@@ -3,11 +3,14 @@
 Processes due sequence steps and queues emails for sending.
 Sprint 63: Sequence Automation
 """
+import asyncio
 import logging
+import time
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import select, and_
+from sqlalchemy import Select, select, and_, func, update
 from sqlalchemy.orm import selectinload
 
 from src.celery_app import celery_app
@@ -24,10 +27,13 @@ from src.models.command_queue import CommandQueueItem, QueueItemStatus
 
 logger = logging.getLogger(__name__)
 
+# Enrollments claimed (row-locked) per batch, and steps processed at once
+CLAIM_BATCH_SIZE = 100
+STEP_CONCURRENCY = 10
+
 
 def _run_async(coro):
     """Run async coroutine in sync context for Celery."""
-    import asyncio
     try:
         loop = asyncio.get_event_loop()
     except RuntimeError:
@@ -47,52 +53,154 @@ def execute_due_steps(self):
     """Execute all due sequence steps.
     
     Runs every 15 minutes via Celery beat.
-    Finds enrollments with next_step_at <= now and processes them.
+    Claims enrollments with next_step_at <= now in batches and processes
+    them until the backlog is drained. Several workers can run this at
+    once; each claims different rows.
     """
     return _run_async(_execute_due_steps_async())
 
 
-async def _execute_due_steps_async():
-    """Async implementation of step execution."""
-    now = datetime.utcnow()
+def _claim_due_query(cutoff: datetime, batch_size: int, exclude_ids: List) -> Select:
+    """Select and row-lock the next batch of due enrollments.
+    
+    FOR UPDATE SKIP LOCKED makes concurrent workers claim disjoint batches
+    instead of blocking on (or double-processing) each other's rows.
+    """
+    query = (
+        select(SequenceEnrollment)
+        .options(selectinload(SequenceEnrollment.sequence).selectinload(Sequence.steps))
+        .where(
+            and_(
+                SequenceEnrollment.status == EnrollmentStatus.ACTIVE.value,
+                SequenceEnrollment.next_step_at <= cutoff,
+            )
+        )
+        .order_by(SequenceEnrollment.next_step_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True, of=SequenceEnrollment)
+    )
+    if exclude_ids:
+        query = query.where(SequenceEnrollment.id.notin_(exclude_ids))
+    return query
+
+
+async def _execute_due_steps_async(
+    batch_size: int = CLAIM_BATCH_SIZE,
+    concurrency: int = STEP_CONCURRENCY,
+    max_batches: Optional[int] = None,
+):
+    """Async implementation of step execution.
+    
+    Each batch is claimed, processed and committed in its own transaction
+    (the commit releases the row locks); paging stops when a claim comes
+    back short or empty. Enrollments whose step failed stay due and are
+    excluded from later claims in this run.
+    """
+    started = time.monotonic()
+    cutoff = datetime.utcnow()
     processed = 0
     errors = 0
+    batches = 0
+    failed_ids: List = []
     
-    async with get_session() as db:
-        # Find all active enrollments with due steps
-        query = (
-            select(SequenceEnrollment)
-            .options(selectinload(SequenceEnrollment.sequence).selectinload(Sequence.steps))
-            .where(
-                and_(
-                    SequenceEnrollment.status == EnrollmentStatus.ACTIVE.value,
-                    SequenceEnrollment.next_step_at <= now,
-                )
+    while max_batches is None or batches < max_batches:
+        async with get_session() as db:
+            result = await db.execute(_claim_due_query(cutoff, batch_size, failed_ids))
+            enrollments = result.scalars().all()
+            if not enrollments:
+                break
+            
+            batches += 1
+            batch_processed, batch_failed = await _process_batch(
+                db, enrollments, datetime.utcnow(), concurrency
             )
-            .limit(100)  # Process in batches
-        )
+            await db.commit()
         
-        result = await db.execute(query)
-        enrollments = result.scalars().all()
-        
-        logger.info(f"Found {len(enrollments)} enrollments with due steps")
+        processed += batch_processed
+        errors += len(batch_failed)
+        failed_ids.extend(batch_failed)
+        logger.info(
+            f"Sequence batch {batches}: {batch_processed} processed, {len(batch_failed)} errors"
+        )
         
-        for enrollment in enrollments:
+        if len(enrollments) < batch_size:
+            break
+    
+    elapsed = time.monotonic() - started
+    drain_rate = processed / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        f"Sequence executor completed: {processed} processed, {errors} errors "
+        f"in {batches} batches, {elapsed:.1f}s ({drain_rate:.1f} steps/s)"
+    )
+    return {
+        "processed": processed,
+        "errors": errors,
+        "batches": batches,
+        "elapsed_seconds": round(elapsed, 3),
+        "drain_rate_per_second": round(drain_rate, 2),
+    }
+
+
+async def _process_batch(
+    db,
+    enrollments: List[SequenceEnrollment],
+    now: datetime,
+    concurrency: int,
+) -> Tuple[int, List]:
+    """Process a claimed batch with bounded concurrency.
+    
+    Steps share the batch's session, so they must only stage changes
+    (``db.add`` / attribute updates) and not await on the session. The
+    sequence counters for enrollments that completed are applied once per
+    sequence afterwards, as SQL-side increments.
+    
+    Returns:
+        (processed count, ids of enrollments that failed)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    completed: Counter = Counter()
+    
+    async def run(enrollment: SequenceEnrollment):
+        async with semaphore:
             try:
-                await _process_enrollment_step(db, enrollment, now)
-                processed += 1
+                if await _process_enrollment_step(db, enrollment, now):
+                    completed[enrollment.sequence_id] += 1
+                return None
             except Exception as e:
                 logger.error(f"Error processing enrollment {enrollment.id}: {e}")
-                errors += 1
-        
-        await db.commit()
+                return enrollment.id
     
-    logger.info(f"Sequence executor completed: {processed} processed, {errors} errors")
-    return {"processed": processed, "errors": errors}
+    results = await asyncio.gather(*(run(enrollment) for enrollment in enrollments))
+    failed = [enrollment_id for enrollment_id in results if enrollment_id is not None]
+    for sequence_id, count in completed.items():
+        await db.execute(_completed_enrollments_update(sequence_id, count))
+    return len(enrollments) - len(failed), failed
 
 
-async def _process_enrollment_step(db, enrollment: SequenceEnrollment, now: datetime):
-    """Process a single enrollment step."""
+def _completed_enrollments_update(sequence_id, count: int):
+    """Move ``count`` enrollments from active to completed on a sequence.
+    
+    The claim only locks enrollment rows, so workers in other transactions
+    may finish enrollments of the same sequence concurrently; incrementing
+    in SQL keeps their updates from overwriting each other.
+    """
+    return (
+        update(Sequence)
+        .where(Sequence.id == sequence_id)
+        .values(
+            active_enrollments=func.greatest(Sequence.active_enrollments - count, 0),
+            completed_enrollments=Sequence.completed_enrollments + count,
+        )
+    )
+
+
+async def _process_enrollment_step(db, enrollment: SequenceEnrollment, now: datetime) -> bool:
+    """Process a single enrollment step.
+    
+    Returns:
+        True if the enrollment completed; the caller updates the sequence
+        counters.
+    """
     sequence = enrollment.sequence
     
     if not sequence or sequence.status != SequenceStatus.ACTIVE.value:
@@ -100,7 +208,7 @@ async def _process_enrollment_step(db, enrollment: SequenceEnrollment, now: date
         enrollment.status = EnrollmentStatus.PAUSED.value
         enrollment.paused_at = now
         logger.info(f"Paused enrollment {enrollment.id} - sequence not active")
-        return
+        return False
     
     # Get current step
     current_step_num = enrollment.current_step + 1
@@ -112,12 +220,8 @@ async def _process_enrollment_step(db, enrollment: SequenceEnrollment, now: date
         enrollment.completed_at = now
         enrollment.next_step_at = None
         
-        # Update sequence metrics
-        sequence.active_enrollments = max(0, sequence.active_enrollments - 1)
-        sequence.completed_enrollments += 1
-        
         logger.info(f"Completed enrollment {enrollment.id} - no more steps")
-        return
+        return True
     
     step = steps_by_num[current_step_num]
     
@@ -154,10 +258,9 @@ async def _process_enrollment_step(db, enrollment: SequenceEnrollment, now: date
         enrollment.status = EnrollmentStatus.COMPLETED.value
         enrollment.completed_at = now
         enrollment.next_step_at = None
-        sequence.active_enrollments = max(0, sequence.active_enrollments - 1)
-        sequence.completed_enrollments += 1
     
     logger.info(f"Processed step {current_step_num} for enrollment {enrollment.id}")
+    return enrollment.status == EnrollmentStatus.COMPLETED.value
 
 
 async def _queue_email_step(db, enrollment: SequenceEnrollment, step: SequenceStep):
@@ -189,11 +189,10 @@ class VoiceProfileTrainer:
                 max_results=limit
             )
             
-            for thread in threads:
-                thread_data = await self.gmail_connector.get_thread(thread["id"])
-                if not thread_data:
-                    continue
-                
+            thread_details = await self.gmail_connector.get_threads_batch(
+                [thread["id"] for thread in threads]
+            )
+            for thread_data in thread_details.values():
                 for message in thread_data.get("messages", []):
                     # Extract body from message
                     payload = message.get("payload", {})
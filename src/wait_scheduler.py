@@ -0,0 +1,97 @@
+"""
+Wait Scheduler
+==============
+Min-heap of ids keyed by their wake-up time, shared by the workflow
+engine (parked executions) and the sequence engine (enrollments with a
+step due).
+
+Engines used to scan every execution or enrollment on each tick to find
+due work. The scheduler keeps one heap entry per scheduled id so a tick
+only visits the entries that are due: O(log n) to schedule, O(1) to
+cancel (stale heap entries are skipped when they surface and compacted
+away once they outnumber live ones), and O(k log n) to pop k due ids.
+"""
+
+import heapq
+from datetime import datetime
+from typing import Optional
+
+
+class WaitScheduler:
+    """Schedule ids (executions, enrollments) to wake up at a given time."""
+
+    def __init__(self):
+        # Heap of [due_at, seq, item_id]; a cancelled entry has its id set to None
+        self._heap: list[list] = []
+        self._entries: dict[str, list] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._entries
+
+    def schedule(self, item_id: str, due_at: datetime) -> None:
+        """Wake ``item_id`` at ``due_at``, replacing any earlier schedule."""
+        self.cancel(item_id)
+        self._seq += 1
+        entry = [due_at, self._seq, item_id]
+        self._entries[item_id] = entry
+        heapq.heappush(self._heap, entry)
+
+    def cancel(self, item_id: str) -> bool:
+        """Drop the schedule for ``item_id``. Returns True if one existed."""
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return False
+        entry[2] = None
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._compact()
+        return True
+
+    def due_at(self, item_id: str) -> Optional[datetime]:
+        """When ``item_id`` is scheduled to wake, if at all."""
+        entry = self._entries.get(item_id)
+        return entry[0] if entry else None
+
+    def next_due(self) -> Optional[datetime]:
+        """Earliest scheduled wake-up time."""
+        self._drop_cancelled()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime) -> list[str]:
+        """Remove and return every id due at or before ``now``, earliest first."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, item_id = heapq.heappop(self._heap)
+            if item_id is not None:
+                del self._entries[item_id]
+                due.append(item_id)
+        return due
+
+    def peek_due(self, now: datetime) -> list[str]:
+        """Ids due at or before ``now``, earliest first, without removing them.
+
+        Walks only the part of the heap that is due: O(k log k) for k due ids.
+        """
+        heap = self._heap
+        due = []
+        frontier = [(heap[0][0], heap[0][1], 0)] if heap and heap[0][0] <= now else []
+        while frontier:
+            _, _, index = heapq.heappop(frontier)
+            item_id = heap[index][2]
+            if item_id is not None:
+                due.append(item_id)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap) and heap[child][0] <= now:
+                    heapq.heappush(frontier, (heap[child][0], heap[child][1], child))
+        return due
+
+    def _drop_cancelled(self) -> None:
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if entry[2] is not None]
+        heapq.heapify(self._heap)
@@ -11,6 +11,8 @@ from src.workflows.workflow_engine import (
     ExecutionStatus,
     get_workflow_engine,
 )
+from src.workflows.runner import StepRunner
+from src.wait_scheduler import WaitScheduler
 
 __all__ = [
     "WorkflowEngine",
@@ -22,4 +24,6 @@ __all__ = [
     "TriggerType",
     "ExecutionStatus",
     "get_workflow_engine",
+    "StepRunner",
+    "WaitScheduler",
 ]
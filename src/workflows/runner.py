@@ -0,0 +1,133 @@
+"""
+Step Runner
+===========
+Worker pool that runs queued workflow executions.
+
+``WorkflowEngine.trigger_workflow`` and ``resume_waiting_executions`` only
+enqueue an execution; a fixed pool of worker tasks pulls executions off
+the queue and runs their steps one after another until they wait, finish
+or fail. Slow step types can be capped (e.g. at most N concurrent
+AI_GENERATE steps across all workers), and the runner keeps queue depth
+and per-step-type latency metrics.
+"""
+
+import asyncio
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Any, AsyncContextManager, Awaitable, Callable, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class StepLatency:
+    """Latency statistics for one step type."""
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(1000 * self.total_seconds / self.count, 3) if self.count else 0.0,
+            "max_ms": round(1000 * self.max_seconds, 3),
+        }
+
+
+class StepRunner:
+    """Queue plus worker pool that drives executions through their steps."""
+
+    def __init__(
+        self,
+        run: Callable[[Any], Awaitable[None]],
+        workers: int = 8,
+        step_limits: Optional[dict] = None,
+    ):
+        """
+        Args:
+            run: Coroutine function that runs one execution until it stops
+            workers: Number of worker tasks
+            step_limits: Max concurrent steps per step type
+        """
+        self._run = run
+        self.workers = workers
+        self.step_limits = dict(step_limits or {})
+        self.latency: dict[str, StepLatency] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list[asyncio.Task] = []
+        self._slots: dict[Any, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running = 0
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+        # First use, or a new event loop (e.g. a new test or worker process)
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._slots = {
+            step_type: asyncio.Semaphore(limit) for step_type, limit in self.step_limits.items()
+        }
+        self._running = 0
+        self._tasks = [
+            loop.create_task(self._work(), name=f"workflow-runner-{i}")
+            for i in range(self.workers)
+        ]
+
+    def enqueue(self, execution: Any) -> None:
+        """Queue an execution to run; must be called from the event loop."""
+        self._ensure_started()
+        self._queue.put_nowait(execution)
+
+    async def join(self) -> None:
+        """Wait until every queued execution has run."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks. Queued executions are dropped."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        if tasks and self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._queue = None
+        self._loop = None
+
+    def step_slot(self, step_type: Any) -> AsyncContextManager:
+        """Context manager that holds one of ``step_type``'s concurrency slots."""
+        return self._slots.get(step_type) or nullcontext()
+
+    def record_step(self, step_type: Any, seconds: float) -> None:
+        key = getattr(step_type, "value", step_type)
+        self.latency.setdefault(key, StepLatency()).record(seconds)
+
+    def metrics(self) -> dict:
+        """Queue depth, worker usage and per-step-type latency."""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "running": self._running,
+            "workers": self.workers,
+            "step_limits": {getattr(k, "value", k): v for k, v in self.step_limits.items()},
+            "step_latency": {k: v.to_dict() for k, v in self.latency.items()},
+        }
+
+    async def _work(self) -> None:
+        while True:
+            execution = await self._queue.get()
+            self._running += 1
+            try:
+                await self._run(execution)
+            except Exception as e:
+                logger.error("workflow_execution_crashed", execution_id=execution.id, error=str(e))
+            finally:
+                self._running -= 1
+                self._queue.task_done()
@@ -5,7 +5,8 @@ Powerful workflow automation for complex multi-step sales processes.
 Supports triggers, conditions, actions, branching, and parallel execution.
 """
 
-import asyncio
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -13,6 +14,9 @@ from typing import Any, Callable, Optional
 import structlog
 import uuid
 
+from src.workflows.runner import StepRunner
+from src.wait_scheduler import WaitScheduler
+
 logger = structlog.get_logger(__name__)
 
 
@@ -64,6 +68,13 @@ class ExecutionStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+TERMINAL_STATUSES = frozenset({
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.CANCELLED,
+})
+
+
 @dataclass
 class WorkflowStep:
     """A single step in a workflow."""
@@ -119,6 +130,19 @@ class WorkflowTrigger:
                 return False
         
         return True
+    
+    def compile(self) -> Callable[[dict], bool]:
+        """Build a predicate over ``event["data"]`` for this trigger's filters.
+        
+        The event type is not checked; callers index triggers by type.
+        """
+        items = tuple(self.filters.items())
+        if not items:
+            return lambda data: True
+        if len(items) == 1:
+            (key, expected), = items
+            return lambda data: data.get(key) == expected
+        return lambda data: all(data.get(key) == expected for key, expected in items)
 
 
 @dataclass
@@ -195,15 +219,38 @@ class WorkflowExecution:
         }
 
 
+# Default caps on concurrently running steps of slow step types
+DEFAULT_STEP_LIMITS = {
+    StepType.AI_GENERATE: 4,
+    StepType.WEBHOOK: 8,
+}
+
+
 class WorkflowEngine:
     """
     Engine that executes workflows.
     Handles step execution, branching, waiting, and error recovery.
+    
+    ``executions`` only holds live (running, waiting, paused) executions;
+    timed waits are parked in ``scheduler`` and finished executions move to
+    a bounded ``archived_executions`` map. Executions are run by ``runner``,
+    a worker pool fed by trigger_workflow and resume_waiting_executions.
     """
     
-    def __init__(self):
+    ARCHIVE_LIMIT = 10_000
+    
+    def __init__(self, workers: int = 8, step_limits: Optional[dict[StepType, int]] = None):
         self.workflows: dict[str, Workflow] = {}
         self.executions: dict[str, WorkflowExecution] = {}
+        self.archived_executions: OrderedDict[str, WorkflowExecution] = OrderedDict()
+        self.scheduler = WaitScheduler()
+        # event type -> [(workflow, trigger, compiled filter)], in registration order
+        self._trigger_index: dict[str, list[tuple[Workflow, WorkflowTrigger, Callable[[dict], bool]]]] = {}
+        self.runner = StepRunner(
+            self._run_execution,
+            workers=workers,
+            step_limits=DEFAULT_STEP_LIMITS if step_limits is None else step_limits,
+        )
         self.step_handlers: dict[StepType, Callable] = {}
         self._register_default_handlers()
     
@@ -225,8 +272,13 @@ class WorkflowEngine:
         }
     
     def register_workflow(self, workflow: Workflow) -> None:
-        """Register a workflow."""
+        """Register a workflow.
+        
+        Its triggers are indexed here; re-register the workflow after
+        changing them.
+        """
         self.workflows[workflow.id] = workflow
+        self._index_triggers(workflow)
         logger.info("workflow_registered", workflow_id=workflow.id, name=workflow.name)
     
     def create_workflow(
@@ -288,7 +340,11 @@ class WorkflowEngine:
         company_id: str = None,
         context: dict = None,
     ) -> WorkflowExecution:
-        """Start a new workflow execution."""
+        """Start a new workflow execution.
+        
+        The execution is queued on the runner and returned while still
+        RUNNING; await ``runner.join()`` to wait for queued work.
+        """
         workflow = self.workflows.get(workflow_id)
         if not workflow:
             raise ValueError(f"Workflow {workflow_id} not found")
@@ -316,53 +372,87 @@ class WorkflowEngine:
             contact_id=contact_id,
         )
         
-        # Start executing
-        await self._execute_next_step(execution)
+        self.runner.enqueue(execution)
         
         return execution
     
+    def _index_triggers(self, workflow: Workflow) -> None:
+        """(Re)build the trigger index entries for a workflow."""
+        for entries in self._trigger_index.values():
+            entries[:] = [entry for entry in entries if entry[0].id != workflow.id]
+        for trigger in workflow.triggers:
+            self._trigger_index.setdefault(trigger.trigger_type.value, []).append(
+                (workflow, trigger, trigger.compile())
+            )
+    
+    def match_event(self, event: dict) -> list[Workflow]:
+        """Active workflows with a trigger matching the event, one entry per matching trigger."""
+        entries = self._trigger_index.get(event.get("type"))
+        if not entries:
+            return []
+        data = event.get("data", {})
+        return [
+            workflow for workflow, _, predicate in entries
+            if workflow.is_active and predicate(data)
+        ]
+    
     async def process_event(self, event: dict) -> list[WorkflowExecution]:
-        """Process an event and trigger matching workflows."""
-        triggered_executions = []
-        
-        for workflow in self.workflows.values():
-            if not workflow.is_active:
-                continue
-            
-            for trigger in workflow.triggers:
-                if trigger.matches(event):
-                    execution = await self.trigger_workflow(
-                        workflow_id=workflow.id,
-                        contact_id=event.get("data", {}).get("contact_id"),
-                        company_id=event.get("data", {}).get("company_id"),
-                        context={"trigger_event": event},
-                    )
-                    triggered_executions.append(execution)
-        
-        return triggered_executions
-    
-    async def _execute_next_step(self, execution: WorkflowExecution) -> None:
-        """Execute the next step in the workflow."""
+        """Process an event and trigger matching workflows.
+        
+        Matching workflows are queued on the runner, whose worker pool
+        runs them concurrently.
+        """
+        data = event.get("data", {})
+        executions = []
+        
+        for workflow in self.match_event(event):
+            execution = await self.trigger_workflow(
+                workflow_id=workflow.id,
+                contact_id=data.get("contact_id"),
+                company_id=data.get("company_id"),
+                context={"trigger_event": event},
+            )
+            executions.append(execution)
+        
+        return executions
+    
+    async def _run_execution(self, execution: WorkflowExecution) -> None:
+        """Run an execution step by step until it waits, stops or finishes."""
+        if execution.status != ExecutionStatus.RUNNING:
+            return  # paused or cancelled while queued
+        
+        while await self._execute_next_step(execution):
+            if execution.status in (ExecutionStatus.PAUSED, ExecutionStatus.CANCELLED):
+                break
+        self._settle(execution)
+    
+    async def _execute_next_step(self, execution: WorkflowExecution) -> bool:
+        """Execute the current step. Returns True if the next step should run."""
         workflow = self.workflows.get(execution.workflow_id)
         if not workflow or not execution.current_step_id:
             execution.status = ExecutionStatus.COMPLETED
             execution.completed_at = datetime.utcnow()
-            return
+            return False
         
         step = workflow.get_step(execution.current_step_id)
         if not step:
             execution.status = ExecutionStatus.FAILED
             execution.error_message = f"Step {execution.current_step_id} not found"
-            return
+            return False
         
         handler = self.step_handlers.get(step.step_type)
         if not handler:
             execution.status = ExecutionStatus.FAILED
             execution.error_message = f"No handler for step type {step.step_type}"
-            return
+            return False
         
         try:
-            result = await handler(execution, step)
+            async with self.runner.step_slot(step.step_type):
+                started = time.perf_counter()
+                try:
+                    result = await handler(execution, step)
+                finally:
+                    self.runner.record_step(step.step_type, time.perf_counter() - started)
             execution.step_results[step.id] = {
                 "status": "success",
                 "result": result,
@@ -379,16 +469,17 @@ class WorkflowEngine:
             elif step.step_type == StepType.WAIT_EVENT:
                 execution.status = ExecutionStatus.WAITING
             elif step.step_type == StepType.CONDITION:
-                # Condition handler sets next_step_id
-                if execution.current_step_id:
-                    await self._execute_next_step(execution)
+                # Condition handler sets next_step_id; no branch taken ends the run
+                if execution.current_step_id and execution.current_step_id != step.id:
+                    return True
+                execution.status = ExecutionStatus.COMPLETED
+                execution.completed_at = datetime.utcnow()
             elif step.next_step_id:
                 execution.current_step_id = step.next_step_id
-                await self._execute_next_step(execution)
+                return True
             else:
                 execution.status = ExecutionStatus.COMPLETED
                 execution.completed_at = datetime.utcnow()
-                
         except Exception as e:
             logger.error("step_execution_failed", step_id=step.id, error=str(e))
             execution.retry_count += 1
@@ -403,27 +494,49 @@ class WorkflowEngine:
                 
                 if step.on_failure_step_id:
                     execution.current_step_id = step.on_failure_step_id
-                    await self._execute_next_step(execution)
+                    return True
+        
+        return False
     
-    async def resume_waiting_executions(self) -> list[WorkflowExecution]:
-        """Resume executions that are past their wait time."""
+    def _settle(self, execution: WorkflowExecution) -> None:
+        """Park, unpark or archive an execution after it has run."""
+        if execution.status == ExecutionStatus.WAITING and execution.next_execution_at:
+            self.scheduler.schedule(execution.id, execution.next_execution_at)
+        else:
+            self.scheduler.cancel(execution.id)
+        
+        if execution.status in TERMINAL_STATUSES:
+            self.executions.pop(execution.id, None)
+            self.archived_executions[execution.id] = execution
+            self.archived_executions.move_to_end(execution.id)
+            while len(self.archived_executions) > self.ARCHIVE_LIMIT:
+                self.archived_executions.popitem(last=False)
+    
+    async def resume_waiting_executions(self, now: datetime = None) -> list[WorkflowExecution]:
+        """Resume executions that are past their wait time.
+        
+        Only the executions the scheduler reports as due are touched; they
+        are queued on the runner.
+        """
         resumed = []
-        now = datetime.utcnow()
-        
-        for execution in self.executions.values():
-            if execution.status == ExecutionStatus.WAITING:
-                if execution.next_execution_at and execution.next_execution_at <= now:
-                    execution.status = ExecutionStatus.RUNNING
-                    
-                    # Move to next step
-                    workflow = self.workflows.get(execution.workflow_id)
-                    if workflow:
-                        current_step = workflow.get_step(execution.current_step_id)
-                        if current_step and current_step.next_step_id:
-                            execution.current_step_id = current_step.next_step_id
-                    
-                    await self._execute_next_step(execution)
-                    resumed.append(execution)
+        now = now or datetime.utcnow()
+        
+        for execution_id in self.scheduler.pop_due(now):
+            execution = self.executions.get(execution_id)
+            if not execution or execution.status != ExecutionStatus.WAITING:
+                continue
+            
+            execution.status = ExecutionStatus.RUNNING
+            
+            # Move to next step
+            workflow = self.workflows.get(execution.workflow_id)
+            if workflow:
+                current_step = workflow.get_step(execution.current_step_id)
+                if current_step and current_step.next_step_id:
+                    execution.current_step_id = current_step.next_step_id
+            
+            self.runner.enqueue(execution)
+            resumed.append(execution)
         
         return resumed
     
@@ -640,7 +753,7 @@ class WorkflowEngine:
     
     def get_execution(self, execution_id: str) -> Optional[WorkflowExecution]:
         """Get an execution by ID."""
-        return self.executions.get(execution_id)
+        return self.executions.get(execution_id) or self.archived_executions.get(execution_id)
     
     def list_workflows(self, active_only: bool = True) -> list[Workflow]:
         """List all workflows."""
@@ -656,7 +769,12 @@ class WorkflowEngine:
         contact_id: str = None,
     ) -> list[WorkflowExecution]:
         """List executions with optional filters."""
-        executions = list(self.executions.values())
+        if status in TERMINAL_STATUSES:
+            executions = list(self.archived_executions.values())
+        elif status:
+            executions = list(self.executions.values())
+        else:
+            executions = [*self.executions.values(), *self.archived_executions.values()]
         
         if workflow_id:
             executions = [e for e in executions if e.workflow_id == workflow_id]
@@ -672,7 +790,8 @@ class WorkflowEngine:
         execution = self.executions.get(execution_id)
         if execution:
             execution.status = ExecutionStatus.PAUSED
-        return execution
+            self._settle(execution)
+        return self.get_execution(execution_id)
     
     def cancel_execution(self, execution_id: str) -> WorkflowExecution:
         """Cancel an execution."""
@@ -680,7 +799,8 @@ class WorkflowEngine:
         if execution:
             execution.status = ExecutionStatus.CANCELLED
             execution.completed_at = datetime.utcnow()
-        return execution
+            self._settle(execution)
+        return self.get_execution(execution_id)
 
 
 # Singleton instance
@@ -696,6 +816,12 @@ def get_workflow_engine() -> WorkflowEngine:
     return _workflow_engine
 
 
+async def shutdown_workflow_engine() -> None:
+    """Stop the workflow engine's worker pool, if the engine was created."""
+    if _workflow_engine is not None:
+        await _workflow_engine.runner.stop()
+
+
 def _setup_default_workflows(engine: WorkflowEngine) -> None:
     """Set up default workflow templates."""
     
@@ -0,0 +1,80 @@
+"""Synthetic contact corpus with planted duplicates for deduplication tests."""
+import random
+
+FIRST_NAMES = [
+    "Sarah", "Michael", "Emma", "James", "Olivia", "Liam", "Sophia", "Noah",
+    "Ava", "Lucas", "Mia", "Ethan", "Amelia", "Mason", "Harper", "Logan",
+]
+LAST_NAME_STEMS = [
+    "John", "Chen", "Rodri", "Smith", "Nguy", "Pat", "Kowal",
+    "Oka", "Schm", "Ross", "Hadd", "Silv", "Tana", "Murph",
+]
+LAST_NAME_SUFFIXES = ["son", "el", "guez", "ski", "for", "idt", "ad", "er", "ova", "berg", "ley", "ini"]
+COMPANY_DOMAINS = [
+    f"{prefix}{suffix}.{tld}"
+    for prefix in ["tech", "cargo", "freight", "ship", "logi", "port", "fleet", "haul"]
+    for suffix in ["corp", "max", "line", "works", "fast", "side", "hub", "ly"]
+    for tld in ["com", "io"]
+]
+PERSONAL_DOMAINS = ["gmail.com", "yahoo.com", "outlook.com"]
+
+
+def _typo(rng: random.Random, value: str) -> str:
+    """Introduce a single-character edit."""
+    pos = rng.randrange(1, len(value) - 1)
+    edit = rng.choice(["drop", "swap", "replace"])
+    if edit == "drop":
+        return value[:pos] + value[pos + 1:]
+    if edit == "swap":
+        return value[:pos] + value[pos + 1] + value[pos] + value[pos + 2:]
+    return value[:pos] + rng.choice("aeiou") + value[pos + 1:]
+
+
+def make_dedup_corpus(size: int = 600, duplicate_rate: float = 0.2, seed: int = 42) -> list[dict]:
+    """
+    Build a contact corpus where a fraction of records are perturbed copies.
+
+    Duplicates vary email formatting (dots, + aliases, case), phone
+    formatting, missing fields and single-character name typos.
+    """
+    rng = random.Random(seed)
+    contacts = []
+
+    originals = int(size * (1 - duplicate_rate))
+    for i in range(originals):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAME_STEMS) + rng.choice(LAST_NAME_SUFFIXES) + rng.choice(["", "e", "o", "a"])
+        domain = rng.choice(COMPANY_DOMAINS + PERSONAL_DOMAINS)
+        contact = {
+            "id": f"c{i:05d}",
+            "full_name": f"{first} {last}",
+            "email": f"{first.lower()}.{last.lower()}{i}@{domain}",
+            "phone": f"+1-555-{rng.randrange(1000, 9999)}-{i:04d}",
+        }
+        if rng.random() < 0.5:
+            contact["linkedin_url"] = f"https://linkedin.com/in/{first.lower()}{last.lower()}{i}"
+        if domain in COMPANY_DOMAINS:
+            contact["company_domain"] = domain
+        contacts.append(contact)
+
+    for k in range(size - originals):
+        source = dict(rng.choice(contacts[:originals]))
+        source["id"] = f"d{k:05d}"
+        variant = rng.random()
+        if variant < 0.3:
+            local, _, domain = source["email"].partition("@")
+            source["email"] = f"{local.replace('.', '').upper()}+crm@{domain}"
+        elif variant < 0.55:
+            source["phone"] = "".join(ch for ch in source["phone"] if ch.isdigit())
+            source.pop("email")
+        elif variant < 0.8:
+            first, last = source["full_name"].split()
+            source["full_name"] = f"{_typo(rng, first)} {last}"
+            source.pop("email")
+            source.pop("phone")
+        else:
+            source.pop("phone")
+        contacts.append(source)
+
+    rng.shuffle(contacts)
+    return contacts
@@ -2,10 +2,13 @@
 
 Sprint 39B: Verify contact enrichment for queue items.
 """
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.services.contact_enrichment import (
+    ContactCache,
     ContactEnrichmentService,
     ContactInfo,
     get_contact_enrichment_service,
@@ -140,10 +143,10 @@ class TestContactEnrichmentService:
     async def test_enrich_queue_items(self):
         """Enrich multiple queue items with contact info."""
         mock_connector = MagicMock()
-        mock_connector.get_contact = AsyncMock(side_effect=[
-            {"id": "c1", "properties": {"firstname": "Alice", "lastname": "One", "email": "alice@test.com"}},
-            {"id": "c2", "properties": {"firstname": "Bob", "lastname": "Two", "company": "BobCorp"}},
-        ])
+        mock_connector.batch.read_objects = AsyncMock(return_value={
+            "c1": {"id": "c1", "properties": {"firstname": "Alice", "lastname": "One", "email": "alice@test.com"}},
+            "c2": {"id": "c2", "properties": {"firstname": "Bob", "lastname": "Two", "company": "BobCorp"}},
+        })
         
         service = ContactEnrichmentService(hubspot_connector=mock_connector)
         
@@ -161,6 +164,8 @@ class TestContactEnrichmentService:
         assert enriched[1]["contact_name"] == "Bob Two"
         assert enriched[1]["contact_company"] == "BobCorp"
         assert "contact_name" not in enriched[2] or enriched[2].get("contact_name") is None
+        # Both misses read in one batch call
+        mock_connector.batch.read_objects.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_enrich_queue_items_empty_list(self):
@@ -193,3 +198,143 @@ class TestGetContactEnrichmentService:
         service2 = get_contact_enrichment_service()
         
         assert service1 is service2
+
+
+def _contact(contact_id: str, first: str) -> dict:
+    return {"id": contact_id, "properties": {"firstname": first, "lastname": "Test"}}
+
+
+class TestContactCache:
+    """Bounded TTL cache with single-flight and stale-while-revalidate."""
+
+    @pytest.mark.asyncio
+    async def test_batch_api_reads_only_misses(self):
+        connector = MagicMock()
+        connector.batch.read_objects = AsyncMock(side_effect=[
+            {"a": _contact("a", "Ann"), "b": _contact("b", "Ben")},
+            {"c": _contact("c", "Cat")},
+        ])
+        service = ContactEnrichmentService(connector, cache=ContactCache())
+
+        await service.get_contact_infos(["a", "b"])
+        infos = await service.get_contact_infos(["a", "b", "c", "missing"])
+
+        assert infos["c"].name == "Cat Test"
+        assert infos["missing"].name == "Unknown"
+        second_call = connector.batch.read_objects.call_args_list[1]
+        assert second_call.args[1] == ["c", "missing"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        calls = []
+
+        async def get_contact(contact_id):
+            calls.append(contact_id)
+            await asyncio.sleep(0.01)
+            return _contact(contact_id, "Ann")
+
+        connector = MagicMock()
+        connector.get_contact = get_contact
+        service = ContactEnrichmentService(connector, cache=ContactCache())
+
+        infos = await asyncio.gather(*(service.get_contact_info("a") for _ in range(5)))
+
+        assert calls == ["a"]
+        assert {info.name for info in infos} == {"Ann Test"}
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        connector = MagicMock()
+        connector.get_contact = AsyncMock(side_effect=lambda cid: _contact(cid, cid))
+        cache = ContactCache(max_size=2)
+        service = ContactEnrichmentService(connector, cache=cache)
+
+        await service.get_contact_info("a")
+        await service.get_contact_info("b")
+        await service.get_contact_info("a")  # a is now most recently used
+        await service.get_contact_info("c")
+
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self):
+        connector = MagicMock()
+        connector.get_contact = AsyncMock(side_effect=[_contact("a", "Old"), _contact("a", "New")])
+        cache = ContactCache(ttl=0.0, stale_ttl=60)
+        service = ContactEnrichmentService(connector, cache=cache)
+
+        await service.get_contact_info("a")
+        stale = await service.get_contact_info("a")
+        await asyncio.sleep(0)
+        await asyncio.gather(*cache._tasks)
+
+        assert stale.name == "Old Test"
+        assert cache.stats["stale_hits"] == 1
+        assert cache._entries["a"].value.name == "New Test"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_entry(self):
+        connector = MagicMock()
+        connector.get_contact = AsyncMock(side_effect=[_contact("a", "Jane"), RuntimeError("hubspot 503")])
+        cache = ContactCache(ttl=0.01, stale_ttl=60)
+        service = ContactEnrichmentService(connector, cache=cache)
+
+        await service.get_contact_info("a")
+        await asyncio.sleep(0.02)
+        assert (await service.get_contact_info("a")).name == "Jane Test"
+        await asyncio.gather(*cache._tasks)
+
+        assert (await service.get_contact_info("a")).name == "Jane Test"
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_not_cached_as_unknown(self):
+        connector = MagicMock()
+        connector.batch.read_objects = AsyncMock(side_effect=[
+            RuntimeError("hubspot 503"),
+            {"a": _contact("a", "Ann")},
+        ])
+        service = ContactEnrichmentService(connector, cache=ContactCache())
+
+        failed = await service.get_contact_infos(["a", "b"])
+        infos = await service.get_contact_infos(["a", "b"])
+
+        assert failed["a"].name == "Unknown"
+        assert infos["a"].name == "Ann Test"
+        # Only ids a successful fetch left out are cached as unknown
+        assert infos["b"].name == "Unknown" and "b" in service.cache
+        assert connector.batch.read_objects.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self):
+        connector = MagicMock()
+        connector.get_contact = AsyncMock(return_value=_contact("a", "Ann"))
+        service = ContactEnrichmentService(connector, cache=ContactCache(ttl=0.0, stale_ttl=0.0))
+
+        await service.get_contact_info("a")
+        await service.get_contact_info("a")
+
+        assert connector.get_contact.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shares_entries_across_workers(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        connector = MagicMock()
+        connector.batch.read_objects = AsyncMock(return_value={
+            "a": _contact("a", "Ann"), "b": _contact("b", "Ben"),
+        })
+        worker1 = ContactEnrichmentService(
+            connector, cache=ContactCache(redis_client=fakeredis.FakeAsyncRedis(server=server))
+        )
+        worker2 = ContactEnrichmentService(
+            connector, cache=ContactCache(redis_client=fakeredis.FakeAsyncRedis(server=server))
+        )
+
+        await worker1.get_contact_infos(["a", "b"])
+        infos = await worker2.get_contact_infos(["a", "b"])
+
+        assert infos["a"] == ContactInfo(id="a", name="Ann Test")
+        connector.batch.read_objects.assert_called_once()
+        assert worker2.cache.stats["redis_hits"] == 2
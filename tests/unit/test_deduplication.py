@@ -0,0 +1,110 @@
+"""Tests for the contact deduplication engine."""
+import pytest
+
+from src.deduplication import DeduplicationEngine
+from src.deduplication.blocking import generate_candidate_pairs, qgrams
+from tests.fixtures.dedup_corpus import make_dedup_corpus
+
+
+@pytest.fixture
+def engine():
+    return DeduplicationEngine()
+
+
+def _pair_ids(matches):
+    return {tuple(sorted((m.contact_id_1, m.contact_id_2))) for m in matches}
+
+
+class TestBlocking:
+    """Test candidate pair generation."""
+
+    def test_block_pairs(self):
+        pairs, stats = generate_candidate_pairs([{"a"}, {"b"}, {"a", "b"}, {"c"}])
+
+        assert pairs == [(0, 2), (1, 2)]
+        assert stats.total_pairs == 6
+        assert stats.candidate_pairs == 2
+        assert stats.reduction_ratio == pytest.approx(4 / 6)
+
+    def test_oversized_blocks_are_skipped(self):
+        pairs, stats = generate_candidate_pairs([{"x"}] * 5, max_block_size=4)
+
+        assert pairs == []
+        assert stats.oversized_blocks == 1
+
+    def test_uncapped_blocks_are_kept(self):
+        pairs, stats = generate_candidate_pairs(
+            [{"email:x", "domain:y"}] * 5, max_block_size=4, uncapped_prefixes=("email:",)
+        )
+
+        assert len(pairs) == 10
+        assert stats.oversized_blocks == 1
+
+    def test_sorted_neighbourhood_window(self):
+        keys = [["carl", "anna", "bob", "", "dave"]]
+        pairs, _ = generate_candidate_pairs([set()] * 5, sort_keys=keys, window=2)
+
+        # anna-bob, bob-carl, carl-dave; the empty key is left out
+        assert pairs == [(0, 2), (0, 4), (1, 2)]
+
+    def test_qgrams(self):
+        assert qgrams("jo ann") == {"joa", "oan", "ann"}
+        assert qgrams("al") == {"al"}
+        assert qgrams("") == set()
+
+
+class TestBulkDeduplication:
+    """Test bulk deduplication with and without blocking."""
+
+    def test_normalized_email_duplicates_share_a_block(self, engine):
+        contacts = [
+            {"id": "1", "email": "Jane.Doe+news@gmail.com", "full_name": "Jane Doe"},
+            {"id": "2", "email": "janedoe@gmail.com", "full_name": "Jane Doe"},
+            {"id": "3", "email": "bob@example.com", "full_name": "Bob Stone"},
+        ]
+
+        matches = engine.run_bulk_deduplication(contacts, threshold=50.0)
+
+        assert _pair_ids(matches) == {("1", "2")}
+        assert engine.last_blocking_stats.total_pairs == 3
+
+    def test_exact_rule_blocks_ignore_size_cap(self, engine):
+        contacts = [
+            {"id": str(i), "email": "shared@example.com", "full_name": f"Person {i}"}
+            for i in range(6)
+        ]
+
+        pairs, stats = engine.candidate_pairs(contacts, max_block_size=3)
+
+        assert len(pairs) == 15
+        assert stats.oversized_blocks >= 1  # the email domain block is still capped
+
+    def test_blocking_recall_matches_brute_force(self, engine):
+        contacts = make_dedup_corpus(size=400)
+
+        brute = _pair_ids(engine.run_bulk_deduplication(contacts, use_blocking=False))
+        blocked = _pair_ids(engine.run_bulk_deduplication(contacts))
+        stats = engine.last_blocking_stats
+
+        assert brute
+        recall = len(blocked & brute) / len(brute)
+        assert recall >= 0.99
+        assert blocked <= brute
+        assert stats.reduction_ratio > 0.9
+
+    def test_blocking_preserves_match_order(self, engine):
+        contacts = make_dedup_corpus(size=200)
+
+        brute = engine.run_bulk_deduplication(contacts, use_blocking=False)
+        blocked = engine.run_bulk_deduplication(contacts)
+
+        assert [m.to_dict()["score"] for m in blocked] == [m.to_dict()["score"] for m in brute]
+
+    def test_parallel_scoring_matches_serial(self, engine):
+        contacts = make_dedup_corpus(size=400)
+
+        serial = engine.run_bulk_deduplication(contacts)
+        parallel = engine.run_bulk_deduplication(contacts, workers=2, chunk_size=500)
+
+        assert [(m.contact_id_1, m.contact_id_2, m.score, m.master_record_id) for m in parallel] == \
+            [(m.contact_id_1, m.contact_id_2, m.score, m.master_record_id) for m in serial]
@@ -0,0 +1,202 @@
+"""Tests for Drive document-chunk retrieval."""
+import numpy as np
+import pytest
+
+from src.agents.specialized import AssetHunterAgent
+from src.retrieval import (
+    DocumentRetrievalService,
+    HashingEmbedder,
+    MappedVectorStore,
+    chunk_text,
+)
+
+FREIGHT = "Freight visibility case study: carrier tracking cut detention costs for a national shipper. " * 20
+WAREHOUSE = "Warehouse labor planning proposal with slotting optimization and pick path analysis. " * 20
+PRICING = "Pricing sheet for annual renewal with tiered discounts and volume commitments. " * 20
+
+
+class TestMappedVectorStore:
+    """Vectors persist in a float32 file with an id sidecar."""
+
+    def test_search_and_reopen(self, tmp_path):
+        path = str(tmp_path / "index")
+        store = MappedVectorStore(path, dim=3)
+        store.add([
+            ("a", [1, 0, 0], {"kind": "x"}),
+            ("b", [0, 1, 0], {"kind": "y"}),
+            ("c", [0.9, 0.1, 0], {"kind": "y"}),
+        ])
+
+        reopened = MappedVectorStore(path, dim=3)
+
+        assert isinstance(reopened._matrix, np.memmap)
+        assert [key for key, _, _ in reopened.search([1, 0, 0], k=2)] == ["a", "c"]
+        filtered = reopened.search([1, 0, 0], k=2, where=lambda m: m["kind"] == "y")
+        assert [key for key, _, _ in filtered] == ["c", "b"]
+
+    def test_replace_delete_and_compact(self, tmp_path):
+        path = str(tmp_path / "index")
+        store = MappedVectorStore(path, dim=2)
+        store.add([("a", [1, 0], {"v": 1}), ("b", [0, 1], {"v": 1})])
+        store.add([("a", [0, 1], {"v": 2})])
+        store.delete(["b"])
+
+        assert len(store) == 1 and store.deleted == 2
+        assert store.search([0, 1], k=5) == [("a", pytest.approx(1.0), {"v": 2})]
+
+        store.compact()
+        reopened = MappedVectorStore(path, dim=2)
+        assert reopened.keys == ["a"]
+        assert reopened.search([0, 1], k=5)[0][0] == "a"
+
+    def test_reader_sees_writer_appends(self, tmp_path):
+        path = str(tmp_path / "index")
+        writer = MappedVectorStore(path, dim=2)
+        reader = MappedVectorStore(path, dim=2)
+
+        writer.add([("a", [1, 0], {})])
+
+        assert [key for key, _, _ in reader.search([1, 0])] == ["a"]
+
+    def test_ignores_partial_trailing_write(self, tmp_path):
+        path = str(tmp_path / "index")
+        MappedVectorStore(path, dim=2).add([("a", [1, 0], {})])
+        with open(f"{path}.ids.jsonl", "a") as f:
+            f.write('{"row": 1, "key": "b"')  # crash mid-line, no vector written
+
+        store = MappedVectorStore(path, dim=2)
+
+        assert store.keys == ["a"]
+        store.add([("c", [0, 1], {})])
+        assert MappedVectorStore(path, dim=2).search([0, 1], k=1)[0][0] == "c"
+
+    def test_dimension_change_resets(self, tmp_path):
+        path = str(tmp_path / "index")
+        MappedVectorStore(path, dim=2).add([("a", [1, 0], {})])
+
+        assert len(MappedVectorStore(path, dim=3)) == 0
+
+
+def _service(tmp_path, drive=None):
+    embedder = HashingEmbedder(dim=128)
+    return DocumentRetrievalService(
+        MappedVectorStore(str(tmp_path / "docs"), embedder.dim), embedder, drive_connector=drive
+    )
+
+
+class TestDocumentRetrievalService:
+    """Chunking, incremental indexing and filtered search."""
+
+    def test_chunks_overlap(self):
+        words = [f"w{i}" for i in range(250)]
+        chunks = chunk_text(" ".join(words), chunk_words=100, overlap=20)
+
+        assert [c.split()[0] for c in chunks] == ["w0", "w80", "w160"]
+        assert chunks[-1].split()[-1] == "w249"
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_relevant_file(self, tmp_path):
+        service = _service(tmp_path)
+        await service.index_document("f1", FREIGHT, {"folder": "pesti_sales"})
+        await service.index_document("f2", WAREHOUSE, {"folder": "pesti_sales"})
+        await service.index_document("f3", PRICING, {"folder": "charlie_pesti"})
+
+        hits = await service.search("carrier tracking for shipper", k=1)
+        assert hits[0].drive_file_id == "f1"
+
+        filtered = await service.search_files("carrier tracking", k=5, filters={"folder": "charlie_pesti"})
+        assert [h.drive_file_id for h in filtered] == ["f3"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_is_skipped(self, tmp_path):
+        service = _service(tmp_path)
+
+        assert await service.index_document("f1", FREIGHT, version="v1") > 0
+        assert await service.index_document("f1", FREIGHT, version="v1") == 0
+
+        # A shorter new version replaces every old chunk
+        await service.index_document("f1", "short updated text", version="v2")
+        assert service._chunk_keys("f1") == ["f1:0"]
+        assert service.indexed_version("f1") == "v2"
+
+    @pytest.mark.asyncio
+    async def test_sync_drive_indexes_new_and_modified_files(self, tmp_path):
+        class FakeDrive:
+            FOLDER_CONFIG = {"pesti_sales": {"id": "folder", "include_all": True}}
+
+            def __init__(self):
+                self.files = [
+                    {"id": "f1", "name": "Freight case study", "mimeType": "application/pdf",
+                     "modifiedTime": "2026-01-01"},
+                    {"id": "f2", "name": "Deck", "mimeType": "application/pdf", "modifiedTime": "2026-01-01"},
+                ]
+                self.downloads = []
+
+            async def list_folder_files(self, folder_id):
+                return self.files
+
+            def is_allowed(self, file, config):
+                return True
+
+            def get_asset_type(self, mime_type):
+                return "pdf"
+
+            async def get_file_content(self, file_id, mime_type=None):
+                self.downloads.append(file_id)
+                return FREIGHT if file_id == "f1" else "[Binary Content - Skipped]"
+
+        drive = FakeDrive()
+        service = _service(tmp_path, drive)
+
+        assert await service.sync_drive() == {"indexed": 1, "unchanged": 0, "failed": 1}
+        drive.downloads.clear()
+        drive.files[1]["modifiedTime"] = "2026-02-01"
+        stats = await service.sync_drive()
+
+        assert stats["unchanged"] == 1
+        assert drive.downloads == ["f2"]
+        hit = (await service.search("carrier tracking", k=1))[0]
+        assert hit.metadata["name"] == "Freight case study"
+        assert hit.metadata["folder"] == "pesti_sales"
+
+
+class TestAssetHunterRetrieval:
+    """AssetHunterAgent ranks assets by content when an index exists."""
+
+    @pytest.mark.asyncio
+    async def test_uses_retrieved_assets(self, tmp_path):
+        service = _service(tmp_path)
+        await service.index_document(
+            "f1", FREIGHT, {"folder": "pesti_sales", "name": "CP Proposals/Freight.pdf", "link": "https://x"}
+        )
+        await service.index_document(
+            "f2", WAREHOUSE, {"folder": "pesti_sales", "name": "CP Closed/Warehouse.pdf"}
+        )
+
+        result = await AssetHunterAgent(retriever=service).hunt_assets("shipper carrier tracking")
+
+        assert [a["id"] for a in result["assets"]] == ["f1"]
+        assert result["assets"][0]["webViewLink"] == "https://x"
+
+    @pytest.mark.asyncio
+    async def test_weak_hits_fall_back_to_drive_search(self, tmp_path):
+        class FakeDrive:
+            async def search_assets(self, query, company_name=None, max_results=10):
+                return [
+                    {"id": "f1", "name": "CP Proposals/Freight.pdf", "folder": "pesti_sales"},
+                    {"id": "d2", "name": "CP Proposals/Acme.pdf", "folder": "pesti_sales"},
+                ]
+
+        service = _service(tmp_path)
+        await service.index_document("f1", FREIGHT, {"folder": "pesti_sales", "name": "CP Proposals/Freight.pdf"})
+        await service.index_document("f2", WAREHOUSE, {"folder": "pesti_sales", "name": "CP Proposals/Warehouse.pdf"})
+        agent = AssetHunterAgent(drive_connector=FakeDrive(), retriever=service)
+
+        unrelated = await agent.hunt_assets("Acme Logistics", max_results=2)
+        merged = await agent.hunt_assets("shipper carrier tracking", max_results=2)
+
+        # No retrieved chunk clears the threshold, so Drive search answers
+        assert [a["id"] for a in unrelated["assets"]] == ["f1", "d2"]
+        # A strong hit is kept and Drive fills the rest without duplicating it
+        assert [a["id"] for a in merged["assets"]] == ["f1", "d2"]
+        assert merged["assets"][0]["relevance"] > AssetHunterAgent.MIN_RELEVANCE
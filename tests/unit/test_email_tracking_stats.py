@@ -0,0 +1,170 @@
+"""Tests for EmailTrackingService's pre-aggregated statistics."""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.email_tracking import BounceType, EmailStatus, EmailTrackingService
+from src.email_tracking.unique_counter import UniqueCounter
+
+
+def _full_scan_stats(emails):
+    """The per-request full scan the aggregates replace."""
+    total = len(emails)
+    delivered = len([e for e in emails if e.status not in [EmailStatus.QUEUED, EmailStatus.BOUNCED]])
+    opened = len([e for e in emails if e.open_count > 0])
+    return {
+        "total_sent": total,
+        "delivered": delivered,
+        "opened": opened,
+        "clicked": len([e for e in emails if e.click_count > 0]),
+        "replied": len([e for e in emails if e.replied_at]),
+        "bounced": len([e for e in emails if e.status == EmailStatus.BOUNCED]),
+        "total_opens": sum(e.open_count for e in emails),
+        "total_clicks": sum(e.click_count for e in emails),
+    }
+
+
+def _full_scan_links(emails):
+    links = {}
+    for email in emails:
+        for click in email.clicks:
+            stats = links.setdefault(click.url, {"clicks": 0, "clickers": set()})
+            stats["clicks"] += 1
+            if email.contact_id:
+                stats["clickers"].add(email.contact_id)
+    return {url: (s["clicks"], len(s["clickers"])) for url, s in links.items()}
+
+
+def _full_scan_devices(emails):
+    devices = {}
+    for email in emails:
+        for open_event in email.opens:
+            device = open_event.device_type or "unknown"
+            devices[device] = devices.get(device, 0) + 1
+    return devices
+
+
+async def _populate(service, n=300, seed=7):
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    emails = []
+    for i in range(n):
+        email = await service.create_tracking(
+            message_id=f"m{i}",
+            subject="Hi",
+            recipient_email=f"r{i}@example.com",
+            contact_id=rng.choice([None, *(f"c{j}" for j in range(40))]),
+            sequence_id=rng.choice([None, "s1", "s2"]),
+            campaign_id=rng.choice([None, "camp1", "camp2"]),
+            user_id=rng.choice(["u1", "u2"]),
+        )
+        email.created_at = now - timedelta(days=rng.randint(0, 40), hours=rng.randint(0, 23))
+        emails.append(email)
+    service.rebuild_stats()
+
+    agents = [None, "Mozilla/5.0 (iPhone)", "Mozilla/5.0 (Windows NT 10.0)", "iPad"]
+    for email in emails:
+        if rng.random() < 0.8:
+            await service.mark_sent(email.id)
+        if rng.random() < 0.6:
+            await service.mark_delivered(email.id)
+        for _ in range(rng.randint(0, 3)):
+            await service.record_open(email.open_tracking_id, user_agent=rng.choice(agents))
+        for _ in range(rng.randint(0, 2)):
+            url = rng.choice(["https://a.example", "https://b.example", "https://c.example"])
+            await service.record_click(email.click_tracking_id, url)
+        if rng.random() < 0.2:
+            await service.record_reply(email.id, is_auto_reply=rng.random() < 0.3)
+        if rng.random() < 0.1:
+            await service.record_bounce(email.id, BounceType.HARD)
+        if rng.random() < 0.05:
+            await service.record_unsubscribe(email.id)
+    return emails
+
+
+class TestAggregatesReconcile:
+    """Aggregated stats equal a full recompute over every EmailTrack."""
+
+    @pytest.mark.asyncio
+    async def test_email_stats(self):
+        service = EmailTrackingService()
+        emails = await _populate(service)
+        now = datetime.utcnow()
+        cases = [
+            {},
+            {"user_id": "u1"},
+            {"campaign_id": "camp2", "sequence_id": "s1"},
+            {"from_date": now - timedelta(days=10, hours=5)},
+            {"user_id": "u2", "from_date": now - timedelta(days=30, hours=3), "to_date": now - timedelta(days=2, hours=7)},
+            {"from_date": now - timedelta(days=5, hours=1), "to_date": now - timedelta(days=5)},
+        ]
+
+        for filters in cases:
+            expected, _ = await service.list_tracking(**filters, limit=100000)
+            stats = await service.get_email_stats(**filters)
+            assert {k: stats[k] for k in _full_scan_stats(expected)} == _full_scan_stats(expected), filters
+
+    @pytest.mark.asyncio
+    async def test_daily_stats(self):
+        service = EmailTrackingService()
+        await _populate(service)
+
+        for user_id in (None, "u1"):
+            daily = await service.get_daily_stats(days=30, user_id=user_id)
+            from_date = datetime.utcnow() - timedelta(days=30)
+            emails, _ = await service.list_tracking(user_id=user_id, from_date=from_date, limit=100000)
+            for row in daily:
+                day = [e for e in emails if e.created_at.strftime("%Y-%m-%d") == row["date"]]
+                assert row["sent"] == len(day)
+                assert row["opened"] == len([e for e in day if e.open_count > 0])
+                assert row["clicked"] == len([e for e in day if e.click_count > 0])
+                assert row["replied"] == len([e for e in day if e.replied_at])
+
+    @pytest.mark.asyncio
+    async def test_links_and_devices(self):
+        service = EmailTrackingService()
+        await _populate(service)
+
+        for campaign_id, sequence_id in [(None, None), ("camp1", None), ("camp2", "s2")]:
+            emails, _ = await service.list_tracking(
+                campaign_id=campaign_id, sequence_id=sequence_id, limit=100000
+            )
+            links = await service.get_link_performance(campaign_id=campaign_id, sequence_id=sequence_id)
+            assert {l["url"]: (l["clicks"], l["unique_clickers"]) for l in links} == _full_scan_links(emails)
+            assert [l["clicks"] for l in links] == sorted((l["clicks"] for l in links), reverse=True)
+
+        for campaign_id in (None, "camp1"):
+            emails, _ = await service.list_tracking(campaign_id=campaign_id, limit=100000)
+            assert await service.get_device_breakdown(campaign_id) == _full_scan_devices(emails)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental(self):
+        service = EmailTrackingService()
+        await _populate(service)
+        before = await service.get_email_stats(user_id="u2")
+
+        service.rebuild_stats()
+
+        assert await service.get_email_stats(user_id="u2") == before
+
+
+class TestUniqueCounter:
+    """Exact distinct counts, then a HyperLogLog estimate."""
+
+    def test_exact_below_limit_and_merge(self):
+        a = UniqueCounter(f"c{i}" for i in range(100))
+        b = UniqueCounter(f"c{i}" for i in range(50, 200))
+
+        a.update(b)
+
+        assert a.is_exact and len(a) == 200
+
+    def test_sketch_estimate_and_merge(self):
+        a = UniqueCounter((f"c{i}" for i in range(30_000)), exact_limit=1000)
+        b = UniqueCounter((f"c{i}" for i in range(20_000, 50_000)), exact_limit=1000)
+
+        assert not a.is_exact
+        assert abs(len(a) - 30_000) / 30_000 < 0.05
+        a.update(b)
+        assert abs(len(a) - 50_000) / 50_000 < 0.05
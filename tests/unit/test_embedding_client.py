@@ -0,0 +1,142 @@
+"""Tests for the batching, caching embedding client."""
+import asyncio
+import json
+
+import fakeredis.aioredis
+import pytest
+
+from src.services.embedding_client import EmbeddingClient, normalize_text
+
+
+class RejectedInput(Exception):
+    status_code = 400
+
+
+class FakeAPI:
+    """Embeds each text as [len(text), batch number]."""
+
+    def __init__(self, fail: bool = False, reject: str = None):
+        self.calls = []
+        self.fail = fail
+        self.reject = reject
+
+    async def __call__(self, texts):
+        self.calls.append(list(texts))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ConnectionError("provider unavailable")
+        if self.reject in texts:
+            raise RejectedInput(f"invalid input: {self.reject}")
+        return [[float(len(t)), float(len(self.calls))] for t in texts]
+
+
+class TestEmbeddingClient:
+    """Micro-batching, caching and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        api = FakeAPI()
+        client = EmbeddingClient(api, max_wait=0.01)
+
+        vectors = await asyncio.gather(*(client.embed(f"message {i}") for i in range(5)))
+
+        assert len(api.calls) == 1
+        assert sorted(api.calls[0]) == [f"message {i}" for i in range(5)]
+        assert vectors[0] == [9.0, 1.0]
+        assert client.metrics()["max_batch"] == 5
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_is_cached(self):
+        api = FakeAPI()
+        client = EmbeddingClient(api, max_wait=0)
+
+        first = await client.embed("What deals  closed\nthis week?")
+        again = await client.embed("What deals closed this week?")
+        both = await asyncio.gather(client.embed("new query"), client.embed("new query"))
+
+        assert first == again
+        assert both[0] == both[1]
+        assert len(api.calls) == 2
+        metrics = client.metrics()
+        assert metrics["requests"] == 4 and metrics["misses"] == 2
+        assert metrics["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_batches_split_at_size_limit(self):
+        api = FakeAPI()
+        client = EmbeddingClient(api, max_batch_size=3, max_wait=0.01)
+
+        await client.embed_many([f"text {i}" for i in range(7)])
+
+        assert [len(call) for call in api.calls] == [3, 3, 1]
+        assert client.metrics()["avg_batch"] == pytest.approx(7 / 3, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_returns_none_and_is_not_cached(self):
+        api = FakeAPI(fail=True)
+        client = EmbeddingClient(api, max_wait=0)
+
+        assert await client.embed("hello") is None
+        api.fail = False
+        assert await client.embed("hello") == [5.0, 2.0]
+        assert client.stats["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_input_fails_only_itself(self):
+        api = FakeAPI(reject="bad")
+        client = EmbeddingClient(api, max_wait=0)
+
+        vectors = await client.embed_many(["a", "bb", "bad", "cccc", "ddddd"])
+
+        assert vectors[2] is None
+        assert [v[0] for i, v in enumerate(vectors) if i != 2] == [1.0, 2.0, 4.0, 5.0]
+        assert client._lookup(client.key("bad")) is None
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_not_split(self):
+        api = FakeAPI(fail=True)
+        client = EmbeddingClient(api, max_wait=0)
+
+        assert await client.embed_many(["a", "b", "c"]) == [None, None, None]
+        assert len(api.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_text_skips_the_api(self):
+        api = FakeAPI()
+        client = EmbeddingClient(api, max_wait=0)
+
+        vectors = await client.embed_many(["", "  \n", "hello"])
+
+        assert vectors[:2] == [None, None]
+        assert api.calls == [["hello"]]
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        client = EmbeddingClient(FakeAPI(), max_size=2, max_wait=0)
+
+        await client.embed_many(["a", "b"])
+        await client.embed("a")  # touch a so b is evicted
+        await client.embed("c")
+
+        assert client._lookup(client.key("a")) is not None
+        assert client._lookup(client.key("b")) is None
+        assert client.stats["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shared_between_clients(self):
+        redis = fakeredis.aioredis.FakeRedis()
+        api = FakeAPI()
+        writer = EmbeddingClient(api, redis_client=redis, max_wait=0)
+        reader = EmbeddingClient(api, redis_client=redis, max_wait=0)
+
+        vector = await writer.embed("shared text")
+
+        assert await reader.embed("shared text") == vector
+        assert len(api.calls) == 1
+        assert reader.stats["redis_hits"] == 1
+        stored = await redis.get("embedding:" + writer.key("shared text"))
+        assert json.loads(stored) == vector
+
+    def test_normalize_text_truncates(self):
+        assert normalize_text("  a \n\t b ") == "a b"
+        assert len(normalize_text("x" * 10_000)) == 8000
@@ -0,0 +1,186 @@
+"""Tests for the vector store behind MemoryService.search_similar."""
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+import src.services.memory_service as memory_module
+from src.services.embedding_store import EmbeddingStore, top_k
+from src.services.memory_service import MemoryService
+
+
+def _vectors(n: int, dim: int = 32, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+
+
+def _exact(vectors: np.ndarray, query: np.ndarray, k: int) -> list:
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = normalized @ (query / np.linalg.norm(query))
+    return [str(i) for i in np.argsort(-scores)[:k]]
+
+
+class TestEmbeddingStore:
+    """Exact and IVF top-k over per-session matrices."""
+
+    def test_top_k_orders_highest_first(self):
+        scores = np.array([0.1, 0.9, 0.5, 0.7])
+
+        assert list(top_k(scores, 2)) == [1, 3]
+        assert list(top_k(scores, 10)) == [1, 3, 2, 0]
+
+    def test_exact_search_matches_brute_force(self):
+        vectors = _vectors(500)
+        store = EmbeddingStore(ann_min_vectors=None)
+        store.add("s", [(str(i), v.tolist()) for i, v in enumerate(vectors)])
+        query = _vectors(1, seed=1)[0]
+
+        hits = store.search("s", query.tolist(), limit=5)
+
+        assert [memory_id for memory_id, _ in hits] == _exact(vectors, query, 5)
+        assert hits[0][1] >= hits[-1][1]
+
+    def test_threshold_filters_results(self):
+        store = EmbeddingStore()
+        store.add("s", [("same", [1.0, 0.0]), ("orthogonal", [0.0, 1.0]), ("close", [0.9, 0.1])])
+
+        hits = store.search("s", [1.0, 0.0], limit=5, threshold=0.7)
+
+        assert [memory_id for memory_id, _ in hits] == ["same", "close"]
+        assert hits[0][1] == pytest.approx(1.0)
+
+    def test_ivf_index_recall(self):
+        # Clustered data, as real conversation embeddings are
+        rng = np.random.default_rng(2)
+        centers = rng.normal(size=(40, 32))
+        vectors = (centers[rng.integers(0, 40, 4000)] + 0.3 * rng.normal(size=(4000, 32))).astype(np.float32)
+        store = EmbeddingStore(ann_min_vectors=1000, nprobe=8)
+        store.add("s", [(str(i), v.tolist()) for i, v in enumerate(vectors)])
+
+        recalled = 0
+        for q in range(20):
+            query = (centers[q] + 0.3 * rng.normal(size=32)).astype(np.float32)
+            expected = set(_exact(vectors, query, 10))
+            hits = store.search("s", query.tolist(), limit=10)
+            recalled += len(expected & {memory_id for memory_id, _ in hits})
+
+        assert store.get("s").index is not None
+        assert recalled / 200 >= 0.9
+
+    def test_rows_added_after_index_build_are_searched(self):
+        vectors = _vectors(1200)
+        store = EmbeddingStore(ann_min_vectors=1000, nprobe=1)
+        store.add("s", [(str(i), v.tolist()) for i, v in enumerate(vectors)])
+        store.search("s", vectors[0].tolist())
+
+        store.add("s", [("new", [1.0] * 32)])
+        hits = store.search("s", [1.0] * 32, limit=1)
+
+        assert hits[0][0] == "new"
+
+    def test_remove_and_duplicates(self):
+        store = EmbeddingStore()
+        store.add("s", [("a", [1.0, 0.0]), ("b", [0.0, 1.0])])
+        store.add("s", [("a", [0.0, 1.0]), ("bad", [1.0, 0.0, 0.0])])
+
+        assert len(store.get("s")) == 2
+        store.remove("s", ["a"])
+        assert [m for m, _ in store.search("s", [1.0, 0.0], limit=5)] == ["b"]
+
+    def test_sessions_bounded_lru(self):
+        store = EmbeddingStore(max_sessions=2)
+        for session in ("a", "b"):
+            store.add(session, [("m", [1.0, 0.0])])
+        store.get("a")
+        store.add("c", [("m", [1.0, 0.0])])
+
+        assert "a" in store and "c" in store
+        assert "b" not in store
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return list(self._rows)
+
+    def scalars(self):
+        return self
+
+    def scalar(self):
+        return len(self._rows)
+
+
+class FakeDB:
+    """Applies only the created_at lower bound; MemoryService filters by id itself."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    async def execute(self, query):
+        self.queries.append(str(query))
+        since = [v for v in query.compile().params.values() if isinstance(v, datetime)]
+        return FakeResult([row for row in self.rows if not since or row.created_at >= since[0]])
+
+
+class TestSearchSimilar:
+    """MemoryService.search_similar reads vectors through the store."""
+
+    @pytest.fixture(autouse=True)
+    def no_llm(self, monkeypatch):
+        monkeypatch.setattr(memory_module, "get_llm", lambda: None)
+
+    def _memory(self, embedding, created_at):
+        return SimpleNamespace(id=uuid.uuid4(), embedding=embedding, created_at=created_at)
+
+    @pytest.mark.asyncio
+    async def test_returns_ranked_messages_and_syncs_new_rows(self):
+        now = datetime.utcnow()
+        near = self._memory([1.0, 0.0], now)
+        far = self._memory([0.0, 1.0], now)
+        db = FakeDB([near, far])
+        service = MemoryService(db, embedding_store=EmbeddingStore())
+        service._generate_embedding = AsyncMock(return_value=[1.0, 0.1])
+        session_id = str(uuid.uuid4())
+
+        assert await service.search_similar(session_id, "q", threshold=0.5) == [near]
+
+        newer = self._memory([1.0, 0.05], now + timedelta(seconds=1))
+        db.rows.append(newer)
+        assert await service.search_similar(session_id, "q", threshold=0.5) == [newer, near]
+        # Incremental sync only asks for rows near or after the last one seen
+        assert "created_at >=" in db.queries[-3]
+        assert "count(" in db.queries[-2]
+
+    @pytest.mark.asyncio
+    async def test_rows_deleted_elsewhere_are_dropped(self):
+        now = datetime.utcnow()
+        gone = self._memory([1.0, 0.0], now)
+        kept = self._memory([0.9, 0.2], now)
+        store = EmbeddingStore()
+        session_id = str(uuid.uuid4())
+        store.add(session_id, [(str(gone.id), gone.embedding), (str(kept.id), kept.embedding)], loaded_until=now)
+        service = MemoryService(FakeDB([kept]), embedding_store=store)
+        service._generate_embedding = AsyncMock(return_value=[1.0, 0.0])
+
+        assert await service.search_similar(session_id, "q", limit=1, threshold=0.5) == [kept]
+        assert str(gone.id) not in store.get(session_id).positions
+
+    @pytest.mark.asyncio
+    async def test_row_committed_late_with_earlier_timestamp_is_loaded(self):
+        now = datetime.utcnow()
+        seen = self._memory([0.0, 1.0], now)
+        db = FakeDB([seen])
+        service = MemoryService(db, embedding_store=EmbeddingStore())
+        service._generate_embedding = AsyncMock(return_value=[1.0, 0.0])
+        session_id = str(uuid.uuid4())
+        assert await service.search_similar(session_id, "q", threshold=0.5) == []
+
+        # created_at was set before the first sync but the row committed after it
+        late = self._memory([1.0, 0.0], now - timedelta(minutes=5))
+        db.rows.append(late)
+        assert await service.search_similar(session_id, "q", threshold=0.5) == [late]
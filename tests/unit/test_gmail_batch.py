@@ -0,0 +1,165 @@
+"""Tests for Gmail batch thread and message fetches."""
+import json
+import re
+from datetime import datetime
+from urllib.parse import parse_qs, urlparse
+
+import httplib2
+import pytest
+from googleapiclient.discovery import build
+
+from src.connectors import gmail
+from src.connectors.gmail import GmailConnector
+
+
+class FakeGmailBatch:
+    """Fake Gmail batch endpoint that answers each multipart sub-request."""
+
+    def __init__(self, fail_once=(), missing=()):
+        self.fail_once = set(fail_once)
+        self.missing = set(missing)
+        self.batches = []
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        if isinstance(body, bytes):
+            body = body.decode()
+        parts = re.findall(r"Content-ID: <(.*?)>\s*\r?\n\s*\r?\n(?:GET|POST) (\S+)", body)
+        self.batches.append([urlparse(path) for _, path in parts])
+
+        out = []
+        for content_id, path in parts:
+            status, payload = self._respond(urlparse(path))
+            out.append(
+                "--batch_fake\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} X\r\n"
+                "Content-Type: application/json\r\n\r\n"
+                f"{json.dumps(payload)}\r\n"
+            )
+        content = "".join(out) + "--batch_fake--"
+        return httplib2.Response({
+            "status": "200",
+            "content-type": 'multipart/mixed; boundary="batch_fake"',
+        }), content.encode()
+
+    def _respond(self, url):
+        resource, item_id = url.path.rsplit("/", 2)[-2:]
+        if item_id in self.missing:
+            return 404, {"error": {"code": 404, "message": "Not Found"}}
+        if item_id in self.fail_once:
+            self.fail_once.discard(item_id)
+            return 503, {"error": {"code": 503, "message": "Backend Error"}}
+
+        query = parse_qs(url.query)
+        message = {"id": f"{item_id}-m1", "snippet": "Sounds good", "labelIds": ["INBOX"]}
+        if query["format"] == ["metadata"]:
+            message["payload"] = {"headers": [
+                {"name": name, "value": f"{name} of {item_id}"}
+                for name in query.get("metadataHeaders", [])
+            ]}
+        else:
+            message["payload"] = {"headers": [], "body": {"data": "SGVsbG8="}}
+        if resource == "messages":
+            return 200, {**message, "id": item_id}
+        return 200, {"id": item_id, "messages": [message]}
+
+
+def _connector(http) -> GmailConnector:
+    connector = GmailConnector()
+    connector.service = build("gmail", "v1", http=http, static_discovery=True)
+    return connector
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(gmail, "BATCH_INITIAL_BACKOFF", 0)
+
+
+class TestGmailBatch:
+    """Test batched thread/message fetches."""
+
+    @pytest.mark.asyncio
+    async def test_threads_fetched_in_batches_of_100(self):
+        http = FakeGmailBatch()
+        ids = [f"t{i}" for i in range(150)]
+
+        threads = await _connector(http).get_threads_batch(ids)
+
+        assert sorted(len(batch) for batch in http.batches) == [50, 100]
+        assert list(threads) == ids
+        assert threads["t7"]["messages"][0]["payload"]["body"]["data"] == "SGVsbG8="
+
+    @pytest.mark.asyncio
+    async def test_metadata_format_requests_only_whitelisted_headers(self):
+        http = FakeGmailBatch()
+
+        messages = await _connector(http).get_messages_batch(
+            ["m1", "m2"], format="metadata", metadata_headers=["From", "Subject"]
+        )
+
+        query = parse_qs(http.batches[0][0].query)
+        assert query["format"] == ["metadata"]
+        assert query["metadataHeaders"] == ["From", "Subject"]
+        assert [h["name"] for h in messages["m1"]["payload"]["headers"]] == ["From", "Subject"]
+        assert "body" not in messages["m1"]["payload"]
+
+    @pytest.mark.asyncio
+    async def test_retries_only_failed_items(self):
+        http = FakeGmailBatch(fail_once={"t2"}, missing={"t3"})
+
+        threads = await _connector(http).get_threads_batch(["t1", "t2", "t3"])
+
+        assert list(threads) == ["t1", "t2"]
+        assert [[u.path.rsplit("/", 1)[-1] for u in b] for b in http.batches] == [
+            ["t1", "t2", "t3"],
+            ["t2"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        class AlwaysFailing(FakeGmailBatch):
+            def _respond(self, url):
+                return 429, {"error": {"code": 429, "message": "Rate Limit"}}
+
+        http = AlwaysFailing()
+
+        threads = await _connector(http).get_threads_batch(["t1"], max_retries=2)
+
+        assert threads == {}
+        assert len(http.batches) == 3
+
+    @pytest.mark.asyncio
+    async def test_threads_with_replies_use_metadata(self):
+        class Replies(FakeGmailBatch):
+            def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+                if "/threads?" in uri:
+                    return httplib2.Response({"status": "200"}), json.dumps(
+                        {"threads": [{"id": "t1"}]}
+                    ).encode()
+                return super().request(uri, method, body, headers, **kwargs)
+
+            def _respond(self, url):
+                headers = [
+                    {"name": "From", "value": "Jane Doe <jane@acme.com>"},
+                    {"name": "Subject", "value": "Re: Pilot"},
+                    {"name": "Date", "value": "Tue, 14 Jan 2025 10:00:00 +0000"},
+                ]
+                messages = [
+                    {"id": "m1", "labelIds": ["SENT"], "payload": {"headers": headers}},
+                    {"id": "m2", "labelIds": ["INBOX"], "snippet": "Let's talk",
+                     "payload": {"headers": headers}},
+                ]
+                return 200, {"id": "t1", "messages": messages}
+
+        http = Replies()
+
+        threads = await _connector(http).get_threads_with_replies(since=datetime(2025, 1, 1))
+
+        assert parse_qs(http.batches[0][0].query)["format"] == ["metadata"]
+        reply = threads[0]["latest_reply"]
+        assert threads[0]["subject"] == "Re: Pilot"
+        assert reply["id"] == "m2"
+        assert reply["from_email"] == "jane@acme.com"
+        assert reply["sender_name"] == "Jane Doe"
+        assert reply["is_from_us"] is False
@@ -0,0 +1,158 @@
+"""Tests that Google API connector calls do not block the event loop."""
+import asyncio
+import json
+import threading
+import time
+
+import httplib2
+import pytest
+from googleapiclient.discovery import build
+
+from src.connectors.calendar_connector import CalendarConnector
+from src.connectors.drive import DriveConnector
+from src.connectors.gmail import GmailConnector
+from src.connectors.google_executor import bind_thread_http
+
+
+class SlowGoogleHttp:
+    """Fake Google endpoint that answers every request after a blocking delay."""
+
+    def __init__(self, body: dict, delay: float = 0.3):
+        self.body = body
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return httplib2.Response({"status": "200"}), json.dumps(self.body).encode()
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+async def _max_loop_stall(stop: asyncio.Event, tick: float = 0.01) -> float:
+    """Largest gap between event loop ticks until ``stop`` is set."""
+    loop = asyncio.get_running_loop()
+    worst = 0.0
+    last = loop.time()
+    while not stop.is_set():
+        await asyncio.sleep(tick)
+        now = loop.time()
+        worst = max(worst, now - last - tick)
+        last = now
+    return worst
+
+
+async def _run_while_probing(coro):
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_max_loop_stall(stop))
+    try:
+        result = await coro
+    finally:
+        stop.set()
+    return result, await probe
+
+
+def _gmail(http: SlowGoogleHttp) -> GmailConnector:
+    connector = GmailConnector()
+    connector.service = build("gmail", "v1", http=http, static_discovery=True)
+    return connector
+
+
+class TestNonBlockingCalls:
+    """Slow Google round-trips must not stall other coroutines."""
+
+    @pytest.mark.asyncio
+    async def test_gmail_search_keeps_loop_responsive(self):
+        http = SlowGoogleHttp({"threads": [{"id": "t1"}]})
+        connector = _gmail(http)
+
+        threads, stall = await _run_while_probing(connector.search_threads("from:jane@acme.com"))
+
+        assert threads == [{"id": "t1"}]
+        assert stall < 0.1
+
+    @pytest.mark.asyncio
+    async def test_gmail_calls_run_concurrently(self):
+        http = SlowGoogleHttp({"id": "draft-1", "messages": []}, delay=0.2)
+        connector = _gmail(http)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        results = await asyncio.gather(
+            connector.get_thread("t1"),
+            connector.get_messages("is:unread"),
+            connector.create_draft("jane@acme.com", "Hi", "Hello"),
+            connector.search_threads("from:jane@acme.com"),
+        )
+        elapsed = loop.time() - start
+
+        assert results[2] == "draft-1"
+        assert http.max_in_flight > 1
+        assert elapsed < 0.6
+
+    @pytest.mark.asyncio
+    async def test_calendar_freebusy_keeps_loop_responsive(self):
+        http = SlowGoogleHttp({"calendars": {"primary": {"busy": []}}})
+        connector = CalendarConnector()
+        connector.service = build("calendar", "v3", http=http, static_discovery=True)
+
+        result, stall = await _run_while_probing(connector.get_freebusy())
+
+        assert result["calendars"]["primary"]["busy"] == []
+        assert stall < 0.1
+
+    @pytest.mark.asyncio
+    async def test_drive_folder_search_keeps_loop_responsive(self):
+        http = SlowGoogleHttp({"files": [{
+            "id": "f1", "name": "CP Proposals - Acme", "mimeType": "application/pdf",
+        }]})
+        connector = DriveConnector()
+        connector.service = build("drive", "v3", http=http, static_discovery=True)
+        config = DriveConnector.FOLDER_CONFIG["pesti_sales"]
+
+        results, stall = await _run_while_probing(
+            connector._search_folder("folder-1", "Acme", config, 5)
+        )
+
+        assert [r["id"] for r in results] == ["f1"]
+        assert stall < 0.1
+
+
+class TestThreadHttp:
+    """Requests are re-bound to a per-thread HTTP connection."""
+
+    def test_bind_thread_http_ignores_requests_without_credentials(self):
+        http = SlowGoogleHttp({})
+        request = build("gmail", "v1", http=http, static_discovery=True).users().getProfile(userId="me")
+
+        assert bind_thread_http(request).http is http
+
+    def test_each_thread_gets_its_own_connection(self):
+        class Credentialed(SlowGoogleHttp):
+            credentials = object()
+
+        shared = Credentialed({})
+        service = build("gmail", "v1", http=shared, static_discovery=True)
+        bound = []
+
+        def bind():
+            request = service.users().getProfile(userId="me")
+            bound.append(bind_thread_http(request).http)
+            bound.append(bind_thread_http(service.users().getProfile(userId="me")).http)
+
+        threads = [threading.Thread(target=bind) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert bound[0] is bound[1] and bound[2] is bound[3]
+        assert bound[0] is not bound[2]
+        assert all(h is not shared and h.credentials is shared.credentials for h in bound)
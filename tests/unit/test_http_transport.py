@@ -0,0 +1,214 @@
+"""Tests for the shared pooled HTTP transport."""
+import asyncio
+
+import httpx
+import pytest
+
+from src.connectors import http_transport
+from src.connectors.http_transport import (
+    HTTPPoolConfig,
+    PooledHTTPTransport,
+    close_shared_transports,
+    get_shared_transport,
+)
+from src.connectors.hubspot import HubSpotBatchOperations, HubSpotConnector
+from src.integrations.hubspot.client import HubSpotClient
+
+
+def _mock_transport(seen: list) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path.endswith("/pipelines/deals/default/stages"):
+            return httpx.Response(200, json={"results": [{"id": "s1", "label": "Qualified"}]})
+        return httpx.Response(200, json={"id": "123", "properties": {"email": "a@b.com"}})
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture
+def reset_shared_transports(monkeypatch):
+    monkeypatch.setattr(http_transport, "_shared_transports", {})
+
+
+async def _serve_keepalive(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Minimal HTTP/1.1 server that keeps connections open."""
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            if not head:
+                break
+            body = b'{"ok": true}'
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+class TestPooledHTTPTransport:
+    """Test the pooled transport itself."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_across_sessions(self):
+        transport = PooledHTTPTransport("test", transport=_mock_transport([]))
+
+        async with transport.session(timeout=10) as first:
+            await first.get("https://example.com/a")
+        async with transport.session(timeout=60) as second:
+            await second.get("https://example.com/b")
+
+        assert transport.is_open
+        assert transport.client is transport.client
+        assert transport.stats.requests == 2
+        await transport.aclose()
+        assert not transport.is_open
+
+    def test_new_event_loop_closes_previous_client(self):
+        transport = PooledHTTPTransport("test", transport=_mock_transport([]))
+
+        async def request():
+            async with transport.session() as client:
+                await client.get("https://example.com/a")
+            return transport.client
+
+        first = asyncio.run(request())
+
+        async def request_and_settle():
+            client = await request()
+            await asyncio.sleep(0)  # let the old client finish closing
+            return client
+
+        second = asyncio.run(request_and_settle())
+
+        assert first.is_closed
+        assert second is not first and not second.is_closed
+        assert not transport._closing
+
+    @pytest.mark.asyncio
+    async def test_session_applies_per_call_timeout(self):
+        seen = []
+        transport = PooledHTTPTransport(
+            "test",
+            config=HTTPPoolConfig(timeout=30.0, connect_timeout=5.0),
+            transport=_mock_transport(seen),
+        )
+
+        async with transport.session(timeout=60) as client:
+            await client.get("https://example.com/slow")
+        async with transport.session() as client:
+            await client.get("https://example.com/default")
+
+        assert seen[0].extensions["timeout"]["read"] == 60
+        assert seen[0].extensions["timeout"]["connect"] == 5.0
+        assert seen[1].extensions["timeout"]["read"] == 30.0
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_tracks_connection_reuse(self):
+        server = await asyncio.start_server(_serve_keepalive, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        transport = PooledHTTPTransport("test", config=HTTPPoolConfig(http2=False))
+        try:
+            async with transport.session(timeout=5) as client:
+                for _ in range(3):
+                    response = await client.get(f"http://127.0.0.1:{port}/ping")
+                    assert response.json() == {"ok": True}
+        finally:
+            await transport.aclose()
+            server.close()
+            await server.wait_closed()
+
+        stats = transport.stats.to_dict()
+        assert stats["requests"] == 3
+        assert stats["new_connections"] == 1
+        assert stats["reused_connections"] == 2
+        assert stats["reuse_rate"] == pytest.approx(2 / 3, abs=1e-4)
+
+    def test_config_from_env(self, monkeypatch):
+        monkeypatch.setenv("HUBSPOT_HTTP_MAX_CONNECTIONS", "7")
+        monkeypatch.setenv("HUBSPOT_HTTP_KEEPALIVE_EXPIRY", "12.5")
+        monkeypatch.setenv("HUBSPOT_HTTP_HTTP2", "false")
+        monkeypatch.setenv("HUBSPOT_HTTP_TIMEOUT", "not-a-number")
+
+        config = HTTPPoolConfig.from_env("HUBSPOT_HTTP")
+
+        assert config.max_connections == 7
+        assert config.keepalive_expiry == 12.5
+        assert config.http2 is False
+        assert config.timeout == HTTPPoolConfig().timeout
+
+
+class TestSharedHubSpotTransport:
+    """Test that both HubSpot stacks share one pool."""
+
+    def test_connector_and_client_share_transport(self, reset_shared_transports):
+        connector = HubSpotConnector("test-key")
+        client = HubSpotClient(api_key="test-key")
+
+        assert connector.transport is client.transport
+        assert connector.transport is get_shared_transport("hubspot")
+
+    @pytest.mark.asyncio
+    async def test_connector_calls_use_pooled_client(self):
+        seen = []
+        transport = PooledHTTPTransport("hubspot", transport=_mock_transport(seen))
+        connector = HubSpotConnector("test-key", transport=transport)
+        batch = HubSpotBatchOperations(connector)
+
+        contact = await connector.get_contact("123")
+        stages = await connector.get_pipeline_stages()
+        updated = await batch.update_contact("123", {"email": "a@b.com"})
+
+        assert contact["id"] == "123"
+        assert stages[0]["label"] == "Qualified"
+        assert updated is not None
+        assert len(seen) == 3
+        assert all(r.headers["Authorization"] == "Bearer test-key" for r in seen)
+        assert transport.stats.requests == 3
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_integration_client_uses_shared_transport(self):
+        seen = []
+        transport = PooledHTTPTransport("hubspot", transport=_mock_transport(seen))
+        client = HubSpotClient(api_key="test-key", enable_cache=False, transport=transport)
+
+        await client._request("GET", "/crm/v3/objects/contacts/123")
+        await client.close()
+
+        assert seen[0].url == "https://api.hubapi.com/crm/v3/objects/contacts/123"
+        assert seen[0].headers["Authorization"] == "Bearer test-key"
+        assert transport.is_open
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_closes_its_own_pool(self, reset_shared_transports):
+        own = HubSpotClient(api_key="test-key", enable_cache=False, share_transport=False)
+        shared = HubSpotClient(api_key="test-key", enable_cache=False)
+        for client in (own, shared):
+            client.transport._transport = _mock_transport([])
+            await client._request("GET", "/crm/v3/objects/contacts/123")
+
+        await own.close()
+        await shared.close()
+
+        assert own.transport is not shared.transport
+        assert not own.transport.is_open
+        assert shared.transport.is_open
+        await close_shared_transports()
+
+    @pytest.mark.asyncio
+    async def test_close_shared_transports(self, reset_shared_transports):
+        transport = get_shared_transport("hubspot")
+        transport._transport = _mock_transport([])
+        async with transport.session() as client:
+            await client.get("https://api.hubapi.com/ping")
+        assert transport.is_open
+
+        await close_shared_transports()
+
+        assert not transport.is_open
@@ -0,0 +1,207 @@
+"""Tests for HubSpot batch reads and coalesced single-id loads."""
+import asyncio
+import json
+import re
+
+import httpx
+import pytest
+
+from src.connectors.http_transport import PooledHTTPTransport
+from src.connectors.hubspot import HubSpotConnector, _BatchLoader
+from src.resilience import CircuitBreaker, CircuitBreakerOpenError
+
+
+CONTACTS = {
+    str(i): {"email": f"user{i}@acme.com", "firstname": f"User{i}"}
+    for i in range(250)
+}
+CONTACT_COMPANIES = {"1": ["900", "901"], "2": ["901"]}
+
+
+class CountingBucket:
+    """Token bucket stand-in that counts acquisitions."""
+
+    def __init__(self):
+        self.acquired = 0
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        self.acquired += 1
+        return 0.0
+
+
+class FakeHubSpot:
+    """Mock HubSpot batch API that records every batch call."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        ids = [i["id"] for i in body["inputs"]]
+        self.calls.append((request.url.path, ids))
+        await asyncio.sleep(0)
+
+        if request.url.path.startswith("/crm/v3/associations/"):
+            results = [
+                {
+                    "from": {"id": i},
+                    "to": [{"id": c, "type": "contact_to_company"} for c in CONTACT_COMPANIES[i]],
+                }
+                for i in ids if i in CONTACT_COMPANIES
+            ]
+            return httpx.Response(200, json={"results": results})
+
+        object_type = re.match(r"/crm/v3/objects/(\w+)/batch/read", request.url.path).group(1)
+        if object_type == "companies":
+            results = [{"id": i, "properties": {"name": f"Company {i}"}} for i in ids]
+        elif body.get("idProperty") == "email":
+            by_email = {p["email"]: (cid, p) for cid, p in CONTACTS.items()}
+            results = [
+                {"id": by_email[i][0], "properties": by_email[i][1]}
+                for i in ids if i in by_email
+            ]
+        else:
+            results = [{"id": i, "properties": CONTACTS[i]} for i in ids if i in CONTACTS]
+        return httpx.Response(207 if len(results) < len(ids) else 200, json={"results": results})
+
+    def paths(self, prefix: str):
+        return [ids for path, ids in self.calls if path.startswith(prefix)]
+
+
+@pytest.fixture(autouse=True)
+def circuit_breaker(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60.0, name="hubspot-test")
+    monkeypatch.setattr(HubSpotConnector, "_circuit_breaker", breaker)
+    return breaker
+
+
+def _connector(api: FakeHubSpot, **kwargs) -> HubSpotConnector:
+    transport = PooledHTTPTransport("test", transport=httpx.MockTransport(api.handler))
+    return HubSpotConnector("test-key", transport=transport, rate_limiter=CountingBucket(), **kwargs)
+
+
+class TestBatchRead:
+    """Test the chunked batch read endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_read_objects_chunks_by_100(self):
+        api = FakeHubSpot()
+        connector = _connector(api)
+
+        contacts = await connector.batch.read_objects("contacts", list(CONTACTS))
+
+        assert [len(ids) for ids in api.paths("/crm/v3/objects/contacts")] == [100, 100, 50]
+        assert connector.rate_limiter.acquired == 3
+        assert contacts["42"]["properties"]["firstname"] == "User42"
+
+    @pytest.mark.asyncio
+    async def test_missing_ids_are_left_out(self):
+        connector = _connector(FakeHubSpot())
+
+        contacts = await connector.batch.read_objects("contacts", ["1", "missing"])
+
+        assert set(contacts) == {"1"}
+
+    @pytest.mark.asyncio
+    async def test_read_associations_keeps_empty_ids(self):
+        connector = _connector(FakeHubSpot())
+
+        associations = await connector.batch.read_associations("contacts", "companies", ["1", "3"])
+
+        assert [a["id"] for a in associations["1"]] == ["900", "901"]
+        assert associations["3"] == []
+
+
+class TestCoalescedLoads:
+    """Test DataLoader-style coalescing of single-id loads."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_email_lookups_share_one_call(self):
+        api = FakeHubSpot()
+        connector = _connector(api)
+
+        emails = ["user1@acme.com", "USER2@acme.com", "nobody@acme.com", "user1@acme.com"]
+        contacts = await asyncio.gather(*(connector.batch.load_contact_by_email(e) for e in emails))
+
+        assert api.paths("/crm/v3/objects/contacts") == [
+            ["user1@acme.com", "user2@acme.com", "nobody@acme.com"]
+        ]
+        assert [c["id"] if c else None for c in contacts] == ["1", "2", None, "1"]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_dispatches_without_waiting(self):
+        calls = []
+
+        async def batch_fn(keys):
+            calls.append(keys)
+            return {k: k.upper() for k in keys}
+
+        loader = _BatchLoader(batch_fn, max_batch_size=2, window=60)
+        results = await asyncio.wait_for(
+            asyncio.gather(loader.load("a"), loader.load("b")), timeout=1
+        )
+
+        assert results == ["A", "B"]
+        assert calls == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_caller(self):
+        async def batch_fn(keys):
+            raise RuntimeError("HubSpot down")
+
+        loader = _BatchLoader(batch_fn)
+        results = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_contact_companies_chain_is_batched(self):
+        api = FakeHubSpot()
+        connector = _connector(api)
+
+        first, second = await asyncio.gather(
+            connector.batch.load_contact_companies("1"),
+            connector.batch.load_contact_companies("2"),
+        )
+
+        assert [c["id"] for c in first] == ["900", "901"]
+        assert [c["id"] for c in second] == ["901"]
+        assert api.paths("/crm/v3/associations/contacts/companies") == [["1", "2"]]
+        assert api.paths("/crm/v3/objects/companies") == [["900", "901"]]
+
+
+class TestConnectorReads:
+    """Single-object connector reads go through the coalescing loaders."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_chain_is_batched(self):
+        api = FakeHubSpot()
+        connector = _connector(api)
+
+        async def resolve(email):
+            contact = await connector.search_contacts(email)
+            associations = await connector.get_contact_associations(contact["id"])
+            return await connector.get_company(associations[0]["id"])
+
+        companies = await asyncio.gather(resolve("user1@acme.com"), resolve("user2@acme.com"))
+
+        assert [c["id"] for c in companies] == ["900", "901"]
+        assert api.paths("/crm/v3/objects/contacts") == [["user1@acme.com", "user2@acme.com"]]
+        assert api.paths("/crm/v3/associations/contacts/companies") == [["1", "2"]]
+        assert api.paths("/crm/v3/objects/companies") == [["900", "901"]]
+
+    @pytest.mark.asyncio
+    async def test_batch_reads_share_the_circuit_breaker(self, circuit_breaker):
+        async def failing(request):
+            return httpx.Response(503, json={})
+
+        connector = _connector(FakeHubSpot())
+        connector.transport = PooledHTTPTransport("test", transport=httpx.MockTransport(failing))
+
+        assert await connector.get_company("900") is None
+        assert await connector.batch.load_contact("1") is None
+        assert circuit_breaker.state == "open"
+        with pytest.raises(CircuitBreakerOpenError):
+            await connector.batch.read_objects("contacts", ["1"])
+        with pytest.raises(CircuitBreakerOpenError):
+            await connector.search_contacts("user1@acme.com")
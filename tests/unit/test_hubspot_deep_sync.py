@@ -109,7 +109,7 @@ class TestHubSpotConnectorEnhancements:
         }
         mock_response.raise_for_status = MagicMock()
         
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HubSpotConnector, "_session") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -135,7 +135,7 @@ class TestHubSpotConnectorEnhancements:
         mock_response.status_code = 404
         mock_response.raise_for_status = MagicMock(side_effect=httpx.HTTPStatusError("Not Found", request=MagicMock(), response=mock_response))
         
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HubSpotConnector, "_session") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -167,7 +167,7 @@ class TestHubSpotConnectorEnhancements:
         }
         mock_response.raise_for_status = MagicMock()
         
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HubSpotConnector, "_session") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -28,7 +28,7 @@ class TestGetPipelineStages:
             ]
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HubSpotConnector, "_session") as mock_client:
             mock_client.return_value.__aenter__.return_value.get = AsyncMock(
                 return_value=mock_response
             )
@@ -41,7 +41,7 @@ class TestGetPipelineStages:
     @pytest.mark.asyncio
     async def test_returns_empty_on_error(self, connector):
         """Should return empty list on API error."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HubSpotConnector, "_session") as mock_client:
             mock_client.return_value.__aenter__.return_value.get = AsyncMock(
                 side_effect=httpx.HTTPError("API Error")
             )
@@ -93,7 +93,7 @@ class TestGetDealsByStage:
             ]
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HubSpotConnector, "_session") as mock_client:
             mock_client.return_value.__aenter__.return_value.get = AsyncMock(
                 return_value=mock_response
             )
@@ -108,7 +108,7 @@ class TestGetDealsByStage:
     @pytest.mark.asyncio
     async def test_returns_empty_on_error(self, connector):
         """Should return empty dict on API error."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch.object(HubSpotConnector, "_session") as mock_client:
             mock_client.return_value.__aenter__.return_value.get = AsyncMock(
                 side_effect=httpx.HTTPError("API Error")
             )
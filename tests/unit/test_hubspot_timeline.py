@@ -0,0 +1,188 @@
+"""Tests for concurrent HubSpot timeline and engagement fetches."""
+import asyncio
+import re
+
+import httpx
+import pytest
+
+from src.connectors.http_transport import PooledHTTPTransport
+from src.connectors.hubspot import HubSpotConnector
+from src.enrichment.history_enricher import HistoryEnricher
+
+
+TIMESTAMPS = {
+    "emails": ["2024-01-15T10:00:00Z", "2024-01-11T10:00:00Z", "2024-01-13T10:00:00Z"],
+    "calls": ["2024-01-14T10:00:00Z", "2024-01-12T10:00:00Z"],
+    "meetings": ["2024-01-16T10:00:00Z", "2024-01-10T10:00:00Z"],
+    "notes": ["2024-01-12T10:00:00Z", "2024-01-17T10:00:00Z"],
+    "engagements": ["2024-01-09T10:00:00Z"],
+    "deals": [None],
+    "tasks": [None],
+}
+
+
+class CountingBucket:
+    """Token bucket stand-in that counts acquisitions."""
+
+    def __init__(self):
+        self.acquired = 0
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        self.acquired += 1
+        return 0.0
+
+
+class FakeHubSpot:
+    """Mock HubSpot API that records request concurrency."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return self._respond(request.url.path)
+        finally:
+            self.in_flight -= 1
+
+    def _respond(self, path: str) -> httpx.Response:
+        assoc = re.match(r"/crm/v4/objects/contacts/\w+/associations/(\w+)", path)
+        if assoc:
+            object_type = assoc.group(1)
+            results = [
+                {"toObjectId": f"{object_type}-{i}"}
+                for i in range(len(TIMESTAMPS[object_type]))
+            ]
+            return httpx.Response(200, json={"results": results})
+
+        detail = re.match(r"/crm/v3/objects/(\w+)/\w+-(\d+)", path)
+        object_type, index = detail.group(1), int(detail.group(2))
+        timestamp = TIMESTAMPS[object_type][index]
+        properties = {
+            "hs_timestamp": timestamp,
+            "hs_meeting_start_time": timestamp,
+            "hs_engagement_type": "EMAIL",
+            "hs_note_body": "Discussed budget for Q3",
+            "hs_task_subject": "Send proposal",
+            "hs_task_status": "NOT_STARTED",
+            "dealname": "Pilot",
+            "dealstage": "qualified",
+            "amount": "5000",
+        }
+        return httpx.Response(
+            200, json={"id": f"{object_type}-{index}", "properties": properties}
+        )
+
+
+def _connector(api: FakeHubSpot, **kwargs) -> HubSpotConnector:
+    transport = PooledHTTPTransport("test", transport=httpx.MockTransport(api.handler))
+    return HubSpotConnector("test-key", transport=transport, **kwargs)
+
+
+class TestTimelineFanOut:
+    """Test get_contact_timeline concurrency and merge order."""
+
+    @pytest.mark.asyncio
+    async def test_merges_streams_newest_first(self):
+        api = FakeHubSpot(delay=0)
+        connector = _connector(api, rate_limiter=CountingBucket())
+
+        timeline = await connector.get_contact_timeline("101", limit=50)
+
+        timestamps = [a["timestamp"] for a in timeline]
+        assert timestamps == sorted(timestamps, reverse=True)
+        assert len(timeline) == 9
+        assert timeline[0]["type"] == "note"
+        assert {a["type"] for a in timeline} == {"email", "call", "meeting", "note"}
+
+    @pytest.mark.asyncio
+    async def test_limit_applies_after_merge(self):
+        connector = _connector(FakeHubSpot(delay=0), rate_limiter=CountingBucket())
+
+        timeline = await connector.get_contact_timeline("101", limit=12)
+
+        # limit // 4 = 3 notes allowed, limit // 3 = 4 of each other type
+        assert [a["timestamp"] for a in timeline[:3]] == [
+            "2024-01-17T10:00:00Z",
+            "2024-01-16T10:00:00Z",
+            "2024-01-15T10:00:00Z",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_requests_are_bounded_and_rate_limited(self):
+        api = FakeHubSpot()
+        bucket = CountingBucket()
+        connector = _connector(api, rate_limiter=bucket, max_concurrency=3)
+
+        await connector.get_contact_timeline("101")
+
+        # 4 association reads + 9 detail reads
+        assert api.requests == 13
+        assert bucket.acquired == 13
+        assert 1 < api.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_one_is_serial(self):
+        api = FakeHubSpot()
+        connector = _connector(api, rate_limiter=CountingBucket())
+
+        serial = await connector.get_contact_timeline("101", concurrency=1)
+        assert api.max_in_flight == 1
+
+        parallel = await connector.get_contact_timeline("101")
+        assert parallel == serial
+
+    @pytest.mark.asyncio
+    async def test_fan_out_is_faster_than_serial(self):
+        api = FakeHubSpot(delay=0.03)
+        connector = _connector(api, rate_limiter=CountingBucket(), max_concurrency=16)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await connector.get_contact_timeline("101", concurrency=1)
+        serial = loop.time() - start
+
+        start = loop.time()
+        await connector.get_contact_timeline("101")
+        parallel = loop.time() - start
+
+        assert parallel < serial / 2
+
+
+class TestEngagementFanOut:
+    """Test per-contact engagement fetches used by the history enricher."""
+
+    @pytest.mark.asyncio
+    async def test_detail_reads_keep_association_order(self):
+        api = FakeHubSpot()
+        connector = _connector(api, rate_limiter=CountingBucket())
+
+        notes = await connector.get_contact_notes("101", limit=10)
+
+        assert [n["id"] for n in notes] == ["notes-0", "notes-1"]
+        assert api.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_history_enricher_fetches_concurrently(self):
+        api = FakeHubSpot()
+        connector = _connector(api, rate_limiter=CountingBucket())
+
+        async def get_contact(contact_id):
+            return {"id": contact_id}
+
+        connector.get_contact = get_contact
+        summary = await HistoryEnricher(connector).get_relationship_summary(
+            "jane@acme.com", contact_id="101"
+        )
+
+        assert summary.total_touchpoints == 1
+        assert summary.active_deals == 1
+        assert summary.action_items == ["Send proposal"]
+        assert "budget" in summary.key_topics
+        assert api.max_in_flight >= 4
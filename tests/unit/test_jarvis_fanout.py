@@ -0,0 +1,152 @@
+"""Tests for Jarvis running routed agents concurrently."""
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+import src.agents.jarvis as jarvis_module
+from src.agents.base import BaseAgent
+from src.agents.jarvis import AgentDomain, JarvisAgent
+
+
+class SleepyAgent(BaseAgent):
+    """Agent that sleeps before answering, or raises."""
+
+    def __init__(self, name: str, delay: float = 0.0, error: Exception = None):
+        super().__init__(name=name, description="test agent")
+        self.delay = delay
+        self.error = error
+        self.cancelled = False
+
+    async def validate_input(self, context):
+        return True
+
+    async def execute(self, context):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return {"message": f"{self.name} done"}
+
+
+def _jarvis(agents, memory=False) -> JarvisAgent:
+    jarvis = JarvisAgent()
+    jarvis._initialized = True
+    jarvis._memory_enabled = memory
+    for agent in agents:
+        jarvis._register_agent(agent.name, agent, domain=AgentDomain.SALES, capabilities=[])
+
+    async def route(query, context):
+        return [agent.name for agent in agents]
+
+    jarvis._route_query = route
+    return jarvis
+
+
+class TestConcurrentAgents:
+    """Agents run concurrently, each under its own timeout."""
+
+    @pytest.mark.asyncio
+    async def test_latency_is_slowest_agent_not_sum(self):
+        agents = [SleepyAgent(f"agent_{i}", delay=0.1) for i in range(4)]
+        jarvis = _jarvis(agents)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        response = await jarvis.ask("anything")
+        elapsed = loop.time() - start
+
+        assert elapsed < 0.25
+        assert response["agents_invoked"] == [a.name for a in agents]
+        assert all(r["status"] == "success" for r in response["results"].values())
+        latency = response["metadata"]["agent_latency_ms"]
+        assert set(latency) == {a.name for a in agents}
+        assert all(ms >= 90 for ms in latency.values())
+
+    @pytest.mark.asyncio
+    async def test_slow_agent_is_cancelled_and_others_returned(self):
+        fast = SleepyAgent("fast")
+        slow = SleepyAgent("slow", delay=5)
+        jarvis = _jarvis([fast, slow])
+
+        response = await asyncio.wait_for(jarvis.ask("anything", agent_timeout=0.05), timeout=1)
+
+        assert response["results"]["fast"]["status"] == "success"
+        assert response["results"]["slow"]["status"] == "timeout"
+        assert response["metadata"]["timed_out"] == ["slow"]
+        assert slow.cancelled
+
+    @pytest.mark.asyncio
+    async def test_failing_agent_does_not_affect_others(self):
+        jarvis = _jarvis([SleepyAgent("broken", error=RuntimeError("boom")), SleepyAgent("ok")])
+
+        response = await jarvis.ask("anything")
+
+        assert response["results"]["broken"] == {
+            "status": "error",
+            "error": "boom",
+            "latency_ms": response["results"]["broken"]["latency_ms"],
+        }
+        assert response["results"]["ok"]["status"] == "success"
+
+
+class SlowMemory:
+    """MemoryService stand-in whose reads each take ``delay`` seconds."""
+
+    delay = 0.1
+    calls = []
+
+    def __init__(self, db):
+        pass
+
+    async def get_or_create_session(self, user_id, session_name):
+        return SimpleNamespace(id="session-1", last_topic=None)
+
+    async def recall(self, session_id, limit=20):
+        await asyncio.sleep(self.delay)
+        return ["recent"]
+
+    async def search_similar(self, session_id, query, limit=5):
+        await asyncio.sleep(self.delay)
+        return ["similar"]
+
+    async def remember(self, **kwargs):
+        SlowMemory.calls.append(kwargs["role"])
+
+
+@asynccontextmanager
+async def _fake_session():
+    yield None
+
+
+class TestMemoryOverlap:
+    """Memory recall overlaps with routing and with itself."""
+
+    @pytest.mark.asyncio
+    async def test_memory_loads_while_routing(self, monkeypatch):
+        monkeypatch.setattr(jarvis_module, "MemoryService", SlowMemory)
+        monkeypatch.setattr(jarvis_module, "get_session", _fake_session)
+        SlowMemory.calls = []
+        jarvis = _jarvis([SleepyAgent("agent")], memory=True)
+
+        async def slow_route(query, context):
+            await asyncio.sleep(0.1)
+            return ["agent"]
+
+        jarvis._route_query = slow_route
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        response = await jarvis.ask("anything")
+        elapsed = loop.time() - start
+
+        # Routing, recall and search_similar (0.1s each) all overlap
+        assert elapsed < 0.2
+        assert response["memory"] == {"session_id": "session-1"}
+        assert jarvis._conversation_context["recent_messages"] == ["recent"]
+        assert jarvis._conversation_context["relevant_context"] == ["similar"]
+        assert SlowMemory.calls == ["user", "assistant"]
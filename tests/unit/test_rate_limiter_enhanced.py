@@ -0,0 +1,167 @@
+"""Tests for the Redis-scripted token bucket rate limiter."""
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+from src.rate_limiter_enhanced import (
+    RateLimitExceeded,
+    RateLimitService,
+    TokenBucketRateLimiter,
+)
+
+
+class SlowRefillLimiter(TokenBucketRateLimiter):
+    """Limiter with a small bucket that does not refill during a test."""
+
+    SERVICE_LIMITS = {
+        RateLimitService.HUBSPOT: {"capacity": 50, "refill_rate": 0.0001},
+        RateLimitService.GMAIL: {"capacity": 5, "refill_rate": 0.0001},
+    }
+
+
+class CountingRedis(fakeredis.FakeAsyncRedis):
+    """FakeAsyncRedis that counts round-trips (commands and pipelines)."""
+
+    round_trips = 0
+
+    async def execute_command(self, *args, **kwargs):
+        CountingRedis.round_trips += 1
+        return await super().execute_command(*args, **kwargs)
+
+
+async def _admitted(limiter: TokenBucketRateLimiter, service, n: int) -> int:
+    async def attempt():
+        try:
+            return await limiter.check_limit(service)
+        except RateLimitExceeded:
+            return False
+
+    results = await asyncio.gather(*(attempt() for _ in range(n)))
+    return sum(results)
+
+
+class TestAtomicBucket:
+    """Refill-and-consume runs atomically in Redis."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_workers_never_over_admit(self):
+        server = fakeredis.FakeServer()
+        workers = [
+            SlowRefillLimiter(fakeredis.FakeAsyncRedis(server=server), lease_sizes={})
+            for _ in range(4)
+        ]
+
+        admitted = await asyncio.gather(*(
+            _admitted(worker, RateLimitService.HUBSPOT, 40) for worker in workers
+        ))
+
+        assert sum(admitted) == 50
+
+    @pytest.mark.asyncio
+    async def test_denied_request_reports_retry_time(self):
+        limiter = SlowRefillLimiter(fakeredis.FakeAsyncRedis(), lease_sizes={})
+
+        for _ in range(5):
+            assert await limiter.check_limit(RateLimitService.GMAIL)
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await limiter.check_limit(RateLimitService.GMAIL)
+
+        assert exc_info.value.service == "gmail"
+        assert exc_info.value.retry_after > 0
+
+    @pytest.mark.asyncio
+    async def test_single_check_is_one_round_trip(self):
+        redis = CountingRedis()
+        limiter = SlowRefillLimiter(redis, lease_sizes={})
+        await limiter.check_limit(RateLimitService.GMAIL)  # loads the script
+
+        CountingRedis.round_trips = 0
+        await limiter.check_limit(RateLimitService.GMAIL)
+
+        assert CountingRedis.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_quota_status_reads_script_state(self):
+        limiter = SlowRefillLimiter(fakeredis.FakeAsyncRedis(), lease_sizes={})
+
+        await limiter.check_limit(RateLimitService.GMAIL, cost=3)
+        status = await limiter.get_quota_status(RateLimitService.GMAIL)
+
+        assert status["tokens_available"] == pytest.approx(2, abs=0.01)
+
+
+class TestCheckMany:
+    """Several buckets are checked in one pipelined call."""
+
+    @pytest.mark.asyncio
+    async def test_checks_buckets_independently(self):
+        limiter = SlowRefillLimiter(fakeredis.FakeAsyncRedis(), lease_sizes={})
+
+        results = await limiter.check_many([
+            (RateLimitService.GMAIL, 3, "user-1"),
+            (RateLimitService.GMAIL, 6, "user-2"),
+            (RateLimitService.HUBSPOT, 1, None),
+            (RateLimitService.OPENAI, 1, None),  # no limit configured
+        ])
+
+        assert results == [True, False, True, True]
+        status = await limiter.get_quota_status(RateLimitService.GMAIL, user_id="user-2")
+        assert status["tokens_available"] == pytest.approx(5, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_local_fallback_without_redis(self):
+        limiter = SlowRefillLimiter()
+
+        results = await limiter.check_many([
+            (RateLimitService.GMAIL, 4, None),
+            (RateLimitService.GMAIL, 4, None),
+        ])
+
+        assert results == [True, False]
+
+
+class TestTokenLease:
+    """High-rate services reserve tokens in-process."""
+
+    @pytest.mark.asyncio
+    async def test_lease_serves_checks_without_redis(self):
+        redis = CountingRedis()
+        limiter = SlowRefillLimiter(redis, lease_sizes={RateLimitService.HUBSPOT: 10})
+        await limiter.check_limit(RateLimitService.HUBSPOT)
+
+        CountingRedis.round_trips = 0
+        for _ in range(9):
+            assert await limiter.check_limit(RateLimitService.HUBSPOT)
+
+        assert CountingRedis.round_trips == 0
+        status = await limiter.get_quota_status(RateLimitService.HUBSPOT)
+        assert status["tokens_available"] == pytest.approx(40, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_leases_never_over_admit(self):
+        server = fakeredis.FakeServer()
+        workers = [
+            SlowRefillLimiter(
+                fakeredis.FakeAsyncRedis(server=server),
+                lease_sizes={RateLimitService.HUBSPOT: 7},
+            )
+            for _ in range(4)
+        ]
+
+        admitted = await asyncio.gather(*(
+            _admitted(worker, RateLimitService.HUBSPOT, 40) for worker in workers
+        ))
+
+        assert 0 < sum(admitted) <= 50
+
+    @pytest.mark.asyncio
+    async def test_lease_falls_back_to_single_cost(self):
+        limiter = SlowRefillLimiter(
+            fakeredis.FakeAsyncRedis(), lease_sizes={RateLimitService.GMAIL: 10}
+        )
+
+        # Bucket holds 5 < lease of 10, so each check takes just its own cost
+        assert await _admitted(limiter, RateLimitService.GMAIL, 8) == 5
@@ -0,0 +1,180 @@
+"""Tests for the search service and its inverted index."""
+import pytest
+
+from src.search import InvertedIndex, SearchableEntity, SearchService
+from src.search.search_service import SearchFilter, SearchOperator
+
+
+@pytest.fixture
+def service():
+    return SearchService()
+
+
+async def _seed(service):
+    await service.index_document(
+        "c1", SearchableEntity.CONTACT, "Jane Smith",
+        {"first_name": "Jane", "last_name": "Smith", "email": "jane@acme.com", "company": "Acme"},
+    )
+    await service.index_document(
+        "c2", SearchableEntity.CONTACT, "John Doe",
+        {"first_name": "John", "last_name": "Doe", "email": "john@globex.com", "company": "Globex"},
+    )
+    await service.index_document(
+        "co1", SearchableEntity.COMPANY, "Acme Corp",
+        {"name": "Acme Corp", "domain": "acme.com", "industry": "Logistics"},
+    )
+
+
+class TestInvertedIndex:
+    """Test the inverted index directly."""
+
+    def test_add_and_score(self):
+        index = InvertedIndex(fields=["name", "notes"], boost_fields={"name": 2.0})
+        index.add("a", {"name": "Acme Freight", "notes": "freight broker"})
+        index.add("b", {"name": "Globex", "notes": "acme competitor"})
+
+        scores = index.score(["acme"])
+
+        assert set(scores) == {"a", "b"}
+        # Name matches are boosted above notes matches
+        assert scores["a"] > scores["b"]
+
+    def test_remove_cleans_postings(self):
+        index = InvertedIndex()
+        index.add("a", {"name": "Acme"})
+        index.add("b", {"name": "Acme Globex"})
+
+        assert index.remove("a") is True
+        assert index.remove("a") is False
+        assert index.score(["acme"]).keys() == {"b"}
+
+        index.remove("b")
+        assert index.term_count == 0
+        assert index.terms_with_prefix("a") == []
+
+    def test_readd_replaces_document(self):
+        index = InvertedIndex()
+        index.add("a", {"name": "Acme"})
+        index.add("a", {"name": "Globex"})
+
+        assert index.score(["acme"]) == {}
+        assert "a" in index.score(["globex"])
+        assert len(index) == 1
+
+    def test_terms_with_prefix(self):
+        index = InvertedIndex()
+        index.add("a", {"name": "freight freightliner fresh"})
+
+        assert index.terms_with_prefix("freight") == ["freight", "freightliner"]
+        assert index.terms_with_prefix("fre", limit=1) == ["freight"]
+
+
+class TestSearchService:
+    """Test search through the inverted index."""
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_boosted_fields(self, service):
+        await _seed(service)
+
+        result = await service.search("acme")
+
+        assert result.total == 2
+        assert {item.id for item in result.items} == {"c1", "co1"}
+        assert result.items[0].score >= result.items[1].score
+        company = next(item for item in result.items if item.id == "co1")
+        assert company.highlights["name"] == ["<em>Acme</em> Corp"]
+
+    @pytest.mark.asyncio
+    async def test_partial_last_word_matches_by_prefix(self, service):
+        await service.index_document(
+            "c3", SearchableEntity.CONTACT, "Jonathan Smithers",
+            {"name": "Jonathan Smithers", "company": "Acmecorp"},
+        )
+
+        for query in ("smith", "acme", "jonathan", "jonathan smi"):
+            result = await service.search(query, entity_types=[SearchableEntity.CONTACT])
+            assert "c3" in [item.id for item in result.items], query
+
+        # Whole-word matches still rank above prefix matches
+        await _seed(service)
+        result = await service.search("smith", entity_types=[SearchableEntity.CONTACT])
+        assert [item.id for item in result.items] == ["c1", "c3"]
+
+    @pytest.mark.asyncio
+    async def test_fields_outside_index_config_are_searchable(self, service):
+        await service.index_document(
+            "d1", SearchableEntity.DEAL, "Renewal",
+            {"name": "Renewal", "stage": "negotiation", "owner_email": "sam@acme.com"},
+        )
+
+        result = await service.search("negotiation", entity_types=[SearchableEntity.DEAL])
+
+        assert [item.id for item in result.items] == ["d1"]
+
+    @pytest.mark.asyncio
+    async def test_search_entity_type_and_facets(self, service):
+        await _seed(service)
+
+        result = await service.search("acme", entity_types=[SearchableEntity.CONTACT])
+
+        assert [item.id for item in result.items] == ["c1"]
+        assert [(f.value, f.count) for f in result.facets["entity_type"]] == [("contact", 1)]
+
+    @pytest.mark.asyncio
+    async def test_search_applies_filters(self, service):
+        await _seed(service)
+
+        result = await service.search(
+            "acme",
+            filters=[SearchFilter(field="company", operator=SearchOperator.EQUALS, value="Acme")],
+        )
+
+        assert [item.id for item in result.items] == ["c1"]
+
+    @pytest.mark.asyncio
+    async def test_pagination_uses_top_k(self, service):
+        for i in range(30):
+            await service.index_document(
+                f"d{i}", SearchableEntity.DEAL, f"Deal {i}",
+                {"name": "freight " * (i % 5 + 1), "description": f"deal number {i}"},
+            )
+
+        first = await service.search("freight", page=1, page_size=10)
+        second = await service.search("freight", page=2, page_size=10)
+
+        assert first.total == second.total == 30
+        assert not {i.id for i in first.items} & {i.id for i in second.items}
+        assert first.items[-1].score >= second.items[0].score
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_keep_index_current(self, service):
+        await _seed(service)
+
+        await service.update_document("c2", {"company": "Acme"})
+        result = await service.search("acme", entity_types=[SearchableEntity.CONTACT])
+        assert {item.id for item in result.items} == {"c1", "c2"}
+
+        await service.delete_document("c1")
+        result = await service.search("acme", entity_types=[SearchableEntity.CONTACT])
+        assert [item.id for item in result.items] == ["c2"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_index_and_empty_query(self, service):
+        stats = await service.bulk_index([
+            {"id": "n1", "type": "note", "title": "Call recap", "data": {"body": "pricing"}},
+            {"id": "n2", "type": "note", "title": "Kickoff", "data": {"body": "timeline"}},
+            {"id": "bad", "type": "not-a-type", "title": "x"},
+        ])
+
+        assert stats == {"indexed": 2, "failed": 1, "total": 3}
+        result = await service.search("", include_suggestions=False)
+        assert result.total == 2
+
+    @pytest.mark.asyncio
+    async def test_suggestions_use_title_index(self, service):
+        await _seed(service)
+
+        suggestions = await service.get_suggestions("acme")
+
+        assert [s.text for s in suggestions] == ["Acme Corp"]
+        assert suggestions[0].highlighted == "<em>Acme</em> Corp"
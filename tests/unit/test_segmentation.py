@@ -0,0 +1,308 @@
+"""Tests for compiled and columnar segment rule evaluation."""
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.segmentation import RuleOperator, Segment, SegmentationEngine, SegmentRule
+
+
+NOW = datetime.utcnow()
+
+RULES = [
+    ("title", RuleOperator.EQUALS, "ceo"),
+    ("title", RuleOperator.NOT_EQUALS, "CEO"),
+    ("title", RuleOperator.CONTAINS, "vp"),
+    ("title", RuleOperator.NOT_CONTAINS, "Vp"),
+    ("title", RuleOperator.STARTS_WITH, "head"),
+    ("title", RuleOperator.ENDS_WITH, "officer"),
+    ("score", RuleOperator.GREATER_THAN, 50),
+    ("score", RuleOperator.LESS_THAN, "50"),
+    ("score", RuleOperator.GREATER_OR_EQUAL, 80),
+    ("score", RuleOperator.LESS_OR_EQUAL, 20.5),
+    ("phone", RuleOperator.IS_EMPTY, None),
+    ("phone", RuleOperator.IS_NOT_EMPTY, None),
+    ("title", RuleOperator.IN_LIST, ["CEO", "CTO", "Head of Sales", None]),
+    ("title", RuleOperator.NOT_IN_LIST, ["CEO", "CTO"]),
+    ("title", RuleOperator.IN_LIST, "CEO"),
+    ("title", RuleOperator.NOT_IN_LIST, "CEO"),
+    ("created_at", RuleOperator.BEFORE, (NOW - timedelta(days=30)).isoformat()),
+    ("created_at", RuleOperator.AFTER, NOW - timedelta(days=30)),
+    ("created_at", RuleOperator.AFTER, "not a date"),
+    ("created_at", RuleOperator.WITHIN_DAYS, 7),
+    ("created_at", RuleOperator.WITHIN_DAYS, "14"),
+    ("company.industry", RuleOperator.CONTAINS, "tech"),
+    ("company.employee_count", RuleOperator.GREATER_OR_EQUAL, 1000),
+    ("company.employee_count.value", RuleOperator.IS_EMPTY, None),
+]
+
+
+def make_contacts(count: int, seed: int = 3) -> list[dict]:
+    rng = random.Random(seed)
+    titles = ["CEO", "cto", "VP Sales", "Head of Sales", "Chief Revenue Officer", "", None, 42]
+    contacts = []
+    for i in range(count):
+        created = NOW - timedelta(days=rng.randrange(0, 60), seconds=rng.randrange(0, 86400))
+        contact = {
+            "id": f"c{i}",
+            "title": rng.choice(titles),
+            "score": rng.choice([None, 0, 10, 20.5, 50, "50", 80, 99.9, "85"]),
+            "phone": rng.choice([None, "", "555-0100"]),
+            "created_at": rng.choice([created, created.isoformat(), None, "garbage", ""]),
+        }
+        if rng.random() < 0.7:
+            contact["company"] = {
+                "industry": rng.choice(["Technology", "Logistics", None]),
+                "employee_count": rng.choice([None, 50, 1000, 5000]),
+            }
+        elif rng.random() < 0.5:
+            contact["company"] = "Acme"
+        contacts.append(contact)
+    return contacts
+
+
+@pytest.mark.parametrize("field,operator,value", RULES)
+def test_compiled_and_batch_match_reference(field, operator, value):
+    rule = SegmentRule(id="r", field=field, operator=operator, value=value)
+    contacts = make_contacts(300)
+
+    expected = [rule.evaluate(c) for c in contacts]
+    compiled = rule.compile()
+
+    assert [compiled(c) for c in contacts] == expected
+    assert rule.evaluate_batch(contacts) == expected
+
+
+def test_aware_dates_match_reference():
+    rule = SegmentRule(
+        id="r", field="created_at", operator=RuleOperator.BEFORE,
+        value="2024-06-01T00:00:00Z",
+    )
+    contacts = [
+        {"created_at": "2024-05-31T23:59:59.999999+00:00"},
+        {"created_at": "2024-06-01T02:00:00+02:00"},
+        {"created_at": datetime(2024, 6, 1, 0, 0, 1, tzinfo=timezone.utc)},
+    ]
+
+    assert rule.evaluate_batch(contacts) == [rule.evaluate(c) for c in contacts] == [True, False, False]
+
+
+def test_mixed_naive_and_aware_dates_raise_like_reference():
+    rule = SegmentRule(id="r", field="created_at", operator=RuleOperator.AFTER, value="2024-06-01")
+    contacts = [{"created_at": "2024-07-01T00:00:00Z"}]
+
+    with pytest.raises(TypeError):
+        rule.evaluate(contacts[0])
+    with pytest.raises(TypeError):
+        rule.evaluate_batch(contacts)
+
+
+def test_reassigning_rule_value_recompiles():
+    rule = SegmentRule(id="r", field="title", operator=RuleOperator.IN_LIST, value=["CEO"])
+    contact = {"title": "CTO"}
+
+    assert rule.compile()(contact) is False
+    rule.value = ["CTO"]
+    assert rule.compile()(contact) is True
+
+
+@pytest.mark.parametrize("match_type", ["all", "any"])
+def test_segment_batch_matches_reference(match_type):
+    segment = Segment(id="s", name="Test", match_type=match_type)
+    for field, operator, value in RULES[:8] + RULES[19:23]:
+        segment.add_rule(field, operator, value)
+    segment.rules[1].is_active = False
+    contacts = make_contacts(300)
+
+    combine = all if match_type == "all" else any
+    active = [r for r in segment.rules if r.is_active]
+    expected = [combine([r.evaluate(c) for r in active]) for c in contacts]
+
+    assert segment.evaluate_batch(contacts) == expected
+    assert [segment.evaluate_contact(c) for c in contacts] == expected
+
+
+def test_refresh_and_preview_use_batch_evaluation():
+    engine = SegmentationEngine()
+    segment = engine.get_segment_by_name("Decision Makers")
+    contacts = make_contacts(100)
+    expected = {
+        c["id"] for c in contacts
+        if any(r.evaluate(c) for r in segment.rules)
+    }
+
+    result = engine.refresh_segment_membership(segment.id, contacts)
+    preview = engine.preview_segment(
+        [r.to_dict() for r in segment.rules], "all", contacts, limit=5,
+    )
+
+    assert result["total_members"] == len(expected)
+    assert preview["total_matching"] == len(expected)
+    assert {c["id"] for c in preview["sample"]} <= expected
+
+
+def test_batch_without_numpy_matches_reference(monkeypatch):
+    from src.segmentation import segmentation_engine
+
+    monkeypatch.setattr(segmentation_engine, "np", None)
+    segment = Segment(id="s", name="Test", match_type="any")
+    for field, operator, value in RULES[6:10] + RULES[16:21]:
+        segment.add_rule(field, operator, value)
+    contacts = make_contacts(200)
+
+    expected = [any(r.evaluate(c) for r in segment.rules) for c in contacts]
+
+    assert segment.evaluate_batch(contacts) == expected
+
+
+class FrozenDatetime(datetime):
+    """datetime with a controllable utcnow() for expiry tests."""
+    current = datetime(2025, 1, 10, 12, 0, 0)
+
+    @classmethod
+    def utcnow(cls):
+        return cls.current
+
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    from src.segmentation import segmentation_engine
+
+    monkeypatch.setattr(segmentation_engine, "datetime", FrozenDatetime)
+    FrozenDatetime.current = datetime(2025, 1, 10, 12, 0, 0)
+    return FrozenDatetime
+
+
+class TestIncrementalMembership:
+    """Test apply_contact_change and expiry processing."""
+
+    def _engine(self):
+        engine = SegmentationEngine()
+        for segment_id in list(engine.segments):
+            engine.delete_segment(segment_id)
+        return engine
+
+    def test_only_dependent_segments_are_reevaluated(self, monkeypatch):
+        engine = self._engine()
+        by_title = engine.create_segment("Execs")
+        by_title.add_rule("title", RuleOperator.IN_LIST, ["CEO", "CTO"])
+        by_score = engine.create_segment("Scored")
+        by_score.add_rule("score", RuleOperator.GREATER_OR_EQUAL, 80)
+
+        evaluated = []
+        original = Segment.evaluate_contact
+        monkeypatch.setattr(
+            Segment, "evaluate_contact",
+            lambda self, c: evaluated.append(self.id) or original(self, c),
+        )
+
+        before = {"id": "c1", "title": "Analyst", "score": 90}
+        engine.apply_contact_change(None, before)
+        evaluated.clear()
+
+        deltas = engine.apply_contact_change(before, {**before, "title": "CEO"})
+
+        assert evaluated == [by_title.id]
+        assert [(d.segment_id, d.change) for d in deltas] == [(by_title.id, "added")]
+        assert by_title.member_count == 1
+
+    def test_static_and_inactive_segments_keep_members(self):
+        engine = self._engine()
+        static = engine.create_segment("Static", is_dynamic=False)
+        static.add_rule("title", RuleOperator.EQUALS, "CEO")
+        paused = engine.create_segment("Paused")
+        paused.add_rule("title", RuleOperator.EQUALS, "CEO")
+        contacts = [{"id": "c1", "title": "CEO"}]
+        engine.refresh_segment_membership(static.id, contacts)
+        engine.refresh_segment_membership(paused.id, contacts)
+        engine.update_segment(paused.id, {"is_active": False})
+
+        assert engine.apply_contact_change(None, {"id": "c2", "title": "CEO"}) == []
+        assert engine.apply_contact_change(contacts[0], {"id": "c1", "title": "CTO"}) == []
+        assert set(engine._active_members[static.id]) == {"c1"}
+        assert set(engine._active_members[paused.id]) == {"c1"}
+
+    def test_in_place_rule_edit_updates_dependencies(self):
+        engine = self._engine()
+        segment = engine.create_segment("Execs")
+        rule = segment.add_rule("title", RuleOperator.EQUALS, "CEO")
+        before = {"id": "c1", "title": "Analyst", "role": "Analyst"}
+        engine.apply_contact_change(None, before)
+        engine.apply_contact_change(before, {**before, "title": "Analyst II"})
+
+        rule.field = "role"
+        deltas = engine.apply_contact_change(before, {**before, "role": "CEO"})
+
+        assert [(d.segment_id, d.change) for d in deltas] == [(segment.id, "added")]
+
+    def test_deltas_match_full_refresh(self):
+        engine = self._engine()
+        segment = engine.create_segment("Tech", match_type="any")
+        segment.add_rule("company.industry", RuleOperator.CONTAINS, "tech")
+        segment.add_rule("score", RuleOperator.GREATER_THAN, 50)
+        contacts = make_contacts(200)
+
+        engine.refresh_segment_membership(segment.id, contacts)
+        changed = [dict(c, score=99) if i % 3 == 0 else c for i, c in enumerate(contacts)]
+        for before, after in zip(contacts, changed):
+            engine.apply_contact_change(before, after)
+
+        reference = self._engine()
+        ref_segment = reference.create_segment("Tech", match_type="any")
+        ref_segment.rules = segment.rules
+        reference.refresh_segment_membership(ref_segment.id, changed)
+
+        assert set(engine._active_members[segment.id]) == set(reference._active_members[ref_segment.id])
+        assert segment.member_count == ref_segment.member_count
+
+    def test_deleted_contact_leaves_all_segments(self):
+        engine = self._engine()
+        segment = engine.create_segment("Execs")
+        segment.add_rule("title", RuleOperator.EQUALS, "CEO")
+        contact = {"id": "c1", "title": "CEO"}
+
+        engine.apply_contact_change(None, contact)
+        deltas = engine.apply_contact_change(contact, None)
+
+        assert [(d.contact_id, d.change) for d in deltas] == [("c1", "removed")]
+        assert engine.get_segment_stats(segment.id)["member_count"] == 0
+
+    def test_within_days_members_expire_from_queue(self, frozen_time):
+        engine = self._engine()
+        segment = engine.create_segment("Active")
+        segment.add_rule("last_activity_at", RuleOperator.WITHIN_DAYS, 7)
+        now = frozen_time.current
+        recent = {"id": "recent", "last_activity_at": (now - timedelta(days=6)).isoformat()}
+        older = {"id": "older", "last_activity_at": (now - timedelta(days=6, hours=20)).isoformat()}
+
+        engine.apply_contact_change(None, recent)
+        engine.apply_contact_change(None, older)
+        assert segment.member_count == 2
+
+        frozen_time.current = now + timedelta(hours=3)
+        assert engine.process_expirations() == []
+
+        frozen_time.current = now + timedelta(hours=5)
+        deltas = engine.process_expirations()
+        assert [(d.contact_id, d.change, d.reason) for d in deltas] == [("older", "removed", "expiry")]
+
+        frozen_time.current = now + timedelta(days=1, minutes=1)
+        deltas = engine.process_expirations()
+        assert [d.contact_id for d in deltas] == ["recent"]
+        assert segment.member_count == 0
+        assert engine._expiry_heap == []
+
+    def test_updated_contact_reschedules_expiry(self, frozen_time):
+        engine = self._engine()
+        segment = engine.create_segment("Active")
+        segment.add_rule("last_activity_at", RuleOperator.WITHIN_DAYS, 7)
+        now = frozen_time.current
+        before = {"id": "c1", "last_activity_at": (now - timedelta(days=6, hours=23)).isoformat()}
+        after = {"id": "c1", "last_activity_at": now.isoformat()}
+
+        engine.apply_contact_change(None, before)
+        engine.apply_contact_change(before, after)
+
+        frozen_time.current = now + timedelta(days=2)
+        assert engine.process_expirations() == []
+        assert segment.member_count == 1
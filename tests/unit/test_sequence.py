@@ -2,6 +2,7 @@
 
 Sprint 63: Sequence Automation
 """
+import asyncio
 import uuid
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -182,6 +183,140 @@ class TestSequenceExecutor:
         assert result == ""
 
 
+class FakeClaimSession:
+    """Session stand-in that serves pre-built claim batches."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.claims = []
+        self.commits = 0
+
+    async def execute(self, query):
+        self.claims.append(query)
+        batch = self.batches.pop(0) if self.batches else []
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = batch
+        return result
+
+    async def commit(self):
+        self.commits += 1
+
+
+class TestBatchedExecutor:
+    """Tests for the claim-based batch executor."""
+
+    def test_claim_query_skips_locked_rows(self):
+        """Test the claim locks enrollment rows with SKIP LOCKED."""
+        from sqlalchemy.dialects import postgresql
+        from src.tasks.sequence_executor import _claim_due_query
+
+        sql = str(_claim_due_query(datetime.utcnow(), 50, []).compile(dialect=postgresql.dialect()))
+
+        assert "FOR UPDATE OF sequence_enrollments SKIP LOCKED" in sql
+        assert "ORDER BY sequence_enrollments.next_step_at" in sql
+        assert "LIMIT" in sql
+
+    @pytest.mark.asyncio
+    async def test_drains_backlog_in_batches(self):
+        """Test paging continues until a short batch, committing each one."""
+        from contextlib import asynccontextmanager
+        from src.tasks import sequence_executor
+
+        batches = [[MagicMock(id=i) for i in range(start, start + size)]
+                   for start, size in [(0, 3), (3, 3), (6, 1)]]
+        session = FakeClaimSession(batches)
+        in_flight = 0
+        peak = 0
+
+        @asynccontextmanager
+        async def fake_session():
+            yield session
+
+        async def fake_step(db, enrollment, now):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            if enrollment.id == 4:
+                raise RuntimeError("template error")
+
+        with patch.object(sequence_executor, "get_session", fake_session), \
+                patch.object(sequence_executor, "_process_enrollment_step", fake_step):
+            stats = await sequence_executor._execute_due_steps_async(batch_size=3, concurrency=2)
+
+        assert stats["processed"] == 6
+        assert stats["errors"] == 1
+        assert stats["batches"] == 3
+        assert stats["drain_rate_per_second"] > 0
+        assert session.commits == 3
+        assert peak == 2
+        # The failed enrollment is excluded from later claims
+        assert "NOT IN" in str(session.claims[2])
+
+    @pytest.mark.asyncio
+    async def test_empty_backlog_claims_once(self):
+        """Test an empty backlog stops after one claim."""
+        from contextlib import asynccontextmanager
+        from src.tasks import sequence_executor
+
+        session = FakeClaimSession([])
+
+        @asynccontextmanager
+        async def fake_session():
+            yield session
+
+        with patch.object(sequence_executor, "get_session", fake_session):
+            stats = await sequence_executor._execute_due_steps_async()
+
+        assert stats["processed"] == 0
+        assert stats["batches"] == 0
+        assert len(session.claims) == 1
+        assert session.commits == 0
+
+
+    @pytest.mark.asyncio
+    async def test_completions_update_counters_in_sql(self):
+        """Test completed enrollments bump the sequence counters SQL-side."""
+        from sqlalchemy.dialects import postgresql
+        from src.tasks.sequence_executor import _process_batch
+
+        sequence = Sequence(
+            id=uuid.uuid4(),
+            name="Done",
+            status=SequenceStatus.ACTIVE.value,
+            active_enrollments=5,
+            completed_enrollments=0,
+        )
+        sequence.steps = []
+        enrollments = [
+            SequenceEnrollment(
+                id=uuid.uuid4(),
+                sequence_id=sequence.id,
+                sequence=sequence,
+                contact_email=f"c{i}@example.com",
+                current_step=1,
+                status=EnrollmentStatus.ACTIVE.value,
+            )
+            for i in range(3)
+        ]
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        processed, failed = await _process_batch(db, enrollments, datetime.utcnow(), 2)
+
+        assert (processed, failed) == (3, [])
+        assert all(e.status == EnrollmentStatus.COMPLETED.value for e in enrollments)
+        # The loaded row is untouched; the counters are incremented in the UPDATE
+        assert sequence.active_enrollments == 5
+        db.execute.assert_awaited_once()
+        statement = db.execute.await_args.args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "active_enrollments=greatest(sequences.active_enrollments - " in sql
+        assert "completed_enrollments=(sequences.completed_enrollments + " in sql
+        assert statement.compile().params["completed_enrollments_1"] == 3
+
+
 class TestSequenceWorkflow:
     """Integration-style tests for sequence workflow."""
 
@@ -0,0 +1,92 @@
+"""Tests for SequenceEngine due-step polling and reply handling."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.sequences import EnrollmentStatus, SequenceEngine
+from src.wait_scheduler import WaitScheduler
+
+
+async def _enroll(engine: SequenceEngine, email: str, due_in: timedelta, sequence_id="template_executive"):
+    enrollment = await engine.enroll_contact(sequence_id, email)
+    enrollment.next_step_at = datetime.utcnow() + due_in
+    engine._track(enrollment)
+    return enrollment
+
+
+class TestDueSteps:
+    """get_due_steps only reports due, active enrollments."""
+
+    @pytest.mark.asyncio
+    async def test_due_steps_earliest_first(self):
+        engine = SequenceEngine()
+        later = await _enroll(engine, "b@acme.com", timedelta(minutes=-1))
+        earlier = await _enroll(engine, "a@acme.com", timedelta(hours=-2))
+        await _enroll(engine, "c@acme.com", timedelta(days=3))
+
+        due = await engine.get_due_steps()
+
+        assert [d["enrollment"]["id"] for d in due] == [earlier.id, later.id]
+        assert due[0]["step"]["step_number"] == 1
+        assert due[0]["sequence_name"] == "Executive Outreach"
+
+    @pytest.mark.asyncio
+    async def test_executed_step_is_rescheduled(self):
+        engine = SequenceEngine()
+        enrollment = await engine.enroll_contact("template_executive", "a@acme.com")
+
+        await engine.execute_step(enrollment.id, {"first_name": "Ann"})
+
+        assert enrollment.current_step == 2
+        assert await engine.get_due_steps() == []
+        assert engine._due.due_at(enrollment.id) == enrollment.next_step_at
+
+    @pytest.mark.asyncio
+    async def test_completed_sequence_leaves_heap(self):
+        engine = SequenceEngine()
+        enrollment = await engine.enroll_contact("template_executive", "a@acme.com")
+
+        for _ in range(3):
+            await engine.execute_step(enrollment.id, {})
+
+        assert enrollment.status == EnrollmentStatus.COMPLETED
+        assert enrollment.id not in engine._due
+
+
+class TestMarkReplied:
+    """Replies stop every active enrollment for the contact."""
+
+    @pytest.mark.asyncio
+    async def test_mark_replied_is_case_insensitive(self):
+        engine = SequenceEngine()
+        first = await engine.enroll_contact("template_executive", "Jane@Acme.com")
+        second = await engine.enroll_contact("template_demand_gen", "jane@acme.com")
+        other = await engine.enroll_contact("template_executive", "bob@acme.com")
+
+        await engine.mark_replied("JANE@acme.com")
+
+        assert first.status == second.status == EnrollmentStatus.REPLIED
+        assert other.status == EnrollmentStatus.ACTIVE
+        assert [d["enrollment"]["id"] for d in await engine.get_due_steps()] == [other.id]
+        assert {e["id"] for e in engine.get_enrollment_status("jane@ACME.com")} == {first.id, second.id}
+
+
+class TestPeekDue:
+    """WaitScheduler.peek_due lists due ids without removing them."""
+
+    def test_peek_due_matches_sorted_scan(self):
+        scheduler = WaitScheduler()
+        t0 = datetime(2025, 1, 1)
+        offsets = [(i * 7919) % 1000 for i in range(1000)]
+        for i, offset in enumerate(offsets):
+            scheduler.schedule(str(i), t0 + timedelta(minutes=offset))
+        for i in range(0, 1000, 3):
+            scheduler.cancel(str(i))
+
+        now = t0 + timedelta(minutes=250)
+        expected = sorted(
+            (offset, i) for i, offset in enumerate(offsets) if offset <= 250 and i % 3
+        )
+
+        assert scheduler.peek_due(now) == [str(i) for _, i in expected]
+        assert len(scheduler) == 1000 - 334
@@ -0,0 +1,91 @@
+"""Tests for the dependency-graph step runner."""
+import asyncio
+
+import pytest
+
+from src.step_graph import GraphStep, StepGraph
+
+
+def _sleeper(delay: float, result=None, log=None, name=None):
+    async def run(**inputs):
+        if log is not None:
+            log.append(("start", name, sorted(inputs)))
+        await asyncio.sleep(delay)
+        return result
+    return run
+
+
+class TestValidation:
+    """Graphs are checked when built."""
+
+    def test_rejects_unknown_input(self):
+        with pytest.raises(ValueError, match="Unknown step inputs"):
+            StepGraph([GraphStep("a", _sleeper(0), ("missing",))])
+
+    def test_rejects_cycle(self):
+        with pytest.raises(ValueError, match="cycle"):
+            StepGraph([
+                GraphStep("a", _sleeper(0), ("b",)),
+                GraphStep("b", _sleeper(0), ("a",)),
+            ])
+
+    def test_rejects_duplicate_output(self):
+        with pytest.raises(ValueError, match="produced twice"):
+            StepGraph([
+                GraphStep("a", _sleeper(0), output="x"),
+                GraphStep("b", _sleeper(0), output="x"),
+            ])
+
+
+class TestRun:
+    """Steps start as soon as their inputs are ready."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        log = []
+        graph = StepGraph(
+            [
+                GraphStep("root", _sleeper(0.01, "r", log, "root"), ("seed",)),
+                GraphStep("a", _sleeper(0.1, 1, log, "a"), ("root",)),
+                GraphStep("b", _sleeper(0.1, 2, log, "b"), ("root",)),
+                GraphStep("c", _sleeper(0.1, 3, log, "c"), ("root",)),
+                GraphStep("join", _sleeper(0.01, "j", log, "join"), ("a", "b", "c")),
+            ],
+            initial=("seed",),
+        )
+        timings = {}
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        values = await graph.run({"seed": 0}, timings=timings)
+        elapsed = loop.time() - start
+
+        assert values["join"] == "j" and values["b"] == 2
+        assert elapsed < 0.2  # critical path ~0.12s, serial would be ~0.32s
+        assert log[-1] == ("start", "join", ["a", "b", "c"])
+        assert timings["a"]["started_ms"] == pytest.approx(timings["b"]["started_ms"], abs=5)
+        assert timings["join"]["started_ms"] >= timings["a"]["started_ms"] + timings["a"]["duration_ms"] - 1
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_running_steps(self):
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("HubSpot down")
+
+        graph = StepGraph([GraphStep("slow", slow), GraphStep("boom", boom)])
+        timings = {}
+
+        with pytest.raises(RuntimeError, match="HubSpot down"):
+            await graph.run({}, timings=timings)
+
+        assert cancelled.is_set()
+        assert set(timings) == {"boom"}
@@ -0,0 +1,110 @@
+"""Tests for the queued, iterative workflow step runner."""
+import asyncio
+
+import pytest
+
+from src.workflows import ExecutionStatus, StepType, WorkflowEngine
+
+
+def _linear_workflow(engine: WorkflowEngine, steps: int, step_type: StepType = StepType.CREATE_TASK):
+    workflow = engine.create_workflow(name="Linear")
+    previous = None
+    for i in range(steps):
+        step = engine.add_step_to_workflow(
+            workflow.id, f"Step {i}", step_type, after_step_id=previous.id if previous else None
+        )
+        previous = step
+    return workflow
+
+
+class TestStepRunner:
+    """Executions run on the worker pool, one step after another."""
+
+    @pytest.mark.asyncio
+    async def test_long_chain_runs_without_recursion(self):
+        engine = WorkflowEngine(workers=1)
+        workflow = _linear_workflow(engine, steps=3000)
+
+        execution = await engine.trigger_workflow(workflow.id)
+        await engine.runner.join()
+
+        assert execution.status == ExecutionStatus.COMPLETED
+        assert len(execution.step_results) == 3000
+        await engine.runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_trigger_returns_before_slow_step_finishes(self):
+        engine = WorkflowEngine()
+        release = asyncio.Event()
+
+        async def slow_ai(execution, step):
+            await release.wait()
+            return {"action": "ai_generated"}
+
+        engine.step_handlers[StepType.AI_GENERATE] = slow_ai
+        workflow = _linear_workflow(engine, steps=1, step_type=StepType.AI_GENERATE)
+
+        execution = await asyncio.wait_for(engine.trigger_workflow(workflow.id), timeout=1)
+        await asyncio.sleep(0)
+        assert execution.status == ExecutionStatus.RUNNING
+        assert engine.runner.metrics()["running"] == 1
+
+        release.set()
+        await engine.runner.join()
+        assert execution.status == ExecutionStatus.COMPLETED
+        await engine.runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_step_type_cap_limits_concurrency(self):
+        engine = WorkflowEngine(workers=6, step_limits={StepType.AI_GENERATE: 2})
+        in_flight = 0
+        peak = 0
+
+        async def ai(execution, step):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {}
+
+        engine.step_handlers[StepType.AI_GENERATE] = ai
+        workflow = _linear_workflow(engine, steps=2, step_type=StepType.AI_GENERATE)
+
+        for _ in range(6):
+            await engine.trigger_workflow(workflow.id)
+        await engine.runner.join()
+
+        assert peak == 2
+        latency = engine.runner.metrics()["step_latency"]["ai_generate"]
+        assert latency["count"] == 12
+        assert latency["max_ms"] >= 10
+        await engine.runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_while_queued_is_not_run(self):
+        engine = WorkflowEngine(workers=1)
+        workflow = _linear_workflow(engine, steps=2)
+
+        execution = await engine.trigger_workflow(workflow.id)
+        engine.cancel_execution(execution.id)
+        await engine.runner.join()
+
+        assert execution.status == ExecutionStatus.CANCELLED
+        assert execution.step_results == {}
+        await engine.runner.stop()
+
+    @pytest.mark.asyncio
+    async def test_condition_without_branch_completes(self):
+        engine = WorkflowEngine()
+        workflow = engine.create_workflow(name="Condition")
+        engine.add_step_to_workflow(
+            workflow.id, "Check", StepType.CONDITION,
+            {"conditions": [{"field": "score", "operator": "greater_than", "value": 50}]},
+        )
+
+        execution = await engine.trigger_workflow(workflow.id, context={"score": 10})
+        await asyncio.wait_for(engine.runner.join(), timeout=1)
+
+        assert execution.status == ExecutionStatus.COMPLETED
+        await engine.runner.stop()
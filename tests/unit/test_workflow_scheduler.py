@@ -0,0 +1,128 @@
+"""Tests for the workflow wait scheduler and execution archiving."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.workflows import ExecutionStatus, StepType, WaitScheduler, WorkflowEngine
+
+
+T0 = datetime(2025, 1, 1, 12, 0, 0)
+
+
+class TestWaitScheduler:
+    """Test the min-heap scheduler."""
+
+    def test_pop_due_returns_only_due_ids_in_order(self):
+        scheduler = WaitScheduler()
+        scheduler.schedule("late", T0 + timedelta(hours=2))
+        scheduler.schedule("b", T0 + timedelta(minutes=5))
+        scheduler.schedule("a", T0 + timedelta(minutes=1))
+
+        assert scheduler.pop_due(T0 + timedelta(minutes=10)) == ["a", "b"]
+        assert len(scheduler) == 1
+        assert scheduler.next_due() == T0 + timedelta(hours=2)
+
+    def test_reschedule_replaces_previous_entry(self):
+        scheduler = WaitScheduler()
+        scheduler.schedule("a", T0)
+        scheduler.schedule("a", T0 + timedelta(hours=1))
+
+        assert scheduler.pop_due(T0 + timedelta(minutes=30)) == []
+        assert scheduler.due_at("a") == T0 + timedelta(hours=1)
+
+    def test_cancel_removes_entry(self):
+        scheduler = WaitScheduler()
+        scheduler.schedule("a", T0)
+        scheduler.schedule("b", T0)
+
+        assert scheduler.cancel("a") is True
+        assert scheduler.cancel("a") is False
+        assert scheduler.pop_due(T0) == ["b"]
+        assert scheduler.next_due() is None
+
+    def test_cancelled_entries_are_compacted(self):
+        scheduler = WaitScheduler()
+        for i in range(1000):
+            scheduler.schedule(str(i), T0 + timedelta(seconds=i))
+        for i in range(990):
+            scheduler.cancel(str(i))
+
+        assert len(scheduler) == 10
+        assert len(scheduler._heap) < 100
+
+
+def _engine_with_delay_workflow(delay_seconds: int = 60):
+    engine = WorkflowEngine()
+    workflow = engine.create_workflow(name="Nurture")
+    wait = engine.add_step_to_workflow(
+        workflow.id, "Wait", StepType.WAIT_DELAY, {"delay_seconds": delay_seconds}
+    )
+    engine.add_step_to_workflow(workflow.id, "Done", StepType.END, after_step_id=wait.id)
+    return engine, workflow
+
+
+class TestEngineScheduling:
+    """The engine parks waits in the scheduler and archives finished runs."""
+
+    @pytest.mark.asyncio
+    async def test_waiting_execution_resumes_when_due(self):
+        engine, workflow = _engine_with_delay_workflow()
+        execution = await engine.trigger_workflow(workflow.id, contact_id="c1")
+        await engine.runner.join()
+
+        assert execution.status == ExecutionStatus.WAITING
+        assert execution.id in engine.scheduler
+
+        assert await engine.resume_waiting_executions(now=datetime.utcnow()) == []
+
+        resumed = await engine.resume_waiting_executions(
+            now=execution.next_execution_at + timedelta(seconds=1)
+        )
+        await engine.runner.join()
+
+        assert resumed == [execution]
+        assert execution.status == ExecutionStatus.COMPLETED
+        assert execution.id not in engine.executions
+        assert engine.get_execution(execution.id) is execution
+
+    @pytest.mark.asyncio
+    async def test_cancelled_execution_is_unscheduled_and_archived(self):
+        engine, workflow = _engine_with_delay_workflow()
+        execution = await engine.trigger_workflow(workflow.id)
+        await engine.runner.join()
+
+        engine.cancel_execution(execution.id)
+
+        assert execution.id not in engine.scheduler
+        assert execution.id not in engine.executions
+        assert engine.list_executions(status=ExecutionStatus.CANCELLED) == [execution]
+        assert await engine.resume_waiting_executions(
+            now=execution.next_execution_at + timedelta(days=1)
+        ) == []
+
+    @pytest.mark.asyncio
+    async def test_paused_execution_is_not_resumed(self):
+        engine, workflow = _engine_with_delay_workflow()
+        execution = await engine.trigger_workflow(workflow.id)
+        await engine.runner.join()
+
+        engine.pause_execution(execution.id)
+
+        assert execution.id in engine.executions
+        assert await engine.resume_waiting_executions(
+            now=execution.next_execution_at + timedelta(days=1)
+        ) == []
+
+    @pytest.mark.asyncio
+    async def test_archive_is_bounded(self):
+        engine = WorkflowEngine()
+        engine.ARCHIVE_LIMIT = 3
+        workflow = engine.create_workflow(name="One step")
+        engine.add_step_to_workflow(workflow.id, "Done", StepType.END)
+
+        executions = [await engine.trigger_workflow(workflow.id) for _ in range(5)]
+        await engine.runner.join()
+
+        assert engine.executions == {}
+        assert list(engine.archived_executions) == [e.id for e in executions[2:]]
+        assert len(engine.list_executions()) == 3
@@ -0,0 +1,97 @@
+"""Tests for indexed trigger matching and concurrent workflow dispatch."""
+import asyncio
+
+import pytest
+
+from src.workflows import ExecutionStatus, StepType, WorkflowEngine, WorkflowTrigger, TriggerType
+
+
+def _engine(workflows: int = 3) -> WorkflowEngine:
+    engine = WorkflowEngine()
+    for i in range(workflows):
+        workflow = engine.create_workflow(
+            name=f"Form {i}",
+            triggers=[{"type": "form_submission", "filters": {"form_id": f"form-{i}"}}],
+        )
+        engine.add_step_to_workflow(workflow.id, "Done", StepType.END)
+    engine.create_workflow(name="Any reply", triggers=[{"type": "email_replied"}])
+    return engine
+
+
+class TestTriggerIndex:
+    """Events are matched through the per-type trigger index."""
+
+    def test_compiled_trigger_agrees_with_matches(self):
+        trigger = WorkflowTrigger(
+            id="t1",
+            trigger_type=TriggerType.DEAL_STAGE_CHANGED,
+            filters={"stage": "closedwon", "pipeline": "default"},
+        )
+        predicate = trigger.compile()
+
+        for data in [
+            {"stage": "closedwon", "pipeline": "default"},
+            {"stage": "closedwon"},
+            {"stage": "closedlost", "pipeline": "default"},
+            {},
+        ]:
+            event = {"type": "deal_stage_changed", "data": data}
+            assert predicate(data) == trigger.matches(event)
+
+    def test_match_event_uses_type_and_filters(self):
+        engine = _engine()
+
+        matched = engine.match_event({"type": "form_submission", "data": {"form_id": "form-1"}})
+
+        assert [w.name for w in matched] == ["Form 1"]
+        assert [w.name for w in engine.match_event({"type": "email_replied"})] == ["Any reply"]
+        assert engine.match_event({"type": "meeting_booked", "data": {}}) == []
+
+    def test_inactive_workflows_are_skipped(self):
+        engine = _engine()
+        engine.list_workflows()[1].is_active = False
+
+        assert engine.match_event({"type": "form_submission", "data": {"form_id": "form-1"}}) == []
+
+    def test_reregistering_replaces_index_entries(self):
+        engine = _engine()
+        workflow = engine.list_workflows()[0]
+        workflow.triggers = [WorkflowTrigger(id="t2", trigger_type=TriggerType.TAG_ADDED)]
+
+        engine.register_workflow(workflow)
+
+        assert engine.match_event({"type": "form_submission", "data": {"form_id": "form-0"}}) == []
+        assert engine.match_event({"type": "tag_added"}) == [workflow]
+
+
+class TestConcurrentDispatch:
+    """Matching workflows are queued and run concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_matching_workflows_run_concurrently(self):
+        engine = WorkflowEngine(workers=8, step_limits={StepType.END: 3})
+        in_flight = 0
+        peak = 0
+
+        async def slow_end(execution, step):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"action": "workflow_ended"}
+
+        engine.step_handlers[StepType.END] = slow_end
+        for i in range(8):
+            workflow = engine.create_workflow(name=f"W{i}", triggers=[{"type": "contact_created"}])
+            engine.add_step_to_workflow(workflow.id, "Done", StepType.END)
+
+        executions = await engine.process_event(
+            {"type": "contact_created", "data": {"contact_id": "c1"}}
+        )
+        await engine.runner.join()
+
+        assert [e.workflow_id for e in executions] == list(engine.workflows)
+        assert all(e.contact_id == "c1" for e in executions)
+        assert all(e.status == ExecutionStatus.COMPLETED for e in executions)
+        assert peak == 3